@@ -0,0 +1,2 @@
+# Замеры накладных расходов custom_selenium_qa на поддельном вебдрайвере без браузера.
+# Запуск из корня репозитория: python -m benchmarks [--update-baseline]
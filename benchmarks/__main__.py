@@ -0,0 +1,6 @@
+from sys import exit
+
+from .runner import main
+
+
+exit(main())
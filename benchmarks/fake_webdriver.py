@@ -0,0 +1,570 @@
+import re
+from asyncio import sleep as async_sleep
+from base64 import b64encode
+from json import dumps
+from json import loads
+from threading import Condition
+from time import monotonic
+from time import sleep
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import remote_commands
+
+from custom_selenium_qa.async_webdriver import AsyncTransport
+from custom_selenium_qa.async_webdriver import AsyncWebDriver
+from custom_selenium_qa.devtools_channel import DevToolsConnection
+from custom_selenium_qa.scripts import GET_ATTRIBUTES_SCRIPT
+from custom_selenium_qa.scripts import GET_ELEMENT_ATTRIBUTE_SCRIPT
+from custom_selenium_qa.scripts import GET_PAGE_PERFORMANCE_SCRIPT
+from custom_selenium_qa.scripts import GET_TEXTS_SCRIPT
+from custom_selenium_qa.scripts import IS_VISIBLE_SCRIPT
+from custom_selenium_qa.scripts import PAGE_FINGERPRINT_SCRIPT
+from custom_selenium_qa.scripts import QUERY_MANY_SCRIPT
+from custom_selenium_qa.scripts import WAIT_FOR_CONDITION_SCRIPT
+from custom_selenium_qa.scripts import WAIT_FOR_PAGE_IDLE_SCRIPT
+
+# Ключ ссылки на элемент в протоколе W3C WebDriver
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+# Содержимое скриншота, которое возвращает поддельный вебдрайвер
+FAKE_PNG = b'\x89PNG\r\n\x1a\nfake'
+
+# Метрики производительности страницы, которые возвращает поддельный браузер
+FAKE_PAGE_PERFORMANCE = {
+    'time_to_first_byte': 120.0,
+    'dom_content_loaded': 600.0,
+    'load': 900.0,
+    'first_contentful_paint': 350.0,
+    'long_tasks_count': 1,
+    'total_blocking_time': 70.0,
+}
+
+# Интервал, с которым поддельный браузер проверяет условие WAIT_FOR_CONDITION_SCRIPT
+_BROWSER_POLL_INTERVAL = 0.005
+
+
+class FakeWebDriverError(Exception):
+    """
+    Ошибка команды поддельного вебдрайвера, возвращаемая клиенту в формате W3C WebDriver.
+    """
+
+    def __init__(self, error: str, message: str = ''):
+        """
+        :param error: Код ошибки W3C WebDriver, например no such element.
+        :param message: Сообщение об ошибке.
+        """
+        super().__init__(error, message)
+        self.error = error
+        self.message = message
+
+
+class FakeElement:
+    """
+    Элемент страницы поддельного вебдрайвера.
+    Состояние элемента может меняться по расписанию, отсчитываемому от загрузки страницы.
+    """
+
+    def __init__(
+            self,
+            text: str = '',
+            attributes: Optional[Dict[str, str]] = None,
+            is_displayed: bool = True,
+            is_enabled: bool = True,
+            appear_after: float = 0.0,
+            disappear_after: Optional[float] = None,
+            stale_reads: int = 0
+    ):
+        """
+        :param text: Видимый текст элемента.
+        :param attributes: Атрибуты элемента, в том числе value.
+        :param is_displayed: Флаг видимости элемента.
+        :param is_enabled: Флаг доступности элемента.
+        :param appear_after: Через сколько секунд после загрузки страницы элемент появляется в DOM.
+        :param disappear_after: Через сколько секунд после загрузки страницы элемент пропадает из DOM.
+        :param stale_reads: Сколько обращений по ранее найденной ссылке завершатся StaleElementReferenceException.
+        """
+        self.text = text
+        self.attributes = dict(attributes or {})
+        self.is_displayed = is_displayed
+        self.is_enabled = is_enabled
+        self.appear_after = appear_after
+        self.disappear_after = disappear_after
+        self.stale_reads = stale_reads
+        self.clicks = 0
+        self._updates: List[Tuple[float, Dict[str, Any]]] = []
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (text={self.text!r}, attributes={self.attributes})>'
+
+    def update_after(self, seconds: float, **changes: Any) -> 'FakeElement':
+        """
+        Планирует изменение элемента (text, is_displayed, is_enabled или атрибута) через заданное время.
+
+        :param seconds: Через сколько секунд после загрузки страницы применить изменения.
+        :param changes: Новые значения полей; неизвестные поля считаются атрибутами.
+        :return: Этот же элемент.
+        """
+        self._updates.append((seconds, changes))
+        self._updates.sort(key=lambda update: update[0])
+        return self
+
+    def apply_updates(self, elapsed: float) -> None:
+        """
+        Применяет наступившие изменения из расписания.
+
+        :param elapsed: Время с загрузки страницы в секундах.
+        :return: None
+        """
+        while self._updates and self._updates[0][0] <= elapsed:
+            _, changes = self._updates.pop(0)
+            for name, value in changes.items():
+                if name in ('text', 'is_displayed', 'is_enabled'):
+                    setattr(self, name, value)
+                else:
+                    self.attributes[name] = value
+
+    def is_present(self, elapsed: float) -> bool:
+        """
+        Проверяет, находится ли элемент в DOM.
+
+        :param elapsed: Время с загрузки страницы в секундах.
+        :return: True, если элемент в DOM.
+        """
+        return self.appear_after <= elapsed and (self.disappear_after is None or elapsed < self.disappear_after)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Возвращает значение атрибута.
+
+        :param name: Имя атрибута.
+        :return: Значение или None.
+        """
+        if name == 'value':
+            return self.attributes.get('value', '')
+        return self.attributes.get(name)
+
+
+class FakePage:
+    """
+    Страница поддельного вебдрайвера: элементы по селекторам, заголовок и алерт.
+    Селекторы сопоставляются как строки, тип локатора не учитывается.
+    """
+
+    def __init__(
+            self,
+            elements: Optional[Dict[str, Sequence[FakeElement]]] = None,
+            title: str = '',
+            alert_text: Optional[str] = None
+    ):
+        """
+        :param elements: Элементы страницы по селекторам.
+        :param title: Заголовок страницы.
+        :param alert_text: Текст открытого алерта или None.
+        """
+        self.elements = {selector: list(found) for selector, found in (elements or {}).items()}
+        self.title = title
+        self.alert_text = alert_text
+        self.loaded_at = monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Возвращает время с загрузки страницы.
+
+        :return: Количество секунд.
+        """
+        return monotonic() - self.loaded_at
+
+    def find(self, selector: str) -> List[FakeElement]:
+        """
+        Возвращает элементы, находящиеся в DOM, с применёнными изменениями по расписанию.
+
+        :param selector: Селектор.
+        :return: Список элементов.
+        """
+        elapsed = self.elapsed
+        found = [element for element in self.elements.get(selector, ()) if element.is_present(elapsed)]
+        for element in found:
+            element.apply_updates(elapsed)
+        return found
+
+
+class FakeCommandExecutor:
+    """
+    Внутрипроцессный исполнитель команд W3C WebDriver для webdriver.Remote.
+    Имитирует задержку сети на каждую команду, устаревание ссылок на элементы и появление элементов с задержкой;
+    скрипты пакета (custom_selenium_qa.scripts) и атомы Selenium выполняются на стороне Python.
+    """
+
+    def __init__(self, page: FakePage, latency: float = 0.0):
+        """
+        :param page: Страница.
+        :param latency: Задержка каждой команды в секундах.
+        """
+        self._url = 'http://fake-webdriver'
+        self.page = page
+        self.latency = latency
+        self.commands: List[str] = []
+        self.devtools_commands: List[Tuple[str, Dict[str, Any]]] = []
+        # Тайм-аут асинхронных скриптов сессии в миллисекундах
+        self.script_timeout = 30000
+        # Результаты команд DevTools протокола по именам команд; остальные команды возвращают пустой результат
+        self.devtools_responses: Dict[str, Any] = {}
+        self._references: Dict[str, FakeElement] = {}
+        self._element_references: Dict[int, str] = {}
+        self._references_count = 0
+        self._scripts: Dict[str, Callable[..., Any]] = {
+            GET_TEXTS_SCRIPT: self.__get_texts,
+            GET_ATTRIBUTES_SCRIPT: self.__get_attributes,
+            QUERY_MANY_SCRIPT: self.__query_many,
+            WAIT_FOR_CONDITION_SCRIPT: self.__wait_for_condition,
+            PAGE_FINGERPRINT_SCRIPT: self.__page_fingerprint,
+            IS_VISIBLE_SCRIPT: lambda element: element.is_displayed,
+            GET_ELEMENT_ATTRIBUTE_SCRIPT: lambda element, name: element.get_attribute(name),
+            GET_PAGE_PERFORMANCE_SCRIPT: lambda: {'url': self._url, 'metrics': dict(FAKE_PAGE_PERFORMANCE)},
+            WAIT_FOR_PAGE_IDLE_SCRIPT: lambda *args: {
+                'idle': True, 'readyState': 'complete', 'pending': 0, 'jqueryActive': 0
+            },
+        }
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (commands={len(self.commands)}, latency={self.latency})>'
+
+    def __reference(self, element: FakeElement) -> Dict[str, str]:
+        """
+        Возвращает ссылку на элемент; как и браузер, повторный поиск элемента даёт ту же ссылку, пока она не устарела.
+        """
+        reference = self._element_references.get(id(element))
+        if reference is None:
+            self._references_count += 1
+            reference = self._element_references[id(element)] = f'element-{self._references_count}'
+            self._references[reference] = element
+        return {ELEMENT_KEY: reference}
+
+    def __resolve(self, reference: str) -> FakeElement:
+        element = self._references.get(reference)
+        if element is None or element.stale_reads > 0 or not element.is_present(self.page.elapsed):
+            if element is not None:
+                element.stale_reads = max(0, element.stale_reads - 1)
+                del self._references[reference]
+                del self._element_references[id(element)]
+            raise FakeWebDriverError('stale element reference', f'Ссылка на элемент устарела: {reference}')
+        element.apply_updates(self.page.elapsed)
+        return element
+
+    def __unwrap(self, value: Any) -> Any:
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self.__resolve(value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self.__unwrap(item) for item in value]
+        return value
+
+    def execute(self, command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Выполняет команду WebDriver.
+
+        :param command: Имя команды.
+        :param params: Параметры команды.
+        :return: Ответ в формате W3C WebDriver.
+        """
+        self.commands.append(command)
+        if self.latency:
+            sleep(self.latency)
+        params = params or {}
+        try:
+            return {'value': self.__execute(command, params)}
+        except FakeWebDriverError as exc:
+            return {'status': 404, 'value': dumps({'value': {'error': exc.error, 'message': exc.message}})}
+
+    def __execute(self, command: str, params: Dict[str, Any]) -> Any:
+        if command == Command.NEW_SESSION:
+            return {'sessionId': 'fake-session', 'capabilities': {'browserName': 'chrome'}}
+        if command == Command.FIND_ELEMENT:
+            found = self.page.find(params['value'])
+            if not found:
+                raise FakeWebDriverError('no such element', f'Элемент не найден: {params["value"]}')
+            return self.__reference(found[0])
+        if command == Command.FIND_ELEMENTS:
+            return [self.__reference(element) for element in self.page.find(params['value'])]
+        if command in (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC):
+            return self.__execute_script(params['script'], self.__unwrap(params['args']))
+        if command == Command.REFRESH:
+            self._references.clear()
+            self._element_references.clear()
+            self.page.loaded_at = monotonic()
+            return None
+        if command == Command.GET_TITLE:
+            return self.page.title
+        if command == Command.W3C_GET_WINDOW_HANDLES:
+            return ['window-1']
+        if command in (Command.W3C_GET_ALERT_TEXT, Command.W3C_ACCEPT_ALERT, Command.W3C_DISMISS_ALERT):
+            if self.page.alert_text is None:
+                raise FakeWebDriverError('no such alert', 'Алерт не открыт')
+            text = self.page.alert_text
+            if command != Command.W3C_GET_ALERT_TEXT:
+                self.page.alert_text = None
+            return text
+        if command == Command.SCREENSHOT:
+            return b64encode(FAKE_PNG).decode()
+        if command == Command.GET_TIMEOUTS:
+            return {'implicit': 0, 'pageLoad': 300000, 'script': self.script_timeout}
+        if command == Command.SET_TIMEOUTS:
+            self.script_timeout = params.get('script', self.script_timeout)
+            return None
+        if command == Command.SWITCH_TO_FRAME:
+            if isinstance(params.get('id'), dict):
+                self.__unwrap(params['id'])
+            return None
+        if 'id' in params:
+            return self.__execute_element_command(command, self.__resolve(params['id']), params)
+        return None
+
+    def __execute_element_command(self, command: str, element: FakeElement, params: Dict[str, Any]) -> Any:
+        if command == Command.GET_ELEMENT_TEXT:
+            return element.text if element.is_displayed else ''
+        if command == Command.IS_ELEMENT_ENABLED:
+            return element.is_enabled
+        if command == Command.CLICK_ELEMENT:
+            element.clicks += 1
+            return None
+        if command == Command.CLEAR_ELEMENT:
+            element.attributes['value'] = ''
+            return None
+        if command == Command.SEND_KEYS_TO_ELEMENT:
+            element.attributes['value'] = element.attributes.get('value', '') + params['text']
+            return None
+        if command == Command.ELEMENT_SCREENSHOT:
+            return b64encode(FAKE_PNG).decode()
+        return None
+
+    def __execute_script(self, script: str, args: List[Any]) -> Any:
+        if script in self._scripts:
+            return self._scripts[script](*args)
+        if script.startswith('/* isDisplayed */'):
+            return args[0].is_displayed
+        if script.startswith('/* getAttribute */'):
+            return args[0].get_attribute(args[1])
+        return None
+
+    def __get_texts(self, by: str, selector: str) -> List[str]:
+        return [element.text.strip() if element.is_displayed else '' for element in self.page.find(selector)]
+
+    def __get_attributes(self, by: str, selector: str, names: List[str]) -> List[Dict[str, Optional[str]]]:
+        return [{name: element.get_attribute(name) for name in names} for element in self.page.find(selector)]
+
+    def __query_many(self, pairs: List[List[str]], fields: List[str]) -> List[Dict[str, Any]]:
+        results = []
+        for _, selector in pairs:
+            found = self.page.find(selector)
+            result: Dict[str, Any] = {'present': bool(found), 'count': len(found)}
+            if 'visible' in fields:
+                result['visible'] = bool(found) and found[0].is_displayed
+            if 'text' in fields:
+                result['text'] = (found[0].text if found[0].is_displayed else '') if found else None
+            results.append(result)
+        return results
+
+    def __wait_for_condition(
+            self,
+            by: str,
+            selector: str,
+            condition: str,
+            expected: str,
+            attribute_name: str,
+            is_strong: bool,
+            timeout_ms: int,
+            poll_ms: int
+    ) -> Dict[str, Any]:
+        def read_current() -> Any:
+            found = self.page.find(selector)
+            if condition == 'absent':
+                return len(found)
+            if not found:
+                return None
+            if condition == 'text':
+                return found[0].text if found[0].is_displayed else ''
+            if condition == 'value':
+                return (found[0].get_attribute('value') or '').strip()
+            return found[0].get_attribute(attribute_name)
+
+        def is_met(current: Any) -> bool:
+            if condition == 'absent':
+                return current == 0  # type: ignore
+            if current is None:
+                return False
+            return current == expected if is_strong else expected in current  # type: ignore
+
+        end_time = monotonic() + timeout_ms / 1000
+        while True:
+            current = read_current()
+            if is_met(current):
+                return {'matched': True, 'current': current}
+            if monotonic() >= end_time:
+                return {'matched': False, 'current': current}
+            sleep(_BROWSER_POLL_INTERVAL)
+
+    def __page_fingerprint(self) -> str:
+        state = [
+            (selector, element.text, sorted(element.attributes.items()))
+            for selector, elements in self.page.elements.items()
+            for element in elements
+        ]
+        return f'{self._url}|{hash(repr(state))}'
+
+    def close(self) -> None:
+        """
+        Закрывает соединения (вызывается из webdriver.Remote.quit); поддельному исполнителю закрывать нечего.
+
+        :return: None
+        """
+
+    def _request(self, method: str, url: str, body: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Выполняет запрос к расширению Chromium, который использует BaseActions.send_by_devtools_protocol.
+
+        :param method: HTTP-метод.
+        :param url: Адрес запроса.
+        :param body: Тело запроса.
+        :return: Ответ.
+        """
+        self.commands.append(f'devtools:{url.rsplit("/", 1)[-1]}')
+        if self.latency:
+            sleep(self.latency)
+        payload = loads(body) if body else {}
+        self.devtools_commands.append((payload.get('cmd', ''), payload.get('params', {})))
+        return {'value': self.devtools_responses.get(payload.get('cmd', ''), {})}
+
+
+def create_fake_driver(page: FakePage, latency: float = 0.0) -> Tuple[Remote, FakeCommandExecutor]:
+    """
+    Создаёт webdriver.Remote, работающий с поддельным исполнителем команд без браузера.
+
+    :param page: Страница.
+    :param latency: Задержка каждой команды в секундах.
+    :return: Вебдрайвер и его исполнитель команд.
+    """
+    executor = FakeCommandExecutor(page, latency)
+    driver = Remote(command_executor=executor, options=ChromeOptions())  # type: ignore
+    executor.commands.clear()
+    return driver, executor
+
+
+class FakeDevToolsConnection(DevToolsConnection):
+    """
+    Соединение DevToolsChannel с поддельным браузером: команды учитываются в FakeCommandExecutor,
+    ответ на каждую команду приходит через latency после её отправки - как по websocket, ответы на команды,
+    отправленные подряд, ожидаются одновременно.
+    """
+
+    def __init__(self, executor: FakeCommandExecutor, latency: float = 0.0):
+        """
+        :param executor: Исполнитель команд сессии.
+        :param latency: Задержка ответа на каждую команду в секундах.
+        """
+        self.executor = executor
+        self.latency = latency
+        self._messages: List[Tuple[float, str]] = []
+        self._condition = Condition()
+        self._is_closed = False
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (latency={self.latency})>'
+
+    def send(self, message: str) -> None:
+        payload = loads(message)
+        self.executor.commands.append(f'devtools:{payload["method"]}')
+        self.executor.devtools_commands.append((payload['method'], payload.get('params', {})))
+        result = self.executor.devtools_responses.get(payload['method'], {})
+        self.__put(dumps({'id': payload['id'], 'result': result}), self.latency)
+
+    def emit(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Отправляет событие DevTools протокола без задержки.
+
+        :param method: Имя события.
+        :param params: Параметры события.
+        :return: None
+        """
+        self.__put(dumps({'method': method, 'params': params or {}}), 0.0)
+
+    def recv(self) -> str:
+        with self._condition:
+            while not self._messages:
+                if self._is_closed:
+                    raise ConnectionError('Соединение закрыто')
+                self._condition.wait()
+            ready_at, message = self._messages.pop(0)
+        delay = ready_at - monotonic()
+        if delay > 0:
+            sleep(delay)
+        return message
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+
+    def __put(self, message: str, delay: float) -> None:
+        with self._condition:
+            self._messages.append((monotonic() + delay, message))
+            self._condition.notify()
+
+
+class FakeAsyncTransport(AsyncTransport):
+    """
+    Асинхронный транспорт AsyncWebDriver поверх FakeCommandExecutor: HTTP-путь сопоставляется с командой Selenium
+    по таблице remote_commands, задержка сети выполняется через asyncio.sleep и не блокирует другие сессии.
+    """
+
+    # Шаблоны путей команд W3C WebDriver: (метод, регулярное выражение пути, имя команды)
+    _ROUTES = [
+        (method, re.compile('^' + re.sub(r'\$(\w+)', r'(?P<\1>[^/]+)', path) + '$'), command)
+        for command, (method, path) in remote_commands.items()
+    ]
+
+    def __init__(self, page: FakePage, latency: float = 0.0):
+        """
+        :param page: Страница.
+        :param latency: Задержка каждой команды в секундах.
+        """
+        self.executor = FakeCommandExecutor(page)
+        self.latency = latency
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (commands={len(self.executor.commands)}, latency={self.latency})>'
+
+    async def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if self.latency:
+            await async_sleep(self.latency)
+        if path.endswith('/chromium/send_command_and_get_result'):
+            return self.executor._request(method, self.executor._url + path, dumps(body))
+        for route_method, pattern, command in self._ROUTES:
+            match = pattern.match(path)
+            if route_method == method and match:
+                params = {**(body or {}), **match.groupdict()}
+                params.pop('sessionId', None)
+                return self.executor.execute(command, params)
+        return {'status': 404, 'value': dumps({'value': {'error': 'unknown command', 'message': path}})}
+
+
+async def create_fake_async_driver(page: FakePage, latency: float = 0.0) -> Tuple[AsyncWebDriver, FakeCommandExecutor]:
+    """
+    Создаёт AsyncWebDriver, работающий с поддельным исполнителем команд без браузера.
+
+    :param page: Страница.
+    :param latency: Задержка каждой команды в секундах.
+    :return: Асинхронный вебдрайвер и исполнитель команд.
+    """
+    transport = FakeAsyncTransport(page, latency)
+    driver = await AsyncWebDriver.create(transport, {'browserName': 'chrome'})
+    transport.executor.commands.clear()
+    return driver, transport.executor
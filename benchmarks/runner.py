@@ -0,0 +1,255 @@
+from argparse import ArgumentParser
+from json import dump
+from json import load
+from os import chdir
+from os import getcwd
+from os.path import abspath
+from os.path import dirname
+from os.path import exists
+from os.path import join
+from random import seed
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from custom_selenium_qa import ActionListener
+from custom_selenium_qa import PerformanceReport
+
+from .fake_webdriver import FakeDevToolsConnection
+from .fake_webdriver import create_fake_driver
+from .scenarios import SCENARIOS
+from .scenarios import BenchmarkPage
+from .scenarios import Scenario
+
+# Базовая линия по умолчанию
+BASELINE_PATH = join(dirname(abspath(__file__)), 'baseline.json')
+
+# Задержка каждой команды поддельного вебдрайвера по умолчанию (сек)
+DEFAULT_LATENCY = 0.002
+
+# Допустимый рост времени выполнения относительно базовой линии
+DEFAULT_TIME_TOLERANCE = 0.5
+
+# Допустимый рост количества команд и повторных попыток для сценариев, зависящих от времени
+DEFAULT_COUNT_TOLERANCE = 0.25
+
+# Абсолютный запас времени (сек), чтобы быстрые сценарии не падали из-за шума планировщика
+TIME_SLACK = 0.02
+
+
+class _CountingListener(ActionListener):
+    """
+    Слушатель, считающий повторные попытки и вызовы условий ожиданий.
+    """
+
+    def __init__(self) -> None:
+        self.retries = 0
+        self.polls = 0
+
+    def on_retry(self, error: BaseException) -> None:
+        self.retries += 1
+
+    def on_wait(self, started: float, duration: float, polls: int, is_succeeded: bool) -> None:
+        self.polls += polls
+
+
+def run_scenario(scenario: Scenario, latency: float = DEFAULT_LATENCY) -> Dict[str, Any]:
+    """
+    Выполняет сценарий один раз на новом поддельном вебдрайвере.
+
+    :param scenario: Сценарий.
+    :param latency: Задержка каждой команды в секундах.
+    :return: Словарь с полями time, commands, retries, polls и error.
+    """
+    seed(0)  # Случайный разброс пауз BackoffPolling одинаков во всех запусках
+    driver, executor = create_fake_driver(scenario.page_factory(), latency)
+    page_object = BenchmarkPage(driver, 'benchmark', has_element_cache=scenario.has_element_cache)  # type: ignore
+    page_object.PERFORMANCE_REPORT = PerformanceReport()
+    if scenario.has_devtools_channel:
+        page_object.open_devtools_channel(FakeDevToolsConnection(executor, latency))
+    listener = _CountingListener()
+    page_object.add_listener(listener)
+    error: Optional[str] = None
+    started = perf_counter()
+    try:
+        scenario.action(page_object)
+    except BaseException as exc:
+        if scenario.expected_error is None or not isinstance(exc, scenario.expected_error):
+            error = f'{type(exc).__name__}: {exc}'
+    else:
+        if scenario.expected_error is not None:
+            error = f'Ожидалось исключение {scenario.expected_error.__name__}'
+    duration = perf_counter() - started
+    page_object.close_devtools_channel()
+    page_object.flush_screenshots()
+    return {
+        'time': duration,
+        'commands': len(executor.commands),
+        'retries': listener.retries,
+        'polls': listener.polls,
+        'error': error,
+    }
+
+
+def run_scenarios(
+        scenarios: Sequence[Scenario],
+        latency: float = DEFAULT_LATENCY,
+        repeat: int = 3
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Выполняет сценарии в отдельной временной директории (для скриншотов).
+    Время - медиана повторов, счётчики - максимум по повторам.
+
+    :param scenarios: Сценарии.
+    :param latency: Задержка каждой команды в секундах.
+    :param repeat: Количество повторов каждого сценария.
+    :return: Результаты по именам сценариев.
+    """
+    results = {}
+    current_directory = getcwd()
+    with TemporaryDirectory() as directory:
+        chdir(directory)
+        try:
+            for scenario in scenarios:
+                runs = [run_scenario(scenario, latency) for _ in range(max(1, repeat))]
+                results[scenario.name] = {
+                    'time': median(run['time'] for run in runs),
+                    'commands': max(run['commands'] for run in runs),
+                    'retries': max(run['retries'] for run in runs),
+                    'polls': max(run['polls'] for run in runs),
+                    'error': next((run['error'] for run in runs if run['error']), None),
+                }
+        finally:
+            chdir(current_directory)
+    return results
+
+
+def find_regressions(
+        results: Dict[str, Dict[str, Any]],
+        baseline: Dict[str, Any],
+        scenarios: Sequence[Scenario],
+        latency: float = DEFAULT_LATENCY,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        count_tolerance: float = DEFAULT_COUNT_TOLERANCE
+) -> Dict[str, List[str]]:
+    """
+    Сравнивает результаты с базовой линией.
+    Для детерминированных сценариев любое увеличение количества команд или повторных попыток - регрессия,
+    для сценариев, зависящих от времени, - увеличение сверх count_tolerance.
+    Время сравнивается, только если базовая линия снята с той же задержкой команд.
+
+    :param results: Результаты run_scenarios.
+    :param baseline: Базовая линия.
+    :param scenarios: Сценарии.
+    :param latency: Задержка каждой команды, с которой получены результаты.
+    :param time_tolerance: Допустимый относительный рост времени.
+    :param count_tolerance: Допустимый относительный рост счётчиков для сценариев, зависящих от времени.
+    :return: Описания регрессий по именам сценариев.
+    """
+    is_time_comparable = baseline.get('latency') == latency
+    deterministic = {scenario.name: scenario.is_deterministic for scenario in scenarios}
+    regressions: Dict[str, List[str]] = {}
+    for name, result in results.items():
+        problems = []
+        if result['error']:
+            problems.append(f'ошибка: {result["error"]}')
+        expected = baseline.get('scenarios', {}).get(name)
+        if expected is not None:
+            for counter in ('commands', 'retries'):
+                limit = expected[counter]
+                if not deterministic.get(name, True):
+                    limit = int(limit * (1 + count_tolerance)) + 1
+                if result[counter] > limit:
+                    problems.append(f'{counter}: {expected[counter]} -> {result[counter]}')
+            time_limit = expected['time'] * (1 + time_tolerance) + TIME_SLACK
+            if is_time_comparable and result['time'] > time_limit:
+                problems.append(f'time: {expected["time"] * 1000:.1f} мс -> {result["time"] * 1000:.1f} мс')
+        if problems:
+            regressions[name] = problems
+    return regressions
+
+
+def format_report(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any]) -> str:
+    """
+    Формирует таблицу результатов с базовой линией в скобках.
+
+    :param results: Результаты run_scenarios.
+    :param baseline: Базовая линия.
+    :return: Текст таблицы.
+    """
+    width = max(len(name) for name in results)
+    lines = [f'{"scenario":<{width}}  {"time, ms":>18}  {"commands":>12}  {"retries":>10}  {"polls":>10}']
+    for name, result in results.items():
+        expected = baseline.get('scenarios', {}).get(name, {})
+        time_text = f'{result["time"] * 1000:.1f}'
+        if expected:
+            time_text += f' ({expected["time"] * 1000:.1f})'
+        columns = [time_text.rjust(18)]
+        for counter, column_width in (('commands', 12), ('retries', 10), ('polls', 10)):
+            text = str(result[counter])
+            if expected:
+                text += f' ({expected[counter]})'
+            columns.append(text.rjust(column_width))
+        lines.append(f'{name:<{width}}  ' + '  '.join(columns) + ('  ERROR' if result['error'] else ''))
+    return '\n'.join(lines)
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    """
+    Запускает замеры, печатает таблицу и сравнивает результаты с базовой линией.
+
+    :param arguments: Аргументы командной строки.
+    :return: Код возврата: 0 - без регрессий, 1 - есть регрессии или ошибки.
+    """
+    parser = ArgumentParser(prog='python -m benchmarks', description='Замеры накладных расходов custom_selenium_qa')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Путь к файлу базовой линии')
+    parser.add_argument('--update-baseline', action='store_true', help='Записать результаты как базовую линию')
+    parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY, help='Задержка каждой команды, сек')
+    parser.add_argument('--repeat', type=int, default=3, help='Количество повторов каждого сценария')
+    parser.add_argument('--time-tolerance', type=float, default=DEFAULT_TIME_TOLERANCE)
+    parser.add_argument('--count-tolerance', type=float, default=DEFAULT_COUNT_TOLERANCE)
+    parser.add_argument('-k', '--filter', default='', help='Запускать только сценарии, содержащие подстроку')
+    options = parser.parse_args(arguments)
+
+    scenarios = [scenario for scenario in SCENARIOS if options.filter in scenario.name]
+    results = run_scenarios(scenarios, options.latency, options.repeat)
+    baseline: Dict[str, Any] = {}
+    if exists(options.baseline):
+        with open(options.baseline, encoding='UTF-8') as file:
+            baseline = load(file)
+    print(format_report(results, baseline))
+
+    if options.update_baseline:
+        scenarios_baseline = dict(baseline.get('scenarios', {}))
+        for name, result in results.items():
+            if not result['error']:
+                scenarios_baseline[name] = {
+                    'time': round(result['time'], 4),
+                    'commands': result['commands'],
+                    'retries': result['retries'],
+                    'polls': result['polls'],
+                }
+        baseline = {'latency': options.latency, 'scenarios': scenarios_baseline}
+        with open(options.baseline, 'w', encoding='UTF-8') as file:
+            dump(baseline, file, ensure_ascii=False, indent=2)
+        print(f'\nБазовая линия записана: {options.baseline}')
+
+    regressions = find_regressions(
+        results,
+        baseline,
+        scenarios,
+        options.latency,
+        options.time_tolerance,
+        options.count_tolerance
+    )
+    if regressions:
+        print('\nРегрессии:')
+        for name, problems in regressions.items():
+            print(f'  {name}: {"; ".join(problems)}')
+        return 1
+    return 0
@@ -0,0 +1,287 @@
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Type
+
+from custom_selenium_qa import BaseActions
+from custom_selenium_qa import CustomWebDriverWait
+from custom_selenium_qa import Locator
+
+from .fake_webdriver import FakeElement
+from .fake_webdriver import FakePage
+
+
+class BenchmarkPage(BaseActions):
+    """
+    Объект страницы для замеров: все методы BaseActions без изменений.
+    """
+
+    _IS_ABSTRACT_CLASS = False
+
+
+class Scenario:
+    """
+    Сценарий замера: страница поддельного вебдрайвера и действие над объектом страницы.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            action: Callable[[BenchmarkPage], Any],
+            page_factory: Optional[Callable[[], FakePage]] = None,
+            is_deterministic: bool = True,
+            has_element_cache: bool = False,
+            expected_error: Optional[Type[BaseException]] = None,
+            has_devtools_channel: bool = False
+    ):
+        """
+        :param name: Имя сценария (ключ в базовой линии).
+        :param action: Действие над объектом страницы.
+        :param page_factory: Функция, создающая страницу; по умолчанию - стандартная страница.
+        :param is_deterministic: Флаг независимости количества команд от времени выполнения
+        (сценарии с появлением элементов по расписанию сравниваются с допуском).
+        :param has_element_cache: Флаг включения кэша элементов в объекте страницы.
+        :param expected_error: Исключение, которым должно завершиться действие.
+        :param has_devtools_channel: Флаг отправки команд DevTools протокола через канал DevToolsChannel
+        поверх FakeDevToolsConnection вместо HTTP.
+        """
+        self.name = name
+        self.action = action
+        self.page_factory = page_factory or standard_page
+        self.is_deterministic = is_deterministic
+        self.has_element_cache = has_element_cache
+        self.expected_error = expected_error
+        self.has_devtools_channel = has_devtools_channel
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} ({self.name})>'
+
+
+BUTTON = Locator('css selector', '#button', 'Кнопка')
+FIELD = Locator('css selector', '#field', 'Поле ввода')
+ROWS = Locator('css selector', '.row', 'Строки таблицы')
+ROW = Locator('css selector', '.row[data-id={row_id}]', 'Строка таблицы')
+HEADER = Locator('css selector', '#header', 'Заголовок')
+HIDDEN = Locator('css selector', '#hidden', 'Скрытый элемент')
+ABSENT = Locator('css selector', '#absent', 'Отсутствующий элемент')
+FRAME = Locator('css selector', '#frame', 'Фрейм')
+STALE = Locator('css selector', '#stale', 'Перерисовываемый элемент')
+DELAYED = Locator('css selector', '#delayed', 'Элемент, появляющийся с задержкой')
+STATUS = Locator('css selector', '#status', 'Статус')
+SPINNER = Locator('css selector', '#spinner', 'Индикатор загрузки')
+
+# Время, через которое меняются элементы в сценариях ожидания
+CHANGE_DELAY = 0.3
+
+# Количество строк таблицы на стандартной странице
+ROWS_NUMBER = 50
+
+# Время тишины сети в сценариях ожидания по событиям DevTools протокола (без событий ожидание длится ровно столько)
+NETWORK_IDLE_TIME = 0.05
+
+# Количество команд в сценариях последовательной и пакетной отправки команд DevTools протокола
+DEVTOOLS_COMMANDS_NUMBER = 10
+
+
+def standard_page() -> FakePage:
+    """
+    Создаёт стандартную страницу: кнопка, поле ввода, таблица, скрытый элемент, фрейм.
+
+    :return: FakePage
+    """
+    return FakePage(
+        {
+            BUTTON.selector: [FakeElement('Сохранить', {'class': 'btn btn-primary', 'data-state': 'ready'})],
+            FIELD.selector: [FakeElement(attributes={'value': 'начальное значение', 'name': 'field'})],
+            ROWS.selector: [
+                FakeElement(f'Строка {index}', {'data-id': str(index)}) for index in range(ROWS_NUMBER)
+            ],
+            HEADER.selector: [FakeElement('Заголовок')],
+            HIDDEN.selector: [FakeElement('Скрыт', is_displayed=False)],
+            FRAME.selector: [FakeElement()],
+        },
+        title='Страница замеров',
+        alert_text='Подтвердите действие'
+    )
+
+
+def stale_page() -> FakePage:
+    """
+    Создаёт страницу, где первая ссылка на элемент устаревает (элемент перерисован).
+
+    :return: FakePage
+    """
+    page = standard_page()
+    page.elements[STALE.selector] = [FakeElement('Перерисован', stale_reads=1)]
+    return page
+
+
+def delayed_page() -> FakePage:
+    """
+    Создаёт страницу с элементами, которые появляются, меняются или пропадают через CHANGE_DELAY секунд.
+
+    :return: FakePage
+    """
+    page = standard_page()
+    page.elements[DELAYED.selector] = [FakeElement('Появился', appear_after=CHANGE_DELAY)]
+    page.elements[STATUS.selector] = [
+        FakeElement('Загрузка', {'data-state': 'loading', 'value': 'старое'}).update_after(
+            CHANGE_DELAY, text='Готово', **{'data-state': 'ready', 'value': 'новое'}
+        )
+    ]
+    page.elements[SPINNER.selector] = [FakeElement('Загрузка', disappear_after=CHANGE_DELAY)]
+    return page
+
+
+def _replace_keys(page_object: BenchmarkPage) -> None:
+    for index in range(1000):
+        ROW.replace_keys(row_id=str(index))
+        ROW.replace_keys(has_streaks=True, row_id=str(index))
+
+
+def _repeated_find(page_object: BenchmarkPage) -> None:
+    for _ in range(10):
+        page_object.find_element(BUTTON)
+
+
+def _devtools_commands(page_object: BenchmarkPage) -> None:
+    for _ in range(DEVTOOLS_COMMANDS_NUMBER):
+        page_object.send_by_devtools_protocol('Network.enable')
+
+
+def _devtools_batch(page_object: BenchmarkPage) -> None:
+    page_object.send_batch_by_devtools_protocol([('Network.enable', None)] * DEVTOOLS_COMMANDS_NUMBER)
+
+
+def _throttled_refresh(page_object: BenchmarkPage) -> None:
+    with page_object.throttling('slow-4g'):
+        page_object.emulator_refresh()
+
+
+def _blocked_refresh(page_object: BenchmarkPage) -> None:
+    with page_object.blocking_requests('analytics', 'images'):
+        page_object.emulator_refresh()
+
+
+def _captured_find(page_object: BenchmarkPage) -> None:
+    page_object.start_network_capture()
+    page_object.find_element(BUTTON)
+    page_object.stop_network_capture()
+
+
+def _switch_frames(page_object: BenchmarkPage) -> None:
+    page_object.switch_to_iframe(FRAME)
+    page_object.switch_to_default_page()
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario('Locator.replace_keys', _replace_keys),
+    Scenario('emulator_refresh', lambda page: page.emulator_refresh()),
+    Scenario('find_element_return_bool', lambda page: page.find_element_return_bool(BUTTON)),
+    Scenario('probe_element', lambda page: page.probe_element(ABSENT)),
+    Scenario('find_element', lambda page: page.find_element(BUTTON)),
+    Scenario('find_element[stale]', lambda page: page.get_text_from_element(STALE), stale_page),
+    Scenario('find_element[delayed]', lambda page: page.find_element(DELAYED), delayed_page, is_deterministic=False),
+    Scenario('find_element[cache]', _repeated_find, has_element_cache=True),
+    Scenario('find_element[no cache]', _repeated_find),
+    Scenario('find_elements', lambda page: page.find_elements(ROWS)),
+    Scenario('make_screenshot', lambda page: page.make_screenshot()),
+    Scenario('make_screenshot[element]', lambda page: page.make_screenshot(BUTTON)),
+    Scenario('screenshot_and_raise_error', lambda page: page.screenshot_and_raise_error('Ошибка'),
+             expected_error=AssertionError),
+    Scenario('check_element_visibility', lambda page: page.check_element_visibility(BUTTON)),
+    Scenario('check_element_invisibility', lambda page: page.check_element_invisibility(HIDDEN)),
+    Scenario('check_element_invisibility[delayed]', lambda page: page.check_element_invisibility(SPINNER),
+             delayed_page, is_deterministic=False),
+    Scenario('check_element_clickability', lambda page: page.check_element_clickability(BUTTON)),
+    Scenario('click_element_by_webdriver', lambda page: page.click_element_by_webdriver(BUTTON)),
+    Scenario('click_element_by_action_chance', lambda page: page.click_element_by_action_chance(BUTTON)),
+    Scenario('click_element_by_action_chance_with_move',
+             lambda page: page.click_element_by_action_chance_with_move(BUTTON)),
+    Scenario('click_element_by_javascript', lambda page: page.click_element_by_javascript(BUTTON)),
+    Scenario('get_value_from_element', lambda page: page.get_value_from_element(FIELD)),
+    Scenario('get_text_from_element', lambda page: page.get_text_from_element(BUTTON)),
+    Scenario('get_text_from_elements_with_different_locators',
+             lambda page: page.get_text_from_elements_with_different_locators((BUTTON, HEADER))),  # type: ignore
+    Scenario('query_many', lambda page: page.query_many((BUTTON, HEADER, ROWS))),
+    Scenario('get_texts_from_elements_with_identical_locators',
+             lambda page: page.get_texts_from_elements_with_identical_locators(ROWS)),
+    Scenario('get_texts_from_elements_with_identical_locators[batched]',
+             lambda page: page.get_texts_from_elements_with_identical_locators(ROWS, is_batched=True)),
+    Scenario('wait_for_elements_text_correspond_to_given_set',
+             lambda page: page.wait_for_elements_text_correspond_to_given_set(
+                 ROWS, tuple(f'Строка {index}' for index in range(ROWS_NUMBER)), is_batched=False
+             )),
+    Scenario('wait_for_elements_text_correspond_to_given_set[batched]',
+             lambda page: page.wait_for_elements_text_correspond_to_given_set(
+                 ROWS, tuple(f'Строка {index}' for index in range(ROWS_NUMBER))
+             )),
+    Scenario('wait_for_change_text', lambda page: page.wait_for_change_text(STATUS, 'Готово'),
+             delayed_page, is_deterministic=False),
+    Scenario('wait_for_change_text[event driven]',
+             lambda page: page.wait_for_change_text(STATUS, 'Готово', is_event_driven=True), delayed_page),
+    Scenario('wait_for_change_value', lambda page: page.wait_for_change_value(STATUS, 'новое'),
+             delayed_page, is_deterministic=False),
+    Scenario('wait_for_change_value[event driven]',
+             lambda page: page.wait_for_change_value(STATUS, 'новое', is_event_driven=True), delayed_page),
+    Scenario('fill_text', lambda page: page.fill_text(FIELD, 'новый текст')),
+    Scenario('check_title', lambda page: page.check_title('Страница замеров')),
+    Scenario('get_attribute', lambda page: page.get_attribute(BUTTON, 'class')),
+    Scenario('get_attributes_from_elements', lambda page: page.get_attributes_from_elements(ROWS, ['data-id'])),
+    Scenario('get_attribute_from_elements_with_identical_locators',
+             lambda page: page.get_attribute_from_elements_with_identical_locators(ROWS, 'data-id')),
+    Scenario('find_value_in_attribut', lambda page: page.find_value_in_attribut(BUTTON, 'class', 'btn')),
+    Scenario('attributes_compare', lambda page: page.attributes_compare(BUTTON, 'data-state', 'ready')),
+    Scenario('count_of_elements', lambda page: page.count_of_elements(ROWS)),
+    Scenario('check_element_presence_in_dom', lambda page: page.check_element_presence_in_dom(BUTTON)),
+    Scenario('check_element_not_presence_in_dom', lambda page: page.check_element_not_presence_in_dom(ABSENT)),
+    Scenario('check_element_not_presence_in_dom[delayed]',
+             lambda page: page.check_element_not_presence_in_dom(SPINNER), delayed_page, is_deterministic=False),
+    Scenario('check_element_not_presence_in_dom[event driven]',
+             lambda page: page.check_element_not_presence_in_dom(SPINNER, is_event_driven=True), delayed_page),
+    Scenario('scroll_web_element_to_page_up', lambda page: page.scroll_web_element_to_page_up(BUTTON)),
+    Scenario('scroll_to_element_by_javascript', lambda page: page.scroll_to_element_by_javascript(BUTTON)),
+    Scenario('send_by_devtools_protocol', lambda page: page.send_by_devtools_protocol('Network.enable')),
+    Scenario('send_by_devtools_protocol[channel]', lambda page: page.send_by_devtools_protocol('Network.enable'),
+             has_devtools_channel=True),
+    Scenario('send_by_devtools_protocol x10', _devtools_commands),
+    Scenario('send_by_devtools_protocol x10[channel]', _devtools_commands, has_devtools_channel=True),
+    Scenario('send_batch_by_devtools_protocol x10', _devtools_batch),
+    Scenario('send_batch_by_devtools_protocol x10[channel]', _devtools_batch, has_devtools_channel=True),
+    Scenario('wait_for_network_idle', lambda page: page.wait_for_network_idle()),
+    Scenario('wait_for_network_idle[channel]', lambda page: page.wait_for_network_idle(NETWORK_IDLE_TIME),
+             has_devtools_channel=True),
+    Scenario('wait_for_page_stable', lambda page: page.wait_for_page_stable()),
+    Scenario('collect_page_performance', lambda page: page.collect_page_performance('benchmark')),
+    Scenario('check_performance_budget',
+             lambda page: page.check_performance_budget({'load': 1000, 'total_blocking_time': 100}, 'benchmark')),
+    Scenario('throttling', _throttled_refresh),
+    Scenario('blocking_requests', _blocked_refresh),
+    Scenario('blocking_requests[channel]', _blocked_refresh, has_devtools_channel=True),
+    Scenario('start_network_capture[channel]', _captured_find, has_devtools_channel=True),
+    Scenario('turn_off_internet', lambda page: page.turn_off_internet()),
+    Scenario('turn_off_internet[channel]', lambda page: page.turn_off_internet(), has_devtools_channel=True),
+    Scenario('turn_on_internet', lambda page: page.turn_on_internet()),
+    Scenario('clear_cash_and_logs', lambda page: page.clear_cash_and_logs()),
+    Scenario('clear_cash_and_logs[channel]', lambda page: page.clear_cash_and_logs(), has_devtools_channel=True),
+    Scenario('click_ok_alert', lambda page: page.click_ok_alert()),
+    Scenario('check_without_timeout_and_click', lambda page: page.check_without_timeout_and_click(BUTTON, HEADER)),
+    Scenario('sleep_until_update_attribute',
+             lambda page: page.sleep_until_update_attribute(STATUS, 'data-state', 'ready'),
+             delayed_page, is_deterministic=False),
+    Scenario('sleep_until_update_attribute[event driven]',
+             lambda page: page.sleep_until_update_attribute(STATUS, 'data-state', 'ready', is_event_driven=True),
+             delayed_page),
+    Scenario('compare_counts_of_two_locators', lambda page: page.compare_counts_of_two_locators(BUTTON, HEADER)),
+    Scenario('compare_counts_of_different_locators',
+             lambda page: page.compare_counts_of_different_locators((BUTTON, HEADER, FIELD))),
+    Scenario('compare_two_numbers', lambda page: page.compare_two_numbers(ROWS_NUMBER, ROWS_NUMBER)),
+    Scenario('switch_to_iframe/switch_to_default_page', _switch_frames),
+    Scenario('CustomWebDriverWait.until[delayed]',
+             lambda page: CustomWebDriverWait(page, 2).until(lambda driver: driver.find_elements(*DELAYED())),
+             delayed_page, is_deterministic=False),
+    Scenario('CustomWebDriverWait.until_not[delayed]',
+             lambda page: CustomWebDriverWait(page, 2).until_not(lambda driver: driver.find_elements(*SPINNER())),
+             delayed_page, is_deterministic=False),
+]
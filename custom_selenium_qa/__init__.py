@@ -1,13 +1,141 @@
+from .actions_core import ActionsCore
+
+from .async_base_actions import AsyncBaseActions
+
+from .async_webdriver import AiohttpTransport
+from .async_webdriver import AsyncTransport
+from .async_webdriver import AsyncWebDriver
+from .async_webdriver import AsyncWebElement
+
+from .async_webdriver_wait import AsyncWebDriverWait
+
+from .auth_snapshot import AuthSnapshot
+from .auth_snapshot import AuthSnapshotCache
+from .auth_snapshot import capture_auth_snapshot
+from .auth_snapshot import restore_auth_snapshot
+
 from .base_actions import BaseActions
 
+from .base_settings import AUTH_SNAPSHOTS_DIRECTORY
+from .base_settings import AUTH_SNAPSHOTS_TTL
+from .base_settings import DEVTOOLS_CHANNEL_TIMEOUT
 from .base_settings import EXPLICITLY_TIMEOUT
 from .base_settings import IGNORED_EXCEPTIONS
+from .base_settings import METRICS_DIRECTORY
+from .base_settings import NETWORK_CAPTURE_BUFFER_SIZE
+from .base_settings import NETWORK_CAPTURE_STEP_BUDGET
+from .base_settings import NETWORK_IDLE_IGNORED_RESOURCE_TYPES
+from .base_settings import NETWORK_IDLE_IGNORED_URLS
+from .base_settings import NETWORK_IDLE_POLL_INTERVAL
+from .base_settings import NETWORK_IDLE_TIME
+from .base_settings import PERFORMANCE_DIRECTORY
+from .base_settings import PERFORMANCE_RUN_ID_VARIABLE
+from .base_settings import POLL_BACKOFF_FACTOR
 from .base_settings import POLL_FREQUENCY
+from .base_settings import POLL_INITIAL_DELAY
+from .base_settings import POLL_JITTER
+from .base_settings import POLL_MAX_DELAY
+from .base_settings import QUERY_FIELDS
+from .base_settings import REQUEST_BLOCKING_KNOWN_SIZES_LIMIT
+from .base_settings import SCREENSHOTS_DEDUPLICATION
 from .base_settings import SCREENSHOTS_DIRECTORY
 from .base_settings import SCREENSHOTS_EXTENSION
+from .base_settings import SCREENSHOTS_MAX_IN_FLIGHT_BYTES
+from .base_settings import SCREENSHOTS_PER_TEST_LIMIT
+from .base_settings import SCREENSHOTS_SCALE
+from .base_settings import SCRIPT_TIMEOUT_MARGIN
+from .base_settings import SESSION_POOL_ACQUIRE_TIMEOUT
+from .base_settings import SESSION_POOL_MAX_HEAP_GROWTH
+from .base_settings import SESSION_POOL_MAX_USES
+from .base_settings import SESSION_POOL_SIZE
+from .base_settings import SESSION_RESET_URL
+from .base_settings import STEPS_FLUSH_POLICY
+from .base_settings import STEPS_VERBOSITY
+from .base_settings import TRACES_DIRECTORY
+
+from .blocking import BLOCKING_PRESETS
+from .blocking import BLOCK_ANALYTICS
+from .blocking import BLOCK_FONTS
+from .blocking import BLOCK_IMAGES
+from .blocking import BLOCK_MEDIA
+from .blocking import BlockingRule
+from .blocking import NO_BLOCKING
+from .blocking import RequestBlocker
+from .blocking import RequestBlockingStats
+from .blocking import apply_request_blocking
+from .blocking import get_request_blocker
+from .blocking import resolve_blocking_rule
 
 from .custom_webdriver_wait import CustomWebDriverWait
 
+from .deadline import Deadline
+
+from .devtools import is_devtools_available
+from .devtools import send_devtools_command
+from .devtools import send_devtools_commands
+
+from .devtools_channel import DevToolsChannel
+from .devtools_channel import DevToolsConnection
+from .devtools_channel import DevToolsProtocolError
+from .devtools_channel import WebSocketConnection
+from .devtools_channel import get_devtools_channel
+from .devtools_channel import get_devtools_url
+
+from .element_cache import ElementCache
+
+from .fan_out import FanOutError
+from .fan_out import FanOutExecutor
+from .fan_out import SessionResult
+
+from .instrumentation import ActionListener
+from .instrumentation import MetricsCollector
+
 from .locator import Locator
 
+from .network_idle import NetworkActivityTracker
+
+from .network_recorder import NetworkRecorder
+
+from .performance import PerformanceReport
+from .performance import collect_page_performance
+from .performance import find_budget_violations
+from .performance import summarize_performance_report
+
+from .polling import BackoffPolling
+from .polling import FixedPolling
+from .polling import PollingStrategy
+
+from .screenshots import ScreenshotPolicy
+from .screenshots import ScreenshotWriter
+from .screenshots import get_default_screenshot_writer
+from .screenshots import get_screenshot_policy
+from .screenshots import release_screenshot_policy
+
+from .session_pool import SessionPool
+from .session_pool import get_heap_size
+from .session_pool import reset_browser_state
+
+from .session_recording import ReplayCommandExecutor
+from .session_recording import ReplayMismatchError
+from .session_recording import SessionRecorder
+from .session_recording import create_replay_driver
+
+from .step_reporter import StepReporter
+from .step_reporter import get_step_reporter
+
+from .throttling import FAST_3G
+from .throttling import HIGH_LATENCY_VPN
+from .throttling import NO_THROTTLING
+from .throttling import OFFLINE
+from .throttling import SLOW_3G
+from .throttling import SLOW_4G
+from .throttling import THROTTLING_PROFILES
+from .throttling import ThrottlingProfile
+from .throttling import apply_throttling_profile
+from .throttling import get_throttling_profile
+from .throttling import resolve_throttling_profile
+
+from .trace_recorder import TraceRecorder
+
+from .utils import async_sleep_poll_frequency
 from .utils import sleep_poll_frequency
@@ -0,0 +1,395 @@
+from contextlib import contextmanager
+from os.path import abspath
+from os.path import join
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import Generic
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from .base_settings import EXPLICITLY_TIMEOUT
+from .base_settings import IGNORED_EXCEPTIONS
+from .base_settings import SCREENSHOTS_DIRECTORY
+from .base_settings import SCREENSHOTS_EXTENSION
+from .base_settings import STEPS_FLUSH_POLICY
+from .base_settings import STEPS_VERBOSITY
+from .deadline import Deadline
+from .element_cache import ElementCache
+from .instrumentation import ActionListener
+from .locator import Locator
+from .polling import BackoffPolling
+from .polling import PollingStrategy
+from .screenshots import ScreenshotPolicy
+from .screenshots import ScreenshotWriter
+from .screenshots import get_default_screenshot_writer
+from .screenshots import get_screenshot_policy
+from .screenshots import release_screenshot_policy
+from .step_reporter import StepDescription
+from .step_reporter import StepReporter
+from .step_reporter import format_description
+from .step_reporter import get_step_reporter
+
+# Тип вебдрайвера объекта страницы: webdriver Selenium или AsyncWebDriver
+E = TypeVar('E')
+
+
+def is_text_matched(expected: str, current: str, is_strong_coincidence: bool) -> bool:
+    """
+    Сравнивает текст или значение элемента с ожидаемым.
+
+    :param expected: Ожидаемый текст.
+    :param current: Текущий текст элемента.
+    :param is_strong_coincidence: Флаг строгого совпадения; иначе ожидаемый текст ищется как подстрока.
+    :return: True, если текст совпадает.
+    """
+    return expected == current if is_strong_coincidence else expected in current
+
+
+def describe_locators(locators: Sequence[Locator]) -> str:
+    """
+    Возвращает описание нескольких локаторов для шага TestIT или сообщения об ошибке.
+
+    :param locators: Последовательность локаторов.
+    :return: Описания локаторов через точку с запятой.
+    """
+    return '; '.join(locator.description for locator in locators)
+
+
+def get_query_fields(fields: Sequence[str], wait_for: Optional[str]) -> List[str]:
+    """
+    Возвращает поля, запрашиваемые скриптом QUERY_MANY_SCRIPT: запрошенные и поле ожидания.
+
+    :param fields: Запрошенные поля.
+    :param wait_for: Поле ожидания или None.
+    :return: Список полей.
+    """
+    return list(fields) if wait_for is None else list({*fields, wait_for})
+
+
+def describe_unsatisfied_locators(
+        locators: Sequence[Locator],
+        results: Sequence[Dict[str, Any]],
+        wait_for: Optional[str]
+) -> str:
+    """
+    Возвращает сообщение о локаторах, не удовлетворивших условию ожидания query_many.
+
+    :param locators: Последовательность локаторов.
+    :param results: Последние результаты QUERY_MANY_SCRIPT в порядке локаторов.
+    :param wait_for: Поле ожидания.
+    :return: Сообщение об ошибке.
+    """
+    return f'Элементы не удовлетворяют условию {wait_for}: ' + describe_locators([
+        locator for locator, result in zip(locators, results) if wait_for is not None and not result[wait_for]
+    ])
+
+
+def describe_idle_state(result: Optional[Dict[str, Any]]) -> str:
+    """
+    Возвращает сообщение о нестабильной странице по последнему результату WAIT_FOR_PAGE_IDLE_SCRIPT.
+
+    :param result: Результат скрипта или None, если скрипт не завершился ни разу.
+    :return: Сообщение об ошибке.
+    """
+    state = (
+        f'readyState {result["readyState"]}, незавершённых запросов {result["pending"]}, '
+        f'jQuery.active {result["jqueryActive"]}'
+    ) if result else 'скрипт ожидания прерывался переходами'
+    return f'Страница не пришла в стабильное состояние за отведённое время: {state}.'
+
+
+class ActionsCore(Generic[E]):
+    """
+    Общая часть BaseActions и AsyncBaseActions, не выполняющая команд WebDriver: состояние объекта страницы,
+    шаги TestIT и крайние сроки действий, слушатели, повторные попытки, классификация ошибок и имена скриншотов.
+    Наследники добавляют только обращения к вебдрайверу - вызовы или корутины.
+    """
+
+    _IS_ABSTRACT_CLASS = True
+    # Стратегия опроса для ожиданий CustomWebDriverWait и AsyncWebDriverWait
+    POLLING_STRATEGY: PollingStrategy = BackoffPolling()
+    # Фоновый писатель скриншотов
+    SCREENSHOT_WRITER: ScreenshotWriter = get_default_screenshot_writer()
+    # Подробность шагов TestIT: all - все шаги, top - только внешние шаги действий, none - без шагов
+    STEPS_VERBOSITY = STEPS_VERBOSITY
+    # Момент передачи накопленных шагов в TestIT: action - по завершении внешнего шага, test - в finish_test
+    STEPS_FLUSH_POLICY = STEPS_FLUSH_POLICY
+
+    def __init__(
+            self,
+            emulator: E,
+            test_method_name: str,
+            has_element_cache: bool = False,
+            screenshots_directory: str = SCREENSHOTS_DIRECTORY,
+            step_reporter: Optional[StepReporter] = None,
+            screenshot_policy: Optional[ScreenshotPolicy] = None
+    ):
+        """
+        :param emulator: Объект вебдрайвера.
+        :param test_method_name: Имя тестового метода (используется в имени скриншота).
+        :param has_element_cache: Флаг кэширования найденных элементов по локатору.
+        :param screenshots_directory: Директория скриншотов сессии (относительный путь - от текущей директории
+        на момент создания объекта).
+        :param step_reporter: Буфер шагов TestIT; None - общий буфер потока.
+        :param screenshot_policy: Политика скриншотов теста; None - общая политика объектов страниц теста
+        с тем же test_method_name.
+        """
+        if self._IS_ABSTRACT_CLASS:
+            raise NotImplementedError(
+                'Невозможно создать экземпляр абстрактного базового класса'
+            )
+        else:
+            self._emulator = emulator
+            self._test_method_name = test_method_name
+            self._deadline: Optional[Deadline] = None
+            self._element_cache: Optional[ElementCache] = ElementCache() if has_element_cache else None
+            self._screenshot_policy = screenshot_policy or get_screenshot_policy(test_method_name)
+            self._screenshots_directory = abspath(screenshots_directory)
+            self._step_reporter = step_reporter
+            self._listeners: List[ActionListener] = []
+
+    @property
+    def emulator(self) -> E:
+        """
+        Возвращает объект вебдрайвера.
+
+        :return: webdriver
+        """
+        return self._emulator
+
+    @property
+    def element_cache(self) -> Optional[ElementCache]:
+        """
+        Возвращает кэш элементов сессии (со счётчиками попаданий и промахов).
+
+        :return: ElementCache или None, если кэш отключен.
+        """
+        return self._element_cache
+
+    @property
+    def listeners(self) -> Tuple[ActionListener, ...]:
+        """
+        Возвращает подписанных слушателей событий.
+
+        :return: Кортеж слушателей.
+        """
+        return tuple(self._listeners)
+
+    def add_listener(self, listener: ActionListener) -> None:
+        """
+        Подписывает слушателя на шаги действий, повторные попытки, ожидания и команды WebDriver сессии.
+        Без слушателей инструментирование не выполняется.
+
+        :param listener: Слушатель, например MetricsCollector.
+        :return: None
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+        self._attach_command_listener(listener)
+
+    def remove_listener(self, listener: ActionListener) -> None:
+        """
+        Отписывает слушателя.
+
+        :param listener: Слушатель.
+        :return: None
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+        self._detach_command_listener(listener)
+
+    def _attach_command_listener(self, listener: ActionListener) -> None:
+        """
+        Подписывает слушателя на команды WebDriver сессии.
+
+        :param listener: Слушатель.
+        :return: None
+        """
+        raise NotImplementedError
+
+    def _detach_command_listener(self, listener: ActionListener) -> None:
+        """
+        Отписывает слушателя от команд WebDriver сессии.
+
+        :param listener: Слушатель.
+        :return: None
+        """
+        raise NotImplementedError
+
+    def _notify_test_finished(self) -> None:
+        """
+        Передаёт слушателям событие окончания теста (например, MetricsCollector записывает JSON-сводку).
+
+        :return: None
+        """
+        for listener in self._listeners:
+            listener.on_test_finished(self._test_method_name)
+
+    def _release_screenshot_policy(self) -> None:
+        """
+        Сбрасывает политику скриншотов по окончании теста (см. release_screenshot_policy).
+
+        :return: None
+        """
+        release_screenshot_policy(self._test_method_name, self._screenshot_policy)
+
+    @property
+    def step_reporter(self) -> StepReporter:
+        """
+        Возвращает буфер шагов TestIT сессии, а если он не задан - общий буфер потока.
+
+        :return: StepReporter
+        """
+        return self._step_reporter or get_step_reporter()
+
+    @step_reporter.setter
+    def step_reporter(self, step_reporter: Optional[StepReporter]) -> None:
+        self._step_reporter = step_reporter
+
+    def flush_steps(self) -> None:
+        """
+        Передаёт накопленные в буфере шаги в TestIT.
+
+        :return: None
+        """
+        self.step_reporter.flush()
+
+    @property
+    def deadline(self) -> Optional[Deadline]:
+        """
+        Возвращает крайний срок выполняемого публичного действия.
+
+        :return: Deadline или None, если действие не выполняется.
+        """
+        return self._deadline
+
+    @contextmanager
+    def _step_scope(
+            self,
+            title: str,
+            description: StepDescription = None,
+            timeout: float = EXPLICITLY_TIMEOUT
+    ) -> Iterator[None]:
+        """
+        Открывает шаг TestIT и крайний срок действия, сообщает слушателям о начале и окончании шага.
+        Вложенные шаги используют крайний срок внешнего действия и не могут его продлить,
+        поэтому все ожидания и повторные попытки одного действия укладываются в timeout.
+        Шаг записывается в буфер step_reporter и передаётся в TestIT согласно STEPS_VERBOSITY и STEPS_FLUSH_POLICY.
+
+        :param title: Заголовок шага TestIT.
+        :param description: Описание шага TestIT: строка или функция, вычисляемая только при передаче шага.
+        :param timeout: Количество секунд на выполнение действия.
+        :return: None
+        """
+        parent_deadline = self._deadline
+        self._deadline = Deadline(timeout, parent_deadline)
+        reporter = self.step_reporter
+        reporter.open(title, description, self.STEPS_VERBOSITY)
+        listeners = tuple(self._listeners)
+        description_text = format_description(description) if listeners else None
+        started = perf_counter()
+        for listener in listeners:
+            listener.on_action_start(title, description_text, started)
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            reporter.close(error is not None)
+            self._deadline = parent_deadline
+            if listeners:
+                duration = perf_counter() - started
+                for listener in listeners:
+                    listener.on_action_end(title, description_text, started, duration, error)
+            if self.STEPS_FLUSH_POLICY == 'action':
+                reporter.flush()
+
+    def _attempts(self) -> Iterator[int]:
+        """
+        Генератор номеров попыток в пределах крайнего срока текущего действия.
+        Первая попытка выполняется всегда, даже если срок уже истёк.
+
+        :return: Номер попытки.
+        """
+        deadline = self._deadline or Deadline(EXPLICITLY_TIMEOUT)
+        attempt = 0
+        while True:
+            yield attempt
+            attempt += 1
+            if deadline.is_expired():
+                return
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """
+        Классифицирует ошибку попытки: сбрасывает кэш элементов при устаревшем элементе и сообщает слушателям
+        о повторной попытке, если ошибка входит в IGNORED_EXCEPTIONS.
+
+        :param error: Поднятая ошибка.
+        :return: True, если попытку нужно повторить, False - если ошибка необрабатываемая.
+        """
+        if isinstance(error, StaleElementReferenceException) and self._element_cache is not None:
+            self._element_cache.invalidate()
+        if isinstance(error, IGNORED_EXCEPTIONS):
+            for listener in self._listeners:
+                listener.on_retry(error)
+            return True
+        return False
+
+    @property
+    def screenshots_directory(self) -> str:
+        """
+        Возвращает абсолютный путь к директории скриншотов сессии.
+
+        :return: Путь к директории.
+        """
+        return self._screenshots_directory
+
+    @screenshots_directory.setter
+    def screenshots_directory(self, directory: str) -> None:
+        self._screenshots_directory = abspath(directory)
+
+    @property
+    def screenshot_policy(self) -> ScreenshotPolicy:
+        """
+        Возвращает политику снятия скриншотов теста (лимит, пропуск повторов, счётчики).
+
+        :return: ScreenshotPolicy
+        """
+        return self._screenshot_policy
+
+    @screenshot_policy.setter
+    def screenshot_policy(self, screenshot_policy: ScreenshotPolicy) -> None:
+        self._screenshot_policy = screenshot_policy
+
+    def _screenshot_fingerprint(self, fingerprint: str, locator: Optional[Locator] = None) -> str:
+        """
+        Возвращает отпечаток скриншота: отпечаток страницы, а для скриншота элемента - вместе с селектором.
+
+        :param fingerprint: Отпечаток страницы.
+        :param locator: Локатор элемента, если снимается скриншот элемента.
+        :return: Отпечаток скриншота.
+        """
+        return fingerprint if locator is None else f'{locator.selector}|{fingerprint}'
+
+    def _register_screenshot(self, fingerprint: Optional[str]) -> str:
+        """
+        Учитывает снятый скриншот в политике теста и возвращает путь к его файлу.
+
+        :param fingerprint: Отпечаток скриншота.
+        :return: Абсолютный путь к файлу скриншота.
+        """
+        file_name = ScreenshotPolicy.file_name(
+            self._test_method_name,
+            self._screenshot_policy.register(fingerprint),
+            SCREENSHOTS_EXTENSION
+        )
+        return join(self._screenshots_directory, file_name)
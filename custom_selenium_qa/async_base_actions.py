@@ -0,0 +1,1444 @@
+from asyncio import get_running_loop
+from contextlib import asynccontextmanager
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NoReturn
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import NoAlertPresentException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+
+from .actions_core import ActionsCore
+from .actions_core import describe_idle_state
+from .actions_core import describe_locators
+from .actions_core import describe_unsatisfied_locators
+from .actions_core import get_query_fields
+from .actions_core import is_text_matched
+from .async_webdriver import AsyncWebDriver
+from .async_webdriver import AsyncWebElement
+from .async_webdriver_wait import AsyncWebDriverWait
+from .base_settings import EXPLICITLY_TIMEOUT
+from .base_settings import IGNORED_EXCEPTIONS
+from .base_settings import NETWORK_IDLE_POLL_INTERVAL
+from .base_settings import NETWORK_IDLE_TIME
+from .base_settings import POLL_FREQUENCY
+from .base_settings import QUERY_FIELDS
+from .base_settings import SCREENSHOTS_DIRECTORY
+from .base_settings import SCRIPT_TIMEOUT_MARGIN
+from .deadline import Deadline
+from .instrumentation import ActionListener
+from .locator import Locator
+from .screenshots import ScreenshotPolicy
+from .scripts import GET_ATTRIBUTES_SCRIPT
+from .scripts import GET_TEXTS_SCRIPT
+from .scripts import PAGE_FINGERPRINT_SCRIPT
+from .scripts import QUERY_MANY_SCRIPT
+from .scripts import WAIT_FOR_CONDITION_SCRIPT
+from .scripts import WAIT_FOR_PAGE_IDLE_SCRIPT
+from .step_reporter import StepDescription
+from .step_reporter import StepReporter
+from .utils import async_sleep_poll_frequency
+
+# Длительность перемещения указателя в действиях W3C Actions, мс (как у ActionChains по умолчанию)
+POINTER_MOVE_DURATION = 250
+
+
+def _pointer_actions(*actions: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Возвращает источник ввода мыши для команды W3C Actions.
+
+    :param actions: Действия указателя.
+    :return: Список источников ввода.
+    """
+    return [{'type': 'pointer', 'id': 'mouse', 'parameters': {'pointerType': 'mouse'}, 'actions': list(actions)}]
+
+
+def _move_to(element: AsyncWebElement) -> Dict[str, Any]:
+    """
+    Возвращает действие перемещения указателя в центр элемента.
+
+    :param element: Элемент.
+    :return: Действие указателя.
+    """
+    return {'type': 'pointerMove', 'duration': POINTER_MOVE_DURATION, 'x': 0, 'y': 0, 'origin': element}
+
+
+class AsyncBaseActions(ActionsCore[AsyncWebDriver]):
+    """
+    Асинхронный аналог BaseActions на asyncio с теми же публичными методами (методы действий - корутины).
+    Команды отправляются через AsyncWebDriver, паузы ожиданий и повторных попыток не блокируют цикл событий,
+    поэтому один процесс может параллельно вести много удалённых сессий (например, Selenoid) через asyncio.gather.
+    Шаги TestIT накапливаются в собственном буфере объекта страницы, так как задачи одного потока выполняются
+    вперемешку; буфер передаётся в TestIT целиком, без переключения задач.
+    """
+
+    def __init__(
+            self,
+            emulator: AsyncWebDriver,
+            test_method_name: str,
+            has_element_cache: bool = False,
+            screenshots_directory: str = SCREENSHOTS_DIRECTORY,
+            screenshot_policy: Optional[ScreenshotPolicy] = None
+    ):
+        """
+        :param emulator: Асинхронная сессия вебдрайвера.
+        :param test_method_name: Имя тестового метода (используется в имени скриншота).
+        :param has_element_cache: Флаг кэширования найденных элементов по локатору.
+        :param screenshots_directory: Директория скриншотов сессии (относительный путь - от текущей директории
+        на момент создания объекта).
+        :param screenshot_policy: Политика скриншотов теста; None - общая политика объектов страниц теста
+        с тем же test_method_name.
+        """
+        super().__init__(
+            emulator,
+            test_method_name,
+            has_element_cache,
+            screenshots_directory,
+            StepReporter(),
+            screenshot_policy
+        )
+
+    def _attach_command_listener(self, listener: ActionListener) -> None:
+        if listener not in self._emulator.listeners:
+            self._emulator.listeners.append(listener)
+
+    def _detach_command_listener(self, listener: ActionListener) -> None:
+        if listener in self._emulator.listeners:
+            self._emulator.listeners.remove(listener)
+
+    async def finish_test(self) -> None:
+        """
+        Завершает тест: передаёт накопленные шаги в TestIT, дожидается записи скриншотов, сбрасывает политику
+        скриншотов теста и передаёт слушателям событие окончания теста.
+
+        :return: None
+        """
+        self.flush_steps()
+        await self.flush_screenshots()
+        self._release_screenshot_policy()
+        self._notify_test_finished()
+
+    @asynccontextmanager
+    async def _step(
+            self,
+            title: str,
+            description: StepDescription = None,
+            timeout: float = EXPLICITLY_TIMEOUT
+    ) -> AsyncIterator[None]:
+        """
+        Открывает шаг TestIT и крайний срок действия, сообщает слушателям о начале и окончании шага
+        (аналог BaseActions._step).
+
+        :param title: Заголовок шага TestIT.
+        :param description: Описание шага TestIT: строка или функция, вычисляемая только при передаче шага.
+        :param timeout: Количество секунд на выполнение действия.
+        :return: None
+        """
+        with self._step_scope(title, description, timeout):
+            yield
+
+    async def __errors_handler(
+            self,
+            error: Exception,
+            desc: str = 'Необрабатываемое исключение.'
+    ) -> None:
+        """
+        Обработчик ошибок.
+
+        :param error: Поднятая ошибка
+        :param desc: Описание ошибки если она не подходит под условия
+        :return:
+        """
+        if self._is_retryable(error):
+            await async_sleep_poll_frequency(self._deadline)
+        else:
+            await self.make_screenshot(is_error=True)
+            error.__traceback__ = None
+            raise AssertionError(desc)
+
+    async def screenshot_and_raise_error(self, desc: str) -> NoReturn:
+        """
+        Делает скриншот и поднимает ошибку с типом AssertionError и описанием из аргумента функции
+
+        :param desc: Описание ошибки
+        :return:
+        """
+        await self.make_screenshot(is_error=True)
+        raise AssertionError(desc)
+
+    async def emulator_refresh(self) -> None:
+        """
+        Перезагружает текущую страницу
+        """
+        await self._emulator.refresh()
+        if self._element_cache is not None:
+            self._element_cache.invalidate()
+
+    async def find_element_return_bool(self, locator: Locator, timeout: float = EXPLICITLY_TIMEOUT) -> bool:
+        """
+        Возвращает True/False в зависимости от наличия элемента.
+
+        :param locator: Locator - локатор элемента
+        :param timeout: Количество секунд на ожидание появления элемента, 0 - одна проверка без ожидания.
+        :return: Возвращает True/False в зависимости от наличия элемента
+        """
+        async with self._step('Проверка элемента на видимость (возвращение значения True/False)', locator.description,
+                              timeout=timeout):
+            return await self.probe_element(locator, timeout=timeout)
+
+    async def probe_element(self, locator: Locator, timeout: float = 0.0, is_visible: bool = False) -> bool:
+        """
+        Проверяет наличие (или видимость) элемента в пределах заданного времени без скриншота и ошибки,
+        если элемент не найден; необрабатываемое исключение - скриншот и AssertionError.
+
+        :param locator: Locator - локатор элемента
+        :param timeout: Количество секунд на ожидание, 0 - одна проверка без ожидания.
+        :param is_visible: Флаг проверки видимости элемента вместо наличия в DOM.
+        :return: True, если элемент найден (и видим), иначе False.
+        """
+        field = 'visible' if is_visible else 'present'
+        async with self._step('Быстрая проверка элемента (возвращение значения True/False)', locator.description,
+                              timeout=timeout):
+            for _ in self._attempts():
+                try:
+                    if (await self.query_many((locator,), fields=(field,), wait_for=None))[0][field]:
+                        return True
+                except Exception as exc:
+                    if not self._is_retryable(exc):
+                        await self.make_screenshot(is_error=True)
+                        exc.__traceback__ = None
+                        raise AssertionError(
+                            f'Невозможно проверить наличие элемента {locator.description}. Необрабатываемое исключение.'
+                        )
+                await async_sleep_poll_frequency(self._deadline)
+            return False
+
+    async def find_element(self, locator: Locator) -> AsyncWebElement:
+        """
+        Находит элемент по локатору.
+
+        :param locator: Локатор искомого элемента.
+        :return: Объект AsyncWebElement.
+        """
+        async with self._step('Поиск элемента по локатору', locator.description):
+            for _ in self._attempts():
+                try:
+                    return await self.__lookup_element(locator)
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно найти элемент {locator.description}. Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Невозможно найти элемент {locator.description}. Истекло количество попыток.'
+            )
+
+    async def __lookup_element(self, locator: Locator) -> AsyncWebElement:
+        """
+        Берёт элемент из кэша, а при его отсутствии находит одним запросом к WebDriver.
+
+        :param locator: Локатор искомого элемента.
+        :return: Объект AsyncWebElement.
+        """
+        if self._element_cache is None:
+            return await self._emulator.find_element(*locator())
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = await self._emulator.find_element(*locator())  # type: ignore
+            self._element_cache.put(locator, element)  # type: ignore
+        return element  # type: ignore
+
+    def __element_condition(
+            self,
+            locator: Locator,
+            predicate: Callable[[AsyncWebElement], Awaitable[bool]]
+    ) -> Callable[[Any], Awaitable[Union[AsyncWebElement, bool]]]:
+        """
+        Создаёт условие для AsyncWebDriverWait, проверяющее элемент с учётом кэша элементов.
+
+        :param locator: Локатор элемента.
+        :param predicate: Проверка найденного элемента.
+        :return: Условие, возвращающее элемент при выполнении проверки, иначе False.
+        """
+        async def condition(_) -> Union[AsyncWebElement, bool]:
+            element = await self.__lookup_element(locator)
+            try:
+                return element if await predicate(element) else False
+            except StaleElementReferenceException:
+                if self._element_cache is not None:
+                    self._element_cache.invalidate(locator)
+                raise
+        return condition
+
+    async def find_elements(self, locator: Locator) -> List[AsyncWebElement]:
+        """
+        Находит элементы с одинаковым локатором.
+        :param locator: Локатор искомого элемента.
+        :return: Список объектов AsyncWebElement.
+        """
+        async with self._step('Поиск элементов по локатору', locator.description):
+            for _ in self._attempts():
+                try:
+                    return await self._emulator.find_elements(*locator())
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно найти элементы {locator.description}. Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Невозможно найти элементы {locator.description}. Истекло количество попыток.'
+            )
+
+    async def make_screenshot(self, locator: Optional[Locator] = None, is_error: bool = False) -> None:
+        """
+        Создаёт скриншот страницы браузера или отдельного элемента (аналог BaseActions.make_screenshot).
+
+        :param locator: Локатор элемента для скриншота только этого элемента.
+        :param is_error: Флаг скриншота ошибки перед падением теста.
+        :return: None
+        """
+        if not self._screenshot_policy.has_capacity(is_error):
+            return None
+        fingerprint = await self.__page_fingerprint(locator)
+        if not self._screenshot_policy.is_changed(fingerprint, is_error):
+            return None
+        png = None
+        if locator is not None:
+            try:
+                png = await (await self.__lookup_element(locator)).screenshot_as_png()
+            except WebDriverException:
+                pass  # Элемент недоступен - снимаем страницу целиком
+        if png is None:
+            png = await self._emulator.get_screenshot_as_png()
+        # submit ждёт места в очереди при исчерпании лимита памяти - ожидание не должно блокировать цикл событий
+        await get_running_loop().run_in_executor(
+            None,
+            self.SCREENSHOT_WRITER.submit,
+            self._register_screenshot(fingerprint),
+            png
+        )
+
+    async def __page_fingerprint(self, locator: Optional[Locator] = None) -> Optional[str]:
+        """
+        Возвращает отпечаток состояния страницы для пропуска повторных скриншотов.
+
+        :param locator: Локатор элемента, если снимается скриншот элемента.
+        :return: Отпечаток страницы или None, если отпечаток не нужен или его не удалось получить.
+        """
+        if not self._screenshot_policy.is_deduplicated:
+            return None
+        try:
+            fingerprint = await self._emulator.execute_script(PAGE_FINGERPRINT_SCRIPT)
+        except WebDriverException:
+            return None
+        return self._screenshot_fingerprint(fingerprint, locator)
+
+    async def flush_screenshots(self) -> None:
+        """
+        Ждёт записи на диск всех снятых скриншотов, не блокируя цикл событий.
+
+        :return: None
+        """
+        await get_running_loop().run_in_executor(None, self.SCREENSHOT_WRITER.flush)
+
+    async def check_element_visibility(self, locator: Locator) -> None:
+        """
+        Проверяет присутствие элемента в DOM и его видимость.
+
+        :param locator: Locator
+        :return: None
+        """
+        async def is_displayed(element: AsyncWebElement) -> bool:
+            return await element.is_displayed()
+
+        async with self._step('Проверка присутствие элемента в DOM и его видимость', locator.description):
+            await AsyncWebDriverWait(
+                self,
+                EXPLICITLY_TIMEOUT
+            ).until(
+                self.__element_condition(locator, is_displayed),
+                f'Элемент {locator.description} не отображается.'
+            )
+
+    async def check_element_invisibility(self, locator: Locator, timeout: float = EXPLICITLY_TIMEOUT) -> None:
+        """
+        Проверяет невидимость элемента.
+        Проверка проходит при первом же наблюдении, в котором элемент скрыт или отсутствует в DOM.
+
+        :param locator: Locator
+        :param timeout: Количество секунд на ожидание невидимости элемента.
+        :return: None
+        """
+        async def is_invisible(driver: AsyncWebDriver) -> bool:
+            try:
+                return not await (await driver.find_element(*locator())).is_displayed()
+            except (NoSuchElementException, StaleElementReferenceException):
+                return True
+
+        async with self._step('Проверка на невидимость элемента', locator.description, timeout=timeout):
+            await AsyncWebDriverWait(
+                self,
+                timeout
+            ).until(
+                is_invisible,
+                f'Элемент {locator.description} отображается.'
+            )
+
+    async def check_element_clickability(self, locator: Locator) -> None:
+        """
+        Проверяет кликабельность элемента.
+
+        :param locator: Locator
+        :return: None
+        """
+        async def is_clickable(element: AsyncWebElement) -> bool:
+            return await element.is_displayed() and await element.is_enabled()
+
+        async with self._step('Проверка кликабельности элемента', locator.description):
+            await self.check_element_visibility(locator)
+            await AsyncWebDriverWait(
+                self,
+                EXPLICITLY_TIMEOUT
+            ).until(
+                self.__element_condition(locator, is_clickable),
+                f'Элемент {locator.description} не кликабельный.'
+            )
+
+    async def click_element_by_webdriver(self, locator: Locator, has_check_clickability=True) -> None:
+        """
+        Проверяет, что элемент видим, после чего нажимает на него.
+
+        :param locator: Locator.
+        :param has_check_clickability: Флаг доступности элемента для клика.
+        :return: None.
+        """
+        async with self._step('Нажатие на элемент при помощи Webdriver', locator.description):
+            if has_check_clickability:
+                await self.check_element_clickability(locator)
+            for _ in self._attempts():
+                try:
+                    await (await self.find_element(locator)).click()
+                    return None
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Элемент {locator.description} не кликабельный. Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Элемент {locator.description} не кликабельный. Истекло количество попыток.'
+            )
+
+    async def click_element_by_action_chance(self, locator: Locator) -> None:
+        """
+        Нажимает на элемент через W3C Actions (аналог ActionChains.click), предварительно перемещая курсор к нему.
+
+        :param locator: Locator селектор элемента
+        :return: None
+        """
+        async with self._step('Нажатие на элемент при помощи ActionChance', locator.description):
+            await self.check_element_visibility(locator)
+            element = await self.find_element(locator)
+            await self._emulator.perform_actions(_pointer_actions(
+                _move_to(element),
+                {'type': 'pointerDown', 'button': 0},
+                {'type': 'pointerUp', 'button': 0}
+            ))
+
+    async def click_element_by_action_chance_with_move(self, locator: Locator) -> None:
+        """
+        Нажимает на элемент через W3C Actions, предварительно перемещая курсор к нему.
+
+        :param locator: Locator селектор элемента
+        :return: None
+        """
+        async with self._step('Нажатие на элемент при помощи ActionChance', locator.description):
+            await self.check_element_visibility(locator)
+            element = await self.find_element(locator)
+            await self._emulator.perform_actions(_pointer_actions(
+                _move_to(element),
+                _move_to(element),
+                {'type': 'pointerDown', 'button': 0},
+                {'type': 'pointerUp', 'button': 0}
+            ))
+
+    async def click_element_by_javascript(self, locator: Locator) -> None:
+        """
+        Нажимает на элемент при помощи javascript скрипта.
+
+        :param locator: Locator селектор элемента
+        :return: None
+        """
+        async with self._step('Нажатие на элемент при помощи JavaScript', locator.description):
+            for _ in self._attempts():
+                try:
+                    await self._emulator.execute_script('arguments[0].click();', await self.find_element(locator))
+                    return None
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Элемент {locator.description} не кликабельный. Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Элемент {locator.description} не кликабельный. Истекло количество попыток.'
+            )
+
+    async def get_value_from_element(self, locator: Locator, has_check_visibility=True) -> str:
+        """
+        Находит элемент, и возвращает значение из него. Использовать для получения текста из текстовых полей.
+
+        :param has_check_visibility: Флаг проверки видимости элемента.
+        :param locator: Locator
+        :return: Возвращает значение из элемента
+        """
+        async with self._step('Получение значения с элемента', locator.description):
+            if has_check_visibility:
+                await self.check_element_visibility(locator)
+            for _ in self._attempts():
+                try:
+                    element = await self.find_element(locator)
+                    return (await element.get_attribute('value')).strip(' \n\t')  # type: ignore
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно получить значение из элемента {locator.description}. '
+                             'Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(f'Элемент {locator.description} не позволяет прочитать текст.')
+
+    async def get_text_from_element(self, locator: Locator) -> str:
+        """
+        Находит элемент и возвращает текст из него.
+
+        :param locator: Locator
+        :return: Возвращает текст из элемента
+        """
+        async with self._step('Получение текста из элемента', locator.description):
+            await self.check_element_visibility(locator)
+            for _ in self._attempts():
+                try:
+                    return (await (await self.find_element(locator)).text()).strip()
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно получить текст из элемента {locator.description}. '
+                             'Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(f'Элемент {locator.description} не позволяет прочитать текст.')
+
+    async def get_text_from_elements_with_different_locators(
+            self,
+            locators: Tuple[Locator]
+    ) -> Union[Tuple[str], Tuple[str, ...]]:
+        """
+        Находит элементы по локаторам из кортежа locators и возвращаем кортеж строк текста из них.
+
+        :param locators: кортеж локаторов.
+        :return: кортеж с текстами элементов.
+        """
+        async with self._step('Получение списка текстов из списка элементов', lambda: describe_locators(locators)):
+            return tuple(result['text'] for result in await self.query_many(locators, fields=('text',)))
+
+    async def query_many(
+            self,
+            locators: Sequence[Locator],
+            fields: Sequence[str] = QUERY_FIELDS,
+            wait_for: Optional[str] = 'visible'
+    ) -> List[Dict[str, Any]]:
+        """
+        Запрашивает состояние элементов сразу по нескольким локаторам за один вызов JavaScript.
+        Ожидание условия wait_for выполняется для всех локаторов в пределах одного общего тайм-аута.
+
+        :param locators: Последовательность локаторов.
+        :param fields: Запрашиваемые поля: text (текст первого элемента), count (кол-во элементов),
+        visible (видимость первого элемента), present (наличие в DOM).
+        :param wait_for: Поле, которое должно стать истинным для всех локаторов (visible/present),
+        None - без ожидания.
+        :return: Список словарей с запрошенными полями в порядке следования локаторов.
+        """
+        async with self._step('Запрос состояния элементов по нескольким локаторам',
+                              lambda: describe_locators(locators)):
+            requested_fields = get_query_fields(fields, wait_for)
+            results: List[Dict[str, Any]] = []
+
+            async def all_satisfy_condition(driver: AsyncWebDriver) -> bool:
+                results[:] = await driver.execute_script(
+                    QUERY_MANY_SCRIPT,
+                    [list(locator()) for locator in locators],
+                    requested_fields
+                )
+                return wait_for is None or all(result[wait_for] for result in results)
+
+            try:
+                await AsyncWebDriverWait(
+                    self,
+                    EXPLICITLY_TIMEOUT
+                ).until(
+                    all_satisfy_condition,
+                    f'Элементы не удовлетворяют условию {wait_for}.'
+                )
+            except TimeoutException:
+                raise TimeoutException(describe_unsatisfied_locators(locators, results, wait_for)) from None
+            return [{field: result[field] for field in fields} for result in results]
+
+    async def get_texts_from_elements_with_identical_locators(
+            self,
+            locator: Locator,
+            is_batched: bool = False
+    ) -> Union[Tuple[str], Tuple[str, ...]]:
+        """
+        Находит элементы с одинаковым локатором и возвращает кортеж строк с текстом из них.
+
+        :param locator: Locator элементов.
+        :param is_batched: Флаг чтения текста со всех элементов одним вызовом JavaScript.
+        :return: кортеж со строками текста из элементов.
+        """
+        async with self._step('Получение списка текстов из элемента', locator.description):
+            await self.check_element_visibility(locator)
+            for _ in self._attempts():
+                try:
+                    if is_batched:
+                        return await self.__get_texts_by_javascript(locator)
+                    strings_from_elements = [
+                        (await element.text()).strip() for element in await self.find_elements(locator)
+                    ]
+                    return tuple(strings_from_elements)
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно получить текст со всех элементов {locator.description}. '
+                             'Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(f'Элементы {locator.description} не позволют прочитать текст.')
+
+    async def __get_texts_by_javascript(self, locator: Locator) -> Union[Tuple[str], Tuple[str, ...]]:
+        """
+        Возвращает тексты всех элементов с одинаковым локатором за один вызов JavaScript.
+
+        :param locator: Locator элементов.
+        :return: кортеж со строками текста из элементов.
+        """
+        return tuple(await self._emulator.execute_script(GET_TEXTS_SCRIPT, *locator()))
+
+    async def wait_for_elements_text_correspond_to_given_set(
+            self,
+            locator: Locator,
+            target_texts: tuple,
+            is_batched: bool = True
+    ) -> None:
+        """
+        Ждёт пока текст в элементах с одинаковым локатором не станет соответствовать целевому множеству.
+
+        :param locator: Локатор проверяемых элементов.
+        :param target_texts: Кортеж со строками целевого текста.
+        :param is_batched: Флаг чтения текста со всех элементов одним вызовом JavaScript на каждой итерации.
+        :return: None.
+        """
+        async with self._step('Ожидания до тех пор пока текст в элементах с одинаковым локатором '
+                              'не станет соответствовать целевому значению', locator.description):
+            target_texts_set = set(target_texts)
+            if is_batched:
+                await self.check_element_visibility(locator)
+            for _ in self._attempts():
+                if is_batched:
+                    current_texts_set = await self.__get_texts_set_by_javascript(locator)
+                    # Пустое множество в пакетном режиме - элементы пропали или устарели, а не совпали с целью
+                    is_matched = bool(current_texts_set) and current_texts_set.issubset(target_texts_set)
+                else:
+                    current_texts_set = set(await self.get_texts_from_elements_with_identical_locators(locator))
+                    is_matched = current_texts_set.issubset(target_texts_set)
+                if is_matched:
+                    return None
+                else:
+                    await async_sleep_poll_frequency(self._deadline)
+            await self.screenshot_and_raise_error(f'Текст на элементе {locator.description} не изменился.')
+
+    async def __get_texts_set_by_javascript(self, locator: Locator) -> set:
+        """
+        Возвращает множество текстов элементов за один вызов JavaScript.
+        Пустое множество, если элементы пропали со страницы или устарели.
+
+        :param locator: Locator элементов.
+        :return: множество строк текста из элементов.
+        """
+        try:
+            return set(await self.__get_texts_by_javascript(locator))
+        except Exception as exc:
+            await self.__errors_handler(
+                error=exc,
+                desc=f'Невозможно получить текст со всех элементов {locator.description}. '
+                     'Необрабатываемое исключение.'
+            )
+            return set()
+
+    async def wait_for_change_text(
+            self,
+            locator: Locator,
+            new_text: str,
+            is_strong_coincidence=True,
+            is_event_driven: bool = False
+    ) -> None:
+        """
+        Проверяет, что текст в элементе на странице полностью или частично совпадает с заданным.
+
+        :param locator: Locator
+        :param new_text: текст, который мы ожидаем увидеть в элементе
+        :param is_strong_coincidence: Флаг определяет будет проверка строгой или не строгой
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
+        :return: None
+        """
+        async with self._step('Ожидания до тех пор пока текст не станет '
+                              'полностью или частично соответствовать целевому значению', locator.description):
+            new_text = new_text.replace('\xa0', ' ')  # Иногда попадается текст с пробелами без разрыва "\xa0"
+
+            await self.check_element_visibility(locator)
+            if is_event_driven:
+                result = await self.__wait_by_observer(
+                    locator,
+                    'text',
+                    new_text,
+                    is_strong_coincidence=is_strong_coincidence
+                )
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    await self.screenshot_and_raise_error(
+                        f'Текст на элементе {locator.description} не изменился. '
+                        f'Ожидаемое значение: {new_text}. Текущее значение: {result["current"]}')
+            for _ in self._attempts():
+                element_text = await self.get_text_from_element(locator)
+                if is_text_matched(new_text, element_text, is_strong_coincidence):
+                    return None
+                else:
+                    await async_sleep_poll_frequency(self._deadline)
+            await self.screenshot_and_raise_error(
+                f'Текст на элементе {locator.description} не изменился. '
+                f'Ожидаемое значение: {new_text}. Текущее значение: {element_text}')
+
+    async def wait_for_change_value(
+            self,
+            locator: Locator,
+            new_value: str,
+            is_strong_coincidence: bool = True,
+            has_check_visibility: bool = True,
+            is_event_driven: bool = False
+    ) -> None:
+        """
+        Проверяет, что текст в элементе на странице полностью или частично совпадает с заданным.
+
+        :param locator: Локатор элемента.
+        :param new_value: Текст, который мы ожидаем увидеть в элементе.
+        :param is_strong_coincidence: Флаг строгости проверки. По умолчанию True.
+        :param has_check_visibility: Флаг проверки видимости элемента. По умолчанию True.
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
+        :return: None.
+        """
+        async with self._step('Ожидания до тех пор пока значение не станет '
+                              'полностью или частично совпадает с заданным', locator.description):
+            if has_check_visibility:
+                await self.check_element_visibility(locator)
+            if is_event_driven:
+                result = await self.__wait_by_observer(
+                    locator,
+                    'value',
+                    new_value,
+                    is_strong_coincidence=is_strong_coincidence
+                )
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    await self.screenshot_and_raise_error(f'Значение в элементе {locator.description} не изменилось.')
+            for _ in self._attempts():
+                current_value = await self.get_value_from_element(locator, has_check_visibility=has_check_visibility)
+                if is_text_matched(new_value, current_value, is_strong_coincidence):
+                    return None
+                else:
+                    await async_sleep_poll_frequency(self._deadline)
+            await self.screenshot_and_raise_error(f'Значение в элементе {locator.description} не изменилось.')
+
+    async def fill_text(self, locator: Locator, text: str) -> None:
+        """
+        Нажимает на элемент и вводит в него текст.
+
+        :param locator: Locator
+        :param text: текст для ввода
+        :return: None
+        """
+        async with self._step('Ввод текста после нажатия на элемент', locator.description):
+            await self.click_element_by_webdriver(locator)
+            for _ in self._attempts():
+                try:
+                    await (await self.find_element(locator)).clear()
+                    break
+                except IGNORED_EXCEPTIONS:
+                    await async_sleep_poll_frequency(self._deadline)
+                except Exception as exc:
+                    await self.make_screenshot(is_error=True)
+                    exc.__traceback__ = None
+                    raise AssertionError(
+                        f'Невозможно очистить поле {locator.description}. Необрабатываемое исключение.'
+                    )
+            else:
+                await self.screenshot_and_raise_error(
+                    f'Невозможно очистить поле {locator.description}. Истекло количество попыток.'
+                )
+            for _ in self._attempts():
+                try:
+                    await (await self.find_element(locator)).send_keys(text)
+                    return None
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно записать текст в поле {locator.description}. Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Невозможно записать текст в поле {locator.description}. Истекло количество попыток.'
+            )
+
+    async def __wait_by_observer(
+            self,
+            locator: Locator,
+            condition: str,
+            expected_value: str = '',
+            attribute_name: str = '',
+            is_strong_coincidence: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Ожидает выполнения условия внутри браузера за один вызов execute_async_script (MutationObserver).
+
+        :param locator: Locator элемента.
+        :param condition: Условие: text, value, attribute или absent.
+        :param expected_value: Ожидаемое значение.
+        :param attribute_name: Ключ атрибута для условия attribute.
+        :param is_strong_coincidence: Флаг строгого совпадения значения.
+        :return: Словарь {matched, current} или None, если ожидание нужно продолжить опросом.
+        """
+        timeout = (self._deadline or Deadline(EXPLICITLY_TIMEOUT)).remaining
+        try:
+            async with self.__script_timeout(timeout + SCRIPT_TIMEOUT_MARGIN):
+                result = await self._emulator.execute_async_script(
+                    WAIT_FOR_CONDITION_SCRIPT,
+                    *locator(),
+                    condition,
+                    expected_value,
+                    attribute_name,
+                    is_strong_coincidence,
+                    int(timeout * 1000),
+                    int(POLL_FREQUENCY * 1000)
+                )
+        except (JavascriptException, TimeoutException):
+            return None
+        if 'error' in result:
+            await self.screenshot_and_raise_error(
+                f'Невозможно проверить условие для элемента {locator.description}: {result["error"]}'
+            )
+        return result  # type: ignore
+
+    async def wait_for_network_idle(
+            self,
+            idle_time: float = NETWORK_IDLE_TIME,
+            timeout: float = EXPLICITLY_TIMEOUT,
+            max_in_flight: int = 0
+    ) -> None:
+        """
+        Ожидает завершения сетевых запросов страницы внутри браузера за один вызов execute_async_script
+        (document.readyState, незавершённые fetch/XMLHttpRequest, jQuery.active, новые записи Resource Timing).
+
+        :param idle_time: Количество секунд без сетевой активности.
+        :param timeout: Количество секунд на ожидание.
+        :param max_in_flight: Допустимое количество незавершённых запросов.
+        :return: None
+        """
+        async with self._step('Ожидание завершения сетевых запросов', f'Без запросов {idle_time} сек.', timeout):
+            await self.__wait_for_idle(idle_time, max_in_flight, is_dom_checked=False)
+
+    async def wait_for_page_stable(
+            self,
+            idle_time: float = NETWORK_IDLE_TIME,
+            timeout: float = EXPLICITLY_TIMEOUT,
+            max_in_flight: int = 0
+    ) -> None:
+        """
+        Ожидает, пока сеть затихнет и DOM не будет меняться в течение idle_time секунд.
+
+        :param idle_time: Количество секунд без сетевой активности и изменений DOM.
+        :param timeout: Количество секунд на ожидание.
+        :param max_in_flight: Допустимое количество незавершённых запросов.
+        :return: None
+        """
+        async with self._step('Ожидание стабильного состояния страницы', f'Без изменений {idle_time} сек.', timeout):
+            await self.__wait_for_idle(idle_time, max_in_flight, is_dom_checked=True)
+
+    async def __wait_for_idle(self, idle_time: float, max_in_flight: int, is_dom_checked: bool) -> None:
+        """
+        Ожидает тишины на странице внутри браузера; переход на другую страницу продолжает ожидание на ней.
+
+        :param idle_time: Количество секунд без активности.
+        :param max_in_flight: Допустимое количество незавершённых запросов.
+        :param is_dom_checked: Флаг ожидания отсутствия изменений DOM.
+        :return: None
+        """
+        deadline = self._deadline or Deadline(EXPLICITLY_TIMEOUT)
+        result: Optional[Dict[str, Any]] = None
+        async with self.__script_timeout(deadline.remaining + SCRIPT_TIMEOUT_MARGIN):
+            for _ in self._attempts():
+                try:
+                    result = await self._emulator.execute_async_script(
+                        WAIT_FOR_PAGE_IDLE_SCRIPT,
+                        int(idle_time * 1000),
+                        int(deadline.remaining * 1000),
+                        int(NETWORK_IDLE_POLL_INTERVAL * 1000),
+                        is_dom_checked,
+                        max_in_flight
+                    )
+                except (JavascriptException, TimeoutException):
+                    await async_sleep_poll_frequency(self._deadline)
+                    continue
+                if result is None:
+                    # Страница выгружена до ответа скрипта: ожидание продолжается на новой странице
+                    await async_sleep_poll_frequency(self._deadline)
+                    continue
+                if result['idle']:
+                    return
+                break
+        await self.screenshot_and_raise_error(describe_idle_state(result))
+
+    @asynccontextmanager
+    async def __script_timeout(self, timeout: float) -> AsyncIterator[None]:
+        """
+        Увеличивает тайм-аут асинхронных скриптов сессии на время блока, если он меньше требуемого,
+        и возвращает исходный по выходе: тайм-аут - настройка всей сессии, а не объекта страницы.
+
+        :param timeout: Требуемый тайм-аут в секундах.
+        :return: None
+        """
+        script_timeout = (await self._emulator.get_timeouts()).get('script')
+        original_timeout = float('inf') if script_timeout is None else script_timeout / 1000
+        if timeout <= original_timeout:
+            yield
+            return
+        await self._emulator.set_script_timeout(timeout)
+        try:
+            yield
+        finally:
+            await self._emulator.set_script_timeout(original_timeout)
+
+    async def check_title(self, text: str) -> None:
+        """
+        Проверяет заголовок страницы на соответствие заданному тексту.
+
+        :param text: Ожидаемый текст в заголовке страницы
+        :return: None
+        """
+        titles: List[str] = []
+
+        async def is_title(driver: AsyncWebDriver) -> bool:
+            titles[:] = [await driver.title()]
+            return titles[0] == text
+
+        async with self._step('Проверка заголовка страницы на соответствие заданному тексту'):
+            try:
+                await AsyncWebDriverWait(
+                    self,
+                    EXPLICITLY_TIMEOUT
+                ).until(
+                    is_title,
+                    f'Заголовок страницы {text} не совпадает.'
+                )
+            except TimeoutException:
+                raise TimeoutException(
+                    f'Заголовок страницы {text} не совпадает с {titles[0] if titles else None}.'
+                ) from None
+
+    async def get_attribute(self, locator: Locator, attribute_name: str, has_check_visibility: bool = True) -> str:
+        """
+        Возвращает значение указанного атрибута из элемента.
+
+        :param locator:
+        :param attribute_name: Ключ атрибута в Html-коде
+        :param has_check_visibility: Флаг проверки видимости элемента.
+        :return: Значение атрибута
+        """
+        async with self._step('Получение значения атрибута в элементе', locator.description):
+            if has_check_visibility:
+                await self.check_element_visibility(locator)
+            attributes = await self.__get_first_element_attributes(locator, [attribute_name])
+            return attributes[attribute_name]  # type: ignore
+
+    async def get_attributes_from_elements(
+            self,
+            locator: Locator,
+            attribute_names: List[str],
+            has_check_visibility: bool = True
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Находит элементы с одинаковым локатором и возвращает значения указанных атрибутов (или свойств)
+        из всех элементов за один вызов JavaScript.
+
+        :param locator: Locator элементов.
+        :param attribute_names: Список ключей атрибутов в Html-коде или имён свойств элемента.
+        :param has_check_visibility: Флаг проверки видимости элемента.
+        :return: Список словарей {ключ атрибута: значение} в порядке следования элементов на странице.
+        """
+        async with self._step('Получение значений атрибутов во всех элементах на странице', locator.description):
+            if has_check_visibility:
+                await self.check_element_visibility(locator)
+            for _ in self._attempts():
+                try:
+                    attributes_from_elements = await self.__get_attributes_by_javascript(locator, attribute_names)
+                    if has_check_visibility and not attributes_from_elements:
+                        raise NoSuchElementException(f'Элементы {locator.description} пропали со страницы.')
+                    return attributes_from_elements
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно получить атрибуты {attribute_names} из элементов {locator.description}. '
+                             'Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Элементы {locator.description} не позволяют прочитать атрибуты {attribute_names}.'
+            )
+
+    async def __get_attributes_by_javascript(
+            self,
+            locator: Locator,
+            attribute_names: List[str]
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Возвращает значения атрибутов всех элементов с одинаковым локатором за один вызов JavaScript.
+
+        :param locator: Locator элементов.
+        :param attribute_names: Список ключей атрибутов или имён свойств.
+        :return: Список словарей {ключ атрибута: значение}.
+        """
+        return await self._emulator.execute_script(GET_ATTRIBUTES_SCRIPT, *locator(), attribute_names)  # type: ignore
+
+    async def __get_first_element_attributes(
+            self,
+            locator: Locator,
+            attribute_names: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Возвращает значения атрибутов первого элемента с указанным локатором за один вызов JavaScript.
+        Повторяет попытки, пока элемент отсутствует на странице.
+
+        :param locator: Locator элемента.
+        :param attribute_names: Список ключей атрибутов или имён свойств.
+        :return: Словарь {ключ атрибута: значение}.
+        """
+        for _ in self._attempts():
+            try:
+                attributes_from_elements = await self.__get_attributes_by_javascript(locator, attribute_names)
+                if attributes_from_elements:
+                    return attributes_from_elements[0]
+                raise NoSuchElementException(f'Элемент {locator.description} отсутствует на странице.')
+            except Exception as exc:
+                await self.__errors_handler(
+                    error=exc,
+                    desc=f'Невозможно получить атрибуты {attribute_names} из элемента {locator.description}. '
+                         'Необрабатываемое исключение.'
+                )
+        await self.screenshot_and_raise_error(
+            f'Невозможно найти элемент {locator.description}. Истекло количество попыток.'
+        )
+
+    async def get_attribute_from_elements_with_identical_locators(
+            self,
+            locator: Locator,
+            attribute_name: str
+    ) -> Union[Tuple[str], Tuple[str, ...]]:
+        """
+        Находит элементы с одинаковым локатором, и возвращает кортеж со значениями указанного атрибута из них.
+
+        :param attribute_name: Ключ атрибута в Html-коде.
+        :param locator: Locator элементов.
+        :return: Кортеж со значениями указанного атрибута из элементов.
+        """
+        async with self._step('Получение значений атрибута во всех элементах на странице', locator.description):
+            attribute_values_from_elements = [
+                attributes[attribute_name] for attributes in await self.get_attributes_from_elements(
+                    locator,
+                    [attribute_name]
+                )
+            ]
+            return tuple(attribute_values_from_elements)  # type: ignore
+
+    async def find_value_in_attribut(self, locator: Locator, attribute_name: str, expected_value: str) -> None:
+        """
+        Поиск на вхождение ожидаемого значения в значение атрибута
+        :param locator: Locator элементов.
+        :param attribute_name: Ключ атрибута в Html-коде.
+        :param expected_value: Ожидаемое значение атрибута.
+        :return: None
+        """
+        async with self._step('Сравнение на вхождение ожидаемого и действительного значения в атрибуте элемента',
+                              locator.description):
+            if expected_value in (await self.get_attribute(locator, attribute_name) or ''):
+                return None
+            await self.screenshot_and_raise_error(
+                f"Элемент {locator.description} не содержит в атрибуте значение {expected_value}"
+            )
+
+    async def attributes_compare(self, locator: Locator, attribute_name: str, expected_value: str) -> None:
+        """
+        Прямое сравнивает ожидаемого и текущего значения атрибута
+        :param locator: Locator элементов.
+        :param attribute_name: Ключ атрибута в Html-коде.
+        :param expected_value: ожидаемое значение атрибута.
+        :return: None
+        """
+        async with self._step('Сравнение ожидаемого и действительного значения в атрибуте элемента',
+                              locator.description):
+            if expected_value == await self.get_attribute(locator, attribute_name):
+                return None
+            await self.screenshot_and_raise_error(
+                f'В "{locator.description}" атрибут "{attribute_name}" не равен "{expected_value}"'
+            )
+
+    async def count_of_elements(self, locator: Locator, has_check_visibility: bool = True) -> int:
+        """
+        Возвращает количество элементов на странице.
+
+        :param locator: Locator
+        :param has_check_visibility: Флаг проверки видимости элемента.
+        :return: Количество элементов на странице с таким локатором
+        """
+        async with self._step('Получение кол-ва элементов с одинаковым локатором', locator.description):
+            if has_check_visibility:
+                await self.check_element_visibility(locator)
+            return len(await self.find_elements(locator))
+
+    async def check_element_presence_in_dom(self, locator: Locator) -> None:
+        """
+        Проверяем наличие элемента в DOM.
+
+        :param locator: Locator - локатор элемента
+        :return: None
+        """
+        async def find(driver: AsyncWebDriver) -> AsyncWebElement:
+            return await driver.find_element(*locator())
+
+        async with self._step('Проверка на наличие элемента в DOM', locator.description):
+            await AsyncWebDriverWait(
+                self,
+                EXPLICITLY_TIMEOUT
+            ).until(
+                find,
+                f'Элемент {locator.description} отсутствует в DOM страницы.'
+            )
+
+    async def check_element_not_presence_in_dom(
+            self,
+            locator: Locator,
+            is_event_driven: bool = False,
+            timeout: float = EXPLICITLY_TIMEOUT
+    ) -> None:
+        """
+        Проверяет отсутствие элемента в DOM.
+        Проверка проходит при первом же наблюдении, в котором элемент отсутствует.
+
+        :param locator: Locator - локатор элемента
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
+        :param timeout: Количество секунд на ожидание исчезновения элемента.
+        :return: None
+        """
+        async def find(driver: AsyncWebDriver) -> AsyncWebElement:
+            return await driver.find_element(*locator())
+
+        async with self._step('Проверка на отсутствие элемента в DOM', locator.description, timeout=timeout):
+            if is_event_driven:
+                result = await self.__wait_by_observer(locator, 'absent')
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    await self.screenshot_and_raise_error(
+                        f'Элемент {locator.description} присутствует в DOM страницы.'
+                    )
+            await AsyncWebDriverWait(
+                self,
+                timeout
+            ).until_not(
+                find,
+                f'Элемент {locator.description} присутствует в DOM страницы.'
+            )
+
+    async def scroll_web_element_to_page_up(self, locator: Locator) -> None:
+        """
+        Берёт веб элемент и пролистывает его до верха страницы (перетаскивание на 300 пикселей вверх).
+
+        :param locator: Locator - локатор элемента
+        :return: None
+        """
+        async with self._step('Нажатие на элемент и пролистывание его до верха страницы', locator.description):
+            element = await self.find_element(locator)
+            await self._emulator.perform_actions(_pointer_actions(
+                _move_to(element),
+                {'type': 'pointerDown', 'button': 0},
+                {'type': 'pointerMove', 'duration': POINTER_MOVE_DURATION, 'x': 0, 'y': -300, 'origin': 'pointer'},
+                {'type': 'pointerUp', 'button': 0}
+            ))
+
+    async def scroll_to_element_by_javascript(self, locator) -> None:
+        """
+        Прокручивает страницу до элемента с указанным локатором при помощи javascript скрипта.
+        :param locator: Locator - локатор элемента
+        :return:
+        """
+        async with self._step('Прокручивает страницу до элемента с указанным локатором при помощи JavaScript',
+                              locator.description):
+            for _ in self._attempts():
+                try:
+                    await self._emulator.execute_script(
+                        'arguments[0].scrollIntoView(true)',
+                        await self.find_element(locator)
+                    )
+                    return None
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc=f'Не получается прокрутить страницу до элемента: {locator.description}. '
+                             'Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Не получается прокрутить страницу до элемента: {locator.description}. Истекло количество попыток.'
+            )
+
+    async def send_by_devtools_protocol(self, cmd: str, params: Any = None) -> Any:
+        """
+        Отправляет команду по DevTools протоколу на Webdriver Selenoid
+        :param cmd: команда согласно DevTools протоколу.
+        :param params: словарь с параметрами.
+
+        :return: Результат команды (значение value ответа ChromeDriver)
+        """
+        return await self._emulator.send_devtools_command(cmd, params)
+
+    async def turn_off_internet(self) -> None:
+        """
+        Передает параметр через DevTool протокол для отлючения интернета
+        :return: None
+        """
+        async with self._step('Отключение интернета в браузере через DevTools протокол'):
+            network_conditions = {
+                'offline': True,
+                'latency': 0,
+                'downloadThroughput': 0,
+                'uploadThroughput': 0,
+                'connectionType': 'none'
+            }
+
+            await self.send_by_devtools_protocol('Network.emulateNetworkConditions', network_conditions)
+            await self.send_by_devtools_protocol('Network.enable', {})
+
+    async def turn_on_internet(self) -> None:
+        """
+        Удаляет emulateNetworkConditions из DevTool, чтобы возобнавить работу интернета
+        :return: None
+        """
+        async with self._step('Включение интернета в браузере через DevTools протокол'):
+            await self.send_by_devtools_protocol('Network.disable', {})
+
+    async def clear_cash_and_logs(self) -> None:
+        """
+        Отчистка Логов и Кеша в Chrome Webdriver
+        :return: None
+        """
+        await self.send_by_devtools_protocol('Log.clear', {})
+        await self.send_by_devtools_protocol('Network.clearBrowserCache', {})
+
+    async def click_ok_alert(self) -> None:
+        """
+        Клик на всплывающее окно алерта
+        :return: None
+        """
+        async def is_alert_present(driver: AsyncWebDriver) -> bool:
+            try:
+                await driver.alert_text()
+                return True
+            except NoAlertPresentException:
+                return False
+
+        async with self._step('Нажатие на всплывающее окно алерта'):
+            await AsyncWebDriverWait(
+                self,
+                EXPLICITLY_TIMEOUT
+            ).until(
+                is_alert_present,
+                'Алерт не отображается.'
+            )
+
+            try:
+                await self._emulator.accept_alert()
+            except Exception as exc:
+                await self.make_screenshot(is_error=True)
+                exc.__traceback__ = None
+                raise AssertionError(
+                    'Невозможно кликнуть на всплывающий алерт'
+                )
+
+    async def check_without_timeout_and_click(self, locator_one: Locator, locator_two: Locator) -> None:
+        """
+        Пытается достучаться до первого доступного локатара, в пределах EXPLICITLY_TIMEOUT
+        :param locator_one: Locator - локатор элемента.
+        :param locator_two: Locator - локатор элемента.
+        :return: None
+        """
+        async with self._step('Попытка достучаться (кликнуть) до первого ближайшего элемента',
+                              lambda: f'{locator_two.description}; {locator_one.description}'):
+            for _ in self._attempts():
+                try:
+                    try:
+                        await self._emulator.find_element(*locator_two())
+                        return None
+                    except IGNORED_EXCEPTIONS:
+                        await (await self._emulator.find_element(*locator_one())).click()
+                        return None
+                except IGNORED_EXCEPTIONS:
+                    await async_sleep_poll_frequency(self._deadline)
+
+    async def sleep_until_update_attribute(
+            self,
+            locator: Locator,
+            attribute_name: str,
+            desired_value: str,
+            is_event_driven: bool = False
+    ) -> None:
+        """
+        Ждет обновление значения атрибута, в пределах EXPLICITLY_TIMEOUT.
+        Видимость элемента проверяется один раз, далее на каждой итерации значение читается одним вызовом JavaScript.
+
+        :param locator: Locator - локатор элемента.
+        :param attribute_name: Ключ атрибута в Html-коде.
+        :param desired_value: Ожидаемое значение атрибута
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
+        :return: None
+        """
+        async with self._step('Ожидание обновления значения атрибута', locator.description):
+            await self.check_element_visibility(locator)
+            if is_event_driven:
+                result = await self.__wait_by_observer(
+                    locator,
+                    'attribute',
+                    desired_value,
+                    attribute_name=attribute_name
+                )
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    await self.screenshot_and_raise_error(
+                        f'{locator.description} не содержит в атрибуте {attribute_name} значение {desired_value}'
+                    )
+            for _ in self._attempts():
+                try:
+                    attributes_from_elements = await self.__get_attributes_by_javascript(locator, [attribute_name])
+                    if attributes_from_elements and desired_value == attributes_from_elements[0][attribute_name]:
+                        return None
+                    else:
+                        await async_sleep_poll_frequency(self._deadline)
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc='Необрабатываемое исключение.'
+                    )
+            await self.screenshot_and_raise_error(
+                f'{locator.description} не содержит в атрибуте {attribute_name} значение {desired_value}'
+            )
+
+    async def compare_counts_of_two_locators(self, locator_one: Locator, locator_two: Locator) -> None:
+        """
+        Бросает ошибку если кол-во элемента(ов) локатора не сходится со вторым локатором
+
+        :param locator_one: Locator - Первый локатор для сравнения.
+        :param locator_two: Locator - Второй локатор для сравнения.
+        """
+        async with self._step('Сравнение кол-ва элементов',
+                              lambda: f'{locator_one.description}; {locator_two.description}'):
+            for _ in self._attempts():
+                try:
+                    count_one, count_two = (
+                        result['count']
+                        for result in await self.query_many((locator_one, locator_two), fields=('count',))
+                    )
+                    if count_one == count_two:
+                        return None
+                    else:
+                        await async_sleep_poll_frequency(self._deadline)
+                except Exception as exc:
+                    await self.__errors_handler(
+                        error=exc,
+                        desc='Необрабатываемое исключение, '
+                             f'кол-во {locator_one.description} не равно {locator_two.description}'
+                    )
+            await self.screenshot_and_raise_error(
+                f'Количество элементов {locator_one.description} не равно {locator_two.description}'
+            )
+
+    async def compare_counts_of_different_locators(self, locators: tuple, description: str = '') -> None:
+        """
+        Сравнивает количество элементов на странице из кортежа locators
+
+        :param locators: кортеж локаторов
+        :param description: Описание ошибки
+        :return:
+        """
+        async with self._step('Сравнение количество элементов на странице'):
+            try:
+                counts_of_elements = [
+                    result['count'] for result in await self.query_many(locators, fields=('count',))
+                ]
+            except Exception as exc:
+                await self.__errors_handler(
+                    error=exc,
+                    desc='Необрабатываемое исключение, не удалось получить кол-во элементов: '
+                         + describe_locators(locators)
+                )
+                raise
+            assert len(set(counts_of_elements)) == 1, \
+                f'Количество элементов на странице не равно между собой: {description}'
+
+    async def compare_two_numbers(self, number_one: int, number_two: int, description: str = '') -> None:
+        """
+        Сравнивает два числа на равенство, если не равны бросает ошибку (AssertionError) с описанием
+
+        :param number_one: Первое число для сравнения.
+        :param number_two: Второе число для сравнения.
+        :param description: Описание ошибки.
+        """
+        async with self._step('Сравнение двух чисел'):
+            if number_one == number_two:
+                return None
+            else:
+                await self.screenshot_and_raise_error(f'Числа не равны ({number_one} и {number_two}): {description}')
+
+    async def switch_to_iframe(self, locator: Locator) -> None:
+        """
+        Переключение на iframe по локатору
+
+        :param locator: Локатор iframe
+        :return: None
+        """
+        await self.emulator.switch_to_frame(
+            await self.find_element(locator)
+        )
+        if self._element_cache is not None:
+            self._element_cache.enter_frame(locator)
+
+    async def switch_to_default_page(self) -> None:
+        """
+        Переключение с iframe на основную страницу
+
+        :return: None
+        """
+        await self.emulator.switch_to_frame(None)
+        if self._element_cache is not None:
+            self._element_cache.leave_frames()
@@ -0,0 +1,486 @@
+from base64 import b64decode
+from json import dumps
+from json import loads
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorCode
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+from .instrumentation import ActionListener
+from .instrumentation import notify_command
+from .scripts import GET_ELEMENT_ATTRIBUTE_SCRIPT
+from .scripts import IS_VISIBLE_SCRIPT
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:  # aiohttp - необязательная зависимость, нужна только для AiohttpTransport
+    aiohttp = None  # type: ignore
+
+# Ключ ссылки на элемент в протоколе W3C WebDriver
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+
+class AsyncTransport:
+    """
+    Асинхронный HTTP-транспорт до WebDriver (Selenoid, chromedriver и т.п.).
+    Ответ возвращается в формате RemoteConnection._request: разобранный JSON при успехе,
+    {'status': код, 'value': тело} при ошибке - чтобы ошибки разбирались стандартным ErrorHandler Selenium.
+    """
+
+    async def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Отправляет запрос.
+
+        :param method: HTTP-метод.
+        :param path: Путь относительно адреса WebDriver, например /session/{id}/element.
+        :param body: Тело запроса.
+        :return: Ответ.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Закрывает соединения транспорта.
+
+        :return: None
+        """
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Транспорт на aiohttp с пулом соединений keep-alive (pip install custom_selenium_qa[async]).
+    """
+
+    def __init__(self, url: str, timeout: float = 120.0):
+        """
+        :param url: Адрес WebDriver, например http://selenoid:4444/wd/hub.
+        :param timeout: Тайм-аут HTTP-запроса в секундах.
+        """
+        if aiohttp is None:
+            raise ImportError('Для AiohttpTransport требуется aiohttp: pip install custom_selenium_qa[async]')
+        self._url = url.rstrip('/')
+        self._timeout = timeout
+        self._session: Any = None
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} ({self._url})>'
+
+    async def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self._timeout))
+        async with self._session.request(
+                method,
+                self._url + path,
+                data=dumps(body) if body is not None else None,
+                headers={'Content-Type': 'application/json;charset=UTF-8', 'Accept': 'application/json'}
+        ) as response:
+            data = await response.text()
+            if 399 < response.status <= 500:
+                return {'status': response.status, 'value': data}
+            try:
+                result: Dict[str, Any] = loads(data)
+            except ValueError:
+                status = ErrorCode.SUCCESS if 199 < response.status < 300 else ErrorCode.UNKNOWN_ERROR
+                return {'status': status, 'value': data.strip()}
+            result.setdefault('value', None)
+            return result
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncWebElement:
+    """
+    Ссылка на элемент асинхронной сессии WebDriver.
+    """
+
+    def __init__(self, driver: 'AsyncWebDriver', element_id: str):
+        """
+        :param driver: Асинхронная сессия.
+        :param element_id: Идентификатор элемента в сессии.
+        """
+        self._driver = driver
+        self._id = element_id
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} ({self._id})>'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, AsyncWebElement) and other.id == self._id
+
+    def __hash__(self) -> int:
+        return hash(self._id)
+
+    @property
+    def id(self) -> str:
+        """
+        Возвращает идентификатор элемента в сессии.
+
+        :return: Идентификатор элемента.
+        """
+        return self._id
+
+    async def _execute(self, command: str, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        return await self._driver.execute(command, method, f'/element/{self._id}/{path}', body)
+
+    async def text(self) -> str:
+        """
+        Возвращает видимый текст элемента.
+
+        :return: Текст.
+        """
+        return await self._execute(Command.GET_ELEMENT_TEXT, 'GET', 'text')  # type: ignore
+
+    async def is_enabled(self) -> bool:
+        """
+        Проверяет доступность элемента.
+
+        :return: True, если элемент доступен.
+        """
+        return await self._execute(Command.IS_ELEMENT_ENABLED, 'GET', 'enabled')  # type: ignore
+
+    async def is_displayed(self) -> bool:
+        """
+        Проверяет видимость элемента скриптом IS_VISIBLE_SCRIPT (упрощённый аналог атома isDisplayed Selenium).
+
+        :return: True, если элемент видим.
+        """
+        return bool(await self._driver.execute_script(IS_VISIBLE_SCRIPT, self))
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Возвращает значение атрибута или свойства элемента.
+
+        :param name: Имя атрибута или свойства.
+        :return: Значение или None.
+        """
+        return await self._driver.execute_script(GET_ELEMENT_ATTRIBUTE_SCRIPT, self, name)  # type: ignore
+
+    async def click(self) -> None:
+        """
+        Нажимает на элемент.
+
+        :return: None
+        """
+        await self._execute(Command.CLICK_ELEMENT, 'POST', 'click', {})
+
+    async def clear(self) -> None:
+        """
+        Очищает поле ввода.
+
+        :return: None
+        """
+        await self._execute(Command.CLEAR_ELEMENT, 'POST', 'clear', {})
+
+    async def send_keys(self, text: str) -> None:
+        """
+        Вводит текст в элемент.
+
+        :param text: Текст.
+        :return: None
+        """
+        await self._execute(Command.SEND_KEYS_TO_ELEMENT, 'POST', 'value', {'text': text, 'value': list(text)})
+
+    async def screenshot_as_png(self) -> bytes:
+        """
+        Снимает скриншот элемента.
+
+        :return: Байты PNG.
+        """
+        return b64decode(await self._execute(Command.ELEMENT_SCREENSHOT, 'GET', 'screenshot'))
+
+
+class AsyncWebDriver:
+    """
+    Асинхронный клиент одной сессии W3C WebDriver.
+    Команды отправляются через AsyncTransport; ошибки преобразуются в исключения Selenium
+    (NoSuchElementException, StaleElementReferenceException и т.д.) стандартным ErrorHandler.
+    """
+
+    def __init__(
+            self,
+            transport: AsyncTransport,
+            session_id: str,
+            capabilities: Optional[Dict[str, Any]] = None,
+            is_transport_owned: bool = False
+    ):
+        """
+        :param transport: HTTP-транспорт.
+        :param session_id: Идентификатор сессии.
+        :param capabilities: Возможности сессии.
+        :param is_transport_owned: Транспорт создан драйвером и закрывается в quit; общий транспорт нескольких
+            сессий закрывает его владелец.
+        """
+        self._transport = transport
+        self._is_transport_owned = is_transport_owned
+        self._session_id = session_id
+        self._capabilities = capabilities or {}
+        self._error_handler = ErrorHandler()
+        self.listeners: List[ActionListener] = []
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (session_id={self._session_id})>'
+
+    @classmethod
+    async def create(cls, transport: Union[AsyncTransport, str], capabilities: Dict[str, Any]) -> 'AsyncWebDriver':
+        """
+        Создаёт новую сессию.
+
+        :param transport: HTTP-транспорт или адрес WebDriver; по адресу драйвер создаёт собственный
+            AiohttpTransport и закрывает его в quit, переданный транспорт остаётся открытым.
+        :param capabilities: Запрашиваемые возможности, например ChromeOptions().to_capabilities().
+        :return: AsyncWebDriver
+        """
+        is_transport_owned = isinstance(transport, str)
+        if isinstance(transport, str):
+            transport = AiohttpTransport(transport)
+        try:
+            response = await transport.request('POST', '/session', {'capabilities': {'alwaysMatch': capabilities}})
+            ErrorHandler().check_response(response)
+        except BaseException:
+            if is_transport_owned:
+                await transport.close()
+            raise
+        value = response['value']
+        return cls(transport, value['sessionId'], value.get('capabilities'), is_transport_owned)
+
+    @property
+    def session_id(self) -> str:
+        """
+        Возвращает идентификатор сессии.
+
+        :return: Идентификатор сессии.
+        """
+        return self._session_id
+
+    @property
+    def capabilities(self) -> Dict[str, Any]:
+        """
+        Возвращает возможности сессии.
+
+        :return: Словарь возможностей.
+        """
+        return self._capabilities
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        return value
+
+    def _unwrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    async def execute(self, command: str, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Выполняет команду сессии и сообщает о ней слушателям listeners.
+
+        :param command: Имя команды для слушателей (как в selenium Command, например findElement).
+        :param method: HTTP-метод.
+        :param path: Путь команды относительно сессии, например /element.
+        :param body: Тело запроса.
+        :return: Значение value из ответа (ссылки на элементы преобразуются в AsyncWebElement).
+        """
+        started = perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            response = await self._transport.request(
+                method,
+                f'/session/{self._session_id}{path}',
+                self._wrap(body) if body is not None else None
+            )
+            self._error_handler.check_response(response)
+            return self._unwrap(response.get('value'))
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            if self.listeners:
+                notify_command(self.listeners, command, started, perf_counter() - started, error)
+
+    async def find_element(self, by: str, selector: str) -> AsyncWebElement:
+        """
+        Находит элемент.
+
+        :param by: Тип локатора W3C (css selector, xpath, link text, partial link text, tag name).
+        :param selector: Селектор.
+        :return: AsyncWebElement
+        """
+        return await self.execute(Command.FIND_ELEMENT, 'POST', '/element', _locator_body(by, selector))  # type: ignore
+
+    async def find_elements(self, by: str, selector: str) -> List[AsyncWebElement]:
+        """
+        Находит элементы.
+
+        :param by: Тип локатора.
+        :param selector: Селектор.
+        :return: Список AsyncWebElement.
+        """
+        return await self.execute(  # type: ignore
+            Command.FIND_ELEMENTS,
+            'POST',
+            '/elements',
+            _locator_body(by, selector)
+        )
+
+    async def execute_script(self, script: str, *args: Any) -> Any:
+        """
+        Выполняет синхронный JavaScript.
+
+        :param script: Скрипт.
+        :param args: Аргументы скрипта.
+        :return: Результат скрипта.
+        """
+        body = {'script': script, 'args': list(args)}
+        return await self.execute(Command.W3C_EXECUTE_SCRIPT, 'POST', '/execute/sync', body)
+
+    async def execute_async_script(self, script: str, *args: Any) -> Any:
+        """
+        Выполняет асинхронный JavaScript (последний аргумент скрипта - callback).
+
+        :param script: Скрипт.
+        :param args: Аргументы скрипта.
+        :return: Значение, переданное в callback.
+        """
+        body = {'script': script, 'args': list(args)}
+        return await self.execute(Command.W3C_EXECUTE_SCRIPT_ASYNC, 'POST', '/execute/async', body)
+
+    async def title(self) -> str:
+        """
+        Возвращает заголовок страницы.
+
+        :return: Заголовок.
+        """
+        return await self.execute(Command.GET_TITLE, 'GET', '/title')  # type: ignore
+
+    async def refresh(self) -> None:
+        """
+        Перезагружает страницу.
+
+        :return: None
+        """
+        await self.execute(Command.REFRESH, 'POST', '/refresh', {})
+
+    async def get_screenshot_as_png(self) -> bytes:
+        """
+        Снимает скриншот страницы.
+
+        :return: Байты PNG.
+        """
+        return b64decode(await self.execute(Command.SCREENSHOT, 'GET', '/screenshot'))
+
+    async def perform_actions(self, actions: Sequence[Dict[str, Any]]) -> None:
+        """
+        Выполняет последовательность действий W3C Actions и освобождает нажатые кнопки.
+
+        :param actions: Источники ввода с действиями.
+        :return: None
+        """
+        await self.execute(Command.W3C_ACTIONS, 'POST', '/actions', {'actions': list(actions)})
+        await self.execute(Command.W3C_CLEAR_ACTIONS, 'DELETE', '/actions')
+
+    async def switch_to_frame(self, element: Optional[AsyncWebElement]) -> None:
+        """
+        Переключается во фрейм или, если element равен None, на основную страницу.
+
+        :param element: Элемент iframe.
+        :return: None
+        """
+        await self.execute(Command.SWITCH_TO_FRAME, 'POST', '/frame', {'id': element})
+
+    async def alert_text(self) -> str:
+        """
+        Возвращает текст открытого алерта.
+
+        :return: Текст алерта.
+        """
+        return await self.execute(Command.W3C_GET_ALERT_TEXT, 'GET', '/alert/text')  # type: ignore
+
+    async def accept_alert(self) -> None:
+        """
+        Принимает открытый алерт.
+
+        :return: None
+        """
+        await self.execute(Command.W3C_ACCEPT_ALERT, 'POST', '/alert/accept', {})
+
+    async def get_timeouts(self) -> Dict[str, Any]:
+        """
+        Возвращает тайм-ауты сессии в миллисекундах.
+
+        :return: Словарь тайм-аутов.
+        """
+        return await self.execute(Command.GET_TIMEOUTS, 'GET', '/timeouts')  # type: ignore
+
+    async def set_script_timeout(self, timeout: float) -> None:
+        """
+        Устанавливает тайм-аут асинхронных скриптов.
+
+        :param timeout: Тайм-аут в секундах.
+        :return: None
+        """
+        await self.execute(Command.SET_TIMEOUTS, 'POST', '/timeouts', {'script': int(timeout * 1000)})
+
+    async def send_devtools_command(self, cmd: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Отправляет команду DevTools протокола через расширение Chromium.
+
+        :param cmd: Команда DevTools протокола.
+        :param params: Параметры команды.
+        :return: Результат команды.
+        """
+        return await self.execute(
+            f'devtools:{cmd}',
+            'POST',
+            '/chromium/send_command_and_get_result',
+            {'cmd': cmd, 'params': params or {}}
+        )
+
+    async def quit(self) -> None:
+        """
+        Завершает сессию и закрывает транспорт, если он создан драйвером.
+
+        :return: None
+        """
+        try:
+            await self._transport.request('DELETE', f'/session/{self._session_id}')
+        except WebDriverException:
+            pass
+        if self._is_transport_owned:
+            await self._transport.close()
+
+
+def _locator_body(by: str, selector: str) -> Dict[str, str]:
+    """
+    Преобразует локатор в тело запроса поиска элемента, как это делает webdriver.Remote для W3C.
+
+    :param by: Тип локатора.
+    :param selector: Селектор.
+    :return: Тело запроса.
+    """
+    if by == 'id':
+        return {'using': 'css selector', 'value': f'[id="{selector}"]'}
+    if by == 'name':
+        return {'using': 'css selector', 'value': f'[name="{selector}"]'}
+    if by == 'class name':
+        return {'using': 'css selector', 'value': f'.{selector}'}
+    return {'using': by, 'value': selector}
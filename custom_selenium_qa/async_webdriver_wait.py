@@ -0,0 +1,132 @@
+from asyncio import sleep
+from time import perf_counter
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.common.exceptions import TimeoutException
+
+from .base_settings import IGNORED_EXCEPTIONS
+from .deadline import Deadline
+from .polling import FixedPolling
+from .polling import PollingStrategy
+
+# Условие ожидания: корутинная функция, принимающая AsyncWebDriver
+AsyncCondition = Callable[[Any], Awaitable[Any]]
+
+
+class AsyncWebDriverWait:
+    """
+    Асинхронный аналог CustomWebDriverWait для AsyncBaseActions: паузы между вызовами условия
+    выполняются через asyncio.sleep и не блокируют другие сессии в цикле событий.
+    """
+
+    def __init__(self, page_object: Any, timeout: float, polling: Optional[PollingStrategy] = None):
+        """
+        Если у page_object открыт крайний срок действия (deadline), ожидание не выходит за его пределы.
+
+        :param page_object: Объект страницы AsyncBaseActions.
+        :param timeout: Количество секунд до истечения времени ожидания.
+        :param polling: Стратегия опроса. По умолчанию используется POLLING_STRATEGY из page_object.
+        """
+        self._page_object = page_object
+        self._timeout = float(timeout)
+        self._polling = polling or getattr(page_object, 'POLLING_STRATEGY', None) or FixedPolling()
+        self._polls = 0
+        self._ignored_exceptions = IGNORED_EXCEPTIONS
+        self._parent_deadline = getattr(page_object, 'deadline', None)
+
+    def __repr__(self) -> str:
+        return '<{0.__module__}.{0.__name__} (session="{1}")>'.format(
+            type(self),
+            self._page_object.emulator.session_id
+        )
+
+    @property
+    def polls(self) -> int:
+        """
+        Возвращает количество вызовов условия за последнее ожидание.
+
+        :return: Количество вызовов.
+        """
+        return self._polls
+
+    async def until(self, method: AsyncCondition, message: str = '', polling: Optional[PollingStrategy] = None) -> Any:
+        """
+        Вызывает условие, пока его результат не станет истинным.
+
+        :param method: Корутинная функция, принимающая AsyncWebDriver.
+        :param message: Сообщение TimeoutException.
+        :param polling: Стратегия опроса только для этого вызова.
+        :return: Результат последнего вызова условия.
+        """
+        return await self.__wait(method, message, polling, is_negated=False)
+
+    async def until_not(
+            self,
+            method: AsyncCondition,
+            message: str = '',
+            polling: Optional[PollingStrategy] = None
+    ) -> Any:
+        """
+        Вызывает условие, пока его результат не станет ложным.
+        Исключение из IGNORED_EXCEPTIONS считается выполнением ожидания.
+
+        :param method: Корутинная функция, принимающая AsyncWebDriver.
+        :param message: Сообщение TimeoutException.
+        :param polling: Стратегия опроса только для этого вызова.
+        :return: Результат последнего вызова условия или True.
+        """
+        return await self.__wait(method, message, polling, is_negated=True)
+
+    async def __wait(
+            self,
+            method: AsyncCondition,
+            message: str,
+            polling: Optional[PollingStrategy],
+            is_negated: bool
+    ) -> Any:
+        deadline = Deadline(self._timeout, self._parent_deadline)
+        delays = (polling or self._polling).delays()
+        self._polls = 0
+        started = perf_counter()
+        is_succeeded = False
+
+        try:
+            while True:
+                self._polls += 1
+                try:
+                    value = await method(self._page_object.emulator)
+                    if bool(value) != is_negated:
+                        is_succeeded = True
+                        return value
+                except InvalidSelectorException as exc:
+                    await self._page_object.make_screenshot(is_error=True)
+                    raise exc
+                except self._ignored_exceptions:
+                    if is_negated:
+                        is_succeeded = True
+                        return True
+                if deadline.is_expired():
+                    break
+                await sleep(min(next(delays), deadline.remaining))
+        finally:
+            self._notify_listeners(started, is_succeeded)
+        await self._page_object.make_screenshot(is_error=True)
+        raise TimeoutException(message)
+
+    def _notify_listeners(self, started: float, is_succeeded: bool) -> None:
+        """
+        Передаёт слушателям page_object сведения о завершённом ожидании.
+
+        :param started: Время начала ожидания.
+        :param is_succeeded: Флаг выполнения условия.
+        :return: None
+        """
+        listeners = getattr(self._page_object, 'listeners', ())
+        if listeners:
+            duration = perf_counter() - started
+            for listener in listeners:
+                listener.on_wait(started, duration, self._polls, is_succeeded)
@@ -0,0 +1,322 @@
+import json
+import logging
+import os
+import re
+from hashlib import sha1
+from os.path import abspath
+from os.path import join
+from threading import Lock
+from time import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from .base_settings import AUTH_SNAPSHOTS_DIRECTORY
+from .base_settings import AUTH_SNAPSHOTS_TTL
+from .devtools import send_devtools_command
+from .instrumentation import ActionListener
+from .scripts import GET_STORAGES_SCRIPT
+from .scripts import SET_STORAGES_SCRIPT
+
+logger = logging.getLogger(__name__)
+
+# Поля cookie, общие для WebDriver и DevTools протокола
+_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+
+
+def _get_origin(url: str) -> str:
+    """
+    Возвращает источник (схема и хост) адреса.
+
+    :param url: Адрес страницы.
+    :return: Источник вида https://host:port или пустая строка для адресов без хоста.
+    """
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}' if parts.netloc else ''
+
+
+def _from_devtools_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Приводит cookie DevTools протокола к формату WebDriver.
+
+    :param cookie: Cookie из ответа Network.getAllCookies.
+    :return: Cookie в формате WebDriver.
+    """
+    result = {field: cookie[field] for field in _COOKIE_FIELDS if field in cookie}
+    if not cookie.get('session') and cookie.get('expires', -1) > 0:
+        result['expiry'] = int(cookie['expires'])
+    return result
+
+
+def _to_devtools_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Приводит cookie в формате WebDriver к параметру команды Network.setCookies.
+
+    :param cookie: Cookie в формате WebDriver.
+    :return: Cookie в формате DevTools протокола.
+    """
+    result = {field: cookie[field] for field in _COOKIE_FIELDS if field in cookie}
+    if 'expiry' in cookie:
+        result['expires'] = cookie['expiry']
+    return result
+
+
+class AuthSnapshot:
+    """
+    Снимок авторизованного состояния сессии: cookies, localStorage и sessionStorage одного источника.
+    Сериализуется в словарь для хранения в AuthSnapshotCache.
+    """
+
+    __slots__ = ('url', 'cookies', 'local_storage', 'session_storage', 'created')
+
+    def __init__(
+            self,
+            url: str,
+            cookies: List[Dict[str, Any]],
+            local_storage: Optional[Dict[str, str]] = None,
+            session_storage: Optional[Dict[str, str]] = None,
+            created: Optional[float] = None
+    ):
+        """
+        :param url: Адрес страницы, на которой снят снимок.
+        :param cookies: Cookies в формате WebDriver.
+        :param local_storage: Элементы localStorage.
+        :param session_storage: Элементы sessionStorage.
+        :param created: Время создания снимка (unix time); None - текущее время.
+        """
+        self.url = url
+        self.cookies = cookies
+        self.local_storage = local_storage or {}
+        self.session_storage = session_storage or {}
+        self.created = time() if created is None else created
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} (origin={self.origin!r}, cookies={len(self.cookies)}, '
+            f'local_storage={len(self.local_storage)}, session_storage={len(self.session_storage)})>'
+        )
+
+    @property
+    def origin(self) -> str:
+        """
+        Возвращает источник, к которому относятся хранилища снимка.
+
+        :return: Источник вида https://host:port.
+        """
+        return _get_origin(self.url)
+
+    @property
+    def age(self) -> float:
+        """
+        Возвращает возраст снимка.
+
+        :return: Количество секунд с момента создания.
+        """
+        return time() - self.created
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Сериализует снимок в словарь.
+
+        :return: Словарь, пригодный для json.dumps.
+        """
+        return {
+            'url': self.url,
+            'cookies': self.cookies,
+            'local_storage': self.local_storage,
+            'session_storage': self.session_storage,
+            'created': self.created,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AuthSnapshot':
+        """
+        Восстанавливает снимок из словаря, полученного методом to_dict.
+
+        :param data: Словарь снимка.
+        :return: AuthSnapshot
+        """
+        return cls(
+            url=data['url'],
+            cookies=data['cookies'],
+            local_storage=data.get('local_storage'),
+            session_storage=data.get('session_storage'),
+            created=data.get('created')
+        )
+
+
+def capture_auth_snapshot(
+        emulator: Any,
+        has_devtools: bool = True,
+        listeners: Sequence[ActionListener] = ()
+) -> AuthSnapshot:
+    """
+    Снимает авторизованное состояние текущей страницы: хранилища - одним вызовом JavaScript,
+    cookies всех доменов (включая httpOnly) - одной командой Network.getAllCookies DevTools протокола,
+    а без него - командой WebDriver для cookies текущего домена.
+
+    :param emulator: Объект вебдрайвера.
+    :param has_devtools: Флаг использования DevTools протокола (Chromium).
+    :param listeners: Слушатели команд DevTools протокола.
+    :return: AuthSnapshot
+    """
+    storages = emulator.execute_script(GET_STORAGES_SCRIPT)
+    if has_devtools:
+        response = send_devtools_command(emulator, 'Network.getAllCookies', listeners=listeners, is_checked=True)
+        cookies = [_from_devtools_cookie(cookie) for cookie in response['value']['cookies']]
+    else:
+        cookies = emulator.get_cookies()
+    return AuthSnapshot(storages['url'], cookies, storages['localStorage'], storages['sessionStorage'])
+
+
+def restore_auth_snapshot(
+        emulator: Any,
+        snapshot: AuthSnapshot,
+        url: Optional[str] = None,
+        has_devtools: bool = True,
+        listeners: Sequence[ActionListener] = ()
+) -> None:
+    """
+    Восстанавливает снимок в сессии и открывает страницу. Cookies устанавливаются одной командой
+    Network.setCookies DevTools протокола (без него - по одной командой WebDriver на странице источника снимка),
+    хранилища - одним вызовом JavaScript на странице источника; переход на источник выполняется,
+    только если он требуется и сессия находится на другом источнике.
+
+    :param emulator: Объект вебдрайвера.
+    :param snapshot: Снимок авторизации.
+    :param url: Адрес, открываемый после восстановления; None - адрес, на котором снят снимок.
+    :param has_devtools: Флаг использования DevTools протокола (Chromium).
+    :param listeners: Слушатели команд DevTools протокола.
+    :return: None
+    """
+    now = time()
+    cookies = [cookie for cookie in snapshot.cookies if cookie.get('expiry', now + 1) > now]
+    has_storages = bool(snapshot.local_storage or snapshot.session_storage)
+    if (has_storages or not has_devtools) and _get_origin(emulator.current_url) != snapshot.origin:
+        emulator.get(snapshot.origin + '/')
+    if has_devtools:
+        send_devtools_command(
+            emulator,
+            'Network.setCookies',
+            {'cookies': [_to_devtools_cookie(cookie) for cookie in cookies]},
+            listeners=listeners,
+            is_checked=True
+        )
+    else:
+        for cookie in cookies:
+            try:
+                emulator.add_cookie(cookie)
+            except WebDriverException as exc:
+                # WebDriver устанавливает cookies только для домена текущей страницы
+                logger.debug('Cookie %s не восстановлена: %s', cookie.get('name'), exc)
+    if has_storages:
+        emulator.execute_script(SET_STORAGES_SCRIPT, snapshot.local_storage, snapshot.session_storage)
+    emulator.get(url or snapshot.url)
+
+
+class AuthSnapshotCache:
+    """
+    Дисковый кэш снимков авторизации по пользователю и окружению со временем жизни ttl.
+    Снимки содержат действующие сессионные cookies, поэтому файлы создаются с доступом только для владельца,
+    а директорию кэша не следует сохранять в артефактах прогона.
+    """
+
+    def __init__(self, directory: str = AUTH_SNAPSHOTS_DIRECTORY, ttl: float = AUTH_SNAPSHOTS_TTL):
+        """
+        :param directory: Директория файлов снимков (относительный путь - от текущей директории
+        на момент создания объекта).
+        :param ttl: Время жизни снимка в секундах.
+        """
+        self._directory = abspath(directory)
+        self._ttl = ttl
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (directory={self._directory!r}, ttl={self._ttl})>'
+
+    @property
+    def ttl(self) -> float:
+        """
+        Возвращает время жизни снимка.
+
+        :return: Количество секунд.
+        """
+        return self._ttl
+
+    def get_path(self, user: str, environment: str) -> str:
+        """
+        Возвращает путь к файлу снимка.
+
+        :param user: Имя пользователя.
+        :param environment: Имя окружения (стенда).
+        :return: Абсолютный путь к файлу.
+        """
+        key = sha1(f'{environment}\n{user}'.encode()).hexdigest()[:8]
+        name = re.sub(r'[^\w.-]+', '_', f'{environment}-{user}')
+        return join(self._directory, f'{name}-{key}.json')
+
+    def get(self, user: str, environment: str) -> Optional[AuthSnapshot]:
+        """
+        Возвращает действующий снимок из кэша; просроченный или повреждённый снимок удаляется.
+
+        :param user: Имя пользователя.
+        :param environment: Имя окружения (стенда).
+        :return: AuthSnapshot или None, если снимка нет.
+        """
+        path = self.get_path(user, environment)
+        with self._lock:
+            try:
+                with open(path, encoding='utf-8') as file:
+                    snapshot = AuthSnapshot.from_dict(json.load(file))
+            except FileNotFoundError:
+                return None
+            except (ValueError, KeyError, TypeError) as exc:
+                logger.warning('Повреждённый снимок авторизации %s: %s', path, exc)
+                self.__remove(path)
+                return None
+            if snapshot.age > self._ttl:
+                self.__remove(path)
+                return None
+            return snapshot
+
+    def put(self, user: str, environment: str, snapshot: AuthSnapshot) -> None:
+        """
+        Сохраняет снимок в кэш. Файл записывается атомарно, поэтому параллельные сессии
+        не прочитают его частично.
+
+        :param user: Имя пользователя.
+        :param environment: Имя окружения (стенда).
+        :param snapshot: Снимок авторизации.
+        :return: None
+        """
+        path = self.get_path(user, environment)
+        temporary_path = f'{path}.{os.getpid()}.tmp'
+        with self._lock:
+            os.makedirs(self._directory, exist_ok=True)
+            descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(descriptor, 'w', encoding='utf-8') as file:
+                json.dump(snapshot.to_dict(), file, ensure_ascii=False)
+            os.replace(temporary_path, path)
+
+    def invalidate(self, user: str, environment: str) -> None:
+        """
+        Удаляет снимок из кэша (например, если после его восстановления сессия не авторизована).
+
+        :param user: Имя пользователя.
+        :param environment: Имя окружения (стенда).
+        :return: None
+        """
+        with self._lock:
+            self.__remove(self.get_path(user, environment))
+
+    @staticmethod
+    def __remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -1,55 +1,169 @@
-from json import dumps
-from os import chdir
-from os import curdir
-from os import pardir
-from os.path import join
+from contextlib import contextmanager
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Mapping
 from typing import NoReturn
+from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver import Firefox
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.remote.webelement import WebElement
-from testit import step  # type: ignore
 
+from .actions_core import ActionsCore
+from .actions_core import describe_idle_state
+from .actions_core import describe_locators
+from .actions_core import describe_unsatisfied_locators
+from .actions_core import get_query_fields
+from .actions_core import is_text_matched
+from .auth_snapshot import AuthSnapshot
+from .auth_snapshot import AuthSnapshotCache
+from .auth_snapshot import capture_auth_snapshot
+from .auth_snapshot import restore_auth_snapshot
 from .base_settings import EXPLICITLY_TIMEOUT
 from .base_settings import IGNORED_EXCEPTIONS
+from .base_settings import NETWORK_CAPTURE_BUFFER_SIZE
+from .base_settings import NETWORK_CAPTURE_STEP_BUDGET
+from .base_settings import NETWORK_IDLE_POLL_INTERVAL
+from .base_settings import NETWORK_IDLE_TIME
 from .base_settings import POLL_FREQUENCY
+from .base_settings import QUERY_FIELDS
 from .base_settings import SCREENSHOTS_DIRECTORY
-from .base_settings import SCREENSHOTS_EXTENSION
+from .base_settings import SCRIPT_TIMEOUT_MARGIN
+from .blocking import BlockingRule
+from .blocking import NO_BLOCKING
+from .blocking import RequestBlockingStats
+from .blocking import apply_request_blocking
+from .blocking import get_request_blocker
+from .blocking import resolve_blocking_rule
 from .custom_webdriver_wait import CustomWebDriverWait
+from .deadline import Deadline
+from .devtools import is_devtools_available
+from .devtools import send_devtools_command
+from .devtools import send_devtools_commands
+from .devtools_channel import DevToolsChannel
+from .devtools_channel import DevToolsCommand
+from .devtools_channel import DevToolsConnection
+from .devtools_channel import get_devtools_channel
+from .instrumentation import ActionListener
+from .instrumentation import attach_command_listener
+from .instrumentation import detach_command_listener
 from .locator import Locator
+from .network_idle import NetworkActivityTracker
+from .network_recorder import NetworkRecorder
+from .performance import PerformanceReport
+from .performance import collect_page_performance
+from .performance import find_budget_violations
+from .screenshots import ScreenshotPolicy
+from .session_pool import reset_browser_state
+from .scripts import GET_ATTRIBUTES_SCRIPT
+from .scripts import GET_TEXTS_SCRIPT
+from .scripts import PAGE_FINGERPRINT_SCRIPT
+from .scripts import QUERY_MANY_SCRIPT
+from .scripts import WAIT_FOR_CONDITION_SCRIPT
+from .scripts import WAIT_FOR_PAGE_IDLE_SCRIPT
+from .step_reporter import StepDescription
+from .step_reporter import StepReporter
+from .throttling import NO_THROTTLING
+from .throttling import OFFLINE
+from .throttling import ThrottlingProfile
+from .throttling import apply_throttling_profile
+from .throttling import resolve_throttling_profile
 from .utils import sleep_poll_frequency
 
 
-class BaseActions:
+class BaseActions(ActionsCore[Firefox]):
     """
     Класс абстракций для обобщения низкоуровневых действий браузера.
     """
 
-    _IS_ABSTRACT_CLASS = True
+    # Дисковый кэш снимков авторизации для login_by_auth_snapshot
+    AUTH_SNAPSHOT_CACHE: AuthSnapshotCache = AuthSnapshotCache()
+    # Отчёт о производительности страниц за прогон
+    PERFORMANCE_REPORT: PerformanceReport = PerformanceReport()
+    # Сохранено для обратной совместимости: попытки внутри действий ограничены крайним сроком (deadline)
     ATTEMPTS_NUMBER = int(EXPLICITLY_TIMEOUT // POLL_FREQUENCY)
 
-    def __init__(self, emulator: Firefox, test_method_name: str):
-        if self._IS_ABSTRACT_CLASS:
-            raise NotImplementedError(
-                'Невозможно создать экземпляр абстрактного базового класса'
-            )
-        else:
-            self._emulator = emulator
-            self._test_method_name = test_method_name
+    def __init__(
+            self,
+            emulator: Firefox,
+            test_method_name: str,
+            has_element_cache: bool = False,
+            screenshots_directory: str = SCREENSHOTS_DIRECTORY,
+            step_reporter: Optional[StepReporter] = None,
+            screenshot_policy: Optional[ScreenshotPolicy] = None
+    ):
+        """
+        :param emulator: Объект вебдрайвера.
+        :param test_method_name: Имя тестового метода (используется в имени скриншота).
+        :param has_element_cache: Флаг кэширования найденных элементов WebElement по локатору.
+        :param screenshots_directory: Директория скриншотов сессии (относительный путь - от текущей директории
+        на момент создания объекта).
+        :param step_reporter: Буфер шагов TestIT сессии; None - общий буфер потока.
+        :param screenshot_policy: Политика скриншотов теста; None - общая политика объектов страниц теста
+        с тем же test_method_name.
+        """
+        super().__init__(
+            emulator,
+            test_method_name,
+            has_element_cache,
+            screenshots_directory,
+            step_reporter,
+            screenshot_policy
+        )
+        self._network_tracker: Optional[NetworkActivityTracker] = None
+        self._network_recorder: Optional[NetworkRecorder] = None
 
-    @property
-    def emulator(self) -> Firefox:
+    def _attach_command_listener(self, listener: ActionListener) -> None:
+        attach_command_listener(self._emulator, listener)
+
+    def _detach_command_listener(self, listener: ActionListener) -> None:
+        detach_command_listener(self._emulator, listener)
+
+    def finish_test(self) -> None:
         """
-        Возвращает объект вебдрайвера.
+        Завершает тест: передаёт накопленные шаги в TestIT, дожидается записи скриншотов, сбрасывает политику
+        скриншотов теста и передаёт слушателям событие окончания теста
+        (например, MetricsCollector записывает JSON-сводку).
+        Вызывается в конце теста; при STEPS_FLUSH_POLICY = 'test' - в теле теста, а не в фикстуре,
+        иначе адаптер TestIT отнесёт шаги к фикстуре.
 
-        :return: webdriver
+        :return: None
         """
-        return self._emulator
+        self.flush_steps()
+        self.flush_screenshots()
+        self._release_screenshot_policy()
+        self._notify_test_finished()
+
+    @contextmanager
+    def _step(
+            self,
+            title: str,
+            description: StepDescription = None,
+            timeout: float = EXPLICITLY_TIMEOUT
+    ) -> Iterator[None]:
+        """
+        Открывает шаг TestIT и крайний срок действия, сообщает слушателям о начале и окончании шага
+        (см. ActionsCore._step_scope): все ожидания и повторные попытки одного действия укладываются в timeout.
+
+        :param title: Заголовок шага TestIT.
+        :param description: Описание шага TestIT: строка или функция, вычисляемая только при передаче шага.
+        :param timeout: Количество секунд на выполнение действия.
+        :return: None
+        """
+        with self._step_scope(title, description, timeout):
+            yield
 
     def __errors_handler(
             self,
@@ -64,10 +178,10 @@ class BaseActions:
         :return:
         """
 
-        if isinstance(error, IGNORED_EXCEPTIONS):
-            sleep_poll_frequency()
+        if self._is_retryable(error):
+            sleep_poll_frequency(self._deadline)
         else:
-            self.make_screenshot()
+            self.make_screenshot(is_error=True)
             error.__traceback__ = None
             raise AssertionError(desc)
 
@@ -78,7 +192,7 @@ class BaseActions:
         :param desc: Описание ошибки
         :return:
         """
-        self.make_screenshot()
+        self.make_screenshot(is_error=True)
         raise AssertionError(desc)
 
     def emulator_refresh(self) -> None:
@@ -86,20 +200,48 @@ class BaseActions:
         Перезагружает текущую страницу
         """
         self._emulator.refresh()
+        if self._element_cache is not None:
+            self._element_cache.invalidate()
 
-    def find_element_return_bool(self, locator: Locator) -> bool:
+    def find_element_return_bool(self, locator: Locator, timeout: float = EXPLICITLY_TIMEOUT) -> bool:
         """
         Возвращает True/False в зависимости от наличия элемента.
 
         :param locator: Locator - локатор элемента
+        :param timeout: Количество секунд на ожидание появления элемента, 0 - одна проверка без ожидания.
         :return: Возвращает True/False в зависимости от наличия элемента
         """
-        with step('Проверка элемента на видимость (возвращение значения True/False)', locator.description):
-            try:
-                self.find_element(locator)
-                return True
-            except AssertionError:
-                return False
+        with self._step('Проверка элемента на видимость (возвращение значения True/False)', locator.description,
+                        timeout=timeout):
+            return self.probe_element(locator, timeout=timeout)
+
+    def probe_element(self, locator: Locator, timeout: float = 0.0, is_visible: bool = False) -> bool:
+        """
+        Проверяет наличие (или видимость) элемента в пределах заданного времени без скриншота и ошибки,
+        если элемент не найден; необрабатываемое исключение - скриншот и AssertionError.
+        Каждая проверка выполняется одним вызовом JavaScript; True возвращается при первом обнаружении элемента.
+
+        :param locator: Locator - локатор элемента
+        :param timeout: Количество секунд на ожидание, 0 - одна проверка без ожидания.
+        :param is_visible: Флаг проверки видимости элемента вместо наличия в DOM.
+        :return: True, если элемент найден (и видим), иначе False.
+        """
+        field = 'visible' if is_visible else 'present'
+        with self._step('Быстрая проверка элемента (возвращение значения True/False)', locator.description,
+                        timeout=timeout):
+            for _ in self._attempts():
+                try:
+                    if self.query_many((locator,), fields=(field,), wait_for=None)[0][field]:
+                        return True
+                except Exception as exc:
+                    if not self._is_retryable(exc):
+                        self.make_screenshot(is_error=True)
+                        exc.__traceback__ = None
+                        raise AssertionError(
+                            f'Невозможно проверить наличие элемента {locator.description}. Необрабатываемое исключение.'
+                        )
+                sleep_poll_frequency(self._deadline)
+            return False
 
     def find_element(self, locator: Locator) -> WebElement:
         """
@@ -108,10 +250,10 @@ class BaseActions:
         :param locator: Локатор искомого элемента.
         :return: Объект WebElement.
         """
-        with step('Поиск элемента по локатору', locator.description):
-            for _ in range(self.ATTEMPTS_NUMBER):
+        with self._step('Поиск элемента по локатору', locator.description):
+            for _ in self._attempts():
                 try:
-                    return self._emulator.find_element(*locator())
+                    return self.__lookup_element(locator)
                 except Exception as exc:
                     self.__errors_handler(
                         error=exc,
@@ -121,14 +263,51 @@ class BaseActions:
                 f'Невозможно найти элемент {locator.description}. Истекло количество попыток.'
             )
 
+    def __lookup_element(self, locator: Locator) -> WebElement:
+        """
+        Берёт элемент из кэша, а при его отсутствии находит одним запросом к WebDriver.
+
+        :param locator: Локатор искомого элемента.
+        :return: Объект WebElement.
+        """
+        if self._element_cache is None:
+            return self._emulator.find_element(*locator())
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = self._emulator.find_element(*locator())
+            self._element_cache.put(locator, element)
+        return element
+
+    def __element_condition(
+            self,
+            locator: Locator,
+            predicate: Callable[[WebElement], bool]
+    ) -> Callable[[Any], Union[WebElement, bool]]:
+        """
+        Создаёт условие для CustomWebDriverWait, проверяющее элемент с учётом кэша элементов.
+
+        :param locator: Локатор элемента.
+        :param predicate: Проверка найденного элемента.
+        :return: Условие, возвращающее элемент при выполнении проверки, иначе False.
+        """
+        def condition(_) -> Union[WebElement, bool]:
+            element = self.__lookup_element(locator)
+            try:
+                return element if predicate(element) else False
+            except StaleElementReferenceException:
+                if self._element_cache is not None:
+                    self._element_cache.invalidate(locator)
+                raise
+        return condition
+
     def find_elements(self, locator: Locator) -> List[WebElement]:
         """
         Находит элементы с одинаковым локатором.
         :param locator: Локатор искомого элемента.
         :return: Список объектов WebElement.
         """
-        with step('Поиск элементов по локатору', locator.description):
-            for _ in range(self.ATTEMPTS_NUMBER):
+        with self._step('Поиск элементов по локатору', locator.description):
+            for _ in self._attempts():
                 try:
                     return self._emulator.find_elements(*locator())
                 except Exception as exc:
@@ -140,15 +319,55 @@ class BaseActions:
                 f'Невозможно найти элементы {locator.description}. Истекло количество попыток.'
             )
 
-    def make_screenshot(self) -> None:
+    def make_screenshot(self, locator: Optional[Locator] = None, is_error: bool = False) -> None:
+        """
+        Создаёт скриншот страницы браузера или отдельного элемента.
+        Скриншот снимается в память, а записывается на диск фоновым потоком SCREENSHOT_WRITER.
+        Согласно screenshot_policy скриншот пропускается, если исчерпан лимит теста или страница не изменилась
+        с предыдущего скриншота; каждый следующий скриншот теста сохраняется в отдельный файл с номером.
+        Скриншот ошибки снимается всегда.
+
+        :param locator: Локатор элемента для скриншота только этого элемента.
+        :param is_error: Флаг скриншота ошибки перед падением теста.
+        :return: None
+        """
+        if not self._screenshot_policy.has_capacity(is_error):
+            return None
+        fingerprint = self.__page_fingerprint(locator)
+        if not self._screenshot_policy.is_changed(fingerprint, is_error):
+            return None
+        png = None
+        if locator is not None:
+            try:
+                png = self.__lookup_element(locator).screenshot_as_png
+            except WebDriverException:
+                pass  # Элемент недоступен - снимаем страницу целиком
+        if png is None:
+            png = self._emulator.get_screenshot_as_png()
+        self.SCREENSHOT_WRITER.submit(self._register_screenshot(fingerprint), png)
+
+    def __page_fingerprint(self, locator: Optional[Locator] = None) -> Optional[str]:
         """
-        Создаёт скриншот страницы браузера.
+        Возвращает отпечаток состояния страницы для пропуска повторных скриншотов.
+
+        :param locator: Локатор элемента, если снимается скриншот элемента.
+        :return: Отпечаток страницы или None, если отпечаток не нужен или его не удалось получить.
+        """
+        if not self._screenshot_policy.is_deduplicated:
+            return None
+        try:
+            fingerprint = self._emulator.execute_script(PAGE_FINGERPRINT_SCRIPT)
+        except WebDriverException:
+            return None
+        return self._screenshot_fingerprint(fingerprint, locator)
+
+    def flush_screenshots(self) -> None:
+        """
+        Ждёт записи на диск всех снятых скриншотов.
 
         :return: None
         """
-        chdir(path=join(curdir, SCREENSHOTS_DIRECTORY))
-        self._emulator.save_screenshot(f'{self._test_method_name}.{SCREENSHOTS_EXTENSION}')
-        chdir(path=pardir)
+        self.SCREENSHOT_WRITER.flush()
 
     def check_element_visibility(self, locator: Locator) -> None:
         """
@@ -157,33 +376,34 @@ class BaseActions:
         :param locator: Locator
         :return: None
         """
-        with step('Проверка присутствие элемента в DOM и его видимость', locator.description):
+        with self._step('Проверка присутствие элемента в DOM и его видимость', locator.description):
             CustomWebDriverWait(
                 self,
                 EXPLICITLY_TIMEOUT
             ).until(
-                EC.visibility_of_element_located(
-                    locator()
+                self.__element_condition(
+                    locator,
+                    lambda element: element.is_displayed()
                 ),
                 f'Элемент {locator.description} не отображается.'
             )
 
-    def check_element_invisibility(self, locator: Locator) -> None:
+    def check_element_invisibility(self, locator: Locator, timeout: float = EXPLICITLY_TIMEOUT) -> None:
         """
         Проверяет невидимость элемента.
+        Проверка проходит при первом же наблюдении, в котором элемент скрыт или отсутствует в DOM.
 
         :param locator: Locator
+        :param timeout: Количество секунд на ожидание невидимости элемента.
         :return: None
         """
-        with step('Проверка на невидимость элемента', locator.description):
+        with self._step('Проверка на невидимость элемента', locator.description, timeout=timeout):
             CustomWebDriverWait(
                 self,
-                EXPLICITLY_TIMEOUT
+                timeout
             ).until(
-                EC.invisibility_of_element(
-                    self.find_element(
-                        locator
-                    )
+                EC.invisibility_of_element_located(
+                    locator()
                 ),
                 f'Элемент {locator.description} отображается.'
             )
@@ -195,14 +415,15 @@ class BaseActions:
         :param locator: Locator
         :return: None
         """
-        with step('Проверка кликабельности элемента', locator.description):
+        with self._step('Проверка кликабельности элемента', locator.description):
             self.check_element_visibility(locator)
             CustomWebDriverWait(
                 self,
                 EXPLICITLY_TIMEOUT
             ).until(
-                EC.element_to_be_clickable(
-                    locator()
+                self.__element_condition(
+                    locator,
+                    lambda element: element.is_displayed() and element.is_enabled()
                 ),
                 f'Элемент {locator.description} не кликабельный.'
             )
@@ -215,10 +436,10 @@ class BaseActions:
         :param has_check_clickability: Флаг доступности элемента для клика.
         :return: None.
         """
-        with step('Нажатие на элемент при помощи Webdriver', locator.description):
+        with self._step('Нажатие на элемент при помощи Webdriver', locator.description):
             if has_check_clickability:
                 self.check_element_clickability(locator)
-            for _ in range(self.ATTEMPTS_NUMBER):
+            for _ in self._attempts():
                 try:
                     self.find_element(locator).click()
                     return None
@@ -238,7 +459,7 @@ class BaseActions:
         :param locator: Locator селектор элемента
         :return: None
         """
-        with step('Нажатие на элемент при помощи ActionChance', locator.description):
+        with self._step('Нажатие на элемент при помощи ActionChance', locator.description):
             self.check_element_visibility(locator)
             ActionChains(self._emulator).click(self.find_element(locator)).perform()
 
@@ -249,11 +470,10 @@ class BaseActions:
         :param locator: Locator селектор элемента
         :return: None
         """
-        with step('Нажатие на элемент при помощи ActionChance', locator.description):
+        with self._step('Нажатие на элемент при помощи ActionChance', locator.description):
             self.check_element_visibility(locator)
-            ActionChains(
-                self._emulator
-            ).move_to_element(self.find_element(locator)).click(self.find_element(locator)).perform()
+            element = self.find_element(locator)
+            ActionChains(self._emulator).move_to_element(element).click(element).perform()
 
     def click_element_by_javascript(self, locator: Locator) -> None:
         """
@@ -262,10 +482,10 @@ class BaseActions:
         :param locator: Locator селектор элемента
         :return: None
         """
-        with step('Нажатие на элемент при помощи JavaScript', locator.description):
-            for _ in range(self.ATTEMPTS_NUMBER):
+        with self._step('Нажатие на элемент при помощи JavaScript', locator.description):
+            for _ in self._attempts():
                 try:
-                    self._emulator.execute_script('$(arguments[0]).click();', self.find_element(locator))
+                    self._emulator.execute_script('arguments[0].click();', self.find_element(locator))
                     return None
                 except Exception as exc:
                     self.__errors_handler(
@@ -284,10 +504,10 @@ class BaseActions:
         :param locator: Locator
         :return: Возвращает значение из элемента
         """
-        with step('Получение значения с элемента', locator.description):
+        with self._step('Получение значения с элемента', locator.description):
             if has_check_visibility:
                 self.check_element_visibility(locator)
-            for _ in range(self.ATTEMPTS_NUMBER):
+            for _ in self._attempts():
                 try:
                     return self.find_element(locator).get_attribute('value').strip(' \n\t')  # type: ignore
                 except Exception as exc:
@@ -305,9 +525,9 @@ class BaseActions:
         :param locator: Locator
         :return: Возвращает текст из элемента
         """
-        with step('Получение текста из элемента', locator.description):
+        with self._step('Получение текста из элемента', locator.description):
             self.check_element_visibility(locator)
-            for _ in range(self.ATTEMPTS_NUMBER):
+            for _ in self._attempts():
                 try:
                     return self.find_element(locator).text.strip()
                 except Exception as exc:
@@ -328,25 +548,68 @@ class BaseActions:
         :param locators: кортеж локаторов.
         :return: кортеж с текстами элементов.
         """
-        with step('Получение списка текстов из списка элементов', [locator.description + '; ' for locator in locators]):
-            strings_from_elements = []
-            for locator in locators:
-                strings_from_elements.append(
-                    self.get_text_from_element(locator)
+        with self._step('Получение списка текстов из списка элементов', lambda: describe_locators(locators)):
+            return tuple(result['text'] for result in self.query_many(locators, fields=('text',)))
+
+    def query_many(
+            self,
+            locators: Sequence[Locator],
+            fields: Sequence[str] = QUERY_FIELDS,
+            wait_for: Optional[str] = 'visible'
+    ) -> List[Dict[str, Any]]:
+        """
+        Запрашивает состояние элементов сразу по нескольким локаторам за один вызов JavaScript.
+        Ожидание условия wait_for выполняется для всех локаторов в пределах одного общего тайм-аута.
+
+        :param locators: Последовательность локаторов.
+        :param fields: Запрашиваемые поля: text (текст первого элемента), count (кол-во элементов),
+        visible (видимость первого элемента), present (наличие в DOM).
+        :param wait_for: Поле, которое должно стать истинным для всех локаторов (visible/present),
+        None - без ожидания.
+        :return: Список словарей с запрошенными полями в порядке следования локаторов.
+        """
+        with self._step('Запрос состояния элементов по нескольким локаторам', lambda: describe_locators(locators)):
+            requested_fields = get_query_fields(fields, wait_for)
+            results: List[Dict[str, Any]] = []
+
+            def all_satisfy_condition(_) -> Union[List[Dict[str, Any]], bool]:
+                results[:] = self._emulator.execute_script(
+                    QUERY_MANY_SCRIPT,
+                    [list(locator()) for locator in locators],
+                    requested_fields
                 )
-            return tuple(strings_from_elements)
+                return wait_for is None or all(result[wait_for] for result in results)
 
-    def get_texts_from_elements_with_identical_locators(self, locator: Locator) -> Union[Tuple[str], Tuple[str, ...]]:
+            try:
+                CustomWebDriverWait(
+                    self,
+                    EXPLICITLY_TIMEOUT
+                ).until(
+                    all_satisfy_condition,
+                    f'Элементы не удовлетворяют условию {wait_for}.'
+                )
+            except TimeoutException:
+                raise TimeoutException(describe_unsatisfied_locators(locators, results, wait_for)) from None
+            return [{field: result[field] for field in fields} for result in results]
+
+    def get_texts_from_elements_with_identical_locators(
+            self,
+            locator: Locator,
+            is_batched: bool = False
+    ) -> Union[Tuple[str], Tuple[str, ...]]:
         """
         Находит элементы с одинаковым локатором и возвращает кортеж строк с текстом из них.
 
         :param locator: Locator элементов.
+        :param is_batched: Флаг чтения текста со всех элементов одним вызовом JavaScript.
         :return: кортеж со строками текста из элементов.
         """
-        with step('Получение списка текстов из элемента', locator.description):
+        with self._step('Получение списка текстов из элемента', locator.description):
             self.check_element_visibility(locator)
-            for _ in range(self.ATTEMPTS_NUMBER):
+            for _ in self._attempts():
                 try:
+                    if is_batched:
+                        return self.__get_texts_by_javascript(locator)
                     strings_from_elements = [
                         element.text.strip() for element in self.find_elements(locator)
                     ]
@@ -359,46 +622,101 @@ class BaseActions:
                     )
             self.screenshot_and_raise_error(f'Элементы {locator.description} не позволют прочитать текст.')
 
-    def wait_for_elements_text_correspond_to_given_set(self, locator: Locator, target_texts: tuple) -> None:
+    def __get_texts_by_javascript(self, locator: Locator) -> Union[Tuple[str], Tuple[str, ...]]:
+        """
+        Возвращает тексты всех элементов с одинаковым локатором за один вызов JavaScript.
+
+        :param locator: Locator элементов.
+        :return: кортеж со строками текста из элементов.
+        """
+        return tuple(self._emulator.execute_script(GET_TEXTS_SCRIPT, *locator()))
+
+    def wait_for_elements_text_correspond_to_given_set(
+            self,
+            locator: Locator,
+            target_texts: tuple,
+            is_batched: bool = True
+    ) -> None:
         """
         Ждёт пока текст в элементах с одинаковым локатором не станет соответствовать целевому множеству.
 
         :param locator: Локатор проверяемых элементов.
         :param target_texts: Кортеж со строками целевого текста.
+        :param is_batched: Флаг чтения текста со всех элементов одним вызовом JavaScript на каждой итерации.
         :return: None.
         """
-        with step('Ожидания до тех пор пока текст в элементах с одинаковым локатором '
-                  'не станет соответствовать целевому значению', locator.description):
+        with self._step('Ожидания до тех пор пока текст в элементах с одинаковым локатором '
+                        'не станет соответствовать целевому значению', locator.description):
             target_texts_set = set(target_texts)
-            for _ in range(self.ATTEMPTS_NUMBER):
-                current_texts_set = set(self.get_texts_from_elements_with_identical_locators(locator))
-                if current_texts_set.issubset(target_texts_set):
+            if is_batched:
+                self.check_element_visibility(locator)
+            for _ in self._attempts():
+                if is_batched:
+                    current_texts_set = self.__get_texts_set_by_javascript(locator)
+                    # Пустое множество в пакетном режиме - элементы пропали или устарели, а не совпали с целью
+                    is_matched = bool(current_texts_set) and current_texts_set.issubset(target_texts_set)
+                else:
+                    current_texts_set = set(self.get_texts_from_elements_with_identical_locators(locator))
+                    is_matched = current_texts_set.issubset(target_texts_set)
+                if is_matched:
                     return None
                 else:
-                    sleep_poll_frequency()
+                    sleep_poll_frequency(self._deadline)
             self.screenshot_and_raise_error(f'Текст на элементе {locator.description} не изменился.')
 
-    def wait_for_change_text(self, locator: Locator, new_text: str, is_strong_coincidence=True) -> None:
+    def __get_texts_set_by_javascript(self, locator: Locator) -> set:
+        """
+        Возвращает множество текстов элементов за один вызов JavaScript.
+        Пустое множество, если элементы пропали со страницы или устарели.
+
+        :param locator: Locator элементов.
+        :return: множество строк текста из элементов.
+        """
+        try:
+            return set(self.__get_texts_by_javascript(locator))
+        except Exception as exc:
+            self.__errors_handler(
+                error=exc,
+                desc=f'Невозможно получить текст со всех элементов {locator.description}. '
+                     'Необрабатываемое исключение.'
+            )
+            return set()
+
+    def wait_for_change_text(
+            self,
+            locator: Locator,
+            new_text: str,
+            is_strong_coincidence=True,
+            is_event_driven: bool = False
+    ) -> None:
         """
         Проверяет, что текст в элементе на странице полностью или частично совпадает с заданным.
 
         :param locator: Locator
         :param new_text: текст, который мы ожидаем увидеть в элементе
         :param is_strong_coincidence: Флаг определяет будет проверка строгой или не строгой
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
         :return: None
         """
-        with step('Ожидания до тех пор пока текст не станет '
-                  'полностью или частично соответствовать целевому значению', locator.description):
+        with self._step('Ожидания до тех пор пока текст не станет '
+                        'полностью или частично соответствовать целевому значению', locator.description):
             new_text = new_text.replace('\xa0', ' ')  # Иногда попадается текст с пробелами без разрыва "\xa0"
 
             self.check_element_visibility(locator)
-            for _ in range(self.ATTEMPTS_NUMBER):
+            if is_event_driven:
+                result = self.__wait_by_observer(locator, 'text', new_text, is_strong_coincidence=is_strong_coincidence)
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    self.screenshot_and_raise_error(
+                        f'Текст на элементе {locator.description} не изменился. '
+                        f'Ожидаемое значение: {new_text}. Текущее значение: {result["current"]}')
+            for _ in self._attempts():
                 element_text = self.get_text_from_element(locator)
-                if is_strong_coincidence and new_text == element_text or not \
-                        is_strong_coincidence and new_text in element_text:
+                if is_text_matched(new_text, element_text, is_strong_coincidence):
                     return None
                 else:
-                    sleep_poll_frequency()
+                    sleep_poll_frequency(self._deadline)
             self.screenshot_and_raise_error(
                 f'Текст на элементе {locator.description} не изменился. '
                 f'Ожидаемое значение: {new_text}. Текущее значение: {element_text}')
@@ -408,7 +726,8 @@ class BaseActions:
             locator: Locator,
             new_value: str,
             is_strong_coincidence: bool = True,
-            has_check_visibility: bool = True
+            has_check_visibility: bool = True,
+            is_event_driven: bool = False
     ) -> None:
         """
         Проверяет, что текст в элементе на странице полностью или частично совпадает с заданным.
@@ -417,23 +736,30 @@ class BaseActions:
         :param new_value: Текст, который мы ожидаем увидеть в элементе.
         :param is_strong_coincidence: Флаг строгости проверки. По умолчанию True.
         :param has_check_visibility: Флаг проверки видимости элемента. По умолчанию True.
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
         :return: None.
         """
-        with step('Ожидания до тех пор пока значение не станет '
-                  'полностью или частично совпадает с заданным', locator.description):
+        with self._step('Ожидания до тех пор пока значение не станет '
+                        'полностью или частично совпадает с заданным', locator.description):
             if has_check_visibility:
                 self.check_element_visibility(locator)
-            for _ in range(self.ATTEMPTS_NUMBER):
-                current_value = self.get_value_from_element(locator, has_check_visibility=has_check_visibility)
-                has_strong_coincidence = is_strong_coincidence and new_value == current_value
-                has_not_strong_coincidence = not is_strong_coincidence and new_value in self.get_value_from_element(
+            if is_event_driven:
+                result = self.__wait_by_observer(
                     locator,
-                    has_check_visibility=has_check_visibility
+                    'value',
+                    new_value,
+                    is_strong_coincidence=is_strong_coincidence
                 )
-                if has_strong_coincidence or has_not_strong_coincidence:
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    self.screenshot_and_raise_error(f'Значение в элементе {locator.description} не изменилось.')
+            for _ in self._attempts():
+                current_value = self.get_value_from_element(locator, has_check_visibility=has_check_visibility)
+                if is_text_matched(new_value, current_value, is_strong_coincidence):
                     return None
                 else:
-                    sleep_poll_frequency()
+                    sleep_poll_frequency(self._deadline)
             self.screenshot_and_raise_error(f'Значение в элементе {locator.description} не изменилось.')
 
     def fill_text(self, locator: Locator, text: str) -> None:
@@ -444,25 +770,25 @@ class BaseActions:
         :param text: текст для ввода
         :return: None
         """
-        with step('Ввод текста после нажатия на элемент', locator.description):
+        with self._step('Ввод текста после нажатия на элемент', locator.description):
             self.click_element_by_webdriver(locator)
-            for attempt in range(self.ATTEMPTS_NUMBER):
+            for _ in self._attempts():
                 try:
                     self.find_element(locator).clear()
                     break
                 except IGNORED_EXCEPTIONS:
-                    if attempt == self.ATTEMPTS_NUMBER - 1:
-                        self.screenshot_and_raise_error(
-                            f'Невозможно очистить поле {locator.description}. Истекло количество попыток.'
-                        )
-                    sleep_poll_frequency()
+                    sleep_poll_frequency(self._deadline)
                 except Exception as exc:
-                    self.make_screenshot()
+                    self.make_screenshot(is_error=True)
                     exc.__traceback__ = None
                     raise AssertionError(
                         f'Невозможно очистить поле {locator.description}. Необрабатываемое исключение.'
                     )
-            for _ in range(self.ATTEMPTS_NUMBER):
+            else:
+                self.screenshot_and_raise_error(
+                    f'Невозможно очистить поле {locator.description}. Истекло количество попыток.'
+                )
+            for _ in self._attempts():
                 try:
                     self.find_element(locator).send_keys(text)
                     return None
@@ -475,6 +801,169 @@ class BaseActions:
                 f'Невозможно записать текст в поле {locator.description}. Истекло количество попыток.'
             )
 
+    def __wait_by_observer(
+            self,
+            locator: Locator,
+            condition: str,
+            expected_value: str = '',
+            attribute_name: str = '',
+            is_strong_coincidence: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Ожидает выполнения условия внутри браузера за один вызов execute_async_script.
+        Браузер проверяет условие при каждой мутации DOM (MutationObserver) и сразу возвращает результат.
+
+        :param locator: Locator элемента.
+        :param condition: Условие: text, value, attribute или absent.
+        :param expected_value: Ожидаемое значение.
+        :param attribute_name: Ключ атрибута для условия attribute.
+        :param is_strong_coincidence: Флаг строгого совпадения значения.
+        :return: Словарь {matched, current} или None, если скрипт прерван (например, переходом на другую страницу)
+        и ожидание нужно продолжить опросом.
+        """
+        timeout = (self._deadline or Deadline(EXPLICITLY_TIMEOUT)).remaining
+        try:
+            with self.__script_timeout(timeout + SCRIPT_TIMEOUT_MARGIN):
+                result = self._emulator.execute_async_script(
+                    WAIT_FOR_CONDITION_SCRIPT,
+                    *locator(),
+                    condition,
+                    expected_value,
+                    attribute_name,
+                    is_strong_coincidence,
+                    int(timeout * 1000),
+                    int(POLL_FREQUENCY * 1000)
+                )
+        except (JavascriptException, TimeoutException):
+            return None
+        if 'error' in result:
+            self.screenshot_and_raise_error(
+                f'Невозможно проверить условие для элемента {locator.description}: {result["error"]}'
+            )
+        return result  # type: ignore
+
+    def wait_for_network_idle(
+            self,
+            idle_time: float = NETWORK_IDLE_TIME,
+            timeout: float = EXPLICITLY_TIMEOUT,
+            max_in_flight: int = 0
+    ) -> None:
+        """
+        Ожидает завершения сетевых запросов страницы (XHR/fetch и ресурсов): не более max_in_flight незавершённых
+        запросов и ни одного нового в течение idle_time секунд. Возвращает управление, как только сеть затихла.
+        При открытом канале DevToolsChannel запросы учитываются по событиям Network.* без опроса, без него -
+        внутри браузера за один вызов execute_async_script (document.readyState, незавершённые fetch/XMLHttpRequest,
+        jQuery.active, новые записи Resource Timing).
+
+        :param idle_time: Количество секунд без сетевой активности.
+        :param timeout: Количество секунд на ожидание.
+        :param max_in_flight: Допустимое количество незавершённых запросов (например, для долгих опросов).
+        :return: None
+        """
+        with self._step('Ожидание завершения сетевых запросов', f'Без запросов {idle_time} сек.', timeout):
+            self.__wait_for_idle(idle_time, max_in_flight, is_dom_checked=False)
+
+    def wait_for_page_stable(
+            self,
+            idle_time: float = NETWORK_IDLE_TIME,
+            timeout: float = EXPLICITLY_TIMEOUT,
+            max_in_flight: int = 0
+    ) -> None:
+        """
+        Ожидает, пока страница загрузится и перестанет меняться: сеть затихла (как в wait_for_network_idle)
+        и DOM не меняется в течение idle_time секунд.
+
+        :param idle_time: Количество секунд без сетевой активности и изменений DOM.
+        :param timeout: Количество секунд на ожидание.
+        :param max_in_flight: Допустимое количество незавершённых запросов.
+        :return: None
+        """
+        with self._step('Ожидание стабильного состояния страницы', f'Без изменений {idle_time} сек.', timeout):
+            self.__wait_for_idle(idle_time, max_in_flight, is_dom_checked=True)
+
+    def __wait_for_idle(self, idle_time: float, max_in_flight: int, is_dom_checked: bool) -> None:
+        """
+        Ожидает тишины сети по событиям канала DevToolsChannel, затем (без канала, для только что созданного
+        учёта запросов или для проверки DOM) - внутри браузера.
+
+        :param idle_time: Количество секунд без активности.
+        :param max_in_flight: Допустимое количество незавершённых запросов.
+        :param is_dom_checked: Флаг ожидания отсутствия изменений DOM.
+        :return: None
+        """
+        deadline = self._deadline or Deadline(EXPLICITLY_TIMEOUT)
+        is_tracked = self._network_tracker is not None and self._network_tracker.channel is self.devtools_channel
+        tracker = self.__get_network_tracker()
+        if tracker is not None:
+            if not tracker.wait_for_idle(idle_time, deadline.remaining, max_in_flight):
+                self.screenshot_and_raise_error(
+                    f'Сетевые запросы не завершились за отведённое время: {", ".join(tracker.in_flight[:5])}.'
+                )
+            if is_tracked and not is_dom_checked:
+                return
+        result: Optional[Dict[str, Any]] = None
+        with self.__script_timeout(deadline.remaining + SCRIPT_TIMEOUT_MARGIN):
+            for _ in self._attempts():
+                try:
+                    result = self._emulator.execute_async_script(
+                        WAIT_FOR_PAGE_IDLE_SCRIPT,
+                        int(idle_time * 1000),
+                        int(deadline.remaining * 1000),
+                        int(NETWORK_IDLE_POLL_INTERVAL * 1000),
+                        is_dom_checked,
+                        max_in_flight
+                    )
+                except (JavascriptException, TimeoutException):
+                    # Скрипт прерван переходом на другую страницу: ожидание продолжается на новой странице
+                    sleep_poll_frequency(self._deadline)
+                    continue
+                if result is None:
+                    # Страница выгружена до ответа скрипта: ожидание продолжается на новой странице
+                    sleep_poll_frequency(self._deadline)
+                    continue
+                if result['idle']:
+                    return
+                break
+        self.screenshot_and_raise_error(describe_idle_state(result))
+
+    def __get_network_tracker(self) -> Optional[NetworkActivityTracker]:
+        """
+        Возвращает учёт запросов по событиям открытого канала DevToolsChannel, при необходимости создавая его
+        и включая домен Network.
+
+        :return: NetworkActivityTracker или None, если канал не открыт.
+        """
+        channel = self.devtools_channel
+        if channel is None:
+            return None
+        if self._network_tracker is None or self._network_tracker.channel is not channel:
+            if self._network_tracker is not None:
+                self._network_tracker.detach()
+            self._network_tracker = NetworkActivityTracker(channel)
+            self._network_tracker.attach()
+            self.send_by_devtools_protocol('Network.enable', {})
+        return self._network_tracker
+
+    @contextmanager
+    def __script_timeout(self, timeout: float) -> Iterator[None]:
+        """
+        Увеличивает тайм-аут асинхронных скриптов сессии на время блока, если он меньше требуемого,
+        и возвращает исходный по выходе: тайм-аут - настройка всей сессии, общей для объектов страниц
+        и последующих тестов пула, поэтому он не кэшируется и не остаётся увеличенным.
+
+        :param timeout: Требуемый тайм-аут в секундах.
+        :return: None
+        """
+        original_timeout = self._emulator.timeouts.script
+        if timeout <= original_timeout:
+            yield
+            return
+        self._emulator.set_script_timeout(timeout)
+        try:
+            yield
+        finally:
+            self._emulator.set_script_timeout(original_timeout)
+
     def check_title(self, text: str) -> None:
         """
         Проверяет заголовок страницы на соответствие заданному тексту.
@@ -482,7 +971,7 @@ class BaseActions:
         :param text: Ожидаемый текст в заголовке страницы
         :return: None
         """
-        with step('Проверка заголовка страницы на соответствие заданному тексту'):
+        with self._step('Проверка заголовка страницы на соответствие заданному тексту'):
             CustomWebDriverWait(
                 self,
                 EXPLICITLY_TIMEOUT
@@ -502,10 +991,87 @@ class BaseActions:
         :param has_check_visibility: Флаг проверки видимости элемента.
         :return: Значение атрибута
         """
-        with step('Получение значения атрибута в элементе', locator.description):
+        with self._step('Получение значения атрибута в элементе', locator.description):
             if has_check_visibility:
                 self.check_element_visibility(locator)
-            return self.find_element(locator).get_attribute(attribute_name)  # type: ignore
+            return self.__get_first_element_attributes(locator, [attribute_name])[attribute_name]  # type: ignore
+
+    def get_attributes_from_elements(
+            self,
+            locator: Locator,
+            attribute_names: List[str],
+            has_check_visibility: bool = True
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Находит элементы с одинаковым локатором и возвращает значения указанных атрибутов (или свойств)
+        из всех элементов за один вызов JavaScript.
+
+        :param locator: Locator элементов.
+        :param attribute_names: Список ключей атрибутов в Html-коде или имён свойств элемента.
+        :param has_check_visibility: Флаг проверки видимости элемента.
+        :return: Список словарей {ключ атрибута: значение} в порядке следования элементов на странице.
+        """
+        with self._step('Получение значений атрибутов во всех элементах на странице', locator.description):
+            if has_check_visibility:
+                self.check_element_visibility(locator)
+            for _ in self._attempts():
+                try:
+                    attributes_from_elements = self.__get_attributes_by_javascript(locator, attribute_names)
+                    if has_check_visibility and not attributes_from_elements:
+                        raise NoSuchElementException(f'Элементы {locator.description} пропали со страницы.')
+                    return attributes_from_elements
+                except Exception as exc:
+                    self.__errors_handler(
+                        error=exc,
+                        desc=f'Невозможно получить атрибуты {attribute_names} из элементов {locator.description}. '
+                             'Необрабатываемое исключение.'
+                    )
+            self.screenshot_and_raise_error(
+                f'Элементы {locator.description} не позволяют прочитать атрибуты {attribute_names}.'
+            )
+
+    def __get_attributes_by_javascript(
+            self,
+            locator: Locator,
+            attribute_names: List[str]
+    ) -> List[Dict[str, Optional[str]]]:
+        """
+        Возвращает значения атрибутов всех элементов с одинаковым локатором за один вызов JavaScript.
+
+        :param locator: Locator элементов.
+        :param attribute_names: Список ключей атрибутов или имён свойств.
+        :return: Список словарей {ключ атрибута: значение}.
+        """
+        return self._emulator.execute_script(GET_ATTRIBUTES_SCRIPT, *locator(), attribute_names)  # type: ignore
+
+    def __get_first_element_attributes(
+            self,
+            locator: Locator,
+            attribute_names: List[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Возвращает значения атрибутов первого элемента с указанным локатором за один вызов JavaScript.
+        Повторяет попытки, пока элемент отсутствует на странице.
+
+        :param locator: Locator элемента.
+        :param attribute_names: Список ключей атрибутов или имён свойств.
+        :return: Словарь {ключ атрибута: значение}.
+        """
+        for _ in self._attempts():
+            try:
+                attributes_from_elements = self.__get_attributes_by_javascript(locator, attribute_names)
+                if attributes_from_elements:
+                    return attributes_from_elements[0]
+                raise NoSuchElementException(f'Элемент {locator.description} отсутствует на странице.')
+            except Exception as exc:
+                self.__errors_handler(
+                    error=exc,
+                    desc=f'Невозможно получить атрибуты {attribute_names} из элемента {locator.description}. '
+                         'Необрабатываемое исключение.'
+                )
+        self.screenshot_and_raise_error(
+            f'Невозможно найти элемент {locator.description}. Истекло количество попыток.'
+        )
 
     def get_attribute_from_elements_with_identical_locators(
             self,
@@ -519,10 +1085,12 @@ class BaseActions:
         :param locator: Locator элементов.
         :return: Кортеж со значениями указанного атрибута из элементов.
         """
-        with step('Получение значений атрибута во всех элементах на странице', locator.description):
-            self.check_element_visibility(locator)
+        with self._step('Получение значений атрибута во всех элементах на странице', locator.description):
             attribute_values_from_elements = [
-                element.get_attribute(attribute_name) for element in self.find_elements(locator)
+                attributes[attribute_name] for attributes in self.get_attributes_from_elements(
+                    locator,
+                    [attribute_name]
+                )
             ]
             return tuple(attribute_values_from_elements)  # type: ignore
 
@@ -534,22 +1102,13 @@ class BaseActions:
         :param expected_value: Ожидаемое значение атрибута.
         :return: None
         """
-        with step('Сравнение на вхождение ожидаемого и действительного значения в атрибуте элемента',
-                  locator.description):
-            self.check_element_presence_in_dom(locator)
-            try:
-                if expected_value in self.get_attribute(locator, attribute_name):
-                    return None
-                else:
-                    self.screenshot_and_raise_error(
-                        f"Элемент {locator.description} не содержит в атрибуте значение {expected_value}"
-                    )
-            except Exception as exc:
-                self.__errors_handler(
-                    error=exc,
-                    desc=f'Необрабатываемое исключение. {attribute_name} {expected_value}, '
-                         'не входит в настоящий атрибут'
-                )
+        with self._step('Сравнение на вхождение ожидаемого и действительного значения в атрибуте элемента',
+                        locator.description):
+            if expected_value in (self.get_attribute(locator, attribute_name) or ''):
+                return None
+            self.screenshot_and_raise_error(
+                f"Элемент {locator.description} не содержит в атрибуте значение {expected_value}"
+            )
 
     def attributes_compare(self, locator: Locator, attribute_name: str, expected_value: str) -> None:
         """
@@ -559,21 +1118,12 @@ class BaseActions:
         :param expected_value: ожидаемое значение атрибута.
         :return: None
         """
-        with step('Сравнение ожидаемого и действительного значения в атрибуте элемента', locator.description):
-            self.check_element_presence_in_dom(locator)
-            try:
-                if expected_value == self.get_attribute(locator, attribute_name):
-                    return None
-                else:
-                    self.screenshot_and_raise_error(
-                        f'В "{locator.description}" атрибут "{attribute_name}" не равен "{expected_value}"'
-                    )
-            except Exception as exc:
-                self.__errors_handler(
-                    error=exc,
-                    desc=f'Необрабатываемое исключение. Атрибут {attribute_name} {expected_value}, '
-                         'не равен настоящему атрибуту'
-                )
+        with self._step('Сравнение ожидаемого и действительного значения в атрибуте элемента', locator.description):
+            if expected_value == self.get_attribute(locator, attribute_name):
+                return None
+            self.screenshot_and_raise_error(
+                f'В "{locator.description}" атрибут "{attribute_name}" не равен "{expected_value}"'
+            )
 
     def count_of_elements(self, locator: Locator, has_check_visibility: bool = True) -> int:
         """
@@ -583,7 +1133,7 @@ class BaseActions:
         :param has_check_visibility: Флаг проверки видимости элемента.
         :return: Количество элементов на странице с таким локатором
         """
-        with step('Получение кол-ва элементов с одинаковым локатором', locator.description):
+        with self._step('Получение кол-ва элементов с одинаковым локатором', locator.description):
             if has_check_visibility:
                 self.check_element_visibility(locator)
             return len(self.find_elements(locator))
@@ -595,7 +1145,7 @@ class BaseActions:
         :param locator: Locator - локатор элемента
         :return: None
         """
-        with step('Проверка на наличие элемента в DOM', locator.description):
+        with self._step('Проверка на наличие элемента в DOM', locator.description):
             CustomWebDriverWait(
                 self,
                 EXPLICITLY_TIMEOUT
@@ -606,17 +1156,31 @@ class BaseActions:
                 f'Элемент {locator.description} отсутствует в DOM страницы.'
             )
 
-    def check_element_not_presence_in_dom(self, locator: Locator) -> None:
+    def check_element_not_presence_in_dom(
+            self,
+            locator: Locator,
+            is_event_driven: bool = False,
+            timeout: float = EXPLICITLY_TIMEOUT
+    ) -> None:
         """
         Проверяет отсутствие элемента в DOM.
+        Проверка проходит при первом же наблюдении, в котором элемент отсутствует.
 
         :param locator: Locator - локатор элемента
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
+        :param timeout: Количество секунд на ожидание исчезновения элемента.
         :return: None
         """
-        with step('Проверка на отсутствие элемента в DOM', locator.description):
+        with self._step('Проверка на отсутствие элемента в DOM', locator.description, timeout=timeout):
+            if is_event_driven:
+                result = self.__wait_by_observer(locator, 'absent')
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    self.screenshot_and_raise_error(f'Элемент {locator.description} присутствует в DOM страницы.')
             CustomWebDriverWait(
                 self,
-                EXPLICITLY_TIMEOUT
+                timeout
             ).until_not(
                 EC.presence_of_element_located(
                     locator()
@@ -631,7 +1195,7 @@ class BaseActions:
         :param locator: Locator - локатор элемента
         :return: None
         """
-        with step('Нажатие на элемент и пролистывание его до верха страницы', locator.description):
+        with self._step('Нажатие на элемент и пролистывание его до верха страницы', locator.description):
             ActionChains(self._emulator).drag_and_drop_by_offset(
                 self.find_element(locator),
                 0,
@@ -644,8 +1208,9 @@ class BaseActions:
         :param locator: Locator - локатор элемента
         :return:
         """
-        with step('Прокручивает страницу до элемента с указанным локатором при помощи JavaScript', locator.description):
-            for _ in range(self.ATTEMPTS_NUMBER):
+        with self._step('Прокручивает страницу до элемента с указанным локатором при помощи JavaScript',
+                        locator.description):
+            for _ in self._attempts():
                 try:
                     self._emulator.execute_script('arguments[0].scrollIntoView(true)', self.find_element(locator))
                     return None
@@ -667,53 +1232,338 @@ class BaseActions:
 
         :return: Возврат ответ от ChromeDriver после выполнения команды
         """
-        if not params:
-            params = dict()
+        return send_devtools_command(self._emulator, cmd, params, self._listeners)
 
-        resource = "/session/%s/chromium/send_command_and_get_result" % self._emulator.session_id
-        url = self._emulator.command_executor._url + resource  # type: ignore
-        body = dumps({'cmd': cmd, 'params': params})
-        return self._emulator.command_executor._request('POST', url, body)  # type: ignore
+    def send_batch_by_devtools_protocol(self, commands: Sequence[DevToolsCommand]) -> List[Any]:
+        """
+        Отправляет несколько команд по DevTools протоколу с проверкой ответов: через открытый канал
+        DevToolsChannel - одним пакетом, без него - по очереди.
 
-    def turn_off_internet(self) -> None:
+        :param commands: Команды: пары (команда, параметры).
+        :return: Ответы в порядке команд.
         """
-        Передает параметр через DevTool протокол для отлючения интернета
+        return send_devtools_commands(self._emulator, commands, self._listeners)
+
+    @property
+    def devtools_channel(self) -> Optional[DevToolsChannel]:
+        """
+        Возвращает открытый канал DevTools протокола сессии.
+
+        :return: DevToolsChannel или None, если команды отправляются через HTTP.
+        """
+        return get_devtools_channel(self._emulator)
+
+    def open_devtools_channel(
+            self,
+            connection: Optional[DevToolsConnection] = None,
+            url: Optional[str] = None
+    ) -> DevToolsChannel:
+        """
+        Открывает постоянный канал DevTools протокола сессии (pip install custom_selenium_qa[devtools]):
+        команды send_by_devtools_protocol отправляются по нему, а события доступны через add_event_listener канала.
+        Канал закрывается методом close_devtools_channel до завершения сессии.
+
+        :param connection: Готовое соединение; None - websocket по адресу url.
+        :param url: Адрес websocket; None - se:cdp (Selenium Grid) или /devtools/<session>/page (Selenoid).
+        :return: DevToolsChannel
+        """
+        with self._step('Открытие канала DevTools протокола', url):
+            return DevToolsChannel.open(self._emulator, connection, url)
+
+    def close_devtools_channel(self) -> None:
+        """
+        Закрывает канал DevTools протокола сессии; дальнейшие команды отправляются через HTTP.
+
         :return: None
         """
-        with step('Отключение интернета в браузере через DevTools протокол'):
-            network_conditions = {
-                'offline': True,
-                'latency': 0,
-                'downloadThroughput': 0,
-                'uploadThroughput': 0,
-                'connectionType': 'none'
-            }
+        channel = get_devtools_channel(self._emulator)
+        if channel is not None:
+            if self._network_recorder is not None and self._network_recorder.channel is channel:
+                self.stop_network_capture()
+            channel.close()
 
-            self.send_by_devtools_protocol('Network.emulateNetworkConditions', network_conditions)
-            self.send_by_devtools_protocol('Network.enable', {})
+    def start_network_capture(
+            self,
+            step_budget: Optional[float] = NETWORK_CAPTURE_STEP_BUDGET,
+            buffer_size: int = NETWORK_CAPTURE_BUFFER_SIZE
+    ) -> NetworkRecorder:
+        """
+        Начинает запись запросов страницы с фазами (ожидание сервера, загрузка, соединение) по событиям открытого
+        канала DevToolsChannel. Запись хранится в кольцевом буфере последних buffer_size запросов и сохраняется
+        рядом со скриншотами в файл {test_method_name}.har в finish_test, только если шаг завершился ошибкой
+        или выполнялся дольше step_budget секунд.
+
+        :param step_budget: Количество секунд, дольше которого шаг считается медленным; None - только ошибки.
+        :param buffer_size: Количество последних запросов в буфере.
+        :return: NetworkRecorder
+        """
+        channel = self.devtools_channel
+        if channel is None:
+            raise WebDriverException(
+                'Запись запросов выполняется по событиям канала DevTools протокола: откройте его open_devtools_channel.'
+            )
+        self.stop_network_capture()
+        recorder = NetworkRecorder(channel, self._screenshots_directory, step_budget, buffer_size)
+        recorder.attach()
+        self.send_by_devtools_protocol('Network.enable', {})
+        self.add_listener(recorder)
+        self._network_recorder = recorder
+        return recorder
+
+    def stop_network_capture(self) -> None:
+        """
+        Останавливает запись запросов без сохранения файла.
+
+        :return: None
+        """
+        recorder, self._network_recorder = self._network_recorder, None
+        if recorder is not None:
+            recorder.detach()
+            self.remove_listener(recorder)
+
+    @property
+    def network_recorder(self) -> Optional[NetworkRecorder]:
+        """
+        Возвращает запись запросов, начатую start_network_capture.
+
+        :return: NetworkRecorder или None, если запись не ведётся.
+        """
+        return self._network_recorder
+
+    def apply_throttling_profile(self, profile: Union[str, ThrottlingProfile]) -> ThrottlingProfile:
+        """
+        Ограничивает сеть и процессор браузера по профилю через DevTools протокол (до снятия ограничений
+        или применения другого профиля, в том числе другим объектом страницы той же сессии).
+
+        :param profile: ThrottlingProfile (SLOW_3G, FAST_3G, SLOW_4G, HIGH_LATENCY_VPN, OFFLINE, NO_THROTTLING
+        или собственный) или имя профиля из THROTTLING_PROFILES.
+        :return: Профиль, применённый к сессии до вызова.
+        """
+        profile = resolve_throttling_profile(profile)
+        with self._step('Применение профиля ограничений браузера через DevTools протокол', profile.name):
+            return apply_throttling_profile(self._emulator, profile, self._listeners)
+
+    @contextmanager
+    def throttling(self, profile: Union[str, ThrottlingProfile]) -> Iterator[ThrottlingProfile]:
+        """
+        Применяет профиль ограничений на время блока with и восстанавливает предыдущий профиль по выходе из блока,
+        например, чтобы замерить время загрузки страницы той же страницей объектов в медленной сети:
+
+            with page.throttling(SLOW_4G):
+                page.emulator_refresh()
+                page.check_performance_budget({'load': 10000}, 'Каталог, медленный 4G')
+
+        :param profile: ThrottlingProfile или имя профиля из THROTTLING_PROFILES.
+        :return: Применённый профиль.
+        """
+        profile = resolve_throttling_profile(profile)
+        previous = self.apply_throttling_profile(profile)
+        try:
+            yield profile
+        finally:
+            self.apply_throttling_profile(previous)
+
+    def turn_off_internet(self) -> None:
+        """
+        Отключает интернет в браузере через DevTools протокол (профиль OFFLINE).
+        :return: None
+        """
+        with self._step('Отключение интернета в браузере через DevTools протокол'):
+            apply_throttling_profile(self._emulator, OFFLINE, self._listeners)
 
     def turn_on_internet(self) -> None:
         """
-        Удаляет emulateNetworkConditions из DevTool, чтобы возобнавить работу интернета
+        Снимает ограничения сети и процессора браузера через DevTools протокол (профиль NO_THROTTLING).
         :return: None
         """
-        with step('Включение интернета в браузере через DevTools протокол'):
-            self.send_by_devtools_protocol('Network.disable', {})
+        with self._step('Включение интернета в браузере через DevTools протокол'):
+            apply_throttling_profile(self._emulator, NO_THROTTLING, self._listeners)
+
+    def block_requests(self, *rules: Union[str, BlockingRule], is_dry_run: bool = False) -> RequestBlockingStats:
+        """
+        Блокирует запросы страницы по правилам через DevTools протокол (до снятия блокировки или применения
+        других правил, в том числе другим объектом страницы той же сессии). Запросы и байты заблокированных
+        запросов учитываются, если канал DevToolsChannel открыт.
+
+        :param rules: BlockingRule (BLOCK_ANALYTICS, BLOCK_FONTS, BLOCK_IMAGES, BLOCK_MEDIA или собственные)
+        или имена правил из BLOCKING_PRESETS; несколько правил объединяются.
+        :param is_dry_run: Флаг пробного режима: запросы не блокируются, а учитываются с размерами ответов,
+        по которым затем оцениваются байты заблокированных запросов.
+        :return: Статистика блокировки.
+        """
+        rule = resolve_blocking_rule(*rules)
+        with self._step('Блокировка запросов через DevTools протокол', rule.name):
+            return apply_request_blocking(self._emulator, rule, self._listeners, is_dry_run).stats
+
+    def unblock_requests(self) -> Optional[RequestBlockingStats]:
+        """
+        Снимает блокировку запросов сессии.
+
+        :return: Статистика снятой блокировки или None, если запросы не блокировались.
+        """
+        blocker = get_request_blocker(self._emulator)
+        if blocker is None:
+            return None
+        with self._step('Снятие блокировки запросов через DevTools протокол', f'{blocker.rule.name}: {blocker.stats}'):
+            apply_request_blocking(self._emulator, NO_BLOCKING, self._listeners)
+        return blocker.stats
+
+    @property
+    def request_blocking_stats(self) -> Optional[RequestBlockingStats]:
+        """
+        Возвращает статистику блокировки запросов сессии.
+
+        :return: RequestBlockingStats или None, если запросы не блокируются.
+        """
+        blocker = get_request_blocker(self._emulator)
+        return blocker.stats if blocker is not None else None
+
+    @contextmanager
+    def blocking_requests(
+            self,
+            *rules: Union[str, BlockingRule],
+            is_dry_run: bool = False
+    ) -> Iterator[RequestBlockingStats]:
+        """
+        Блокирует запросы на время блока with и восстанавливает предыдущую блокировку по выходе из блока,
+        например, чтобы не загружать изображения и аналитику в функциональном тесте:
+
+            with page.blocking_requests('analytics', 'images') as stats:
+                page.emulator_refresh()
+            print(stats.to_dict())
+
+        :param rules: BlockingRule или имена правил из BLOCKING_PRESETS.
+        :param is_dry_run: Флаг пробного режима.
+        :return: Статистика блокировки внутри блока.
+        """
+        rule = resolve_blocking_rule(*rules)
+        previous = get_request_blocker(self._emulator)
+        stats = self.block_requests(rule, is_dry_run=is_dry_run)
+        try:
+            yield stats
+        finally:
+            with self._step('Восстановление блокировки запросов через DevTools протокол', f'{rule.name}: {stats}'):
+                if previous is None:
+                    apply_request_blocking(self._emulator, NO_BLOCKING, self._listeners)
+                else:
+                    apply_request_blocking(
+                        self._emulator, previous.rule, self._listeners, previous.is_dry_run, previous.stats
+                    )
 
     def clear_cash_and_logs(self) -> None:
         """
         Отчистка Логов и Кеша в Chrome Webdriver
         :return: None
         """
-        self.send_by_devtools_protocol('Log.clear', {})
-        self.send_by_devtools_protocol('Network.clearBrowserCache', {})
+        self.send_batch_by_devtools_protocol((
+            ('Log.clear', {}),
+            ('Network.clearBrowserCache', {}),
+        ))
+
+    def capture_auth_snapshot(self) -> AuthSnapshot:
+        """
+        Снимает авторизованное состояние сессии (cookies, localStorage и sessionStorage) на текущей странице.
+        В Chromium cookies всех доменов снимаются одной командой DevTools протокола.
+
+        :return: AuthSnapshot
+        """
+        with self._step('Снятие снимка авторизации'):
+            return capture_auth_snapshot(self._emulator, is_devtools_available(self._emulator), self._listeners)
+
+    def restore_auth_snapshot(self, snapshot: AuthSnapshot, url: Optional[str] = None) -> None:
+        """
+        Восстанавливает снимок авторизации в сессии и открывает страницу.
+
+        :param snapshot: Снимок авторизации.
+        :param url: Адрес, открываемый после восстановления; None - адрес, на котором снят снимок.
+        :return: None
+        """
+        with self._step('Восстановление снимка авторизации', snapshot.origin):
+            restore_auth_snapshot(self._emulator, snapshot, url, is_devtools_available(self._emulator), self._listeners)
+            if self._element_cache is not None:
+                self._element_cache.invalidate()
+
+    def login_by_auth_snapshot(
+            self,
+            user: str,
+            environment: str,
+            login: Callable[[], Any],
+            check_locator: Locator,
+            url: Optional[str] = None,
+            timeout: float = EXPLICITLY_TIMEOUT
+    ) -> bool:
+        """
+        Авторизует сессию снимком из AUTH_SNAPSHOT_CACHE вместо входа через интерфейс.
+        Если снимка нет или после его восстановления элемент check_locator не отображается, снимок удаляется
+        из кэша, состояние сессии очищается, выполняется вход функцией login и снимается новый снимок.
+
+        :param user: Имя пользователя.
+        :param environment: Имя окружения (стенда).
+        :param login: Функция входа через интерфейс; начинает с открытия страницы входа.
+        :param check_locator: Locator - локатор элемента, отображаемого только авторизованному пользователю.
+        :param url: Адрес, открываемый после восстановления снимка; None - адрес, на котором снят снимок.
+        :param timeout: Количество секунд на ожидание элемента check_locator.
+        :return: True, если сессия авторизована снимком, False - если выполнен вход через интерфейс.
+        """
+        cache = self.AUTH_SNAPSHOT_CACHE
+        snapshot = cache.get(user, environment)
+        if snapshot is not None:
+            try:
+                self.restore_auth_snapshot(snapshot, url)
+                if self.probe_element(check_locator, timeout=timeout, is_visible=True):
+                    return True
+            except WebDriverException:
+                pass
+            cache.invalidate(user, environment)
+            reset_browser_state(self._emulator, has_devtools=is_devtools_available(self._emulator))
+            if self._element_cache is not None:
+                self._element_cache.invalidate()
+        login()
+        if not self.probe_element(check_locator, timeout=timeout, is_visible=True):
+            self.screenshot_and_raise_error(
+                f'Пользователь {user} не авторизован: элемент {check_locator.description} не отображается.'
+            )
+        cache.put(user, environment, self.capture_auth_snapshot())
+        return False
+
+    def collect_page_performance(self, label: Optional[str] = None) -> Dict[str, float]:
+        """
+        Собирает метрики производительности текущей страницы (Navigation Timing, Paint Timing, длинные задачи,
+        сдвиги макета, в Chromium - Performance.getMetrics) и записывает их в PERFORMANCE_REPORT.
+
+        :param label: Метка страницы, по которой замеры объединяются в сводке; None - адрес страницы.
+        :return: Метрики по именам: времена и длительности - в миллисекундах, размеры - в байтах.
+        """
+        with self._step('Сбор метрик производительности страницы', label):
+            result = collect_page_performance(self._emulator, is_devtools_available(self._emulator), self._listeners)
+            self.PERFORMANCE_REPORT.add(self._test_method_name, label, result['url'], result['metrics'])
+            return result['metrics']  # type: ignore
+
+    def check_performance_budget(self, budget: Mapping[str, float], label: Optional[str] = None) -> Dict[str, float]:
+        """
+        Собирает метрики производительности текущей страницы, записывает их в PERFORMANCE_REPORT и проверяет бюджет.
+        Метрики, которые браузер не предоставил (например, Performance.getMetrics вне Chromium), не проверяются.
+
+        :param budget: Максимально допустимые значения метрик по именам, например {'largest_contentful_paint': 2500}.
+        :param label: Метка страницы, по которой замеры объединяются в сводке; None - адрес страницы.
+        :return: Метрики по именам.
+        """
+        with self._step('Проверка бюджета производительности страницы', label):
+            result = collect_page_performance(self._emulator, is_devtools_available(self._emulator), self._listeners)
+            violations = find_budget_violations(result['metrics'], budget)
+            self.PERFORMANCE_REPORT.add(self._test_method_name, label, result['url'], result['metrics'], violations)
+            if violations:
+                self.screenshot_and_raise_error(
+                    f'Превышен бюджет производительности страницы {label or result["url"]}: {"; ".join(violations)}.'
+                )
+            return result['metrics']  # type: ignore
 
     def click_ok_alert(self) -> None:
         """
         Клик на всплывающее окно алерта
         :return: None
         """
-        with step('Нажатие на всплывающее окно алерта'):
+        with self._step('Нажатие на всплывающее окно алерта'):
             CustomWebDriverWait(
                 self,
                 EXPLICITLY_TIMEOUT
@@ -725,7 +1575,7 @@ class BaseActions:
             try:
                 self._emulator.switch_to.alert.accept()
             except Exception as exc:
-                self.make_screenshot()
+                self.make_screenshot(is_error=True)
                 exc.__traceback__ = None
                 raise AssertionError(
                     'Невозможно кликнуть на всплывающий алерт'
@@ -733,14 +1583,14 @@ class BaseActions:
 
     def check_without_timeout_and_click(self, locator_one: Locator, locator_two: Locator) -> None:
         """
-        Пытается достучаться до первого доступного локатара, в пределах ATTEMPTS_NUMBER
+        Пытается достучаться до первого доступного локатара, в пределах EXPLICITLY_TIMEOUT
         :param locator_one: Locator - локатор элемента.
         :param locator_two: Locator - локатор элемента.
         :return: None
         """
-        with step('Попытка достучаться (кликнуть) до первого ближайшего элемента',
-                  f'{locator_two.description}; {locator_one.description}'):
-            for _ in range(self.ATTEMPTS_NUMBER):
+        with self._step('Попытка достучаться (кликнуть) до первого ближайшего элемента',
+                        lambda: f'{locator_two.description}; {locator_one.description}'):
+            for _ in self._attempts():
                 try:
                     try:
                         self._emulator.find_element(*locator_two())
@@ -749,23 +1599,42 @@ class BaseActions:
                         self._emulator.find_element(*locator_one()).click()
                         return None
                 except IGNORED_EXCEPTIONS:
-                    sleep_poll_frequency()
+                    sleep_poll_frequency(self._deadline)
 
-    def sleep_until_update_attribute(self, locator: Locator, attribute_name: str, desired_value: str) -> None:
+    def sleep_until_update_attribute(
+            self,
+            locator: Locator,
+            attribute_name: str,
+            desired_value: str,
+            is_event_driven: bool = False
+    ) -> None:
         """
-        Ждет обновление значения атрибута, в пределах ATTEMPTS_NUMBER
+        Ждет обновление значения атрибута, в пределах EXPLICITLY_TIMEOUT.
+        Видимость элемента проверяется один раз, далее на каждой итерации значение читается одним вызовом JavaScript.
+
         :param locator: Locator - локатор элемента.
         :param attribute_name: Ключ атрибута в Html-коде.
         :param desired_value: Ожидаемое значение атрибута
+        :param is_event_driven: Флаг ожидания внутри браузера через MutationObserver вместо опроса.
         :return: None
         """
-        with step('Ожидание обновления значения атрибута', locator.description):
-            for _ in range(self.ATTEMPTS_NUMBER):
+        with self._step('Ожидание обновления значения атрибута', locator.description):
+            self.check_element_visibility(locator)
+            if is_event_driven:
+                result = self.__wait_by_observer(locator, 'attribute', desired_value, attribute_name=attribute_name)
+                if result is not None:
+                    if result['matched']:
+                        return None
+                    self.screenshot_and_raise_error(
+                        f'{locator.description} не содержит в атрибуте {attribute_name} значение {desired_value}'
+                    )
+            for _ in self._attempts():
                 try:
-                    if desired_value == self.get_attribute(locator, attribute_name):
+                    attributes_from_elements = self.__get_attributes_by_javascript(locator, [attribute_name])
+                    if attributes_from_elements and desired_value == attributes_from_elements[0][attribute_name]:
                         return None
                     else:
-                        sleep_poll_frequency()
+                        sleep_poll_frequency(self._deadline)
                 except Exception as exc:
                     self.__errors_handler(
                         error=exc,
@@ -782,13 +1651,16 @@ class BaseActions:
         :param locator_one: Locator - Первый локатор для сравнения.
         :param locator_two: Locator - Второй локатор для сравнения.
         """
-        with step('Сравнение кол-ва элементов', f'{locator_one.description}; {locator_two.description}'):
-            for _ in range(self.ATTEMPTS_NUMBER):
+        with self._step('Сравнение кол-ва элементов', lambda: f'{locator_one.description}; {locator_two.description}'):
+            for _ in self._attempts():
                 try:
-                    if self.count_of_elements(locator_one) == self.count_of_elements(locator_two):
+                    count_one, count_two = (
+                        result['count'] for result in self.query_many((locator_one, locator_two), fields=('count',))
+                    )
+                    if count_one == count_two:
                         return None
                     else:
-                        sleep_poll_frequency()
+                        sleep_poll_frequency(self._deadline)
                 except Exception as exc:
                     self.__errors_handler(
                         error=exc,
@@ -807,21 +1679,18 @@ class BaseActions:
         :param description: Описание ошибки
         :return:
         """
-        with step('Сравнение количество элементов на странице'):
-
-            for _ in range(self.ATTEMPTS_NUMBER):
-                try:
-                    counts_of_elements = []
-                    for locator in locators:
-                        counts_of_elements.append(self.count_of_elements(locator))
-                except Exception as exc:
-                    self.__errors_handler(
-                        error=exc,
-                        desc=f'Необрабатываемое исключение, не удалось получить кол-во {locator.description}'
-                    )
-                assert len(set(counts_of_elements)) == 1, \
-                    f'Количество элементов на странице не равно между собой: {description}'
-                return None
+        with self._step('Сравнение количество элементов на странице'):
+            try:
+                counts_of_elements = [result['count'] for result in self.query_many(locators, fields=('count',))]
+            except Exception as exc:
+                self.__errors_handler(
+                    error=exc,
+                    desc='Необрабатываемое исключение, не удалось получить кол-во элементов: '
+                         + describe_locators(locators)
+                )
+                raise
+            assert len(set(counts_of_elements)) == 1, \
+                f'Количество элементов на странице не равно между собой: {description}'
 
     def compare_two_numbers(self, number_one: int, number_two: int, description: str = '') -> None:
         """
@@ -831,7 +1700,7 @@ class BaseActions:
         :param number_two: Второе число для сравнения.
         :param description: Описание ошибки.
         """
-        with step('Сравнение двух чисел'):
+        with self._step('Сравнение двух чисел'):
             if number_one == number_two:
                 return None
             else:
@@ -847,6 +1716,8 @@ class BaseActions:
         self.emulator.switch_to.frame(
             self.find_element(locator)
         )
+        if self._element_cache is not None:
+            self._element_cache.enter_frame(locator)
 
     def switch_to_default_page(self) -> None:
         """
@@ -855,3 +1726,5 @@ class BaseActions:
         :return: None
         """
         self.emulator.switch_to.default_content()
+        if self._element_cache is not None:
+            self._element_cache.leave_frames()
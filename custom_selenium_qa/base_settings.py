@@ -21,3 +21,96 @@ SCREENSHOTS_DIRECTORY = 'screenshots'
 
 # Расширение скриншота
 SCREENSHOTS_EXTENSION = 'png'
+
+# Поля, возвращаемые BaseActions.query_many по умолчанию
+QUERY_FIELDS = ('text', 'count', 'visible', 'present')
+
+# Начальная пауза между вызовами при опросе с нарастающим интервалом
+POLL_INITIAL_DELAY = POLL_FREQUENCY
+
+# Множитель, на который увеличивается пауза после каждого неуспешного вызова
+POLL_BACKOFF_FACTOR = 1.5
+
+# Максимальная пауза между вызовами при опросе с нарастающим интервалом
+POLL_MAX_DELAY = 0.5
+
+# Доля случайного разброса паузы (0 - без разброса), чтобы параллельные сессии не опрашивали грид синхронно
+POLL_JITTER = 0.1
+
+# Запас тайм-аута асинхронных скриптов WebDriver сверх времени ожидания внутри браузера
+SCRIPT_TIMEOUT_MARGIN = 5.0
+
+# Максимальный объём скриншотов (в байтах), ожидающих записи на диск в фоновом потоке
+SCREENSHOTS_MAX_IN_FLIGHT_BYTES = 64 * 1024 * 1024
+
+# Масштаб сохраняемых скриншотов (1.0 - без уменьшения, требует Pillow при другом значении)
+SCREENSHOTS_SCALE = 1.0
+
+# Максимальное количество скриншотов на один тест
+SCREENSHOTS_PER_TEST_LIMIT = 5
+
+# Пропускать скриншот, если страница не изменилась с момента предыдущего скриншота теста
+SCREENSHOTS_DEDUPLICATION = True
+
+# Директория для JSON-сводок инструментирования тестов (MetricsCollector)
+METRICS_DIRECTORY = 'metrics'
+
+# Директория для временных шкал тестов в формате Chrome trace-event (TraceRecorder)
+TRACES_DIRECTORY = 'traces'
+
+# Подробность шагов TestIT: all - все шаги, top - только внешние шаги действий, none - без шагов
+STEPS_VERBOSITY = 'all'
+
+# Момент передачи накопленных шагов в TestIT: action - по завершении внешнего шага действия, test - в finish_test
+STEPS_FLUSH_POLICY = 'action'
+
+# Количество заранее созданных сессий вебдрайвера в пуле SessionPool
+SESSION_POOL_SIZE = 2
+
+# Количество выдач сессии из пула, после которого сессия пересоздаётся
+SESSION_POOL_MAX_USES = 50
+
+# Рост JS-кучи браузера (в байтах) относительно первой выдачи, после которого сессия пересоздаётся
+SESSION_POOL_MAX_HEAP_GROWTH = 200 * 1024 * 1024
+
+# Количество секунд ожидания свободной сессии пула
+SESSION_POOL_ACQUIRE_TIMEOUT = 300.0
+
+# Адрес, который открывается в сессии при возврате в пул
+SESSION_RESET_URL = 'about:blank'
+
+# Директория кэша снимков авторизации (cookies и хранилища) AuthSnapshotCache
+AUTH_SNAPSHOTS_DIRECTORY = 'auth_snapshots'
+
+# Время жизни снимка авторизации в кэше, сек
+AUTH_SNAPSHOTS_TTL = 30 * 60.0
+
+# Количество секунд ожидания ответа на команду по каналу DevToolsChannel
+DEVTOOLS_CHANNEL_TIMEOUT = 30.0
+
+# Сколько секунд страница должна быть без сетевой активности, чтобы wait_for_network_idle считал её загруженной
+NETWORK_IDLE_TIME = 0.5
+
+# Интервал проверки тишины внутри браузера (ожидание без DevToolsChannel), сек
+NETWORK_IDLE_POLL_INTERVAL = 0.05
+
+# Типы запросов DevTools протокола, которые не учитываются при ожидании тишины сети (долгоживущие соединения)
+NETWORK_IDLE_IGNORED_RESOURCE_TYPES = ('WebSocket', 'EventSource', 'Ping', 'CSPViolationReport')
+
+# Регулярные выражения адресов, которые не учитываются при ожидании тишины сети (например, аналитика)
+NETWORK_IDLE_IGNORED_URLS: tuple = ()
+
+# Количество адресов, размеры ответов которых запоминаются в пробном режиме блокировки запросов (RequestBlocker)
+REQUEST_BLOCKING_KNOWN_SIZES_LIMIT = 10000
+
+# Количество последних запросов, которые NetworkRecorder хранит в кольцевом буфере
+NETWORK_CAPTURE_BUFFER_SIZE = 1000
+
+# Длительность шага в секундах, сверх которой NetworkRecorder сохраняет запись запросов теста
+NETWORK_CAPTURE_STEP_BUDGET = 10.0
+
+# Директория отчётов о производительности страниц за прогон (PerformanceReport)
+PERFORMANCE_DIRECTORY = 'performance'
+
+# Переменная окружения с идентификатором прогона: задаётся, чтобы процессы одного прогона писали в общий отчёт
+PERFORMANCE_RUN_ID_VARIABLE = 'CUSTOM_SELENIUM_QA_RUN_ID'
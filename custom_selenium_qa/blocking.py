@@ -0,0 +1,415 @@
+import logging
+import re
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+from .base_settings import REQUEST_BLOCKING_KNOWN_SIZES_LIMIT
+from .devtools import send_devtools_commands
+from .devtools_channel import DevToolsChannel
+from .devtools_channel import DevToolsCommand
+from .devtools_channel import get_devtools_channel
+from .instrumentation import ActionListener
+
+logger = logging.getLogger(__name__)
+
+# Расширения адресов по типам запросов: блокировка типа через Network.setBlockedURLs, если канал не открыт
+_RESOURCE_TYPE_EXTENSIONS = {
+    'Image': ('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'),
+    'Font': ('woff', 'woff2', 'ttf', 'otf', 'eot'),
+    'Media': ('mp4', 'webm', 'ogg', 'ogv', 'mp3', 'wav', 'm4a', 'm3u8', 'mpd'),
+}
+
+# Причина отказа в Network.loadingFailed для запросов, заблокированных Network.setBlockedURLs
+_BLOCKED_BY_URL_REASON = 'inspector'
+
+# Размеры ответов по адресам, замеренные в пробном режиме: по ним оцениваются байты заблокированных запросов
+_known_sizes: Dict[str, int] = {}
+_known_sizes_lock = Lock()
+
+
+class BlockingRule:
+    """
+    Правило блокировки запросов страницы: шаблоны адресов (Network.setBlockedURLs, символ * - любая
+    последовательность) и типы запросов DevTools протокола (Image, Font, Media, Script, Stylesheet и т. д.).
+    """
+
+    __slots__ = ('name', 'url_patterns', 'resource_types')
+
+    def __init__(self, name: str, url_patterns: Sequence[str] = (), resource_types: Sequence[str] = ()):
+        """
+        :param name: Имя правила.
+        :param url_patterns: Шаблоны адресов, например '*google-analytics.com/*'.
+        :param resource_types: Типы запросов DevTools протокола, например 'Image'.
+        """
+        self.name = name
+        self.url_patterns = tuple(url_patterns)
+        self.resource_types = tuple(resource_types)
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} ({self.name}: url_patterns={len(self.url_patterns)}, '
+            f'resource_types={", ".join(self.resource_types) or "-"})>'
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Проверяет, что правило ничего не блокирует.
+
+        :return: True, если нет ни шаблонов адресов, ни типов запросов.
+        """
+        return not self.url_patterns and not self.resource_types
+
+
+# Правила (шаблоны адресов - в формате Network.setBlockedURLs)
+NO_BLOCKING = BlockingRule('Без блокировки')
+BLOCK_ANALYTICS = BlockingRule('Аналитика и реклама', (
+    '*google-analytics.com/*',
+    '*googletagmanager.com/*',
+    '*doubleclick.net/*',
+    '*mc.yandex.ru/*',
+    '*an.yandex.ru/*',
+    '*top-fwz1.mail.ru/*',
+    '*connect.facebook.net/*',
+    '*static.hotjar.com/*',
+    '*script.hotjar.com/*',
+))
+BLOCK_FONTS = BlockingRule('Шрифты', ('*fonts.googleapis.com/*', '*fonts.gstatic.com/*'), ('Font',))
+BLOCK_IMAGES = BlockingRule('Изображения', resource_types=('Image',))
+BLOCK_MEDIA = BlockingRule('Видео и аудио', resource_types=('Media',))
+
+# Правила по именам (для выбора правил из параметров запуска)
+BLOCKING_PRESETS: Dict[str, BlockingRule] = {
+    'none': NO_BLOCKING,
+    'analytics': BLOCK_ANALYTICS,
+    'fonts': BLOCK_FONTS,
+    'images': BLOCK_IMAGES,
+    'media': BLOCK_MEDIA,
+}
+
+
+def resolve_blocking_rule(*rules: Union[str, BlockingRule]) -> BlockingRule:
+    """
+    Возвращает правило по именам из BLOCKING_PRESETS или правилам; несколько правил объединяются в одно.
+
+    :param rules: Имена правил или BlockingRule.
+    :return: BlockingRule; NO_BLOCKING, если правила не переданы.
+    """
+    resolved = []
+    for rule in rules:
+        if not isinstance(rule, BlockingRule):
+            if rule not in BLOCKING_PRESETS:
+                raise ValueError(f'Неизвестное правило {rule!r}, доступны: {", ".join(BLOCKING_PRESETS)}.')
+            rule = BLOCKING_PRESETS[rule]
+        if not rule.is_empty:
+            resolved.append(rule)
+    if not resolved:
+        return NO_BLOCKING
+    if len(resolved) == 1:
+        return resolved[0]
+    return BlockingRule(
+        ' + '.join(rule.name for rule in resolved),
+        tuple(dict.fromkeys(pattern for rule in resolved for pattern in rule.url_patterns)),
+        tuple(dict.fromkeys(resource_type for rule in resolved for resource_type in rule.resource_types)),
+    )
+
+
+def _compile_url_pattern(pattern: str) -> Pattern:
+    """
+    Переводит шаблон Network.setBlockedURLs в регулярное выражение.
+
+    :param pattern: Шаблон адреса.
+    :return: Скомпилированное регулярное выражение.
+    """
+    return re.compile('.*'.join(re.escape(part) for part in pattern.split('*')), re.DOTALL)
+
+
+def _get_known_size(url: str) -> Optional[int]:
+    """
+    Возвращает размер ответа по адресу, замеренный в пробном режиме.
+
+    :param url: Адрес запроса.
+    :return: Размер в байтах или None, если адрес не замерялся.
+    """
+    with _known_sizes_lock:
+        return _known_sizes.get(url)
+
+
+class RequestBlockingStats:
+    """
+    Статистика блокировки запросов сессии. Запросы учитываются по событиям открытого канала DevToolsChannel;
+    байты заблокированных запросов оцениваются по размерам тех же адресов, замеренным в пробном режиме
+    (в пробном режиме запросы не блокируются, а байты - точные).
+    """
+
+    __slots__ = ('requests', 'bytes', 'unsized_requests', 'by_resource_type', '_lock')
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.bytes = 0
+        self.unsized_requests = 0
+        self.by_resource_type: Dict[str, int] = {}
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} ({self})>'
+
+    def __str__(self) -> str:
+        unsized = f' (без размера - {self.unsized_requests})' if self.unsized_requests else ''
+        return f'запросов {self.requests}{unsized}, байт {self.bytes}'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Возвращает статистику словарём (например, для отчёта).
+
+        :return: Словарь {requests, bytes, unsized_requests, by_resource_type}.
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'bytes': self.bytes,
+                'unsized_requests': self.unsized_requests,
+                'by_resource_type': dict(self.by_resource_type),
+            }
+
+    def add_request(self, resource_type: str, size: Optional[int]) -> None:
+        """
+        Учитывает запрос.
+
+        :param resource_type: Тип запроса DevTools протокола.
+        :param size: Размер ответа в байтах; None - неизвестен.
+        :return: None
+        """
+        with self._lock:
+            self.requests += 1
+            self.by_resource_type[resource_type] = self.by_resource_type.get(resource_type, 0) + 1
+            if size is None:
+                self.unsized_requests += 1
+            else:
+                self.bytes += size
+
+    def add_size(self, size: int) -> None:
+        """
+        Добавляет размер ранее учтённого без размера запроса.
+
+        :param size: Размер ответа в байтах.
+        :return: None
+        """
+        with self._lock:
+            self.unsized_requests -= 1
+            self.bytes += size
+
+
+class RequestBlocker:
+    """
+    Блокировка запросов сессии по правилу BlockingRule, применённая функцией apply_request_blocking.
+    Шаблоны адресов блокируются командой Network.setBlockedURLs, типы запросов - перехватом Fetch.requestPaused
+    с ответом Fetch.failRequest, если открыт канал DevToolsChannel, иначе - шаблонами известных расширений
+    (_RESOURCE_TYPE_EXTENSIONS). В пробном режиме запросы не блокируются, а только учитываются с размерами.
+    """
+
+    def __init__(
+            self,
+            rule: BlockingRule,
+            channel: Optional[DevToolsChannel],
+            is_dry_run: bool = False,
+            stats: Optional[RequestBlockingStats] = None
+    ):
+        """
+        :param rule: Правило блокировки.
+        :param channel: Канал DevTools протокола сессии, по событиям которого ведётся статистика; None - без неё.
+        :param is_dry_run: Флаг пробного режима.
+        :param stats: Статистика, в которую продолжается учёт; None - новая.
+        """
+        self.rule = rule
+        self.is_dry_run = is_dry_run
+        self.stats = stats or RequestBlockingStats()
+        self._channel = channel
+        self._url_patterns = [_compile_url_pattern(pattern) for pattern in rule.url_patterns]
+        self._resource_types = frozenset(rule.resource_types)
+        self._matched: Dict[str, Tuple[str, str]] = {}
+        self._is_attached = False
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} ({self.rule.name}, dry_run={self.is_dry_run}: {self.stats})>'
+
+    @property
+    def is_intercepting(self) -> bool:
+        """
+        Проверяет, блокируются ли типы запросов перехватом домена Fetch.
+
+        :return: True, если типы запросов блокируются через открытый канал.
+        """
+        return self._channel is not None and bool(self._resource_types) and not self.is_dry_run
+
+    @property
+    def blocked_urls(self) -> List[str]:
+        """
+        Возвращает шаблоны адресов для Network.setBlockedURLs.
+
+        :return: Список шаблонов; пустой в пробном режиме.
+        """
+        if self.is_dry_run:
+            return []
+        patterns = list(self.rule.url_patterns)
+        if self._channel is None:
+            for resource_type in self.rule.resource_types:
+                extensions = _RESOURCE_TYPE_EXTENSIONS.get(resource_type)
+                if extensions is None:
+                    logger.warning('Тип запросов %s блокируется только через канал DevToolsChannel', resource_type)
+                    continue
+                for extension in extensions:
+                    patterns.extend((f'*.{extension}', f'*.{extension}?*'))
+        return patterns
+
+    @property
+    def commands(self) -> List[DevToolsCommand]:
+        """
+        Возвращает команды DevTools протокола, применяющие правило.
+
+        :return: Список пар (команда, параметры).
+        """
+        commands: List[DevToolsCommand] = [('Network.setBlockedURLs', {'urls': self.blocked_urls})]
+        if not self.rule.is_empty:
+            commands.insert(0, ('Network.enable', {}))
+        if self.is_intercepting:
+            commands.append(('Fetch.enable', {'patterns': [
+                {'urlPattern': '*', 'resourceType': resource_type, 'requestStage': 'Request'}
+                for resource_type in self.rule.resource_types
+            ]}))
+        return commands
+
+    def attach(self) -> None:
+        """
+        Подписывается на события канала для учёта и перехвата запросов.
+
+        :return: None
+        """
+        if self._is_attached or self._channel is None or self.rule.is_empty:
+            return
+        self._channel.add_event_listener('Network.requestWillBeSent', self.__on_request_started)
+        self._channel.add_event_listener('Network.loadingFinished', self.__on_loading_finished)
+        self._channel.add_event_listener('Network.loadingFailed', self.__on_loading_failed)
+        if self.is_intercepting:
+            self._channel.add_event_listener('Fetch.requestPaused', self.__on_request_paused)
+        self._is_attached = True
+
+    def detach(self) -> None:
+        """
+        Отписывается от событий канала.
+
+        :return: None
+        """
+        if not self._is_attached or self._channel is None:
+            return
+        self._channel.remove_event_listener('Network.requestWillBeSent', self.__on_request_started)
+        self._channel.remove_event_listener('Network.loadingFinished', self.__on_loading_finished)
+        self._channel.remove_event_listener('Network.loadingFailed', self.__on_loading_failed)
+        self._channel.remove_event_listener('Fetch.requestPaused', self.__on_request_paused)
+        self._is_attached = False
+        self._matched.clear()
+
+    def __is_matched(self, url: str, resource_type: str) -> bool:
+        return (
+            any(pattern.fullmatch(url) for pattern in self._url_patterns)
+            or self.is_dry_run and resource_type in self._resource_types
+        )
+
+    def __on_request_started(self, params: Dict[str, Any]) -> None:
+        url = params.get('request', {}).get('url', '')
+        resource_type = params.get('type', 'Other')
+        # При перенаправлении requestWillBeSent приходит повторно с тем же requestId
+        if params['requestId'] not in self._matched and self.__is_matched(url, resource_type):
+            self._matched[params['requestId']] = (url, resource_type)
+            if self.is_dry_run:
+                self.stats.add_request(resource_type, None)
+
+    def __on_loading_finished(self, params: Dict[str, Any]) -> None:
+        matched = self._matched.pop(params.get('requestId', ''), None)
+        if matched is None or not self.is_dry_run:
+            return
+        size = int(params.get('encodedDataLength', 0))
+        self.stats.add_size(size)
+        with _known_sizes_lock:
+            if matched[0] in _known_sizes or len(_known_sizes) < REQUEST_BLOCKING_KNOWN_SIZES_LIMIT:
+                _known_sizes[matched[0]] = size
+
+    def __on_loading_failed(self, params: Dict[str, Any]) -> None:
+        matched = self._matched.pop(params.get('requestId', ''), None)
+        if matched is None or self.is_dry_run or params.get('blockedReason') != _BLOCKED_BY_URL_REASON:
+            return
+        self.stats.add_request(matched[1], _get_known_size(matched[0]))
+
+    def __on_request_paused(self, params: Dict[str, Any]) -> None:
+        # Обработчик вызывается в потоке чтения канала: ответ отправляется без ожидания
+        url = params.get('request', {}).get('url', '')
+        self.stats.add_request(params.get('resourceType', 'Other'), _get_known_size(url))
+        if self._channel is not None:
+            self._channel.send_async('Fetch.failRequest', {
+                'requestId': params['requestId'], 'errorReason': 'BlockedByClient'
+            })
+
+
+# Блокировки, применённые к сессиям, по идентификаторам сессий; сессии без блокировки не хранятся
+_blockers: Dict[str, RequestBlocker] = {}
+_blockers_lock = Lock()
+
+
+def get_request_blocker(emulator: Any) -> Optional[RequestBlocker]:
+    """
+    Возвращает блокировку, применённую к сессии функцией apply_request_blocking.
+
+    :param emulator: Объект вебдрайвера.
+    :return: RequestBlocker или None, если запросы не блокируются.
+    """
+    with _blockers_lock:
+        return _blockers.get(emulator.session_id)
+
+
+def apply_request_blocking(
+        emulator: Any,
+        rule: Union[str, BlockingRule],
+        listeners: Sequence[ActionListener] = (),
+        is_dry_run: bool = False,
+        stats: Optional[RequestBlockingStats] = None
+) -> RequestBlocker:
+    """
+    Применяет правило блокировки к сессии одним пакетом команд DevTools протокола вместо применённого ранее.
+    Статистика ведётся, только если канал DevToolsChannel открыт до вызова.
+
+    :param emulator: Объект вебдрайвера.
+    :param rule: Имя правила или BlockingRule; NO_BLOCKING снимает блокировку.
+    :param listeners: Слушатели команд.
+    :param is_dry_run: Флаг пробного режима: запросы не блокируются, а учитываются с размерами ответов.
+    :param stats: Статистика, в которую продолжается учёт; None - новая.
+    :return: Применённая блокировка.
+    """
+    rule = resolve_blocking_rule(rule)
+    blocker = RequestBlocker(rule, get_devtools_channel(emulator), is_dry_run, stats)
+    previous = get_request_blocker(emulator)
+    commands = blocker.commands
+    if previous is not None and previous.is_intercepting and not blocker.is_intercepting:
+        commands.append(('Fetch.disable', {}))
+    if previous is not None:
+        previous.detach()
+    blocker.attach()
+    try:
+        send_devtools_commands(emulator, commands, listeners)
+    except BaseException:
+        blocker.detach()
+        if previous is not None:
+            previous.attach()
+        raise
+    with _blockers_lock:
+        if rule.is_empty:
+            _blockers.pop(emulator.session_id, None)
+        else:
+            _blockers[emulator.session_id] = blocker
+    return blocker
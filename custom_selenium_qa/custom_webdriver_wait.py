@@ -1,11 +1,15 @@
-from time import time
+from time import perf_counter
 from time import sleep
+from typing import Optional
 
 from selenium.common.exceptions import InvalidSelectorException
 from selenium.common.exceptions import TimeoutException
 
 from .base_settings import IGNORED_EXCEPTIONS
 from .base_settings import POLL_FREQUENCY
+from .deadline import Deadline
+from .polling import FixedPolling
+from .polling import PollingStrategy
 
 
 class CustomWebDriverWait(object):
@@ -17,25 +21,33 @@ class CustomWebDriverWait(object):
             self,
             page_object,
             timeout: float,
-            poll_frequency: float = POLL_FREQUENCY
+            poll_frequency: Optional[float] = None,
+            polling: Optional[PollingStrategy] = None
     ):
         """
         Конструктор, принимает экземпляр WebDriver и тайм-аут в секундах.
+        Если у page_object открыт крайний срок действия (deadline), ожидание не выходит за его пределы.
 
         :Аргументы:
         - driver - Экземпляр WebDriver (Ie, Firefox, Chrome или удаленный)
         - timeout - Количество секунд до истечения времени ожидания
-        - poll_frequency - интервал ожидания между вызовами
-        По умолчанию это 0,5 секунды.
+        - poll_frequency - постоянный интервал ожидания между вызовами
+        - polling - стратегия опроса. По умолчанию используется POLLING_STRATEGY из page_object,
+        а при его отсутствии - постоянный интервал POLL_FREQUENCY.
         """
         self._page_object = page_object
         self._timeout = float(timeout)
-        self._poll = poll_frequency
 
-        # avoid the divide by zero
-        if self._poll == 0:
-            self._poll = POLL_FREQUENCY
+        if polling is None:
+            if poll_frequency is not None:
+                # avoid the divide by zero
+                polling = FixedPolling(poll_frequency or POLL_FREQUENCY)
+            else:
+                polling = getattr(page_object, 'POLLING_STRATEGY', None) or FixedPolling()
+        self._polling = polling
+        self._polls = 0
         self._ignored_exceptions = IGNORED_EXCEPTIONS
+        self._parent_deadline = getattr(page_object, 'deadline', None)
 
     def __repr__(self) -> str:
         return '<{0.__module__}.{0.__name__} (session="{1}")>'.format(
@@ -43,61 +55,105 @@ class CustomWebDriverWait(object):
             self._page_object.emulator.session_id
         )
 
-    def until(self, method, message=''):
+    @property
+    def polls(self) -> int:
+        """
+        Возвращает количество вызовов условия за последнее ожидание.
+
+        :return: Количество вызовов.
+        """
+        return self._polls
+
+    def until(self, method, message='', polling: Optional[PollingStrategy] = None):
         """
         Вызывает метод, предоставленный драйвером в качестве аргумента, до тех
         пор, пока возвращаемое значение не оценивается как 'False'.
 
         :param method: callable(WebDriver)
         :param message: optional message for :exc:'TimeoutException'
+        :param polling: стратегия опроса только для этого вызова
         :returns: the result of the last call to 'method'
         :raises: :exc:'selenium.common.exceptions.TimeoutException' if timeout
         occurs
         """
-        end_time = time() + self._timeout
-
-        while True:
-            try:
-                value = method(self._page_object.emulator)
-                if value:
-                    return value
-            except InvalidSelectorException as exc:
-                self._page_object.make_screenshot()
-                raise exc
-            except self._ignored_exceptions:
-                pass
-            sleep(self._poll)
-            if time() > end_time:
-                break
-        self._page_object.make_screenshot()
+        deadline = Deadline(self._timeout, self._parent_deadline)
+        delays = (polling or self._polling).delays()
+        self._polls = 0
+        started = perf_counter()
+        is_succeeded = False
+
+        try:
+            while True:
+                self._polls += 1
+                try:
+                    value = method(self._page_object.emulator)
+                    if value:
+                        is_succeeded = True
+                        return value
+                except InvalidSelectorException as exc:
+                    self._page_object.make_screenshot(is_error=True)
+                    raise exc
+                except self._ignored_exceptions:
+                    pass
+                if deadline.is_expired():
+                    break
+                sleep(min(next(delays), deadline.remaining))
+        finally:
+            self._notify_listeners(started, is_succeeded)
+        self._page_object.make_screenshot(is_error=True)
         raise TimeoutException(message)
 
-    def until_not(self, method, message=''):
+    def until_not(self, method, message='', polling: Optional[PollingStrategy] = None):
         """
         Вызывает метод, предоставленный драйвером в качестве аргумента, до тех
         пор, пока возвращаемое значение равно 'False'.
 
         :param method: callable(WebDriver)
         :param message: optional message for :exc:'TimeoutException'
+        :param polling: стратегия опроса только для этого вызова
         :returns: the result of the last call to 'method', or
                   'True' if 'method' has raised one of the ignored exceptions
         :raises: :exc:'selenium.common.exceptions.TimeoutException' if timeout
                  occurs
         """
-        end_time = time() + self._timeout
-
-        while True:
-            try:
-                value = method(self._page_object.emulator)
-                if not value:
-                    return value
-            except InvalidSelectorException as exc:
-                self._page_object.make_screenshot()
-                raise exc
-            except self._ignored_exceptions:
-                return True
-            sleep(self._poll)
-            if time() > end_time:
-                break
-        self._page_object.make_screenshot()
+        deadline = Deadline(self._timeout, self._parent_deadline)
+        delays = (polling or self._polling).delays()
+        self._polls = 0
+        started = perf_counter()
+        is_succeeded = False
+
+        try:
+            while True:
+                self._polls += 1
+                try:
+                    value = method(self._page_object.emulator)
+                    if not value:
+                        is_succeeded = True
+                        return value
+                except InvalidSelectorException as exc:
+                    self._page_object.make_screenshot(is_error=True)
+                    raise exc
+                except self._ignored_exceptions:
+                    is_succeeded = True
+                    return True
+                if deadline.is_expired():
+                    break
+                sleep(min(next(delays), deadline.remaining))
+        finally:
+            self._notify_listeners(started, is_succeeded)
+        self._page_object.make_screenshot(is_error=True)
         raise TimeoutException(message)
+
+    def _notify_listeners(self, started: float, is_succeeded: bool) -> None:
+        """
+        Передаёт слушателям page_object сведения о завершённом ожидании.
+
+        :param started: Время начала ожидания.
+        :param is_succeeded: Флаг выполнения условия.
+        :return: None
+        """
+        listeners = getattr(self._page_object, 'listeners', ())
+        if listeners:
+            duration = perf_counter() - started
+            for listener in listeners:
+                listener.on_wait(started, duration, self._polls, is_succeeded)
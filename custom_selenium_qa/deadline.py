@@ -0,0 +1,47 @@
+from time import monotonic
+from typing import Optional
+
+
+class Deadline:
+    """
+    Крайний срок выполнения действия по монотонным часам.
+    Общий для всех вложенных ожиданий и повторных попыток одного публичного действия.
+    """
+
+    def __init__(self, timeout: float, parent: Optional['Deadline'] = None):
+        """
+        :param timeout: Количество секунд до истечения срока.
+        :param parent: Крайний срок внешнего действия, позже которого вложенный срок не может истечь.
+        """
+        self._end_time = monotonic() + float(timeout)
+        if parent is not None:
+            self._end_time = min(self._end_time, parent.end_time)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (remaining={self.remaining:.3f})>'
+
+    @property
+    def end_time(self) -> float:
+        """
+        Возвращает момент истечения срока по монотонным часам.
+
+        :return: Значение time.monotonic() на момент истечения срока.
+        """
+        return self._end_time
+
+    @property
+    def remaining(self) -> float:
+        """
+        Возвращает оставшееся до истечения срока время.
+
+        :return: Количество секунд, не меньше нуля.
+        """
+        return max(0.0, self._end_time - monotonic())
+
+    def is_expired(self) -> bool:
+        """
+        Проверяет, истёк ли срок.
+
+        :return: True, если срок истёк.
+        """
+        return monotonic() >= self._end_time
@@ -0,0 +1,101 @@
+from json import dumps
+from time import perf_counter
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from .devtools_channel import DevToolsCommand
+from .devtools_channel import DevToolsProtocolError
+from .devtools_channel import get_devtools_channel
+from .instrumentation import ActionListener
+from .instrumentation import notify_command
+
+# Браузеры, вебдрайвер которых поддерживает команды DevTools протокола через расширение Chromium
+CHROMIUM_BROWSERS = ('chrome', 'chromium', 'MicrosoftEdge', 'msedge')
+
+
+def send_devtools_command(
+        emulator: Any,
+        cmd: str,
+        params: Optional[dict] = None,
+        listeners: Sequence[ActionListener] = (),
+        is_checked: bool = False
+) -> Any:
+    """
+    Отправляет команду DevTools протокола через открытый канал DevToolsChannel сессии, а без него -
+    через расширение Chromium вебдрайвера (Selenoid, chromedriver), и сообщает о ней слушателям
+    как о команде devtools:<cmd>.
+
+    :param emulator: Объект вебдрайвера.
+    :param cmd: Команда согласно DevTools протоколу.
+    :param params: Словарь с параметрами.
+    :param listeners: Слушатели команд.
+    :param is_checked: Флаг проверки ответа: ошибка драйвера поднимается исключением WebDriverException.
+    :return: Ответ ChromeDriver после выполнения команды (результат команды - в ключе value).
+    """
+    started = perf_counter()
+    error: Optional[BaseException] = None
+    try:
+        channel = get_devtools_channel(emulator)
+        if channel is not None:
+            try:
+                return {'value': channel.send(cmd, params)}
+            except DevToolsProtocolError as exc:
+                if is_checked:
+                    raise
+                return {'status': 500, 'value': exc.msg}
+        resource = "/session/%s/chromium/send_command_and_get_result" % emulator.session_id
+        url = emulator.command_executor._url + resource
+        body = dumps({'cmd': cmd, 'params': params or {}})
+        response = emulator.command_executor._request('POST', url, body)
+        if is_checked:
+            emulator.error_handler.check_response(response)
+        return response
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        if listeners:
+            notify_command(list(listeners), f'devtools:{cmd}', started, perf_counter() - started, error)
+
+
+def send_devtools_commands(
+        emulator: Any,
+        commands: Sequence[DevToolsCommand],
+        listeners: Sequence[ActionListener] = ()
+) -> List[Any]:
+    """
+    Отправляет несколько команд DevTools протокола с проверкой ответов. Через открытый канал DevToolsChannel
+    команды отправляются пакетом без ожидания ответов предыдущих, без него - по очереди через HTTP.
+
+    :param emulator: Объект вебдрайвера.
+    :param commands: Команды: пары (команда, параметры).
+    :param listeners: Слушатели команд; о каждой команде пакета сообщается с длительностью всего пакета.
+    :return: Ответы в порядке команд (результат команды - в ключе value).
+    """
+    channel = get_devtools_channel(emulator)
+    if channel is None:
+        return [send_devtools_command(emulator, cmd, params, listeners, is_checked=True) for cmd, params in commands]
+    started = perf_counter()
+    error: Optional[BaseException] = None
+    try:
+        return [{'value': result} for result in channel.send_batch(commands)]
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        if listeners:
+            duration = perf_counter() - started
+            for cmd, _ in commands:
+                notify_command(list(listeners), f'devtools:{cmd}', started, duration, error)
+
+
+def is_devtools_available(emulator: Any) -> bool:
+    """
+    Проверяет, поддерживает ли сессия команды DevTools протокола (браузер на основе Chromium).
+
+    :param emulator: Объект вебдрайвера.
+    :return: True для Chrome, Chromium и Edge.
+    """
+    return (getattr(emulator, 'caps', None) or {}).get('browserName') in CHROMIUM_BROWSERS
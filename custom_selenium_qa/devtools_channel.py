@@ -0,0 +1,389 @@
+import json
+import logging
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from itertools import count
+from threading import Lock
+from threading import Thread
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+
+from .base_settings import DEVTOOLS_CHANNEL_TIMEOUT
+
+try:
+    import websocket  # type: ignore
+except ImportError:  # websocket-client - необязательная зависимость, нужна только для WebSocketConnection
+    websocket = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Команда DevTools протокола: имя и параметры
+DevToolsCommand = Tuple[str, Optional[dict]]
+
+# Открытые каналы по идентификаторам сессий вебдрайвера
+_channels: Dict[str, 'DevToolsChannel'] = {}
+_channels_lock = Lock()
+
+
+class DevToolsProtocolError(WebDriverException):
+    """
+    Браузер вернул ошибку на команду DevTools протокола.
+    """
+
+
+class DevToolsConnection(ABC):
+    """
+    Соединение канала DevToolsChannel, по которому передаются JSON-сообщения DevTools протокола.
+    """
+
+    @abstractmethod
+    def send(self, message: str) -> None:
+        """
+        Отправляет сообщение.
+
+        :param message: JSON-сообщение.
+        :return: None
+        """
+
+    @abstractmethod
+    def recv(self) -> str:
+        """
+        Ожидает и возвращает следующее сообщение; после закрытия соединения поднимает исключение.
+
+        :return: JSON-сообщение.
+        """
+
+    def close(self) -> None:
+        """
+        Закрывает соединение.
+
+        :return: None
+        """
+
+
+class WebSocketConnection(DevToolsConnection):
+    """
+    Соединение по websocket на websocket-client (pip install custom_selenium_qa[devtools]).
+    """
+
+    def __init__(self, url: str, timeout: float = DEVTOOLS_CHANNEL_TIMEOUT):
+        """
+        :param url: Адрес websocket DevTools протокола.
+        :param timeout: Тайм-аут установки соединения в секундах.
+        """
+        if websocket is None:
+            raise ImportError(
+                'Для WebSocketConnection требуется websocket-client: pip install custom_selenium_qa[devtools]'
+            )
+        self._url = url
+        self._socket = websocket.create_connection(url, timeout=timeout, enable_multithread=True)
+        # Чтение выполняется в фоновом потоке канала и ждёт событий без ограничения по времени
+        self._socket.settimeout(None)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} ({self._url})>'
+
+    def send(self, message: str) -> None:
+        self._socket.send(message)
+
+    def recv(self) -> str:
+        message = self._socket.recv()
+        return message.decode('utf-8') if isinstance(message, bytes) else message
+
+    def close(self) -> None:
+        self._socket.close()
+
+
+def get_devtools_url(emulator: Any) -> str:
+    """
+    Возвращает адрес websocket DevTools протокола сессии: возможность se:cdp (Selenium Grid 4, уровень браузера)
+    или адрес страницы сессии Selenoid /devtools/<session>/page на хосте вебдрайвера.
+
+    :param emulator: Объект вебдрайвера.
+    :return: Адрес websocket.
+    """
+    url = (getattr(emulator, 'caps', None) or {}).get('se:cdp')
+    if url:
+        return str(url)
+    parts = urlsplit(emulator.command_executor._url)
+    scheme = 'wss' if parts.scheme == 'https' else 'ws'
+    return f'{scheme}://{parts.netloc}/devtools/{emulator.session_id}/page'
+
+
+def get_devtools_channel(emulator: Any) -> Optional['DevToolsChannel']:
+    """
+    Возвращает открытый канал DevTools протокола сессии.
+
+    :param emulator: Объект вебдрайвера.
+    :return: DevToolsChannel или None, если канал не открыт.
+    """
+    with _channels_lock:
+        channel = _channels.get(emulator.session_id)
+    return channel if channel is not None and channel.is_connected else None
+
+
+class DevToolsChannel:
+    """
+    Постоянный канал DevTools протокола сессии вместо HTTP-запроса к расширению Chromium на каждую команду.
+    Команды отправляются без ожидания ответа предыдущих (send_async, send_batch), ответы и события принимает
+    фоновый поток; события передаются подписчикам add_event_listener в этом потоке.
+
+    Пока канал открыт методом open, send_devtools_command (и BaseActions.send_by_devtools_protocol) отправляет
+    команды сессии через него, а после закрытия - снова через HTTP.
+    """
+
+    def __init__(
+            self,
+            connection: DevToolsConnection,
+            target_session_id: Optional[str] = None,
+            timeout: float = DEVTOOLS_CHANNEL_TIMEOUT
+    ):
+        """
+        :param connection: Соединение с браузером.
+        :param target_session_id: Идентификатор сессии DevTools вкладки (для соединения уровня браузера).
+        :param timeout: Количество секунд ожидания ответа на команду.
+        """
+        self._connection = connection
+        self._target_session_id = target_session_id
+        self._timeout = timeout
+        self._ids = count(1)
+        self._lock = Lock()
+        self._pending: Dict[int, Future] = {}
+        self._event_listeners: Dict[str, List[Callable[[dict], None]]] = {}
+        self._is_connected = True
+        self._session_key: Optional[str] = None
+        self._reader = Thread(target=self.__read, name=type(self).__name__, daemon=True)
+        self._reader.start()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (connected={self._is_connected}, pending={len(self._pending)})>'
+
+    def __enter__(self) -> 'DevToolsChannel':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @classmethod
+    def open(
+            cls,
+            emulator: Any,
+            connection: Optional[DevToolsConnection] = None,
+            url: Optional[str] = None,
+            timeout: float = DEVTOOLS_CHANNEL_TIMEOUT
+    ) -> 'DevToolsChannel':
+        """
+        Открывает канал сессии и регистрирует его для send_devtools_command.
+        Соединение уровня браузера (адрес не оканчивается на /page) подключается к первой вкладке сессии.
+
+        :param emulator: Объект вебдрайвера.
+        :param connection: Готовое соединение (используется как есть, без подключения к вкладке);
+        None - WebSocketConnection по адресу url.
+        :param url: Адрес websocket; None - адрес get_devtools_url.
+        :param timeout: Количество секунд ожидания ответа на команду.
+        :return: DevToolsChannel
+        """
+        if connection is None:
+            url = url or get_devtools_url(emulator)
+            channel = cls(WebSocketConnection(url, timeout), timeout=timeout)
+            is_page_target = urlsplit(url).path.rstrip('/').endswith('/page')
+        else:
+            channel = cls(connection, timeout=timeout)
+            is_page_target = True
+        if not is_page_target:
+            try:
+                channel.attach_to_page()
+            except BaseException:
+                channel.close()
+                raise
+        with _channels_lock:
+            previous = _channels.get(emulator.session_id)
+            channel._session_key = emulator.session_id
+            _channels[emulator.session_id] = channel
+        if previous is not None:
+            previous.close()
+        return channel
+
+    @property
+    def is_connected(self) -> bool:
+        """
+        Проверяет, открыт ли канал.
+
+        :return: True, если канал открыт.
+        """
+        return self._is_connected
+
+    def attach_to_page(self) -> str:
+        """
+        Подключает канал уровня браузера к первой вкладке: последующие команды и события относятся к ней.
+
+        :return: Идентификатор сессии DevTools вкладки.
+        """
+        targets = self.send('Target.getTargets')['targetInfos']
+        page = next((target for target in targets if target['type'] == 'page'), None)
+        if page is None:
+            raise WebDriverException('В сессии нет вкладки для подключения DevTools протокола.')
+        result = self.send('Target.attachToTarget', {'targetId': page['targetId'], 'flatten': True})
+        self._target_session_id = result['sessionId']
+        return self._target_session_id
+
+    def send_async(self, cmd: str, params: Optional[dict] = None) -> Future:
+        """
+        Отправляет команду, не дожидаясь ответа.
+
+        :param cmd: Команда согласно DevTools протоколу.
+        :param params: Словарь с параметрами.
+        :return: Future с результатом команды или исключением DevToolsProtocolError.
+        """
+        future: Future = Future()
+        message: Dict[str, Any] = {'id': next(self._ids), 'method': cmd, 'params': params or {}}
+        if self._target_session_id is not None:
+            message['sessionId'] = self._target_session_id
+        with self._lock:
+            if not self._is_connected:
+                raise WebDriverException('Канал DevTools протокола закрыт.')
+            self._pending[message['id']] = future
+            try:
+                self._connection.send(json.dumps(message))
+            except Exception as exc:
+                del self._pending[message['id']]
+                raise WebDriverException(f'Не удалось отправить команду {cmd}: {exc}')
+        return future
+
+    def send(self, cmd: str, params: Optional[dict] = None) -> dict:
+        """
+        Отправляет команду и ожидает ответ.
+
+        :param cmd: Команда согласно DevTools протоколу.
+        :param params: Словарь с параметрами.
+        :return: Результат команды.
+        """
+        return self.__result(cmd, self.send_async(cmd, params))
+
+    def send_batch(self, commands: Sequence[DevToolsCommand]) -> List[dict]:
+        """
+        Отправляет команды подряд без ожидания ответов и ожидает все ответы: пакет занимает примерно
+        одну задержку сети вместо задержки на каждую команду. Браузер выполняет команды по порядку.
+
+        :param commands: Команды: пары (команда, параметры).
+        :return: Результаты в порядке команд; при ошибке любой команды поднимается исключение первой из них.
+        """
+        futures = [(cmd, self.send_async(cmd, params)) for cmd, params in commands]
+        results = []
+        error: Optional[BaseException] = None
+        for cmd, future in futures:
+            try:
+                results.append(self.__result(cmd, future))
+            except WebDriverException as exc:
+                error = error or exc
+        if error is not None:
+            raise error
+        return results
+
+    def add_event_listener(self, event: str, callback: Callable[[dict], None]) -> None:
+        """
+        Подписывает функцию на событие DevTools протокола (например, Network.requestWillBeSent).
+        Функция вызывается в фоновом потоке канала с параметрами события; домен событий включается
+        отдельной командой (например, Network.enable).
+
+        :param event: Имя события.
+        :param callback: Функция, принимающая параметры события.
+        :return: None
+        """
+        with self._lock:
+            self._event_listeners.setdefault(event, []).append(callback)
+
+    def remove_event_listener(self, event: str, callback: Callable[[dict], None]) -> None:
+        """
+        Отписывает функцию от события.
+
+        :param event: Имя события.
+        :param callback: Функция, переданная в add_event_listener.
+        :return: None
+        """
+        with self._lock:
+            callbacks = self._event_listeners.get(event, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def close(self) -> None:
+        """
+        Закрывает канал; ожидающие ответа команды завершаются исключением WebDriverException.
+
+        :return: None
+        """
+        with _channels_lock:
+            if self._session_key is not None and _channels.get(self._session_key) is self:
+                del _channels[self._session_key]
+        with self._lock:
+            if not self._is_connected:
+                return
+            self._is_connected = False
+        try:
+            self._connection.close()
+        except Exception as exc:
+            logger.debug('Ошибка закрытия соединения DevTools протокола: %s', exc)
+        self.__fail_pending(WebDriverException('Канал DevTools протокола закрыт.'))
+
+    def __result(self, cmd: str, future: Future) -> dict:
+        try:
+            result: dict = future.result(self._timeout)
+        except FutureTimeoutError:
+            raise TimeoutException(f'Нет ответа на команду {cmd} DevTools протокола за {self._timeout} сек.')
+        return result
+
+    def __fail_pending(self, error: BaseException) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def __read(self) -> None:
+        while True:
+            try:
+                message = json.loads(self._connection.recv())
+            except Exception as exc:
+                if self._is_connected:
+                    logger.warning('Канал DevTools протокола закрыт: %s', exc)
+                with self._lock:
+                    self._is_connected = False
+                self.__fail_pending(WebDriverException(f'Канал DevTools протокола закрыт: {exc}'))
+                return
+            if 'id' in message:
+                self.__resolve(message)
+            elif 'method' in message:
+                self.__dispatch(message)
+
+    def __resolve(self, message: Dict[str, Any]) -> None:
+        with self._lock:
+            future = self._pending.pop(message['id'], None)
+        if future is None:
+            return
+        if 'error' in message:
+            error = message['error']
+            future.set_exception(DevToolsProtocolError(f'{error.get("message")} ({error.get("code")})'))
+        else:
+            future.set_result(message.get('result', {}))
+
+    def __dispatch(self, message: Dict[str, Any]) -> None:
+        if self._target_session_id is not None and message.get('sessionId') != self._target_session_id:
+            return
+        with self._lock:
+            callbacks = list(self._event_listeners.get(message['method'], ()))
+        for callback in callbacks:
+            try:
+                callback(message.get('params', {}))
+            except Exception:
+                logger.exception('Ошибка обработчика события %s DevTools протокола', message['method'])
@@ -0,0 +1,101 @@
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from .locator import Locator
+
+
+class ElementCache:
+    """
+    Кэш объектов WebElement одной сессии по локатору и текущему фрейму.
+    Элемент переиспользуется, пока не станет устаревшим (StaleElementReferenceException),
+    либо пока не произойдёт переход на другую страницу или переключение фрейма.
+    """
+
+    def __init__(self) -> None:
+        self._elements: Dict[Tuple[Tuple[Tuple[str, str], ...], str, str], WebElement] = {}
+        self._frames: Tuple[Tuple[str, str], ...] = ()
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (size={len(self._elements)}, hits={self._hits}, misses={self._misses})>'
+
+    @property
+    def hits(self) -> int:
+        """
+        Возвращает количество обращений, для которых элемент нашёлся в кэше.
+
+        :return: Количество попаданий.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Возвращает количество обращений, для которых элемент пришлось искать через WebDriver.
+
+        :return: Количество промахов.
+        """
+        return self._misses
+
+    def _key(self, locator: Locator) -> Tuple[Tuple[Tuple[str, str], ...], str, str]:
+        by, selector = locator()
+        return self._frames, by, selector
+
+    def get(self, locator: Locator) -> Optional[WebElement]:
+        """
+        Возвращает элемент из кэша.
+
+        :param locator: Локатор элемента.
+        :return: WebElement или None, если элемента нет в кэше.
+        """
+        element = self._elements.get(self._key(locator))
+        if element is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return element
+
+    def put(self, locator: Locator, element: WebElement) -> None:
+        """
+        Сохраняет элемент в кэш.
+
+        :param locator: Локатор элемента.
+        :param element: Найденный WebElement.
+        :return: None
+        """
+        self._elements[self._key(locator)] = element
+
+    def invalidate(self, locator: Optional[Locator] = None) -> None:
+        """
+        Удаляет элемент из кэша, а без локатора - очищает кэш полностью.
+
+        :param locator: Локатор элемента.
+        :return: None
+        """
+        if locator is None:
+            self._elements.clear()
+        else:
+            self._elements.pop(self._key(locator), None)
+
+    def enter_frame(self, locator: Locator) -> None:
+        """
+        Отмечает переключение во вложенный фрейм и очищает кэш.
+
+        :param locator: Локатор iframe.
+        :return: None
+        """
+        self._frames = (*self._frames, locator())
+        self.invalidate()
+
+    def leave_frames(self) -> None:
+        """
+        Отмечает возврат на основную страницу и очищает кэш.
+
+        :return: None
+        """
+        self._frames = ()
+        self.invalidate()
@@ -0,0 +1,172 @@
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
+from time import perf_counter
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import TypeVar
+
+from .base_actions import BaseActions
+from .base_settings import SCREENSHOTS_DIRECTORY
+from .screenshots import ScreenshotPolicy
+from .step_reporter import StepReporter
+
+T = TypeVar('T')
+P = TypeVar('P', bound=BaseActions)
+
+
+class SessionResult(Generic[T]):
+    """
+    Результат выполнения действия в одной сессии FanOutExecutor.
+    """
+
+    __slots__ = ('name', 'page_object', 'value', 'error', 'duration')
+
+    def __init__(
+            self,
+            name: str,
+            page_object: BaseActions,
+            value: Optional[T] = None,
+            error: Optional[BaseException] = None,
+            duration: float = 0.0
+    ):
+        """
+        :param name: Имя сессии.
+        :param page_object: Объект страницы сессии.
+        :param value: Значение, которое вернуло действие.
+        :param error: Исключение, с которым завершилось действие, или None.
+        :param duration: Длительность действия в секундах.
+        """
+        self.name = name
+        self.page_object = page_object
+        self.value = value
+        self.error = error
+        self.duration = duration
+
+    def __repr__(self) -> str:
+        state = 'ok' if self.error is None else type(self.error).__name__
+        return f'<{type(self).__name__} (name={self.name!r}, {state}, duration={self.duration:.3f})>'
+
+    @property
+    def is_succeeded(self) -> bool:
+        """
+        Проверяет, завершилось ли действие без исключения.
+
+        :return: True, если действие выполнено успешно.
+        """
+        return self.error is None
+
+
+class FanOutError(AssertionError):
+    """
+    Действие завершилось ошибкой в одной или нескольких сессиях FanOutExecutor.
+    """
+
+    def __init__(self, failures: List[SessionResult]):
+        """
+        :param failures: Результаты сессий, завершившихся ошибкой.
+        """
+        self.failures = failures
+        super().__init__(
+            f'Ошибки в сессиях ({len(failures)}): ' + '; '.join(
+                f'{result.name}: {type(result.error).__name__}: {result.error}' for result in failures
+            )
+        )
+
+
+class FanOutExecutor:
+    """
+    Выполняет одно действие над объектами страниц нескольких сессий параллельно в пуле потоков.
+    Потоки ждут ответов WebDriver без GIL, поэтому пропускная способность растёт почти линейно с числом сессий.
+
+    На время выполнения каждая сессия изолирована: скриншоты пишутся в поддиректорию screenshots_directory
+    с именем сессии по собственной политике скриншотов, шаги TestIT накапливаются в отдельном отложенном буфере
+    объекта страницы и после завершения всех сессий передаются в TestIT из вызывающего потока - по общему шагу
+    на сессию, в порядке следования сессий.
+    После выполнения директория скриншотов, политика скриншотов и буфер шагов объектов страниц восстанавливаются.
+    """
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            screenshots_directory: str = SCREENSHOTS_DIRECTORY,
+            has_steps_report: bool = True
+    ):
+        """
+        :param max_workers: Количество потоков; None - по количеству сессий.
+        :param screenshots_directory: Директория, в которой создаются директории скриншотов сессий.
+        :param has_steps_report: Флаг передачи шагов сессий в TestIT.
+        """
+        self._max_workers = max_workers
+        self._screenshots_directory = screenshots_directory
+        self._has_steps_report = has_steps_report
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (max_workers={self._max_workers})>'
+
+    def run(
+            self,
+            page_objects: Mapping[str, P],
+            action: Callable[[P], T],
+            is_raising: bool = True
+    ) -> List[SessionResult[T]]:
+        """
+        Выполняет действие над каждым объектом страницы и собирает результаты всех сессий.
+        Ошибка одной сессии не прерывает остальные.
+
+        :param page_objects: Объекты страниц по именам сессий (например, по пользователям или локалям).
+        :param action: Действие, принимающее объект страницы.
+        :param is_raising: Флаг исключения FanOutError, если хотя бы одна сессия завершилась ошибкой.
+        :return: Результаты в порядке следования сессий.
+        """
+        if not page_objects:
+            return []
+        previous_directories: Dict[str, str] = {}
+        previous_reporters: Dict[str, Optional[StepReporter]] = {}
+        previous_policies: Dict[str, ScreenshotPolicy] = {}
+        for name, page_object in page_objects.items():
+            previous_directories[name] = page_object.screenshots_directory
+            # Сохраняется собственный буфер объекта: None - общий буфер потока, он же восстанавливается
+            previous_reporters[name] = page_object._step_reporter
+            previous_policies[name] = page_object.screenshot_policy
+            page_object.screenshots_directory = join(self._screenshots_directory, name)
+            # Лимит и нумерация файлов - на сессию: общая политика теста сделала бы их зависимыми от порядка потоков
+            page_object.screenshot_policy = ScreenshotPolicy()
+            page_object.step_reporter = StepReporter(is_deferred=True)
+
+        try:
+            with ThreadPoolExecutor(
+                    max_workers=self._max_workers or len(page_objects),
+                    thread_name_prefix=type(self).__name__
+            ) as pool:
+                futures = [
+                    pool.submit(self.__run_session, name, page_object, action)
+                    for name, page_object in page_objects.items()
+                ]
+                results = [future.result() for future in futures]
+            if self._has_steps_report:
+                for result in results:
+                    result.page_object.step_reporter.report(f'Сессия {result.name}')
+        finally:
+            for name, page_object in page_objects.items():
+                page_object.step_reporter = previous_reporters[name]
+                page_object.screenshots_directory = previous_directories[name]
+                page_object.screenshot_policy = previous_policies[name]
+        failures = [result for result in results if not result.is_succeeded]
+        if is_raising and failures:
+            raise FanOutError(failures)
+        return results
+
+    @staticmethod
+    def __run_session(name: str, page_object: P, action: Callable[[P], T]) -> SessionResult[T]:
+        started = perf_counter()
+        result: SessionResult[T] = SessionResult(name, page_object)
+        try:
+            result.value = action(page_object)
+        except Exception as exc:
+            result.error = exc
+        result.duration = perf_counter() - started
+        return result
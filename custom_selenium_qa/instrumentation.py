@@ -0,0 +1,294 @@
+from json import dump
+from os import makedirs
+from os.path import abspath
+from os.path import join
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from .base_settings import METRICS_DIRECTORY
+
+
+class ActionListener:
+    """
+    Слушатель событий BaseActions и команд WebDriver.
+    Все методы по умолчанию ничего не делают; время передаётся в секундах по time.perf_counter().
+    """
+
+    def on_action_start(self, title: str, description: Optional[str], started: float) -> None:
+        """
+        Вызывается при открытии шага действия BaseActions.
+
+        :param title: Заголовок шага.
+        :param description: Описание шага (обычно описание локатора).
+        :param started: Время начала шага.
+        :return: None
+        """
+
+    def on_action_end(
+            self,
+            title: str,
+            description: Optional[str],
+            started: float,
+            duration: float,
+            error: Optional[BaseException]
+    ) -> None:
+        """
+        Вызывается при закрытии шага действия BaseActions.
+
+        :param title: Заголовок шага.
+        :param description: Описание шага.
+        :param started: Время начала шага.
+        :param duration: Длительность шага в секундах.
+        :param error: Исключение, с которым завершился шаг, или None.
+        :return: None
+        """
+
+    def on_command(self, command: str, started: float, duration: float, error: Optional[BaseException]) -> None:
+        """
+        Вызывается после каждой команды, отправленной в WebDriver.
+
+        :param command: Имя команды WebDriver (или devtools:<команда> для DevTools протокола).
+        :param started: Время отправки команды.
+        :param duration: Длительность команды в секундах.
+        :param error: Исключение, с которым завершилась команда, или None.
+        :return: None
+        """
+
+    def on_retry(self, error: BaseException) -> None:
+        """
+        Вызывается, когда обработчик ошибок поглотил игнорируемое исключение и действие будет повторено.
+
+        :param error: Поглощённое исключение.
+        :return: None
+        """
+
+    def on_wait(self, started: float, duration: float, polls: int, is_succeeded: bool) -> None:
+        """
+        Вызывается по завершении ожидания CustomWebDriverWait.
+
+        :param started: Время начала ожидания.
+        :param duration: Фактическая длительность ожидания в секундах.
+        :param polls: Количество вызовов условия.
+        :param is_succeeded: Флаг выполнения условия до истечения тайм-аута.
+        :return: None
+        """
+
+    def on_test_finished(self, test_method_name: str) -> None:
+        """
+        Вызывается из BaseActions.finish_test по окончании теста.
+
+        :param test_method_name: Имя тестового метода.
+        :return: None
+        """
+
+
+class MetricsCollector(ActionListener):
+    """
+    Слушатель, собирающий время шагов, количество команд WebDriver, повторных попыток и ожиданий.
+    По окончании теста записывает сводку в {directory}/{test_method_name}.json.
+    Команды и повторные попытки учитываются во всех открытых шагах, включая внешние;
+    время по локаторам - только для внешних шагов, чтобы вложенные шаги не учитывались дважды.
+    """
+
+    def __init__(self, directory: str = METRICS_DIRECTORY):
+        """
+        :param directory: Директория для JSON-сводок тестов.
+        """
+        self._directory = directory
+        self._stack: List[Dict[str, int]] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Очищает собранные данные.
+
+        :return: None
+        """
+        self._stack.clear()
+        self._actions: Dict[str, Dict[str, float]] = {}
+        self._locators: Dict[str, Dict[str, float]] = {}
+        self._commands: Dict[str, Dict[str, float]] = {}
+        self._waits: Dict[str, float] = {'count': 0, 'total': 0.0, 'polls': 0, 'timeouts': 0}
+        self._duration = 0.0
+
+    def on_action_start(self, title: str, description: Optional[str], started: float) -> None:
+        self._stack.append({'commands': 0, 'retries': 0})
+
+    def on_action_end(
+            self,
+            title: str,
+            description: Optional[str],
+            started: float,
+            duration: float,
+            error: Optional[BaseException]
+    ) -> None:
+        frame = self._stack.pop() if self._stack else {'commands': 0, 'retries': 0}
+        is_outermost = not self._stack
+        if is_outermost:
+            self._duration += duration
+        action = self._actions.setdefault(
+            title,
+            {'calls': 0, 'total': 0.0, 'max': 0.0, 'commands': 0, 'retries': 0, 'failures': 0}
+        )
+        action['calls'] += 1
+        action['total'] += duration
+        action['max'] = max(action['max'], duration)
+        action['commands'] += frame['commands']
+        action['retries'] += frame['retries']
+        action['failures'] += error is not None
+        if description and is_outermost:
+            locator = self._locators.setdefault(description, {'calls': 0, 'total': 0.0, 'commands': 0})
+            locator['calls'] += 1
+            locator['total'] += duration
+            locator['commands'] += frame['commands']
+
+    def on_command(self, command: str, started: float, duration: float, error: Optional[BaseException]) -> None:
+        for frame in self._stack:
+            frame['commands'] += 1
+        statistics = self._commands.setdefault(command, {'count': 0, 'total': 0.0})
+        statistics['count'] += 1
+        statistics['total'] += duration
+
+    def on_retry(self, error: BaseException) -> None:
+        for frame in self._stack:
+            frame['retries'] += 1
+
+    def on_wait(self, started: float, duration: float, polls: int, is_succeeded: bool) -> None:
+        self._waits['count'] += 1
+        self._waits['total'] += duration
+        self._waits['polls'] += polls
+        self._waits['timeouts'] += not is_succeeded
+
+    def summary(self, test_method_name: str = '') -> Dict[str, Any]:
+        """
+        Возвращает сводку собранных данных; шаги и локаторы отсортированы по убыванию суммарного времени.
+
+        :param test_method_name: Имя тестового метода.
+        :return: Словарь со сводкой.
+        """
+        return {
+            'test': test_method_name,
+            'duration': self._duration,
+            'commands_count': sum(int(command['count']) for command in self._commands.values()),
+            'actions': sorted(
+                ({'title': title, **action} for title, action in self._actions.items()),
+                key=lambda action: -action['total']
+            ),
+            'locators': sorted(
+                ({'description': description, **locator} for description, locator in self._locators.items()),
+                key=lambda locator: -locator['total']
+            ),
+            'commands': self._commands,
+            'waits': self._waits,
+        }
+
+    def write_json(self, path: str, test_method_name: str = '') -> None:
+        """
+        Записывает сводку в JSON-файл.
+
+        :param path: Путь к файлу.
+        :param test_method_name: Имя тестового метода.
+        :return: None
+        """
+        with open(path, 'w', encoding='UTF-8') as file:
+            dump(self.summary(test_method_name), file, ensure_ascii=False, indent=2)
+
+    def on_test_finished(self, test_method_name: str) -> None:
+        directory = abspath(self._directory)
+        makedirs(directory, exist_ok=True)
+        self.write_json(join(directory, f'{test_method_name}.json'), test_method_name)
+        self.reset()
+
+
+class _CommandHook:
+    """
+    Перехватчик метода execute вебдрайвера, передающий каждую команду слушателям сессии.
+    Хранится в атрибуте вебдрайвера _command_hook - живёт не дольше сессии.
+    """
+
+    def __init__(self, emulator: Any):
+        # Собственный execute объекта (например, другой перехватчик) восстанавливается при снятии перехватчика
+        self._own_execute = vars(emulator).get('execute')
+        self._execute = emulator.execute
+        self.listeners: List[ActionListener] = []
+        emulator.execute = self.execute
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> Any:
+        started = perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            return self._execute(driver_command, params)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            notify_command(self.listeners, driver_command, started, perf_counter() - started, error)
+
+    def remove(self, emulator: Any) -> None:
+        """
+        Снимает перехватчик и восстанавливает исходный метод execute вебдрайвера.
+
+        :param emulator: Объект вебдрайвера.
+        :return: None
+        """
+        if self._own_execute is None:
+            del emulator.execute
+        else:
+            emulator.execute = self._own_execute
+        del emulator._command_hook
+
+
+def attach_command_listener(emulator: Any, listener: ActionListener) -> None:
+    """
+    Подписывает слушателя на команды вебдрайвера. Перехватчик устанавливается при первой подписке,
+    один на сессию, даже если её используют несколько объектов страниц.
+
+    :param emulator: Объект вебдрайвера.
+    :param listener: Слушатель.
+    :return: None
+    """
+    hook: Optional[_CommandHook] = getattr(emulator, '_command_hook', None)
+    if hook is None:
+        hook = emulator._command_hook = _CommandHook(emulator)
+    if listener not in hook.listeners:
+        hook.listeners.append(listener)
+
+
+def detach_command_listener(emulator: Any, listener: ActionListener) -> None:
+    """
+    Отписывает слушателя от команд вебдрайвера. После отписки последнего слушателя перехватчик снимается.
+
+    :param emulator: Объект вебдрайвера.
+    :param listener: Слушатель.
+    :return: None
+    """
+    hook: Optional[_CommandHook] = getattr(emulator, '_command_hook', None)
+    if hook is None or listener not in hook.listeners:
+        return None
+    hook.listeners.remove(listener)
+    if not hook.listeners and emulator.execute == hook.execute:
+        hook.remove(emulator)
+
+
+def notify_command(
+        listeners: List[ActionListener],
+        command: str,
+        started: float,
+        duration: float,
+        error: Optional[BaseException]
+) -> None:
+    """
+    Передаёт слушателям сведения о выполненной команде.
+
+    :param listeners: Слушатели.
+    :param command: Имя команды.
+    :param started: Время отправки команды.
+    :param duration: Длительность команды в секундах.
+    :param error: Исключение, с которым завершилась команда, или None.
+    :return: None
+    """
+    for listener in listeners:
+        listener.on_command(command, started, duration, error)
@@ -0,0 +1,139 @@
+import re
+from threading import Condition
+from time import monotonic
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+
+from .base_settings import NETWORK_IDLE_IGNORED_RESOURCE_TYPES
+from .base_settings import NETWORK_IDLE_IGNORED_URLS
+from .devtools_channel import DevToolsChannel
+
+# События DevTools протокола, по которым учитываются запросы
+_REQUEST_STARTED_EVENT = 'Network.requestWillBeSent'
+_REQUEST_FINISHED_EVENTS = ('Network.loadingFinished', 'Network.loadingFailed')
+
+# Схемы адресов, запросы по которым не доходят до сети и не всегда завершаются событием
+_LOCAL_SCHEMES = ('data:', 'blob:')
+
+
+class NetworkActivityTracker:
+    """
+    Учитывает незавершённые запросы страницы по событиям Network.* канала DevToolsChannel
+    и ожидает тишины сети без опроса: ожидание просыпается на каждом событии.
+    Домен Network должен быть включён (Network.enable); запросы, начатые до подписки, не учитываются.
+    """
+
+    def __init__(
+            self,
+            channel: DevToolsChannel,
+            ignored_resource_types: Sequence[str] = NETWORK_IDLE_IGNORED_RESOURCE_TYPES,
+            ignored_urls: Sequence[str] = NETWORK_IDLE_IGNORED_URLS
+    ):
+        """
+        :param channel: Открытый канал DevTools протокола сессии.
+        :param ignored_resource_types: Типы запросов, которые не учитываются (например, WebSocket).
+        :param ignored_urls: Регулярные выражения адресов, которые не учитываются.
+        """
+        self._channel = channel
+        self._ignored_resource_types = frozenset(ignored_resource_types)
+        self._ignored_urls = [re.compile(pattern) for pattern in ignored_urls]
+        self._condition = Condition()
+        self._in_flight: Dict[str, str] = {}
+        self._last_activity = monotonic()
+        self._is_attached = False
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (in_flight={len(self._in_flight)})>'
+
+    @property
+    def channel(self) -> DevToolsChannel:
+        """
+        Возвращает канал, события которого учитываются.
+
+        :return: DevToolsChannel
+        """
+        return self._channel
+
+    @property
+    def in_flight(self) -> List[str]:
+        """
+        Возвращает адреса незавершённых запросов.
+
+        :return: Список адресов.
+        """
+        with self._condition:
+            return list(self._in_flight.values())
+
+    def attach(self) -> None:
+        """
+        Подписывается на события запросов канала.
+
+        :return: None
+        """
+        if self._is_attached:
+            return
+        self._channel.add_event_listener(_REQUEST_STARTED_EVENT, self.__on_request_started)
+        for event in _REQUEST_FINISHED_EVENTS:
+            self._channel.add_event_listener(event, self.__on_request_finished)
+        self._is_attached = True
+
+    def detach(self) -> None:
+        """
+        Отписывается от событий канала и забывает незавершённые запросы.
+
+        :return: None
+        """
+        if not self._is_attached:
+            return
+        self._channel.remove_event_listener(_REQUEST_STARTED_EVENT, self.__on_request_started)
+        for event in _REQUEST_FINISHED_EVENTS:
+            self._channel.remove_event_listener(event, self.__on_request_finished)
+        self._is_attached = False
+        with self._condition:
+            self._in_flight.clear()
+
+    def wait_for_idle(self, idle_time: float, timeout: float, max_in_flight: int = 0) -> bool:
+        """
+        Ожидает, пока незавершённых запросов не больше max_in_flight и новых запросов нет idle_time секунд подряд.
+
+        :param idle_time: Количество секунд без сетевой активности.
+        :param timeout: Количество секунд ожидания.
+        :param max_in_flight: Допустимое количество незавершённых запросов (например, для долгих опросов).
+        :return: True, если сеть затихла, иначе False.
+        """
+        end_time = monotonic() + timeout
+        with self._condition:
+            while True:
+                now = monotonic()
+                is_busy = len(self._in_flight) > max_in_flight
+                if not is_busy and now - self._last_activity >= idle_time:
+                    return True
+                if now >= end_time:
+                    return False
+                wake_time = end_time if is_busy else min(end_time, self._last_activity + idle_time)
+                self._condition.wait(max(0.0, wake_time - now))
+
+    def __is_ignored(self, params: Dict[str, Any]) -> bool:
+        url = params.get('request', {}).get('url', '')
+        return (
+            params.get('type') in self._ignored_resource_types
+            or url.startswith(_LOCAL_SCHEMES)
+            or any(pattern.search(url) for pattern in self._ignored_urls)
+        )
+
+    def __on_request_started(self, params: Dict[str, Any]) -> None:
+        if self.__is_ignored(params):
+            return
+        with self._condition:
+            # При перенаправлении requestWillBeSent приходит повторно с тем же requestId
+            self._in_flight[params['requestId']] = params.get('request', {}).get('url', '')
+            self._last_activity = monotonic()
+            self._condition.notify_all()
+
+    def __on_request_finished(self, params: Dict[str, Any]) -> None:
+        with self._condition:
+            if self._in_flight.pop(params.get('requestId', ''), None) is not None:
+                self._last_activity = monotonic()
+                self._condition.notify_all()
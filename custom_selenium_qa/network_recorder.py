@@ -0,0 +1,327 @@
+from collections import deque
+from datetime import datetime
+from datetime import timezone
+from json import dump
+from os import makedirs
+from os.path import abspath
+from os.path import join
+from threading import Lock
+from time import perf_counter
+from time import time
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from .base_settings import NETWORK_CAPTURE_BUFFER_SIZE
+from .base_settings import NETWORK_CAPTURE_STEP_BUDGET
+from .devtools_channel import DevToolsChannel
+from .instrumentation import ActionListener
+
+
+def _format_wall_time(seconds: float) -> str:
+    """
+    Переводит время эпохи в формат startedDateTime HAR.
+
+    :param seconds: Секунды от начала эпохи.
+    :return: Строка ISO 8601 с миллисекундами.
+    """
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec='milliseconds')
+
+
+def _interval(timing: Dict[str, float], start: str, end: str) -> float:
+    """
+    Возвращает длительность фазы запроса по ResourceTiming DevTools протокола.
+
+    :param timing: ResourceTiming ответа (миллисекунды от requestTime, -1 - фазы не было).
+    :param start: Ключ начала фазы.
+    :param end: Ключ окончания фазы.
+    :return: Длительность в миллисекундах или -1, если фазы не было.
+    """
+    if timing.get(start, -1) < 0 or timing.get(end, -1) < 0:
+        return -1
+    return round(timing[end] - timing[start], 3)
+
+
+class NetworkRecorder(ActionListener):
+    """
+    Слушатель, записывающий запросы страницы по событиям Network.* канала DevToolsChannel в кольцевой буфер
+    последних buffer_size запросов. Файл {directory}/{test_method_name}.har в формате HAR (без тел
+    запросов и ответов, с фазами blocked, dns, connect, ssl, send, wait - ожидание сервера - и receive)
+    записывается по окончании теста, только если шаг BaseActions завершился ошибкой, шаг выполнялся дольше
+    step_budget секунд или вызван метод keep; шаги с ошибкой или превышением бюджета сохраняются в поле _steps.
+    """
+
+    def __init__(
+            self,
+            channel: DevToolsChannel,
+            directory: str,
+            step_budget: Optional[float] = NETWORK_CAPTURE_STEP_BUDGET,
+            buffer_size: int = NETWORK_CAPTURE_BUFFER_SIZE
+    ):
+        """
+        :param channel: Открытый канал DevTools протокола сессии; домен Network должен быть включён.
+        :param directory: Директория файлов HAR (обычно директория скриншотов).
+        :param step_budget: Количество секунд, дольше которого шаг считается медленным; None - без проверки.
+        :param buffer_size: Количество последних запросов, которые хранятся в буфере.
+        """
+        self._channel = channel
+        self._directory = directory
+        self._step_budget = step_budget
+        self._buffer_size = buffer_size
+        self._lock = Lock()
+        self._is_attached = False
+        # Смещение perf_counter шагов относительно времени эпохи
+        self._wall_offset = time() - perf_counter()
+        self.reset()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (entries={len(self._entries)}, kept={bool(self._reasons)})>'
+
+    def reset(self) -> None:
+        """
+        Очищает записанные запросы и шаги и причины сохранения.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries: Deque[Dict[str, Any]] = deque(maxlen=self._buffer_size)
+            self._in_flight: Dict[str, Dict[str, Any]] = {}
+            self._steps: List[Dict[str, Any]] = []
+            self._reasons: List[str] = []
+            self._last_error: Optional[BaseException] = None
+
+    @property
+    def channel(self) -> DevToolsChannel:
+        """
+        Возвращает канал, события которого записываются.
+
+        :return: DevToolsChannel
+        """
+        return self._channel
+
+    @property
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает завершённые запросы буфера в формате записей HAR.
+
+        :return: Список записей в порядке завершения.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    @property
+    def is_kept(self) -> bool:
+        """
+        Проверяет, будет ли записан файл по окончании теста.
+
+        :return: True, если шаг завершился ошибкой, превысил бюджет или вызван метод keep.
+        """
+        return bool(self._reasons)
+
+    def keep(self, reason: str) -> None:
+        """
+        Отмечает, что запись нужно сохранить по окончании теста (например, тест упал вне шагов BaseActions).
+
+        :param reason: Причина сохранения.
+        :return: None
+        """
+        with self._lock:
+            self._reasons.append(reason)
+
+    def attach(self) -> None:
+        """
+        Подписывается на события запросов канала.
+
+        :return: None
+        """
+        if self._is_attached:
+            return
+        for event, callback in self.__event_callbacks().items():
+            self._channel.add_event_listener(event, callback)
+        self._is_attached = True
+
+    def detach(self) -> None:
+        """
+        Отписывается от событий канала.
+
+        :return: None
+        """
+        if not self._is_attached:
+            return
+        for event, callback in self.__event_callbacks().items():
+            self._channel.remove_event_listener(event, callback)
+        self._is_attached = False
+
+    def __event_callbacks(self) -> Dict[str, Callable[[dict], None]]:
+        return {
+            'Network.requestWillBeSent': self.__on_request_started,
+            'Network.responseReceived': self.__on_response_received,
+            'Network.loadingFinished': self.__on_loading_finished,
+            'Network.loadingFailed': self.__on_loading_failed,
+        }
+
+    def on_action_end(
+            self,
+            title: str,
+            description: Optional[str],
+            started: float,
+            duration: float,
+            error: Optional[BaseException]
+    ) -> None:
+        if error is not None and error is self._last_error:
+            return  # Ошибка вложенного шага уже записана
+        if error is not None:
+            reason = f'Шаг «{title}» завершился ошибкой {type(error).__name__}'
+        elif self._step_budget is not None and duration > self._step_budget:
+            reason = f'Шаг «{title}» выполнялся {duration:.3f} сек. при бюджете {self._step_budget:g} сек.'
+        else:
+            return
+        with self._lock:
+            self._reasons.append(reason)
+            self._last_error = error
+            self._steps.append({
+                'title': title,
+                'description': description,
+                'startedDateTime': _format_wall_time(self._wall_offset + started),
+                'time': round(duration * 1000, 3),
+                'error': repr(error) if error is not None else None,
+            })
+
+    def to_har(self, test_method_name: str = '') -> Dict[str, Any]:
+        """
+        Возвращает запись в формате HAR: незавершённые запросы включаются с временем -1.
+
+        :param test_method_name: Имя тестового метода (сохраняется в поле comment).
+        :return: Словарь {log: {...}}.
+        """
+        with self._lock:
+            entries = list(self._entries) + [self.__pending_entry(request) for request in self._in_flight.values()]
+            steps = list(self._steps)
+            reasons = list(self._reasons)
+        entries.sort(key=lambda entry: entry['startedDateTime'])
+        return {'log': {
+            'version': '1.2',
+            'creator': {'name': 'custom_selenium_qa', 'version': '1'},
+            'comment': test_method_name,
+            'entries': entries,
+            '_steps': steps,
+            '_keptReasons': reasons,
+        }}
+
+    def write_har(self, path: str, test_method_name: str = '') -> None:
+        """
+        Записывает запись в файл HAR.
+
+        :param path: Путь к файлу.
+        :param test_method_name: Имя тестового метода.
+        :return: None
+        """
+        with open(path, 'w', encoding='UTF-8') as file:
+            dump(self.to_har(test_method_name), file, ensure_ascii=False)
+
+    def on_test_finished(self, test_method_name: str) -> None:
+        if self.is_kept:
+            directory = abspath(self._directory)
+            makedirs(directory, exist_ok=True)
+            self.write_har(join(directory, f'{test_method_name}.har'), test_method_name)
+        self.reset()
+
+    def __on_request_started(self, params: Dict[str, Any]) -> None:
+        request = params.get('request', {})
+        with self._lock:
+            previous = self._in_flight.pop(params['requestId'], None)
+            # Перенаправление: requestWillBeSent приходит повторно с тем же requestId и ответом на прошлый запрос
+            if previous is not None and 'redirectResponse' in params:
+                previous['response'] = params['redirectResponse']
+                self.__complete(previous, params['timestamp'])
+            if len(self._in_flight) >= self._buffer_size:
+                del self._in_flight[next(iter(self._in_flight))]
+            self._in_flight[params['requestId']] = {
+                'url': request.get('url', ''),
+                'method': request.get('method', 'GET'),
+                'type': params.get('type', 'Other'),
+                'timestamp': params['timestamp'],
+                'wallTime': params.get('wallTime', time()),
+            }
+
+    def __on_response_received(self, params: Dict[str, Any]) -> None:
+        with self._lock:
+            request = self._in_flight.get(params['requestId'])
+            if request is not None:
+                request['response'] = params.get('response', {})
+
+    def __on_loading_finished(self, params: Dict[str, Any]) -> None:
+        with self._lock:
+            request = self._in_flight.pop(params['requestId'], None)
+            if request is not None:
+                request['transferSize'] = params.get('encodedDataLength', -1)
+                self.__complete(request, params['timestamp'])
+
+    def __on_loading_failed(self, params: Dict[str, Any]) -> None:
+        with self._lock:
+            request = self._in_flight.pop(params['requestId'], None)
+            if request is not None:
+                request['error'] = params.get('blockedReason') or params.get('errorText', '')
+                self.__complete(request, params['timestamp'])
+
+    def __complete(self, request: Dict[str, Any], timestamp: float) -> None:
+        """
+        Переводит завершённый запрос в запись HAR и добавляет её в буфер; вызывается под блокировкой.
+
+        :param request: Данные запроса из событий.
+        :param timestamp: Время завершения запроса по часам DevTools протокола (секунды).
+        :return: None
+        """
+        response = request.get('response', {})
+        timing = response.get('timing') or {}
+        total = round((timestamp - request['timestamp']) * 1000, 3)
+        timings: Dict[str, float] = {'blocked': -1, 'dns': -1, 'connect': -1, 'ssl': -1, 'send': 0, 'wait': 0}
+        if timing:
+            queued = (timing['requestTime'] - request['timestamp']) * 1000
+            first_start = next(
+                (timing[key] for key in ('dnsStart', 'connectStart', 'sendStart') if timing.get(key, -1) >= 0), 0
+            )
+            timings.update({
+                'blocked': round(queued + first_start, 3),
+                'dns': _interval(timing, 'dnsStart', 'dnsEnd'),
+                'connect': _interval(timing, 'connectStart', 'connectEnd'),
+                'ssl': _interval(timing, 'sslStart', 'sslEnd'),
+                'send': _interval(timing, 'sendStart', 'sendEnd'),
+                'wait': _interval(timing, 'sendEnd', 'receiveHeadersEnd'),
+            })
+            headers_end = (timing['requestTime'] - request['timestamp']) * 1000 + timing['receiveHeadersEnd']
+            timings['receive'] = round(max(0.0, total - headers_end), 3)
+        else:
+            timings['receive'] = total
+        entry = {
+            'startedDateTime': _format_wall_time(request['wallTime']),
+            'time': total,
+            'request': {'method': request['method'], 'url': request['url']},
+            'response': {
+                'status': response.get('status', 0),
+                'statusText': response.get('statusText', ''),
+                'content': {'mimeType': response.get('mimeType', '')},
+                '_transferSize': request.get('transferSize', -1),
+            },
+            'timings': timings,
+            '_resourceType': request['type'],
+        }
+        if 'error' in request:
+            entry['_error'] = request['error']
+        if response.get('fromDiskCache') or response.get('fromServiceWorker'):
+            entry['_fromCache'] = True
+        self._entries.append(entry)
+
+    def __pending_entry(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'startedDateTime': _format_wall_time(request['wallTime']),
+            'time': -1,
+            'request': {'method': request['method'], 'url': request['url']},
+            'response': {'status': request.get('response', {}).get('status', 0), 'content': {}},
+            'timings': {'send': 0, 'wait': -1, 'receive': -1},
+            '_resourceType': request['type'],
+            '_error': 'Запрос не завершён',
+        }
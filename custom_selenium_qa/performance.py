@@ -0,0 +1,203 @@
+import json
+import os
+from datetime import datetime
+from math import ceil
+from os.path import abspath
+from os.path import join
+from statistics import median
+from threading import Lock
+from time import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+
+from selenium.common.exceptions import WebDriverException
+
+from .base_settings import PERFORMANCE_DIRECTORY
+from .base_settings import PERFORMANCE_RUN_ID_VARIABLE
+from .devtools import send_devtools_commands
+from .instrumentation import ActionListener
+from .scripts import GET_PAGE_PERFORMANCE_SCRIPT
+
+# Метрики Performance.getMetrics DevTools протокола и их имена в отчёте; длительности переводятся в миллисекунды
+_DEVTOOLS_METRICS = {
+    'JSHeapUsedSize': 'js_heap_used_size',
+    'JSHeapTotalSize': 'js_heap_total_size',
+    'Nodes': 'nodes',
+    'JSEventListeners': 'js_event_listeners',
+    'LayoutCount': 'layout_count',
+    'RecalcStyleCount': 'recalc_style_count',
+    'LayoutDuration': 'layout_duration',
+    'RecalcStyleDuration': 'recalc_style_duration',
+    'ScriptDuration': 'script_duration',
+    'TaskDuration': 'task_duration',
+}
+
+
+def collect_page_performance(
+        emulator: Any,
+        has_devtools: bool = True,
+        listeners: Sequence[ActionListener] = ()
+) -> Dict[str, Any]:
+    """
+    Собирает метрики производительности текущей страницы: Navigation Timing, Paint Timing, длинные задачи
+    и сдвиги макета - одним вызовом JavaScript, а в Chromium также счётчики Performance.getMetrics
+    DevTools протокола (JS-куча, пересчёты макета и стилей, время выполнения скриптов).
+    Времена - в миллисекундах от начала навигации, длительности - в миллисекундах, размеры - в байтах.
+
+    :param emulator: Объект вебдрайвера.
+    :param has_devtools: Флаг сбора метрик через DevTools протокол.
+    :param listeners: Слушатели команд DevTools протокола.
+    :return: Словарь {url, metrics}.
+    """
+    result = emulator.execute_async_script(GET_PAGE_PERFORMANCE_SCRIPT)
+    metrics: Dict[str, float] = result['metrics']
+    if has_devtools:
+        try:
+            response = send_devtools_commands(
+                emulator,
+                (('Performance.enable', {'timeDomain': 'timeTicks'}), ('Performance.getMetrics', None)),
+                listeners
+            )[-1]
+        except WebDriverException:
+            response = {}
+        for metric in (response.get('value') or {}).get('metrics', []):
+            name = _DEVTOOLS_METRICS.get(metric['name'])
+            if name is not None:
+                metrics[name] = metric['value'] * 1000 if name.endswith('_duration') else metric['value']
+    return {'url': result['url'], 'metrics': metrics}
+
+
+def find_budget_violations(metrics: Mapping[str, float], budget: Mapping[str, float]) -> List[str]:
+    """
+    Сравнивает метрики с бюджетом. Метрики, которые браузер не предоставил, не проверяются.
+
+    :param metrics: Метрики страницы.
+    :param budget: Максимально допустимые значения метрик по именам.
+    :return: Описания превышений бюджета.
+    """
+    return [
+        f'{name}: {metrics[name]:g} > {limit:g}'
+        for name, limit in budget.items()
+        if name in metrics and metrics[name] > limit
+    ]
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """
+    Возвращает процентиль методом ближайшего ранга.
+
+    :param values: Отсортированные значения.
+    :param percent: Процент от 0 до 100.
+    :return: Значение процентиля.
+    """
+    return values[max(0, ceil(len(values) * percent / 100) - 1)]
+
+
+def summarize_performance_report(path: str) -> Dict[str, Any]:
+    """
+    Агрегирует отчёт PerformanceReport: по каждой странице (метке или адресу) - количество замеров, превышений
+    бюджета и минимум, медиана, 90-й процентиль и максимум каждой метрики.
+
+    :param path: Путь к файлу отчёта.
+    :return: Сводка по страницам.
+    """
+    pages: Dict[str, Dict[str, Any]] = {}
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            page = pages.setdefault(record['label'] or record['url'], {'samples': 0, 'violations': 0, 'metrics': {}})
+            page['samples'] += 1
+            page['violations'] += bool(record['violations'])
+            for name, value in record['metrics'].items():
+                page['metrics'].setdefault(name, []).append(value)
+    for page in pages.values():
+        for name, values in page['metrics'].items():
+            values.sort()
+            page['metrics'][name] = {
+                'min': values[0],
+                'median': median(values),
+                'p90': _percentile(values, 90),
+                'max': values[-1],
+            }
+    return pages
+
+
+class PerformanceReport:
+    """
+    Отчёт о производительности страниц за прогон: каждый замер сразу дописывается строкой JSON в файл
+    {directory}/{run_id}.jsonl, поэтому отчёт не теряется при аварийном завершении, а процессы одного прогона
+    с общим run_id (переменная окружения PERFORMANCE_RUN_ID_VARIABLE) пишут в один файл.
+    Сводка строится функцией summarize_performance_report.
+    """
+
+    def __init__(self, directory: str = PERFORMANCE_DIRECTORY, run_id: Optional[str] = None):
+        """
+        :param directory: Директория отчётов (относительный путь - от текущей директории на момент создания объекта).
+        :param run_id: Идентификатор прогона; None - из переменной окружения или по времени запуска.
+        """
+        self._directory = abspath(directory)
+        self._run_id = (
+            run_id or os.environ.get(PERFORMANCE_RUN_ID_VARIABLE) or datetime.now().strftime('%Y%m%d-%H%M%S')
+        )
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} ({self.path})>'
+
+    @property
+    def path(self) -> str:
+        """
+        Возвращает путь к файлу отчёта.
+
+        :return: Абсолютный путь.
+        """
+        return join(self._directory, f'{self._run_id}.jsonl')
+
+    def add(
+            self,
+            test_method_name: str,
+            label: Optional[str],
+            url: str,
+            metrics: Mapping[str, float],
+            violations: Sequence[str] = ()
+    ) -> None:
+        """
+        Дописывает замер в отчёт.
+
+        :param test_method_name: Имя тестового метода.
+        :param label: Метка страницы, по которой замеры объединяются в сводке; None - адрес страницы.
+        :param url: Адрес страницы.
+        :param metrics: Метрики страницы.
+        :param violations: Описания превышений бюджета.
+        :return: None
+        """
+        record = {
+            'time': time(),
+            'test': test_method_name,
+            'label': label,
+            'url': url,
+            'metrics': dict(metrics),
+            'violations': list(violations),
+        }
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as file:
+                file.write(line)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Возвращает сводку отчёта (см. summarize_performance_report).
+
+        :return: Сводка по страницам или пустой словарь, если замеров не было.
+        """
+        with self._lock:
+            if not os.path.exists(self.path):
+                return {}
+            return summarize_performance_report(self.path)
@@ -0,0 +1,82 @@
+from random import random
+from typing import Iterator
+
+from .base_settings import POLL_BACKOFF_FACTOR
+from .base_settings import POLL_FREQUENCY
+from .base_settings import POLL_INITIAL_DELAY
+from .base_settings import POLL_JITTER
+from .base_settings import POLL_MAX_DELAY
+
+
+class PollingStrategy:
+    """
+    Стратегия опроса: последовательность пауз между вызовами условия в CustomWebDriverWait.
+    Первый вызов условия всегда выполняется без паузы.
+    """
+
+    def delays(self) -> Iterator[float]:
+        """
+        Возвращает новую последовательность пауз для одного ожидания.
+
+        :return: Итератор пауз в секундах.
+        """
+        raise NotImplementedError
+
+
+class FixedPolling(PollingStrategy):
+    """
+    Опрос с постоянной паузой между вызовами.
+    """
+
+    def __init__(self, interval: float = POLL_FREQUENCY):
+        """
+        :param interval: Пауза между вызовами в секундах.
+        """
+        self._interval = interval
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(interval={self._interval})'
+
+    def delays(self) -> Iterator[float]:
+        while True:
+            yield self._interval
+
+
+class BackoffPolling(PollingStrategy):
+    """
+    Опрос с экспоненциально нарастающей паузой, ограниченной сверху, и необязательным случайным разбросом.
+    """
+
+    def __init__(
+            self,
+            initial: float = POLL_INITIAL_DELAY,
+            factor: float = POLL_BACKOFF_FACTOR,
+            maximum: float = POLL_MAX_DELAY,
+            jitter: float = POLL_JITTER
+    ):
+        """
+        :param initial: Пауза после первого неуспешного вызова в секундах.
+        :param factor: Множитель паузы после каждого следующего неуспешного вызова.
+        :param maximum: Максимальная пауза в секундах.
+        :param jitter: Доля случайного уменьшения паузы, от 0 до 1.
+        """
+        if factor < 1:
+            raise ValueError('Множитель паузы не может быть меньше 1.')
+        if not 0 <= jitter <= 1:
+            raise ValueError('Доля случайного разброса должна быть в пределах от 0 до 1.')
+        self._initial = initial
+        self._factor = factor
+        self._maximum = maximum
+        self._jitter = jitter
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(initial={self._initial}, factor={self._factor}, '
+            f'maximum={self._maximum}, jitter={self._jitter})'
+        )
+
+    def delays(self) -> Iterator[float]:
+        delay = min(self._initial, self._maximum)
+        while True:
+            yield delay * (1 - self._jitter * random())
+            delay = min(delay * self._factor, self._maximum)
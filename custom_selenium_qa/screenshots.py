@@ -0,0 +1,302 @@
+import logging
+from atexit import register
+from io import BytesIO
+from os import makedirs
+from os.path import dirname
+from os.path import splitext
+from queue import Queue
+from threading import Condition
+from threading import Lock
+from threading import Thread
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from .base_settings import SCREENSHOTS_DEDUPLICATION
+from .base_settings import SCREENSHOTS_MAX_IN_FLIGHT_BYTES
+from .base_settings import SCREENSHOTS_PER_TEST_LIMIT
+from .base_settings import SCREENSHOTS_SCALE
+
+try:
+    from PIL import Image  # type: ignore
+except ImportError:  # Pillow - необязательная зависимость, нужна только для перекодирования
+    Image = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Форматы Pillow по расширению файла скриншота
+_IMAGE_FORMATS = {
+    'png': 'PNG',
+    'jpg': 'JPEG',
+    'jpeg': 'JPEG',
+    'webp': 'WEBP',
+}
+
+
+class ScreenshotWriter:
+    """
+    Фоновая запись скриншотов на диск.
+    Скриншот передаётся в виде байтов PNG и записывается по абсолютному пути отдельным потоком,
+    не блокируя тест и не меняя рабочую директорию процесса.
+    """
+
+    def __init__(
+            self,
+            max_in_flight_bytes: int = SCREENSHOTS_MAX_IN_FLIGHT_BYTES,
+            scale: float = SCREENSHOTS_SCALE,
+            quality: int = 85
+    ):
+        """
+        :param max_in_flight_bytes: Максимальный объём скриншотов, ожидающих записи.
+        При превышении submit ждёт, пока фоновый поток освободит место.
+        :param scale: Масштаб сохраняемого изображения (1.0 - без уменьшения).
+        :param quality: Качество при перекодировании в JPEG/WEBP.
+        """
+        if not 0 < scale <= 1:
+            raise ValueError('Масштаб скриншота должен быть в пределах (0, 1].')
+        self._max_in_flight_bytes = max_in_flight_bytes
+        self._scale = scale
+        self._quality = quality
+        self._queue: Queue = Queue()
+        self._condition = Condition()
+        self._in_flight_bytes = 0
+        self._thread: Optional[Thread] = None
+        self._thread_lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (in_flight_bytes={self._in_flight_bytes})>'
+
+    def submit(self, path: str, png: bytes) -> None:
+        """
+        Ставит скриншот в очередь на запись.
+
+        :param path: Абсолютный путь к файлу скриншота; формат определяется расширением.
+        :param png: Содержимое скриншота в формате PNG.
+        :return: None
+        """
+        self._check_encoding(path)
+        with self._condition:
+            while self._in_flight_bytes and self._in_flight_bytes + len(png) > self._max_in_flight_bytes:
+                self._condition.wait()
+            self._in_flight_bytes += len(png)
+        self._start()
+        self._queue.put((path, png))
+
+    def flush(self) -> None:
+        """
+        Ждёт записи всех скриншотов из очереди.
+
+        :return: None
+        """
+        if self._thread is not None:
+            self._queue.join()
+
+    def _start(self) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=type(self).__name__, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            path, png = self._queue.get()
+            try:
+                self._write(path, png)
+            except Exception:
+                logger.exception('Не удалось сохранить скриншот %s', path)
+            finally:
+                with self._condition:
+                    self._in_flight_bytes -= len(png)
+                    self._condition.notify_all()
+                self._queue.task_done()
+
+    def _write(self, path: str, png: bytes) -> None:
+        makedirs(dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(self._encode(path, png))
+
+    def _image_format(self, path: str) -> Tuple[str, bool]:
+        image_format = _IMAGE_FORMATS.get(splitext(path)[1].lstrip('.').lower(), 'PNG')
+        return image_format, image_format != 'PNG' or self._scale != 1
+
+    def _check_encoding(self, path: str) -> None:
+        if self._image_format(path)[1] and Image is None:
+            raise ImportError('Для уменьшения или перекодирования скриншотов необходимо установить Pillow.')
+
+    def _encode(self, path: str, png: bytes) -> bytes:
+        image_format, needs_encoding = self._image_format(path)
+        if not needs_encoding:
+            return png
+        image: Any = Image.open(BytesIO(png))
+        if self._scale != 1:
+            image = image.resize((max(1, int(image.width * self._scale)), max(1, int(image.height * self._scale))))
+        if image_format == 'JPEG':
+            image = image.convert('RGB')
+        output = BytesIO()
+        image.save(output, format=image_format, quality=self._quality)
+        return output.getvalue()
+
+
+class ScreenshotPolicy:
+    """
+    Политика снятия скриншотов в рамках одного теста.
+    Ограничивает количество скриншотов, пропускает повторный снимок неизменившейся страницы
+    и нумерует файлы, чтобы следующий скриншот не перезаписывал предыдущий.
+    Скриншот ошибки снимается всегда: он не ограничивается лимитом и не пропускается как повтор.
+    Объекты страниц одного теста используют общую политику (см. get_screenshot_policy), в том числе из разных
+    потоков FanOutExecutor; по окончании теста политика сбрасывается (см. release_screenshot_policy).
+    """
+
+    def __init__(
+            self,
+            max_per_test: int = SCREENSHOTS_PER_TEST_LIMIT,
+            is_deduplicated: bool = SCREENSHOTS_DEDUPLICATION
+    ):
+        """
+        :param max_per_test: Максимальное количество скриншотов на тест.
+        :param is_deduplicated: Флаг пропуска скриншота, если отпечаток страницы не изменился.
+        """
+        self.max_per_test = max_per_test
+        self.is_deduplicated = is_deduplicated
+        self._count = 0
+        self._skipped = 0
+        self._last_fingerprint: Optional[str] = None
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (count={self._count}, skipped={self._skipped})>'
+
+    @property
+    def count(self) -> int:
+        """
+        Возвращает количество снятых скриншотов.
+
+        :return: Количество скриншотов.
+        """
+        return self._count
+
+    @property
+    def skipped(self) -> int:
+        """
+        Возвращает количество пропущенных скриншотов (лимит или неизменившаяся страница).
+
+        :return: Количество пропусков.
+        """
+        return self._skipped
+
+    def has_capacity(self, is_error: bool = False) -> bool:
+        """
+        Проверяет, не исчерпан ли лимит скриншотов теста. Пропуск учитывается в счётчике skipped.
+
+        :param is_error: Флаг скриншота ошибки - такой скриншот снимается сверх лимита.
+        :return: True, если скриншот можно снять.
+        """
+        with self._lock:
+            if is_error or self._count < self.max_per_test:
+                return True
+            self._skipped += 1
+            return False
+
+    def is_changed(self, fingerprint: Optional[str], is_error: bool = False) -> bool:
+        """
+        Проверяет, изменилась ли страница с момента предыдущего скриншота. Пропуск учитывается в счётчике skipped.
+
+        :param fingerprint: Отпечаток страницы или None, если его не удалось получить.
+        :param is_error: Флаг скриншота ошибки - такой скриншот снимается и на неизменившейся странице.
+        :return: True, если скриншот нужно снять.
+        """
+        with self._lock:
+            if is_error:
+                return True
+            if self.is_deduplicated and fingerprint is not None and fingerprint == self._last_fingerprint:
+                self._skipped += 1
+                return False
+            return True
+
+    def register(self, fingerprint: Optional[str]) -> int:
+        """
+        Учитывает снятый скриншот.
+
+        :param fingerprint: Отпечаток страницы.
+        :return: Порядковый номер скриншота в тесте, начиная с 1.
+        """
+        with self._lock:
+            self._count += 1
+            self._last_fingerprint = fingerprint
+            return self._count
+
+    def reset(self) -> None:
+        """
+        Сбрасывает счётчики и отпечаток предыдущего скриншота - политика начинает новый тест.
+
+        :return: None
+        """
+        with self._lock:
+            self._count = 0
+            self._skipped = 0
+            self._last_fingerprint = None
+
+    @staticmethod
+    def file_name(test_method_name: str, number: int, extension: str) -> str:
+        """
+        Возвращает имя файла скриншота: первый - без номера, последующие - с порядковым номером.
+
+        :param test_method_name: Имя тестового метода.
+        :param number: Порядковый номер скриншота.
+        :param extension: Расширение файла.
+        :return: Имя файла.
+        """
+        if number == 1:
+            return f'{test_method_name}.{extension}'
+        return f'{test_method_name}_{number}.{extension}'
+
+
+# Политики скриншотов текущих тестов по именам тестовых методов; политика удаляется в finish_test
+_policies: Dict[str, ScreenshotPolicy] = {}
+_policies_lock = Lock()
+
+
+def get_screenshot_policy(test_method_name: str) -> ScreenshotPolicy:
+    """
+    Возвращает политику скриншотов теста, общую для всех его объектов страниц: лимит, пропуск повторов
+    и нумерация файлов действуют на тест, а не на отдельный объект страницы.
+
+    :param test_method_name: Имя тестового метода.
+    :return: ScreenshotPolicy
+    """
+    with _policies_lock:
+        policy = _policies.get(test_method_name)
+        if policy is None:
+            policy = ScreenshotPolicy()
+            _policies[test_method_name] = policy
+        return policy
+
+
+def release_screenshot_policy(test_method_name: str, policy: ScreenshotPolicy) -> None:
+    """
+    Завершает политику скриншотов теста: сбрасывает её счётчики и удаляет из общих политик,
+    чтобы следующий запуск теста с тем же именем начал лимит и нумерацию файлов заново.
+
+    :param test_method_name: Имя тестового метода.
+    :param policy: Политика скриншотов объекта страницы.
+    :return: None
+    """
+    with _policies_lock:
+        if _policies.get(test_method_name) is policy:
+            del _policies[test_method_name]
+    policy.reset()
+
+
+# Общий для всех сессий процесса фоновый писатель скриншотов
+_DEFAULT_WRITER = ScreenshotWriter()
+register(_DEFAULT_WRITER.flush)
+
+
+def get_default_screenshot_writer() -> ScreenshotWriter:
+    """
+    Возвращает общий для процесса фоновый писатель скриншотов.
+
+    :return: ScreenshotWriter
+    """
+    return _DEFAULT_WRITER
@@ -0,0 +1,401 @@
+# JavaScript-скрипты, выполняемые на стороне браузера за один вызов execute_script,
+# вместо отдельного HTTP-запроса к WebDriver на каждый элемент.
+
+# Функция поиска элементов по паре (by, selector), которую возвращает Locator.__call__
+_FIND_ELEMENTS_FUNCTION = '''
+var findElements = function (by, selector) {
+    var toArray = function (nodes) { return Array.prototype.slice.call(nodes); };
+    var byText = function (isPartial) {
+        return toArray(document.querySelectorAll('a')).filter(function (element) {
+            var text = (element.innerText || '').trim();
+            return isPartial ? text.indexOf(selector) !== -1 : text === selector;
+        });
+    };
+    switch (by) {
+        case 'css selector':
+            return toArray(document.querySelectorAll(selector));
+        case 'xpath':
+            var snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var elements = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                elements.push(snapshot.snapshotItem(i));
+            }
+            return elements;
+        case 'id':
+            return toArray(document.querySelectorAll('[id="' + CSS.escape(selector) + '"]'));
+        case 'name':
+            return toArray(document.querySelectorAll('[name="' + CSS.escape(selector) + '"]'));
+        case 'class name':
+            return toArray(document.getElementsByClassName(selector));
+        case 'tag name':
+            return toArray(document.getElementsByTagName(selector));
+        case 'link text':
+            return byText(false);
+        case 'partial link text':
+            return byText(true);
+    }
+    throw new Error('Неподдерживаемый тип локатора: ' + by);
+};
+'''
+
+# Функция получения видимого текста элемента (аналог WebElement.text с обрезкой пробелов)
+_VISIBLE_TEXT_FUNCTION = '''
+var getVisibleText = function (element) {
+    if (element.tagName !== 'OPTION' && !element.getClientRects().length) {
+        return '';
+    }
+    return (element.innerText || element.textContent || '').replace(/\\u00a0/g, ' ').trim();
+};
+'''
+
+# Возвращает список текстов из всех элементов, найденных по локатору
+# arguments: by, selector
+GET_TEXTS_SCRIPT = _FIND_ELEMENTS_FUNCTION + _VISIBLE_TEXT_FUNCTION + '''
+return findElements(arguments[0], arguments[1]).map(getVisibleText);
+'''
+
+# Функция получения значения атрибута или свойства элемента (аналог WebElement.get_attribute)
+_ATTRIBUTE_VALUE_FUNCTION = '''
+var getAttributeValue = function (element, name) {
+    var value = element[name === 'class' ? 'className' : name];
+    if (typeof value === 'boolean') {
+        return value ? 'true' : null;
+    }
+    if (value === undefined || value === null || typeof value === 'object' || typeof value === 'function') {
+        value = element.getAttribute(name);
+    }
+    return value === undefined || value === null ? null : String(value);
+};
+'''
+
+# Возвращает список словарей {имя атрибута: значение} для всех элементов, найденных по локатору
+# arguments: by, selector, список имён атрибутов или свойств
+GET_ATTRIBUTES_SCRIPT = _FIND_ELEMENTS_FUNCTION + _ATTRIBUTE_VALUE_FUNCTION + '''
+var names = arguments[2];
+return findElements(arguments[0], arguments[1]).map(function (element) {
+    var values = {};
+    names.forEach(function (name) {
+        values[name] = getAttributeValue(element, name);
+    });
+    return values;
+});
+'''
+
+# Функция проверки видимости элемента (аналог WebElement.is_displayed)
+_IS_VISIBLE_FUNCTION = '''
+var isVisible = function (element) {
+    var rect = element.getBoundingClientRect();
+    if (!element.getClientRects().length || !rect.width || !rect.height) {
+        return false;
+    }
+    var style = window.getComputedStyle(element);
+    return style.visibility !== 'hidden' && style.visibility !== 'collapse' && parseFloat(style.opacity) !== 0;
+};
+'''
+
+# Возвращает для каждого локатора словарь с полями present, count и, по запросу, visible и text (первого элемента)
+# arguments: список пар [by, selector], список запрашиваемых полей
+QUERY_MANY_SCRIPT = _FIND_ELEMENTS_FUNCTION + _VISIBLE_TEXT_FUNCTION + _IS_VISIBLE_FUNCTION + '''
+var fields = arguments[1];
+return arguments[0].map(function (pair) {
+    var elements = findElements(pair[0], pair[1]);
+    var result = {present: elements.length > 0, count: elements.length};
+    if (fields.indexOf('visible') !== -1) {
+        result.visible = elements.length > 0 && isVisible(elements[0]);
+    }
+    if (fields.indexOf('text') !== -1) {
+        result.text = elements.length > 0 ? getVisibleText(elements[0]) : null;
+    }
+    return result;
+});
+'''
+
+# Ожидает выполнения условия на стороне браузера при помощи MutationObserver и возвращает
+# {matched: bool, current: текущее значение} при выполнении условия или по истечении тайм-аута,
+# либо {error: сообщение}, если условие невозможно проверить.
+# Условия: text (видимый текст первого элемента), value (значение поля), attribute (значение атрибута),
+# absent (отсутствие элементов в DOM).
+# arguments: by, selector, условие, ожидаемое значение, ключ атрибута, флаг строгого совпадения,
+# тайм-аут в мс, интервал проверки значения поля в мс, callback
+WAIT_FOR_CONDITION_SCRIPT = _FIND_ELEMENTS_FUNCTION + _VISIBLE_TEXT_FUNCTION + _ATTRIBUTE_VALUE_FUNCTION + '''
+var by = arguments[0], selector = arguments[1], condition = arguments[2], expected = arguments[3],
+    attributeName = arguments[4], isStrong = arguments[5], timeout = arguments[6], pollInterval = arguments[7],
+    callback = arguments[arguments.length - 1];
+var observer = null, timer = null, interval = null, finished = false;
+var readCurrent = function () {
+    var elements = findElements(by, selector);
+    if (condition === 'absent') {
+        return elements.length;
+    }
+    if (!elements.length) {
+        return null;
+    }
+    if (condition === 'text') {
+        return getVisibleText(elements[0]);
+    }
+    if (condition === 'value') {
+        return (getAttributeValue(elements[0], 'value') || '').replace(/^[ \\n\\t]+|[ \\n\\t]+$/g, '');
+    }
+    return getAttributeValue(elements[0], attributeName);
+};
+var isMet = function (current) {
+    if (condition === 'absent') {
+        return current === 0;
+    }
+    if (current === null) {
+        return false;
+    }
+    return isStrong ? current === expected : current.indexOf(expected) !== -1;
+};
+var finish = function (result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    clearTimeout(timer);
+    clearInterval(interval);
+    document.removeEventListener('input', check, true);
+    document.removeEventListener('change', check, true);
+    callback(result);
+};
+var check = function () {
+    try {
+        var current = readCurrent();
+        if (isMet(current)) {
+            finish({matched: true, current: current});
+        }
+        return current;
+    } catch (error) {
+        finish({error: String(error)});
+    }
+};
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    document.addEventListener('input', check, true);
+    document.addEventListener('change', check, true);
+    if (condition === 'value') {
+        // Изменение свойства value из JavaScript не порождает мутаций DOM
+        interval = setInterval(check, pollInterval);
+    }
+    timer = setTimeout(function () {
+        var current = check();
+        finish({matched: false, current: current === undefined ? null : current});
+    }, timeout);
+}
+'''
+
+# Возвращает отпечаток состояния страницы: адрес, прокрутку, размер окна и хэш разметки со значениями полей ввода.
+# Используется, чтобы не снимать повторный скриншот неизменившейся страницы.
+PAGE_FINGERPRINT_SCRIPT = '''
+var content = document.documentElement ? document.documentElement.outerHTML : '';
+var fields = document.querySelectorAll('input, textarea, select');
+for (var i = 0; i < fields.length; i++) {
+    content += '\\u0001' + fields[i].value;
+}
+var hash = 2166136261;
+for (var j = 0; j < content.length; j++) {
+    hash ^= content.charCodeAt(j);
+    hash = Math.imul(hash, 16777619) >>> 0;
+}
+return [location.href, window.scrollX, window.scrollY, window.innerWidth, window.innerHeight,
+        content.length, hash.toString(16)].join('|');
+'''
+
+# Возвращает видимость элемента (для клиентов без атома isDisplayed Selenium, например AsyncWebDriver)
+# arguments: элемент
+IS_VISIBLE_SCRIPT = _IS_VISIBLE_FUNCTION + '''
+return isVisible(arguments[0]);
+'''
+
+# Возвращает значение атрибута или свойства элемента (для клиентов без атома getAttribute Selenium)
+# arguments: элемент, имя атрибута или свойства
+GET_ELEMENT_ATTRIBUTE_SCRIPT = _ATTRIBUTE_VALUE_FUNCTION + '''
+return getAttributeValue(arguments[0], arguments[1]);
+'''
+
+# Возвращает адрес, источник и содержимое localStorage и sessionStorage текущей страницы (снимок авторизации)
+GET_STORAGES_SCRIPT = '''
+var dump = function (storage) {
+    var items = {};
+    try {
+        for (var i = 0; i < storage.length; i++) {
+            var key = storage.key(i);
+            items[key] = storage.getItem(key);
+        }
+    } catch (e) {}
+    return items;
+};
+return {
+    url: location.href,
+    origin: location.origin,
+    localStorage: dump(window.localStorage),
+    sessionStorage: dump(window.sessionStorage)
+};
+'''
+
+# Заменяет содержимое localStorage и sessionStorage текущей страницы (восстановление снимка авторизации)
+# arguments: элементы localStorage, элементы sessionStorage
+SET_STORAGES_SCRIPT = '''
+var fill = function (storage, items) {
+    storage.clear();
+    Object.keys(items).forEach(function (key) { storage.setItem(key, items[key]); });
+};
+fill(window.localStorage, arguments[0]);
+fill(window.sessionStorage, arguments[1]);
+'''
+
+# Ожидает тишины на странице внутри браузера: документ загружен, нет незавершённых fetch/XMLHttpRequest
+# (учитываются с первого вызова скрипта на странице) и jQuery.active, не появляются новые записи Resource Timing
+# и, если isDomChecked, нет мутаций DOM - всё это в течение idleMs подряд. Возвращает {idle, readyState, pending,
+# jqueryActive}.
+# arguments: idleMs, timeoutMs, pollMs, isDomChecked, maxPending (допустимое количество незавершённых запросов)
+WAIT_FOR_PAGE_IDLE_SCRIPT = '''
+var idleMs = arguments[0], timeoutMs = arguments[1], pollMs = arguments[2], isDomChecked = arguments[3],
+    maxPending = arguments[4], callback = arguments[arguments.length - 1];
+var network = window.__customSeleniumQaNetwork;
+if (!network) {
+    network = window.__customSeleniumQaNetwork = {pending: 0};
+    var done = function () { network.pending = Math.max(0, network.pending - 1); };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            network.pending++;
+            try {
+                var promise = originalFetch.apply(this, arguments);
+                promise.then(done, done);
+                return promise;
+            } catch (error) {
+                done();
+                throw error;
+            }
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        network.pending++;
+        this.addEventListener('loadend', done);
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (error) {
+            done();
+            throw error;
+        }
+    };
+}
+var hasTiming = !!(window.performance && performance.getEntriesByType && performance.timeOrigin);
+var getResourcesCount = function () {
+    return hasTiming ? performance.getEntriesByType('resource').length : 0;
+};
+// Время окончания последней сетевой активности до вызова скрипта: тихая страница не ждёт idleMs заново
+var getLastNetworkActivity = function () {
+    if (!hasTiming) {
+        return Date.now();
+    }
+    var entries = performance.getEntriesByType('resource').concat(performance.getEntriesByType('navigation'));
+    var end = 0;
+    for (var i = 0; i < entries.length; i++) {
+        end = Math.max(end, entries[i].responseEnd, entries[i].loadEventEnd || 0);
+    }
+    return performance.timeOrigin + end;
+};
+var getState = function () {
+    var jqueryActive = window.jQuery && window.jQuery.active ? window.jQuery.active : 0;
+    return {readyState: document.readyState, pending: network.pending, jqueryActive: jqueryActive};
+};
+var started = Date.now(), resourcesCount = getResourcesCount(), observer = null;
+var lastActivity = isDomChecked ? started : Math.min(started, getLastNetworkActivity());
+if (isDomChecked && document.documentElement) {
+    observer = new MutationObserver(function () { lastActivity = Date.now(); });
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+var check = function () {
+    var now = Date.now(), state = getState(), count = getResourcesCount();
+    if (count !== resourcesCount || state.readyState !== 'complete' || state.pending > maxPending ||
+        state.jqueryActive > maxPending) {
+        resourcesCount = count;
+        lastActivity = now;
+    }
+    var isIdle = now - lastActivity >= idleMs;
+    if (isIdle || now - started >= timeoutMs) {
+        if (observer) {
+            observer.disconnect();
+        }
+        state.idle = isIdle;
+        callback(state);
+        return;
+    }
+    setTimeout(check, pollMs);
+};
+check();
+'''
+
+# Возвращает адрес страницы и метрики производительности (мс, количество, байты): Navigation Timing, Paint Timing,
+# Largest Contentful Paint, длинные задачи и сдвиги макета. Наблюдатели PerformanceObserver устанавливаются
+# при первом вызове на странице и получают и записи, накопленные браузером до него.
+# arguments: callback
+GET_PAGE_PERFORMANCE_SCRIPT = '''
+var callback = arguments[arguments.length - 1];
+var state = window.__customSeleniumQaPerformance;
+if (!state) {
+    state = window.__customSeleniumQaPerformance = {longTasks: [], largestContentfulPaint: null, layoutShift: 0,
+                                                    observers: []};
+    var observe = function (type, handler) {
+        try {
+            var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(handler); });
+            observer.observe({type: type, buffered: true});
+            state.observers.push({observer: observer, handler: handler});
+        } catch (error) {}
+    };
+    observe('longtask', function (entry) { state.longTasks.push(entry.duration); });
+    observe('largest-contentful-paint', function (entry) { state.largestContentfulPaint = entry.startTime; });
+    observe('layout-shift', function (entry) {
+        if (!entry.hadRecentInput) {
+            state.layoutShift += entry.value;
+        }
+    });
+}
+setTimeout(function () {
+    state.observers.forEach(function (item) { item.observer.takeRecords().forEach(item.handler); });
+    var metrics = {};
+    var navigation = performance.getEntriesByType('navigation')[0];
+    var transferSize = 0;
+    if (navigation) {
+        var timings = {
+            time_to_first_byte: navigation.responseStart,
+            dom_interactive: navigation.domInteractive,
+            dom_content_loaded: navigation.domContentLoadedEventEnd,
+            load: navigation.loadEventEnd
+        };
+        Object.keys(timings).forEach(function (name) {
+            if (timings[name] > 0) {
+                metrics[name] = timings[name];
+            }
+        });
+        transferSize += navigation.transferSize || 0;
+    }
+    performance.getEntriesByType('paint').forEach(function (entry) {
+        metrics[entry.name.replace(/-/g, '_')] = entry.startTime;
+    });
+    if (state.largestContentfulPaint !== null) {
+        metrics.largest_contentful_paint = state.largestContentfulPaint;
+    }
+    var resources = performance.getEntriesByType('resource');
+    resources.forEach(function (entry) { transferSize += entry.transferSize || 0; });
+    metrics.resources_count = resources.length;
+    metrics.transfer_size = transferSize;
+    metrics.long_tasks_count = state.longTasks.length;
+    metrics.long_tasks_duration = 0;
+    metrics.total_blocking_time = 0;
+    state.longTasks.forEach(function (duration) {
+        metrics.long_tasks_duration += duration;
+        metrics.total_blocking_time += Math.max(0, duration - 50);
+    });
+    metrics.cumulative_layout_shift = state.layoutShift;
+    callback({url: location.href, metrics: metrics});
+}, 0);
+'''
@@ -0,0 +1,397 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Condition
+from time import monotonic
+from time import perf_counter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+from selenium.common.exceptions import NoAlertPresentException
+from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import Remote
+
+from .base_settings import SESSION_POOL_ACQUIRE_TIMEOUT
+from .base_settings import SESSION_POOL_MAX_HEAP_GROWTH
+from .base_settings import SESSION_POOL_MAX_USES
+from .base_settings import SESSION_POOL_SIZE
+from .base_settings import SESSION_RESET_URL
+from .blocking import BlockingRule
+from .blocking import NO_BLOCKING
+from .blocking import apply_request_blocking
+from .blocking import get_request_blocker
+from .blocking import resolve_blocking_rule
+from .devtools import send_devtools_command
+from .devtools import send_devtools_commands
+from .devtools_channel import DevToolsCommand
+from .throttling import NO_THROTTLING
+from .throttling import apply_throttling_profile
+from .throttling import get_throttling_profile
+
+logger = logging.getLogger(__name__)
+
+# Очистка хранилищ текущего источника, если DevTools протокол недоступен (например, в Firefox)
+_CLEAR_STORAGE_SCRIPT = '''
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+return location.origin;
+'''
+
+
+def _collect_origins(emulator: Remote, origins: Sequence[str]) -> List[str]:
+    """
+    Собирает источники, данные которых нужно очистить: переданные, источники фреймов текущей страницы
+    и источники доменов всех cookies браузера (в том числе доменов SSO, через которые проходил тест).
+    Вызывается до очистки cookies.
+
+    :param emulator: Объект вебдрайвера.
+    :param origins: Известные источники, например текущей страницы.
+    :return: Источники без повторов.
+    """
+    collected = dict.fromkeys(origin for origin in origins if origin and origin.startswith('http'))
+    cookies, frames = send_devtools_commands(emulator, (('Network.getAllCookies', None), ('Page.getFrameTree', None)))
+    for cookie in (cookies.get('value') or {}).get('cookies', []):
+        domain = cookie['domain'].lstrip('.')
+        for scheme in ('https',) if cookie.get('secure') else ('https', 'http'):
+            collected[f'{scheme}://{domain}'] = None
+    stack = [(frames.get('value') or {}).get('frameTree')]
+    while stack:
+        node = stack.pop()
+        if not node:
+            continue
+        origin = node.get('frame', {}).get('securityOrigin', '')
+        if origin.startswith('http'):
+            collected[origin] = None
+        stack.extend(node.get('childFrames', ()))
+    return list(collected)
+
+
+def reset_browser_state(
+        emulator: Remote,
+        url: str = SESSION_RESET_URL,
+        has_devtools: bool = True,
+        blocking_rule: BlockingRule = NO_BLOCKING,
+        origins: Sequence[str] = ()
+) -> None:
+    """
+    Возвращает сессию в исходное состояние между тестами: закрывает алерт, лишние окна и фреймы,
+    очищает cookies и кэш всего браузера и хранилища (localStorage, sessionStorage, IndexedDB, Cache Storage,
+    service workers) источников, снимает ограничения сети и процессора и возвращает блокировку запросов
+    к правилу blocking_rule (через DevTools протокол, если он доступен) и открывает адрес url.
+    Хранилища очищаются для текущей страницы и её фреймов, доменов всех cookies и источников origins:
+    в DevTools протоколе нет очистки хранилищ всех источников, поэтому источник, который не оставил cookies
+    и не открыт во фрейме текущей страницы (или открыт на нестандартном порту), нужно передать в origins.
+
+    :param emulator: Объект вебдрайвера.
+    :param url: Адрес, открываемый после очистки.
+    :param has_devtools: Флаг очистки через DevTools протокол (Chromium); без него очищаются только cookies
+    и хранилища текущего источника.
+    :param blocking_rule: Правило блокировки запросов исходного состояния сессии.
+    :param origins: Дополнительные источники для очистки хранилищ, например 'https://sso.example.com'.
+    :return: None
+    """
+    try:
+        emulator.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+    handles = emulator.window_handles
+    for handle in handles[1:]:
+        emulator.switch_to.window(handle)
+        emulator.close()
+    emulator.switch_to.window(handles[0])
+    emulator.switch_to.default_content()
+    origin = emulator.execute_script(_CLEAR_STORAGE_SCRIPT)
+    if has_devtools:
+        commands: List[DevToolsCommand] = [('Network.clearBrowserCookies', None), ('Network.clearBrowserCache', None)]
+        commands.extend(
+            ('Storage.clearDataForOrigin', {'origin': storage_origin, 'storageTypes': 'all'})
+            for storage_origin in _collect_origins(emulator, [origin or '', *origins])
+        )
+        send_devtools_commands(emulator, commands)
+        if get_throttling_profile(emulator) is not NO_THROTTLING:
+            apply_throttling_profile(emulator, NO_THROTTLING)
+        blocker = get_request_blocker(emulator)
+        if blocker is None and not blocking_rule.is_empty or blocker is not None and (
+                blocker.rule is not blocking_rule or blocker.is_dry_run
+        ):
+            apply_request_blocking(emulator, blocking_rule)
+    else:
+        emulator.delete_all_cookies()
+    emulator.get(url)
+
+
+def get_heap_size(emulator: Remote) -> Optional[int]:
+    """
+    Возвращает объём используемой JS-кучи вкладки через DevTools протокол.
+
+    :param emulator: Объект вебдрайвера.
+    :return: Объём в байтах или None, если DevTools протокол недоступен.
+    """
+    try:
+        response = send_devtools_command(emulator, 'Runtime.getHeapUsage', is_checked=True)
+    except WebDriverException:
+        return None
+    value = (response or {}).get('value') or {}
+    return int(value['usedSize']) if 'usedSize' in value else None
+
+
+class _PooledSession:
+    """
+    Сессия пула со счётчиком выдач и объёмом JS-кучи при первой выдаче.
+    """
+
+    __slots__ = ('emulator', 'uses', 'initial_heap_size')
+
+    def __init__(self, emulator: Remote):
+        self.emulator = emulator
+        self.uses = 0
+        self.initial_heap_size: Optional[int] = None
+
+
+class SessionPool:
+    """
+    Пул заранее созданных сессий вебдрайвера (например, удалённых сессий Selenoid).
+    Тест берёт сессию методом lease и возвращает её по завершении; при возврате сессия очищается
+    функцией reset_browser_state, а при ошибке очистки, после max_uses выдач или при росте JS-кучи
+    сверх max_heap_growth - закрывается и пересоздаётся в фоновом потоке. Перед выдачей сессия проверяется
+    лёгкой командой, неотвечающая сессия пересоздаётся.
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[], Remote],
+            size: int = SESSION_POOL_SIZE,
+            max_uses: int = SESSION_POOL_MAX_USES,
+            max_heap_growth: Optional[int] = SESSION_POOL_MAX_HEAP_GROWTH,
+            reset_url: str = SESSION_RESET_URL,
+            has_devtools: bool = True,
+            request_blocking: Sequence[Union[str, BlockingRule]] = (),
+            reset_origins: Sequence[str] = ()
+    ):
+        """
+        :param factory: Функция создания новой сессии вебдрайвера.
+        :param size: Количество сессий в пуле.
+        :param max_uses: Количество выдач, после которого сессия пересоздаётся.
+        :param max_heap_growth: Допустимый рост JS-кучи в байтах; None - без проверки.
+        :param reset_url: Адрес, открываемый в сессии при возврате в пул.
+        :param has_devtools: Флаг очистки сессии и проверки кучи через DevTools протокол (Chromium).
+        :param request_blocking: Правила блокировки запросов для всех тестов пула (имена из BLOCKING_PRESETS
+        или BlockingRule); применяются к новым сессиям и восстанавливаются при возврате в пул.
+        :param reset_origins: Источники, хранилища которых очищаются при возврате в пул вдобавок к найденным
+        reset_browser_state (например, SSO без cookies).
+        """
+        if size < 1:
+            raise ValueError('Размер пула не может быть меньше 1.')
+        self._factory = factory
+        self._size = size
+        self._max_uses = max_uses
+        self._max_heap_growth = max_heap_growth if has_devtools else None
+        self._reset_url = reset_url
+        self._has_devtools = has_devtools
+        self._reset_origins = tuple(reset_origins)
+        self._blocking_rule = resolve_blocking_rule(*request_blocking) if has_devtools else NO_BLOCKING
+        self._condition = Condition()
+        self._idle: List[_PooledSession] = []
+        self._leased: Dict[int, _PooledSession] = {}
+        self._pending = 0
+        self._is_closed = False
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix=type(self).__name__)
+        self.stats: Dict[str, Any] = {'created': 0, 'recycled': 0, 'failed': 0, 'leases': 0, 'reset_time': 0.0}
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} (size={self._size}, idle={len(self._idle)}, leased={len(self._leased)}, '
+            f'pending={self._pending})>'
+        )
+
+    def __enter__(self) -> 'SessionPool':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """
+        Запускает параллельное создание недостающих сессий пула в фоновых потоках.
+
+        :return: None
+        """
+        with self._condition:
+            missing = self._size - len(self._idle) - len(self._leased) - self._pending
+            self._pending += missing
+        for _ in range(missing):
+            self._executor.submit(self.__create)
+
+    def acquire(self, timeout: float = SESSION_POOL_ACQUIRE_TIMEOUT) -> Remote:
+        """
+        Выдаёт свободную проверенную сессию, при необходимости ожидая её создания или возврата.
+
+        :param timeout: Количество секунд ожидания свободной сессии.
+        :return: Объект вебдрайвера.
+        """
+        self.start()
+        end_time = monotonic() + timeout
+        while True:
+            with self._condition:
+                while not self._idle:
+                    if self._is_closed:
+                        raise WebDriverException('Пул сессий закрыт.')
+                    remaining = end_time - monotonic()
+                    if remaining <= 0:
+                        raise TimeoutException(f'Нет свободной сессии в пуле за {timeout} сек.')
+                    self._condition.wait(remaining)
+                session = self._idle.pop()
+                self._leased[id(session.emulator)] = session
+            if self.__is_healthy(session.emulator):
+                break
+            self.__recycle(session)
+        session.uses += 1
+        with self._condition:
+            self.stats['leases'] += 1
+        if session.initial_heap_size is None and self._max_heap_growth is not None:
+            session.initial_heap_size = get_heap_size(session.emulator)
+        return session.emulator
+
+    def release(self, emulator: Remote, is_broken: bool = False) -> None:
+        """
+        Возвращает сессию в пул: очищает её или, если это невозможно или сессия отработала свой ресурс,
+        пересоздаёт.
+
+        :param emulator: Объект вебдрайвера, выданный методом acquire.
+        :param is_broken: Флаг неработоспособной сессии, которую нужно пересоздать без очистки.
+        :return: None
+        """
+        with self._condition:
+            session = self._leased.get(id(emulator))
+        if session is None:
+            raise ValueError('Сессия не была выдана этим пулом.')
+        if is_broken or self._is_closed or session.uses >= self._max_uses:
+            self.__recycle(session)
+            return
+        started = perf_counter()
+        try:
+            reset_browser_state(
+                emulator, self._reset_url, self._has_devtools, self._blocking_rule, self._reset_origins
+            )
+        except Exception as exc:
+            # Любая ошибка очистки (в том числе неожиданный ответ DevTools протокола или обрыв соединения)
+            # пересоздаёт сессию, иначе она навсегда остаётся выданной и пул уменьшается
+            logger.warning('Не удалось очистить сессию %s: %s', emulator.session_id, exc)
+            self.__recycle(session)
+            return
+        finally:
+            with self._condition:
+                self.stats['reset_time'] += perf_counter() - started
+        if self.__has_heap_grown(session):
+            self.__recycle(session)
+            return
+        with self._condition:
+            del self._leased[id(emulator)]
+            self._idle.append(session)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self, timeout: float = SESSION_POOL_ACQUIRE_TIMEOUT) -> Iterator[Remote]:
+        """
+        Выдаёт сессию на время блока with и возвращает её в пул по выходе из блока.
+
+        :param timeout: Количество секунд ожидания свободной сессии.
+        :return: Объект вебдрайвера.
+        """
+        emulator = self.acquire(timeout)
+        is_broken = False
+        try:
+            yield emulator
+        except WebDriverException:
+            is_broken = not self.__is_healthy(emulator)
+            raise
+        finally:
+            self.release(emulator, is_broken)
+
+    def close(self) -> None:
+        """
+        Закрывает все свободные сессии; выданные сессии закрываются при возврате.
+
+        :return: None
+        """
+        with self._condition:
+            self._is_closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for session in idle:
+            self.__quit(session)
+        self._executor.shutdown(wait=True)
+
+    def __create(self) -> None:
+        try:
+            session = _PooledSession(self.__start_session())
+        except Exception as exc:
+            logger.warning('Не удалось создать сессию пула: %s', exc)
+            with self._condition:
+                self._pending -= 1
+                self.stats['failed'] += 1
+                self._condition.notify_all()
+            return
+        with self._condition:
+            self._pending -= 1
+            self.stats['created'] += 1
+            if not self._is_closed:
+                self._idle.append(session)
+                self._condition.notify()
+                return
+        self.__quit(session)
+
+    def __start_session(self) -> Remote:
+        emulator = self._factory()
+        if not self._blocking_rule.is_empty:
+            try:
+                apply_request_blocking(emulator, self._blocking_rule)
+            except WebDriverException:
+                self.__quit(_PooledSession(emulator))
+                raise
+        return emulator
+
+    def __recycle(self, session: _PooledSession) -> None:
+        with self._condition:
+            self._leased.pop(id(session.emulator), None)
+            self.stats['recycled'] += 1
+            if not self._is_closed:
+                self._pending += 1
+        self.__quit_in_background(session)
+        if not self._is_closed:
+            self._executor.submit(self.__create)
+
+    def __quit_in_background(self, session: _PooledSession) -> None:
+        if self._is_closed:
+            self.__quit(session)
+        else:
+            self._executor.submit(self.__quit, session)
+
+    @staticmethod
+    def __quit(session: _PooledSession) -> None:
+        try:
+            session.emulator.quit()
+        except Exception as exc:
+            logger.warning('Не удалось закрыть сессию %s: %s', session.emulator.session_id, exc)
+
+    @staticmethod
+    def __is_healthy(emulator: Remote) -> bool:
+        try:
+            emulator.execute_script('return 1;')
+        except WebDriverException:
+            return False
+        return True
+
+    def __has_heap_grown(self, session: _PooledSession) -> bool:
+        if self._max_heap_growth is None or session.initial_heap_size is None:
+            return False
+        heap_size = get_heap_size(session.emulator)
+        return heap_size is not None and heap_size - session.initial_heap_size > self._max_heap_growth
@@ -0,0 +1,311 @@
+import gzip
+from copy import deepcopy
+from json import dumps
+from json import loads
+from threading import Lock
+from threading import local
+from time import perf_counter
+from time import sleep
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+# Версия формата файла записи сессии
+RECORDING_FORMAT_VERSION = 1
+
+# Имя команды в записи для запросов к расширению Chromium (DevTools протокол)
+DEVTOOLS_COMMAND = 'devtools'
+
+
+class ReplayMismatchError(WebDriverException):
+    """
+    Команда не найдена в записи сессии: сценарий отправил команду, которой не было при записи.
+    """
+
+
+def _open_recording(path: str, mode: str) -> IO[str]:
+    """
+    Открывает файл записи; файлы с расширением .gz сжимаются gzip.
+
+    :param path: Путь к файлу.
+    :param mode: Режим: r или w.
+    :return: Текстовый файловый объект.
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, f'{mode}t', encoding='UTF-8')  # type: ignore
+    return open(path, mode, encoding='UTF-8')
+
+
+def _request_key(command: str, params: Any) -> str:
+    """
+    Возвращает ключ для поиска ответа в записи: имя команды и параметры без идентификатора сессии.
+
+    :param command: Имя команды.
+    :param params: Параметры команды.
+    :return: Ключ.
+    """
+    if isinstance(params, dict):
+        params = {name: value for name, value in params.items() if name != 'sessionId'}
+    return f'{command} {dumps(params, sort_keys=True, ensure_ascii=False)}'
+
+
+class SessionRecorder:
+    """
+    Записывает все команды сессии вебдрайвера и ответы на них с длительностью в файл JSON Lines
+    (со сжатием gzip для файлов .gz). Первая строка файла - заголовок с адресом и возможностями сессии.
+    Перехватываются execute и _request исполнителя команд (command_executor), в том числе запросы DevTools.
+    """
+
+    def __init__(self, emulator: Remote, path: str):
+        """
+        :param emulator: Объект вебдрайвера.
+        :param path: Путь к файлу записи.
+        """
+        self._emulator = emulator
+        self._path = path
+        self._file: Optional[IO[str]] = None
+        self._lock = Lock()
+        self._thread_data = local()
+        self._origin = 0.0
+        self._count = 0
+        self._replaced: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (path={self._path!r}, commands={self._count})>'
+
+    def __enter__(self) -> 'SessionRecorder':
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @property
+    def commands_count(self) -> int:
+        """
+        Возвращает количество записанных команд.
+
+        :return: Количество команд.
+        """
+        return self._count
+
+    def start(self) -> None:
+        """
+        Начинает запись: открывает файл, записывает заголовок и перехватывает методы исполнителя команд.
+
+        :return: None
+        """
+        executor = self._emulator.command_executor
+        self._file = _open_recording(self._path, 'w')
+        self._origin = perf_counter()
+        self._count = 0
+        self.__write({
+            'version': RECORDING_FORMAT_VERSION,
+            'url': getattr(executor, '_url', ''),
+            'session_id': self._emulator.session_id,
+            'capabilities': self._emulator.caps,
+        })
+        self._replaced = {name: vars(executor).get(name) for name in ('execute', '_request')}
+        execute, request = executor.execute, executor._request  # type: ignore
+
+        def recorded_execute(command: str, params: Optional[dict] = None) -> Any:
+            self._thread_data.is_executing = True
+            try:
+                return self.__record(command, deepcopy(params), lambda: execute(command, params))
+            finally:
+                self._thread_data.is_executing = False
+
+        def recorded_request(method: str, url: str, body: Optional[str] = None) -> Any:
+            if getattr(self._thread_data, 'is_executing', False):
+                return request(method, url, body)  # Запрос команды, уже записываемой в recorded_execute
+            params = {
+                'method': method,
+                'path': url[len(getattr(executor, '_url', '')):],
+                'body': loads(body) if body else None,
+            }
+            return self.__record(DEVTOOLS_COMMAND, params, lambda: request(method, url, body))
+
+        executor.execute = recorded_execute  # type: ignore
+        executor._request = recorded_request  # type: ignore
+
+    def stop(self) -> None:
+        """
+        Останавливает запись: восстанавливает методы исполнителя команд и закрывает файл.
+
+        :return: None
+        """
+        executor = self._emulator.command_executor
+        for name, method in self._replaced.items():
+            if method is None:
+                vars(executor).pop(name, None)
+            else:
+                setattr(executor, name, method)
+        self._replaced = {}
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __record(self, command: str, params: Any, send: Any) -> Any:
+        started = perf_counter()
+        response: Any = None
+        error: Optional[str] = None
+        try:
+            response = send()
+            return response
+        except Exception as exc:
+            error = f'{type(exc).__name__}: {exc}'
+            raise
+        finally:
+            record = {
+                'command': command,
+                'params': params,
+                'started': round(started - self._origin, 6),
+                'duration': round(perf_counter() - started, 6),
+                'response': response,
+            }
+            if error is not None:
+                record['error'] = error
+            self.__write(record)
+
+    def __write(self, record: Dict[str, Any]) -> None:
+        line = dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + '\n')
+                self._count += 'command' in record
+
+
+class ReplayCommandExecutor:
+    """
+    Исполнитель команд, отвечающий на команды вебдрайвера ответами из записи SessionRecorder без браузера.
+    Передаётся в webdriver.Remote как command_executor (см. create_replay_driver).
+
+    В строгом режиме команды должны идти в записанном порядке. В нестрогом режиме ответ ищется по имени команды
+    и параметрам, повторяющиеся команды получают записанные ответы по очереди, а после их исчерпания - последний;
+    так можно прогнать изменённую библиотеку (кэширование, пакетные запросы) по записанной сессии и посчитать
+    сэкономленные обращения.
+    """
+
+    def __init__(self, path: str, speed: float = 0.0, is_strict: bool = False):
+        """
+        :param path: Путь к файлу записи.
+        :param speed: Множитель записанной длительности команд: 0 - без задержек, 1 - с записанной скоростью.
+        :param is_strict: Флаг строгого соблюдения порядка команд.
+        """
+        with _open_recording(path, 'r') as file:
+            lines: List[Dict[str, Any]] = [loads(line) for line in file if line.strip()]
+        if not lines or lines[0].get('version') != RECORDING_FORMAT_VERSION:
+            raise ValueError(f'Файл {path} не является записью сессии версии {RECORDING_FORMAT_VERSION}')
+        self._header, self._records = lines[0], lines[1:]
+        self._url = self._header['url']
+        self._speed = speed
+        self._is_strict = is_strict
+        self._position = 0
+        self._queues: Dict[str, List[Dict[str, Any]]] = {}
+        for record in self._records:
+            self._queues.setdefault(_request_key(record['command'], record['params']), []).append(record)
+        self._lock = Lock()
+        self.commands: List[str] = []
+        self.misses: List[str] = []
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} (recorded={len(self._records)}, served={len(self.commands)}, '
+            f'misses={len(self.misses)})>'
+        )
+
+    @property
+    def recorded_commands_count(self) -> int:
+        """
+        Возвращает количество команд в записи.
+
+        :return: Количество команд.
+        """
+        return len(self._records)
+
+    def execute(self, command: str, params: Optional[dict] = None) -> Any:
+        """
+        Возвращает записанный ответ на команду WebDriver; на создание сессии отвечает данными из заголовка записи.
+
+        :param command: Имя команды.
+        :param params: Параметры команды.
+        :return: Ответ в формате W3C WebDriver.
+        """
+        if command == Command.NEW_SESSION:
+            return {'value': {'sessionId': self._header['session_id'], 'capabilities': self._header['capabilities']}}
+        return self.__replay(command, params)
+
+    def _request(self, method: str, url: str, body: Optional[str] = None) -> Any:
+        """
+        Возвращает записанный ответ на запрос к расширению Chromium (DevTools протокол).
+
+        :param method: HTTP-метод.
+        :param url: Адрес запроса.
+        :param body: Тело запроса.
+        :return: Ответ.
+        """
+        params = {'method': method, 'path': url[len(self._url):], 'body': loads(body) if body else None}
+        return self.__replay(DEVTOOLS_COMMAND, params)
+
+    def close(self) -> None:
+        """
+        Закрывает соединения (вызывается из webdriver.Remote.quit); воспроизведению закрывать нечего.
+
+        :return: None
+        """
+
+    def __replay(self, command: str, params: Any) -> Any:
+        key = _request_key(command, params)
+        with self._lock:
+            self.commands.append(command)
+            record = self.__find_record(command, key)
+            if record is None:
+                self.misses.append(key)
+                raise ReplayMismatchError(f'Команда отсутствует в записи сессии: {key}')
+        if self._speed:
+            sleep(record['duration'] * self._speed)
+        if 'error' in record:
+            raise WebDriverException(f'Записанная ошибка команды: {record["error"]}')
+        return deepcopy(record['response'])
+
+    def __find_record(self, command: str, key: str) -> Optional[Dict[str, Any]]:
+        if self._is_strict:
+            if self._position >= len(self._records):
+                return None
+            record = self._records[self._position]
+            if _request_key(record['command'], record['params']) != key:
+                return None
+            self._position += 1
+            return record
+        queue = self._queues.get(key)
+        if not queue:
+            return None
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+
+def create_replay_driver(
+        path: str,
+        speed: float = 0.0,
+        is_strict: bool = False
+) -> Tuple[Remote, ReplayCommandExecutor]:
+    """
+    Создаёт webdriver.Remote, воспроизводящий записанную сессию без браузера.
+
+    :param path: Путь к файлу записи SessionRecorder.
+    :param speed: Множитель записанной длительности команд: 0 - без задержек, 1 - с записанной скоростью.
+    :param is_strict: Флаг строгого соблюдения порядка команд.
+    :return: Вебдрайвер и исполнитель команд (со списками обработанных команд и промахов).
+    """
+    executor = ReplayCommandExecutor(path, speed, is_strict)
+    driver = Remote(command_executor=executor, options=ChromeOptions())  # type: ignore
+    executor.commands.clear()
+    return driver, executor
@@ -0,0 +1,184 @@
+from threading import local
+from time import perf_counter
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Union
+
+from testit_python_commons.models.step_result import StepResult  # type: ignore
+from testit_python_commons.services import TmsPluginManager  # type: ignore
+
+# Описание шага: строка или функция без аргументов, которая вызывается только при передаче шага в TestIT
+StepDescription = Union[str, Callable[[], str], None]
+
+
+def format_description(description: StepDescription) -> Optional[str]:
+    """
+    Возвращает текст описания шага, вычисляя его, если описание передано функцией.
+
+    :param description: Описание шага.
+    :return: Текст описания или None.
+    """
+    return description() if callable(description) else description
+
+
+class StepRecord:
+    """
+    Запись шага, накопленная в буфере до передачи в TestIT.
+    """
+
+    __slots__ = ('title', 'description', 'started', 'duration', 'is_failed', 'children')
+
+    def __init__(self, title: str, description: StepDescription):
+        """
+        :param title: Заголовок шага.
+        :param description: Описание шага.
+        """
+        self.title = title
+        self.description = description
+        self.started = perf_counter()
+        self.duration = 0.0
+        self.is_failed = False
+        self.children: List['StepRecord'] = []
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (title={self.title!r}, children={len(self.children)})>'
+
+
+class StepReporter:
+    """
+    Буфер шагов TestIT одного потока.
+    Шаги записываются без обращения к TestIT, описания-функции не вычисляются; дерево шагов с фактической
+    длительностью и результатом передаётся в TestIT методом flush.
+    Уровни подробности: all - все шаги, top - только внешние шаги (вложенные шаги не записываются), none - без шагов.
+    Отложенный буфер (is_deferred) не передаёт шаги в flush: их передаёт методом report владелец буфера,
+    например FanOutExecutor из вызывающего потока после завершения сессий.
+    """
+
+    def __init__(self, is_deferred: bool = False) -> None:
+        """
+        :param is_deferred: Флаг отложенной передачи шагов только методом report.
+        """
+        self.is_deferred = is_deferred
+        self._stack: List[Optional[StepRecord]] = []
+        self._records: List[StepRecord] = []
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} (depth={self.depth}, buffered={len(self._records)})>'
+
+    @property
+    def depth(self) -> int:
+        """
+        Возвращает количество открытых шагов.
+
+        :return: Глубина вложенности.
+        """
+        return len(self._stack)
+
+    def open(self, title: str, description: StepDescription, verbosity: str) -> None:
+        """
+        Открывает шаг.
+
+        :param title: Заголовок шага.
+        :param description: Описание шага (строка или функция, возвращающая строку).
+        :param verbosity: Уровень подробности: all, top или none.
+        :return: None
+        """
+        record: Optional[StepRecord] = None
+        if verbosity == 'all' or verbosity == 'top' and not self._stack:
+            record = StepRecord(title, description)
+            parent = next((opened for opened in reversed(self._stack) if opened is not None), None)
+            if parent is None:
+                self._records.append(record)
+            else:
+                parent.children.append(record)
+        self._stack.append(record)
+
+    def close(self, is_failed: bool) -> None:
+        """
+        Закрывает последний открытый шаг.
+
+        :param is_failed: Флаг завершения шага с ошибкой.
+        :return: None
+        """
+        record = self._stack.pop()
+        if record is not None:
+            record.duration = perf_counter() - record.started
+            record.is_failed = is_failed
+
+    def flush(self) -> None:
+        """
+        Передаёт накопленные завершённые шаги в TestIT (вложенными в активный шаг TestIT, если он открыт)
+        и очищает буфер. Открытые шаги остаются в буфере.
+
+        :return: None
+        """
+        if self._stack or self.is_deferred:
+            return
+        self.report()
+
+    def report(self, title: Optional[str] = None) -> None:
+        """
+        Передаёт накопленные шаги в TestIT независимо от is_deferred и очищает буфер.
+        Вызывается, когда все шаги буфера закрыты.
+
+        :param title: Заголовок общего шага, в который вкладываются переданные шаги; None - без общего шага.
+        :return: None
+        """
+        records, self._records = self._records, []
+        if records and title is not None:
+            group = StepRecord(title, None)
+            group.started = min(record.started for record in records)
+            group.duration = max(record.started + record.duration for record in records) - group.started
+            group.is_failed = any(record.is_failed for record in records)
+            group.children = records
+            records = [group]
+        if records:
+            step_manager = TmsPluginManager.get_step_manager()
+            for record in records:
+                self.__report(step_manager, record)
+
+    def __report(self, step_manager: Any, record: StepRecord) -> None:
+        step_result = StepResult()
+        step_result.set_title(record.title)
+        step_result.set_description(format_description(record.description))
+        step_result.set_parameters({})
+        step_manager.start_step(step_result)
+        try:
+            for child in record.children:
+                self.__report(step_manager, child)
+        finally:
+            step_result.set_outcome('Failed' if record.is_failed else _get_passed_step_outcome())
+            step_result.set_duration(round(record.duration * 1000))
+            step_manager.stop_step()
+
+
+def _get_passed_step_outcome() -> str:
+    """
+    Возвращает результат шага, завершившегося без исключения, как StepContext TestIT: адаптер TestIT для pytest
+    через хук get_pytest_check_outcome возвращает Failed, если после предыдущего шага не прошли мягкие проверки
+    pytest-check.
+
+    :return: Passed или Failed.
+    """
+    hook = TmsPluginManager.get_plugin_manager().hook
+    if not hasattr(hook, 'get_pytest_check_outcome'):
+        return 'Passed'
+    outcomes = hook.get_pytest_check_outcome()
+    return outcomes[0] if outcomes else 'Passed'
+
+
+_THREAD_DATA = local()
+
+
+def get_step_reporter() -> StepReporter:
+    """
+    Возвращает буфер шагов текущего потока (общий для всех объектов страниц потока, как и шаги TestIT).
+
+    :return: StepReporter
+    """
+    reporter = getattr(_THREAD_DATA, 'step_reporter', None)
+    if reporter is None:
+        reporter = _THREAD_DATA.step_reporter = StepReporter()
+    return reporter
@@ -0,0 +1,150 @@
+from threading import Lock
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Union
+
+from .devtools import send_devtools_commands
+from .devtools_channel import DevToolsCommand
+from .instrumentation import ActionListener
+
+
+class ThrottlingProfile:
+    """
+    Профиль ухудшения условий работы браузера: сеть (Network.emulateNetworkConditions)
+    и процессор (Emulation.setCPUThrottlingRate) DevTools протокола.
+    """
+
+    __slots__ = (
+        'name', 'latency', 'download_throughput', 'upload_throughput', 'cpu_rate', 'is_offline', 'connection_type'
+    )
+
+    def __init__(
+            self,
+            name: str,
+            latency: float = 0.0,
+            download_throughput: float = -1,
+            upload_throughput: float = -1,
+            cpu_rate: float = 1.0,
+            is_offline: bool = False,
+            connection_type: str = 'other'
+    ):
+        """
+        :param name: Имя профиля.
+        :param latency: Дополнительная задержка каждого запроса в миллисекундах.
+        :param download_throughput: Скорость загрузки в байтах в секунду, -1 - без ограничения.
+        :param upload_throughput: Скорость отправки в байтах в секунду, -1 - без ограничения.
+        :param cpu_rate: Во сколько раз замедляется процессор, 1 - без замедления.
+        :param is_offline: Флаг отключения сети.
+        :param connection_type: Тип соединения DevTools протокола: none, cellular2g, cellular3g, cellular4g,
+        wifi, ethernet, other.
+        """
+        self.name = name
+        self.latency = latency
+        self.download_throughput = download_throughput
+        self.upload_throughput = upload_throughput
+        self.cpu_rate = cpu_rate
+        self.is_offline = is_offline
+        self.connection_type = connection_type
+
+    def __repr__(self) -> str:
+        return (
+            f'<{type(self).__name__} ({self.name}: latency={self.latency:g} мс, '
+            f'download={self.download_throughput:g} Б/с, upload={self.upload_throughput:g} Б/с, '
+            f'cpu={self.cpu_rate:g}x, offline={self.is_offline})>'
+        )
+
+    @property
+    def network_conditions(self) -> Dict[str, Any]:
+        """
+        Возвращает параметры команды Network.emulateNetworkConditions.
+
+        :return: Словарь параметров.
+        """
+        return {
+            'offline': self.is_offline,
+            'latency': self.latency,
+            'downloadThroughput': self.download_throughput,
+            'uploadThroughput': self.upload_throughput,
+            'connectionType': self.connection_type,
+        }
+
+
+# Профили (задержка в мс, скорость в байтах в секунду); значения сетей - как в Chrome DevTools и Lighthouse
+NO_THROTTLING = ThrottlingProfile('Без ограничений')
+OFFLINE = ThrottlingProfile('Без сети', 0, 0, 0, is_offline=True, connection_type='none')
+SLOW_3G = ThrottlingProfile('Медленный 3G', 2000, 50 * 1024, 50 * 1024, 4.0, connection_type='cellular3g')
+FAST_3G = ThrottlingProfile('3G', 562.5, 180 * 1024, 84 * 1024, 4.0, connection_type='cellular3g')
+SLOW_4G = ThrottlingProfile('Медленный 4G', 150, 1.6 * 1024 * 1024 / 8, 750 * 1024 / 8, 4.0,
+                            connection_type='cellular4g')
+HIGH_LATENCY_VPN = ThrottlingProfile('VPN с высокой задержкой', 300, 10 * 1024 * 1024 / 8, 5 * 1024 * 1024 / 8)
+
+# Профили по именам (для выбора профиля из параметров запуска)
+THROTTLING_PROFILES: Dict[str, ThrottlingProfile] = {
+    'none': NO_THROTTLING,
+    'offline': OFFLINE,
+    'slow-3g': SLOW_3G,
+    '3g': FAST_3G,
+    'slow-4g': SLOW_4G,
+    'vpn': HIGH_LATENCY_VPN,
+}
+
+# Профили, применённые к сессиям, по идентификаторам сессий; сессии без ограничений не хранятся
+_applied_profiles: Dict[str, ThrottlingProfile] = {}
+_applied_profiles_lock = Lock()
+
+
+def get_throttling_profile(emulator: Any) -> ThrottlingProfile:
+    """
+    Возвращает профиль, применённый к сессии функцией apply_throttling_profile.
+
+    :param emulator: Объект вебдрайвера.
+    :return: ThrottlingProfile; NO_THROTTLING, если ограничения не применялись.
+    """
+    with _applied_profiles_lock:
+        return _applied_profiles.get(emulator.session_id, NO_THROTTLING)
+
+
+def resolve_throttling_profile(profile: Union[str, ThrottlingProfile]) -> ThrottlingProfile:
+    """
+    Возвращает профиль по имени из THROTTLING_PROFILES или сам профиль.
+
+    :param profile: Имя профиля или ThrottlingProfile.
+    :return: ThrottlingProfile
+    """
+    if isinstance(profile, ThrottlingProfile):
+        return profile
+    if profile not in THROTTLING_PROFILES:
+        raise ValueError(f'Неизвестный профиль {profile!r}, доступны: {", ".join(THROTTLING_PROFILES)}.')
+    return THROTTLING_PROFILES[profile]
+
+
+def apply_throttling_profile(
+        emulator: Any,
+        profile: Union[str, ThrottlingProfile],
+        listeners: Sequence[ActionListener] = ()
+) -> ThrottlingProfile:
+    """
+    Применяет профиль к сессии одним пакетом команд DevTools протокола. Замедление процессора отправляется,
+    только если оно отличается от применённого ранее, а снятие ограничений сети не включает домен Network.
+
+    :param emulator: Объект вебдрайвера.
+    :param profile: Имя профиля или ThrottlingProfile.
+    :param listeners: Слушатели команд.
+    :return: Профиль, применённый к сессии до вызова.
+    """
+    profile = resolve_throttling_profile(profile)
+    previous = get_throttling_profile(emulator)
+    is_throttled = profile is not NO_THROTTLING
+    commands: List[DevToolsCommand] = [('Network.enable', {})] if is_throttled else []
+    commands.append(('Network.emulateNetworkConditions', profile.network_conditions))
+    if profile.cpu_rate != previous.cpu_rate:
+        commands.append(('Emulation.setCPUThrottlingRate', {'rate': profile.cpu_rate}))
+    send_devtools_commands(emulator, commands, listeners)
+    with _applied_profiles_lock:
+        if is_throttled:
+            _applied_profiles[emulator.session_id] = profile
+        else:
+            _applied_profiles.pop(emulator.session_id, None)
+    return previous
@@ -0,0 +1,133 @@
+from json import dump
+from os import getpid
+from os import makedirs
+from os.path import abspath
+from os.path import join
+from threading import get_ident
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from .base_settings import TRACES_DIRECTORY
+from .instrumentation import ActionListener
+
+
+class TraceRecorder(ActionListener):
+    """
+    Слушатель, записывающий временную шкалу теста в формате Chrome trace-event JSON
+    (открывается в Perfetto или chrome://tracing).
+    Шаги BaseActions (они же шаги testit.step), команды WebDriver и ожидания записываются как интервалы,
+    повторные попытки - как мгновенные события. Вложенность интервалов определяется временем начала и длительностью.
+    По окончании теста записывает файл {directory}/{test_method_name}.trace.json.
+    """
+
+    def __init__(self, directory: str = TRACES_DIRECTORY):
+        """
+        :param directory: Директория для файлов временной шкалы.
+        """
+        self._directory = directory
+        self._process_id = getpid()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Очищает записанные события; время на шкале отсчитывается от момента вызова.
+
+        :return: None
+        """
+        self._origin = perf_counter()
+        self._events: List[Dict[str, Any]] = []
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает записанные события.
+
+        :return: Список событий в формате Chrome trace-event.
+        """
+        return list(self._events)
+
+    def __microseconds(self, moment: float) -> float:
+        return round((moment - self._origin) * 1_000_000, 3)
+
+    def __add_span(
+            self,
+            name: str,
+            category: str,
+            started: float,
+            duration: float,
+            arguments: Dict[str, Any]
+    ) -> None:
+        self._events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': self.__microseconds(started),
+            'dur': round(duration * 1_000_000, 3),
+            'pid': self._process_id,
+            'tid': get_ident(),
+            'args': arguments,
+        })
+
+    def on_action_end(
+            self,
+            title: str,
+            description: Optional[str],
+            started: float,
+            duration: float,
+            error: Optional[BaseException]
+    ) -> None:
+        arguments: Dict[str, Any] = {'description': description}
+        if error is not None:
+            arguments['error'] = repr(error)
+        self.__add_span(title, 'action', started, duration, arguments)
+
+    def on_command(self, command: str, started: float, duration: float, error: Optional[BaseException]) -> None:
+        arguments: Dict[str, Any] = {}
+        if error is not None:
+            arguments['error'] = repr(error)
+        self.__add_span(command, 'webdriver', started, duration, arguments)
+
+    def on_retry(self, error: BaseException) -> None:
+        self._events.append({
+            'name': f'retry: {type(error).__name__}',
+            'cat': 'retry',
+            'ph': 'i',
+            's': 't',
+            'ts': self.__microseconds(perf_counter()),
+            'pid': self._process_id,
+            'tid': get_ident(),
+            'args': {'error': repr(error)},
+        })
+
+    def on_wait(self, started: float, duration: float, polls: int, is_succeeded: bool) -> None:
+        self.__add_span('wait', 'wait', started, duration, {'polls': polls, 'is_succeeded': is_succeeded})
+
+    def write_json(self, path: str, test_method_name: str = '') -> None:
+        """
+        Записывает временную шкалу в JSON-файл.
+
+        :param path: Путь к файлу.
+        :param test_method_name: Имя тестового метода (используется как имя процесса на шкале).
+        :return: None
+        """
+        metadata = {
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': self._process_id,
+            'args': {'name': test_method_name or 'selenium'},
+        }
+        with open(path, 'w', encoding='UTF-8') as file:
+            dump(
+                {'traceEvents': [metadata, *self._events], 'displayTimeUnit': 'ms'},
+                file,
+                ensure_ascii=False
+            )
+
+    def on_test_finished(self, test_method_name: str) -> None:
+        directory = abspath(self._directory)
+        makedirs(directory, exist_ok=True)
+        self.write_json(join(directory, f'{test_method_name}.trace.json'), test_method_name)
+        self.reset()
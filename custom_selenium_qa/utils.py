@@ -1,10 +1,30 @@
+from asyncio import sleep as async_sleep
 from time import sleep
+from typing import Optional
+
 from .base_settings import POLL_FREQUENCY
+from .deadline import Deadline
 
 
-def sleep_poll_frequency() -> None:
+def sleep_poll_frequency(deadline: Optional[Deadline] = None) -> None:
     """
     Метод для ожидания в пределах переменной POLL_FREQUENCY
+    :param deadline: Крайний срок действия, после которого ожидание не продолжается.
+    :return:
+    """
+    if deadline is None:
+        sleep(POLL_FREQUENCY)
+    else:
+        sleep(min(POLL_FREQUENCY, deadline.remaining))
+
+
+async def async_sleep_poll_frequency(deadline: Optional[Deadline] = None) -> None:
+    """
+    Асинхронный аналог sleep_poll_frequency: не блокирует цикл событий на время паузы.
+    :param deadline: Крайний срок действия, после которого ожидание не продолжается.
     :return:
     """
-    sleep(POLL_FREQUENCY)
+    if deadline is None:
+        await async_sleep(POLL_FREQUENCY)
+    else:
+        await async_sleep(min(POLL_FREQUENCY, deadline.remaining))
@@ -5,7 +5,7 @@ with open('requirements.txt', 'r', encoding='UTF-8') as f:
     requirements = f.read().split()
 
 
-VERSION = '1.0.7'
+VERSION = '1.1.0'
 DESCRIPTION = 'Python-пакет для работы над Selenium'
 
 
@@ -21,6 +21,11 @@ setup(
     long_description_content_type='text/markdown',
     packages=['custom_selenium_qa'],
     install_requires=requirements,
+    extras_require={
+        'images': ['Pillow'],
+        'async': ['aiohttp'],
+        'devtools': ['websocket-client'],
+    },
     classifiers=[
         'Natural Language :: Russian',
         'Intended Audience :: Developers',
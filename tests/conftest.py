@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeDevToolsConnection
+from benchmarks.fake_webdriver import FakePage
+from benchmarks.fake_webdriver import create_fake_driver
+from custom_selenium_qa import BaseActions
+from custom_selenium_qa import DevToolsChannel
+from custom_selenium_qa import SCREENSHOTS_DIRECTORY
+from custom_selenium_qa import release_screenshot_policy
+from custom_selenium_qa import step_reporter
+
+# Функция, передающая событие DevTools протокола подписчикам канала
+EmitEvent = Callable[[str, Optional[Dict[str, Any]]], None]
+
+
+class FakePageObject(BaseActions):
+    """
+    Объект страницы поддельного вебдрайвера: все методы BaseActions без изменений.
+    """
+
+    _IS_ABSTRACT_CLASS = False
+
+
+class FakeStepManager:
+    """
+    Менеджер шагов TestIT, запоминающий переданные шаги с глубиной вложенности.
+    """
+
+    def __init__(self) -> None:
+        self.steps: List[Tuple[int, Any]] = []
+        self._depth = 0
+
+    def start_step(self, step_result: Any) -> None:
+        self.steps.append((self._depth, step_result))
+        self._depth += 1
+
+    def stop_step(self) -> None:
+        self._depth -= 1
+
+
+@pytest.fixture
+def step_manager(monkeypatch: pytest.MonkeyPatch) -> FakeStepManager:
+    """
+    Менеджер шагов TestIT, подменяющий менеджер плагина testit.
+    """
+    manager = FakeStepManager()
+    monkeypatch.setattr(step_reporter.TmsPluginManager, 'get_step_manager', lambda: manager)
+    return manager
+
+
+def reported(manager: FakeStepManager) -> List[Tuple[int, str, str]]:
+    """
+    Возвращает переданные шаги: глубину, заголовок и результат.
+    """
+    return [(depth, step.get_title(), step.get_outcome()) for depth, step in manager.steps]
+
+
+@pytest.fixture
+def fake_page() -> FakePage:
+    """
+    Пустая страница поддельного вебдрайвера; тест наполняет её элементами.
+    """
+    return FakePage(title='Поддельная страница')
+
+
+@pytest.fixture
+def fake_driver(fake_page: FakePage) -> Tuple[Remote, FakeCommandExecutor]:
+    """
+    Вебдрайвер поддельного браузера и его исполнитель команд.
+    """
+    return create_fake_driver(fake_page)
+
+
+@pytest.fixture
+def page_object(
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+) -> Iterator[FakePageObject]:
+    """
+    Объект страницы поддельного вебдрайвера; скриншоты ошибок пишутся во временную директорию.
+    По окончании теста политика скриншотов сбрасывается, как в finish_test.
+    """
+    (tmp_path / SCREENSHOTS_DIRECTORY).mkdir()
+    monkeypatch.chdir(tmp_path)
+    page_object = FakePageObject(fake_driver[0], 'test_page_object')  # type: ignore
+    yield page_object
+    release_screenshot_policy('test_page_object', page_object.screenshot_policy)
+
+
+@pytest.fixture
+def devtools_connection(fake_driver: Tuple[Remote, FakeCommandExecutor]) -> FakeDevToolsConnection:
+    """
+    Соединение DevTools протокола с поддельным браузером.
+    """
+    return FakeDevToolsConnection(fake_driver[1])
+
+
+@pytest.fixture
+def devtools_channel(
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        devtools_connection: FakeDevToolsConnection
+) -> Iterator[DevToolsChannel]:
+    """
+    Открытый канал DevTools протокола сессии поддельного браузера.
+    """
+    channel = DevToolsChannel.open(fake_driver[0], devtools_connection)
+    yield channel
+    channel.close()
+
+
+@pytest.fixture
+def emit_event(devtools_channel: DevToolsChannel, devtools_connection: FakeDevToolsConnection) -> EmitEvent:
+    """
+    Передаёт событие подписчикам канала и дожидается его обработки: события и ответы канал читает по порядку,
+    поэтому после ответа на следующую за событием команду обработчики события уже выполнены.
+    """
+    def emit(method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        devtools_connection.emit(method, params)
+        devtools_channel.send('Runtime.evaluate', {'expression': '1'})
+
+    return emit
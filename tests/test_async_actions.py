@@ -0,0 +1,171 @@
+from asyncio import gather
+from asyncio import run
+from pathlib import Path
+from time import perf_counter
+from typing import List
+from typing import Tuple
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeAsyncTransport
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from benchmarks.fake_webdriver import create_fake_async_driver
+from custom_selenium_qa import ActionsCore
+from custom_selenium_qa import AsyncBaseActions
+from custom_selenium_qa import AsyncWebDriver
+from custom_selenium_qa import BaseActions
+from custom_selenium_qa import Locator
+from custom_selenium_qa import SCREENSHOTS_DIRECTORY
+from custom_selenium_qa import TraceRecorder
+from custom_selenium_qa import async_webdriver
+
+BUTTON = Locator('css selector', '#save', 'Кнопка сохранения')
+STATUS = Locator('css selector', '#status', 'Статус')
+ROWS = Locator('css selector', '.row', 'Строки таблицы')
+ABSENT = Locator('css selector', '#absent', 'Отсутствующий элемент')
+
+# Задержка каждой команды в сценарии параллельных сессий
+LATENCY = 0.01
+
+
+class FakeAsyncPageObject(AsyncBaseActions):
+    """
+    Асинхронный объект страницы поддельного вебдрайвера.
+    """
+
+    _IS_ABSTRACT_CLASS = False
+
+
+class ClosingCountTransport(FakeAsyncTransport):
+    """
+    Транспорт поддельного вебдрайвера, считающий вызовы close.
+    """
+
+    def __init__(self, *args: object) -> None:
+        super().__init__(FakePage())
+        self.closes = 0
+
+    async def close(self) -> None:
+        self.closes += 1
+
+
+def standard_page() -> FakePage:
+    return FakePage(
+        {
+            BUTTON.selector: [FakeElement('Сохранить')],
+            STATUS.selector: [FakeElement('Загрузка').update_after(0.2, text='Готово')],
+            ROWS.selector: [FakeElement(f' Строка {index} ') for index in range(3)],
+        },
+        title='Поддельная страница'
+    )
+
+
+async def create_page_object(
+        page: FakePage,
+        latency: float = 0.0
+) -> Tuple[FakeAsyncPageObject, AsyncWebDriver, FakeCommandExecutor]:
+    driver, executor = await create_fake_async_driver(page, latency)
+    return FakeAsyncPageObject(driver, 'test_async_page_object'), driver, executor
+
+
+@pytest.fixture(autouse=True)
+def working_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / SCREENSHOTS_DIRECTORY).mkdir()
+    monkeypatch.chdir(tmp_path)
+
+
+def test_sync_and_async_page_objects_share_core() -> None:
+    assert issubclass(BaseActions, ActionsCore)
+    assert issubclass(AsyncBaseActions, ActionsCore)
+    with pytest.raises(NotImplementedError):
+        AsyncBaseActions(None, 'test_abstract')  # type: ignore
+
+
+def test_async_actions_match_sync_results() -> None:
+    async def scenario() -> None:
+        page_object, _, executor = await create_page_object(standard_page())
+        await page_object.click_element_by_webdriver(BUTTON)
+        assert executor.page.elements[BUTTON.selector][0].clicks == 1
+        assert await page_object.get_text_from_element(BUTTON) == 'Сохранить'
+        assert await page_object.get_texts_from_elements_with_identical_locators(ROWS, is_batched=True) == (
+            'Строка 0', 'Строка 1', 'Строка 2'
+        )
+        await page_object.wait_for_change_text(STATUS, 'Готово')
+        await page_object.check_title('Поддельная страница')
+        assert await page_object.probe_element(ABSENT) is False
+
+    run(scenario())
+
+
+def test_async_errors_are_mapped_to_selenium_exceptions() -> None:
+    async def scenario() -> None:
+        page_object, driver, _ = await create_page_object(standard_page())
+        with pytest.raises(NoSuchElementException):
+            await driver.find_element(*ABSENT())
+        async with page_object._step('Поиск с коротким тайм-аутом', timeout=0.2):
+            with pytest.raises(AssertionError):
+                await page_object.find_element(ABSENT)
+
+    run(scenario())
+
+
+def test_async_probe_raises_on_unhandled_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def query_many(*args: object, **kwargs: object) -> List[dict]:
+        raise JavascriptException('Ошибка скрипта')
+
+    async def scenario() -> None:
+        page_object, _, executor = await create_page_object(standard_page())
+        monkeypatch.setattr(page_object, 'query_many', query_many)
+        with pytest.raises(AssertionError, match='Необрабатываемое исключение'):
+            await page_object.probe_element(ABSENT, timeout=1.0)
+        assert executor.commands.count(Command.SCREENSHOT) == 1
+
+    run(scenario())
+
+
+def test_async_commands_are_reported_under_selenium_names() -> None:
+    async def scenario() -> TraceRecorder:
+        page_object, _, _ = await create_page_object(standard_page())
+        recorder = TraceRecorder()
+        page_object.add_listener(recorder)
+        await page_object.find_element(BUTTON)
+        return recorder
+
+    recorder = run(scenario())
+    assert [event['name'] for event in recorder.events] == [Command.FIND_ELEMENT, 'Поиск элемента по локатору']
+
+
+def test_sessions_run_concurrently_on_one_event_loop() -> None:
+    async def flow(page_object: FakeAsyncPageObject) -> str:
+        await page_object.click_element_by_webdriver(BUTTON)
+        return await page_object.get_text_from_element(BUTTON)
+
+    async def scenario(sessions_number: int) -> float:
+        page_objects: List[FakeAsyncPageObject] = [
+            (await create_page_object(standard_page(), LATENCY))[0] for _ in range(sessions_number)
+        ]
+        started = perf_counter()
+        assert await gather(*(flow(page_object) for page_object in page_objects)) == ['Сохранить'] * sessions_number
+        assert len({id(page_object.step_reporter) for page_object in page_objects}) == sessions_number
+        return perf_counter() - started
+
+    single = run(scenario(1))
+    assert run(scenario(10)) < single * 5
+
+
+def test_only_owned_transport_is_closed_on_quit(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def scenario() -> Tuple[int, int]:
+        shared = ClosingCountTransport()
+        for _ in range(2):
+            await (await AsyncWebDriver.create(shared, {'browserName': 'chrome'})).quit()
+        monkeypatch.setattr(async_webdriver, 'AiohttpTransport', ClosingCountTransport)
+        driver = await AsyncWebDriver.create('http://selenoid:4444/wd/hub', {'browserName': 'chrome'})
+        await driver.quit()
+        return shared.closes, driver._transport.closes  # type: ignore
+
+    assert run(scenario()) == (0, 1)
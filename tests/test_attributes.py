@@ -0,0 +1,58 @@
+from typing import Tuple
+
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import Locator
+
+from .conftest import FakePageObject
+
+ROWS = Locator('css selector', '.row', 'Строки таблицы')
+
+
+def fill_rows(page: FakePage, number: int) -> None:
+    page.elements[ROWS.selector] = [
+        FakeElement(attributes={'data-id': str(index), 'class': 'row'}) for index in range(number)
+    ]
+
+
+def test_attributes_are_read_from_all_elements(page_object: FakePageObject, fake_page: FakePage) -> None:
+    fill_rows(fake_page, 2)
+    assert page_object.get_attributes_from_elements(ROWS, ['data-id', 'title']) == [
+        {'data-id': '0', 'title': None},
+        {'data-id': '1', 'title': None},
+    ]
+    assert page_object.get_attribute(ROWS, 'data-id') == '0'
+    assert page_object.get_attribute_from_elements_with_identical_locators(ROWS, 'data-id') == ('0', '1')
+
+
+def test_attributes_cost_one_round_trip_for_any_number_of_elements(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        fake_page: FakePage
+) -> None:
+    executor = fake_driver[1]
+    commands_numbers = []
+    for number in (2, 200):
+        fill_rows(fake_page, number)
+        executor.commands.clear()
+        assert len(page_object.get_attributes_from_elements(ROWS, ['data-id', 'class'])) == number
+        assert Command.FIND_ELEMENTS not in executor.commands
+        commands_numbers.append(len(executor.commands))
+    assert commands_numbers[0] == commands_numbers[1]
+
+
+def test_attribute_checks_pass_for_expected_values(page_object: FakePageObject, fake_page: FakePage) -> None:
+    fill_rows(fake_page, 1)
+    page_object.attributes_compare(ROWS, 'class', 'row')
+    page_object.find_value_in_attribut(ROWS, 'class', 'ro')
+
+
+def test_wait_until_attribute_is_updated(page_object: FakePageObject, fake_page: FakePage) -> None:
+    fake_page.elements[ROWS.selector] = [FakeElement(attributes={'data-state': 'loading'})]
+    fake_page.elements[ROWS.selector][0].update_after(0.3, **{'data-state': 'ready'})
+    page_object.sleep_until_update_attribute(ROWS, 'data-state', 'ready')
+    assert page_object.get_attribute(ROWS, 'data-state') == 'ready'
@@ -0,0 +1,53 @@
+import os
+import stat
+from pathlib import Path
+
+from custom_selenium_qa import AuthSnapshot
+from custom_selenium_qa import AuthSnapshotCache
+
+COOKIES = [{'name': 'sid', 'value': 'secret', 'domain': 'example.com', 'httpOnly': True}]
+
+
+def create_snapshot(created: float = 0.0) -> AuthSnapshot:
+    return AuthSnapshot(
+        'https://example.com:8443/home', COOKIES, {'token': 'abc'}, {'tab': '1'}, created=created or None
+    )
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    cache = AuthSnapshotCache(str(tmp_path))
+    cache.put('user', 'stage', create_snapshot())
+    snapshot = cache.get('user', 'stage')
+    assert snapshot is not None
+    assert snapshot.origin == 'https://example.com:8443'
+    assert snapshot.cookies == COOKIES
+    assert snapshot.local_storage == {'token': 'abc'}
+    assert snapshot.session_storage == {'tab': '1'}
+    assert cache.get('user', 'prod') is None
+
+
+def test_snapshot_file_is_owner_only(tmp_path: Path) -> None:
+    cache = AuthSnapshotCache(str(tmp_path))
+    cache.put('user', 'stage', create_snapshot())
+    mode = stat.S_IMODE(os.stat(cache.get_path('user', 'stage')).st_mode)
+    assert mode == 0o600
+    assert [path.name for path in tmp_path.iterdir()] == [os.path.basename(cache.get_path('user', 'stage'))]
+
+
+def test_expired_snapshot_is_removed(tmp_path: Path) -> None:
+    cache = AuthSnapshotCache(str(tmp_path), ttl=60)
+    cache.put('user', 'stage', create_snapshot(created=1.0))
+    assert cache.get('user', 'stage') is None
+    assert not os.path.exists(cache.get_path('user', 'stage'))
+
+
+def test_damaged_and_invalidated_snapshots_are_removed(tmp_path: Path) -> None:
+    cache = AuthSnapshotCache(str(tmp_path))
+    path = cache.get_path('user', 'stage')
+    Path(path).write_text('{"cookies": []}', encoding='utf-8')
+    assert cache.get('user', 'stage') is None
+    assert not os.path.exists(path)
+    cache.put('user', 'stage', create_snapshot())
+    cache.invalidate('user', 'stage')
+    cache.invalidate('user', 'stage')
+    assert cache.get('user', 'stage') is None
@@ -0,0 +1,27 @@
+from json import loads
+from pathlib import Path
+
+from benchmarks.runner import BASELINE_PATH
+from benchmarks.runner import find_regressions
+from benchmarks.runner import run_scenarios
+from benchmarks.scenarios import SCENARIOS
+
+BASELINE = loads(Path(BASELINE_PATH).read_text(encoding='UTF-8'))
+
+
+def test_baseline_covers_every_scenario() -> None:
+    assert set(BASELINE['scenarios']) == {scenario.name for scenario in SCENARIOS}
+
+
+def test_deterministic_scenarios_match_baseline_counters() -> None:
+    scenarios = [scenario for scenario in SCENARIOS if scenario.is_deterministic]
+    results = run_scenarios(scenarios, latency=0.0, repeat=1)
+    assert find_regressions(results, BASELINE, scenarios, latency=0.0) == {}
+
+
+def test_extra_command_is_a_regression() -> None:
+    scenario = SCENARIOS[0]
+    expected = BASELINE['scenarios'][scenario.name]
+    result = {**expected, 'commands': expected['commands'] + 1, 'error': None}
+    regressions = find_regressions({scenario.name: result}, BASELINE, [scenario], latency=0.0)
+    assert list(regressions) == [scenario.name]
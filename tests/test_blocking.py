@@ -0,0 +1,159 @@
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from custom_selenium_qa import BLOCK_ANALYTICS
+from custom_selenium_qa import BLOCK_FONTS
+from custom_selenium_qa import BLOCK_IMAGES
+from custom_selenium_qa import BlockingRule
+from custom_selenium_qa import DevToolsChannel
+from custom_selenium_qa import NO_BLOCKING
+from custom_selenium_qa import RequestBlocker
+from custom_selenium_qa import RequestBlockingStats
+from custom_selenium_qa import apply_request_blocking
+from custom_selenium_qa import get_request_blocker
+from custom_selenium_qa import resolve_blocking_rule
+
+from .conftest import EmitEvent
+
+# Правило блокировки картинок CDN по шаблону адреса
+CDN_IMAGES = BlockingRule('Картинки CDN', ('*://cdn.test/*.png',))
+
+
+@pytest.fixture
+def blockers() -> Iterator[List[RequestBlocker]]:
+    """
+    Блокировки, подписанные на канал в тесте; по окончании теста блокировки отписываются.
+    """
+    attached: List[RequestBlocker] = []
+    yield attached
+    for blocker in attached:
+        blocker.detach()
+
+
+def attach(blockers: List[RequestBlocker], blocker: RequestBlocker) -> RequestBlocker:
+    blocker.attach()
+    blockers.append(blocker)
+    return blocker
+
+
+def request_started(request_id: str, url: str, resource_type: str) -> dict:
+    return {'requestId': request_id, 'type': resource_type, 'request': {'url': url}}
+
+
+def test_resolve_presets_by_names() -> None:
+    assert resolve_blocking_rule('analytics') is BLOCK_ANALYTICS
+    assert resolve_blocking_rule(BLOCK_IMAGES, 'none') is BLOCK_IMAGES
+    assert resolve_blocking_rule() is NO_BLOCKING
+    assert resolve_blocking_rule('none') is NO_BLOCKING
+
+
+def test_resolve_merges_several_rules() -> None:
+    rule = resolve_blocking_rule('fonts', 'images', BLOCK_FONTS)
+    assert rule.url_patterns == BLOCK_FONTS.url_patterns
+    assert rule.resource_types == ('Font', 'Image')
+
+
+def test_resolve_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError):
+        resolve_blocking_rule('scripts')
+
+
+def test_resource_types_are_blocked_by_extensions_without_channel() -> None:
+    blocker = RequestBlocker(BLOCK_IMAGES, None)
+    assert not blocker.is_intercepting
+    assert '*.png' in blocker.blocked_urls
+    assert '*.png?*' in blocker.blocked_urls
+    assert [cmd for cmd, _ in blocker.commands] == ['Network.enable', 'Network.setBlockedURLs']
+
+
+def test_resource_types_are_intercepted_through_channel(devtools_channel: DevToolsChannel) -> None:
+    blocker = RequestBlocker(BLOCK_IMAGES, devtools_channel)
+    assert blocker.is_intercepting
+    assert blocker.blocked_urls == []
+    assert [cmd for cmd, _ in blocker.commands] == ['Network.enable', 'Network.setBlockedURLs', 'Fetch.enable']
+
+
+def test_dry_run_blocks_nothing(devtools_channel: DevToolsChannel) -> None:
+    blocker = RequestBlocker(BLOCK_IMAGES, devtools_channel, is_dry_run=True)
+    assert not blocker.is_intercepting
+    assert blocker.blocked_urls == []
+
+
+def test_paused_request_is_failed_and_counted(
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        blockers: List[RequestBlocker],
+        devtools_channel: DevToolsChannel,
+        emit_event: EmitEvent
+) -> None:
+    blocker = attach(blockers, RequestBlocker(BLOCK_IMAGES, devtools_channel))
+    emit_event('Fetch.requestPaused', {
+        'requestId': 'fetch-1', 'resourceType': 'Image', 'request': {'url': 'https://paused.test/logo.png'}
+    })
+    failed = [params for cmd, params in fake_driver[1].devtools_commands if cmd == 'Fetch.failRequest']
+    assert failed == [{'requestId': 'fetch-1', 'errorReason': 'BlockedByClient'}]
+    assert blocker.stats.to_dict() == {
+        'requests': 1, 'bytes': 0, 'unsized_requests': 1, 'by_resource_type': {'Image': 1}
+    }
+
+
+def test_blocked_request_is_estimated_by_dry_run_size(
+        blockers: List[RequestBlocker],
+        devtools_channel: DevToolsChannel,
+        emit_event: EmitEvent
+) -> None:
+    url = 'https://cdn.test/estimated.png'
+    dry_run = attach(blockers, RequestBlocker(CDN_IMAGES, devtools_channel, is_dry_run=True))
+    emit_event('Network.requestWillBeSent', request_started('1', url, 'Image'))
+    emit_event('Network.requestWillBeSent', request_started('2', 'https://cdn.test/app.js', 'Script'))
+    assert dry_run.stats.unsized_requests == 1
+    emit_event('Network.loadingFinished', {'requestId': '1', 'encodedDataLength': 2048})
+    emit_event('Network.loadingFinished', {'requestId': '2', 'encodedDataLength': 512})
+    assert dry_run.stats.to_dict() == {
+        'requests': 1, 'bytes': 2048, 'unsized_requests': 0, 'by_resource_type': {'Image': 1}
+    }
+    dry_run.detach()
+
+    stats = RequestBlockingStats()
+    attach(blockers, RequestBlocker(CDN_IMAGES, devtools_channel, stats=stats))
+    emit_event('Network.requestWillBeSent', request_started('3', url, 'Image'))
+    emit_event('Network.loadingFailed', {'requestId': '3', 'blockedReason': 'inspector'})
+    emit_event('Network.requestWillBeSent', request_started('4', 'https://cdn.test/unknown.png', 'Image'))
+    emit_event('Network.loadingFailed', {'requestId': '4', 'blockedReason': 'inspector'})
+    emit_event('Network.requestWillBeSent', request_started('5', 'https://cdn.test/offline.png', 'Image'))
+    emit_event('Network.loadingFailed', {'requestId': '5', 'errorText': 'net::ERR_INTERNET_DISCONNECTED'})
+    assert stats.to_dict() == {'requests': 2, 'bytes': 2048, 'unsized_requests': 1, 'by_resource_type': {'Image': 2}}
+
+
+def test_detached_blocker_ignores_events(
+        blockers: List[RequestBlocker],
+        devtools_channel: DevToolsChannel,
+        emit_event: EmitEvent
+) -> None:
+    blocker = attach(blockers, RequestBlocker(BLOCK_IMAGES, devtools_channel, is_dry_run=True))
+    blocker.detach()
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://detached.test/a.png', 'Image'))
+    assert blocker.stats.requests == 0
+
+
+def test_apply_replaces_previous_blocking(
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        devtools_channel: DevToolsChannel
+) -> None:
+    driver, executor = fake_driver
+    try:
+        images = apply_request_blocking(driver, 'images')
+        assert get_request_blocker(driver) is images
+        executor.devtools_commands.clear()
+        analytics = apply_request_blocking(driver, 'analytics')
+        assert get_request_blocker(driver) is analytics
+        assert [cmd for cmd, _ in executor.devtools_commands] == [
+            'Network.enable', 'Network.setBlockedURLs', 'Fetch.disable'
+        ]
+    finally:
+        apply_request_blocking(driver, NO_BLOCKING)
+    assert get_request_blocker(driver) is None
@@ -0,0 +1,54 @@
+from time import monotonic
+from time import perf_counter
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from custom_selenium_qa import Deadline
+from custom_selenium_qa import Locator
+
+from .conftest import FakePageObject
+
+ABSENT = Locator('css selector', '#absent', 'Отсутствующий элемент')
+
+
+def test_remaining_is_limited_by_timeout() -> None:
+    deadline = Deadline(10)
+    assert 9 < deadline.remaining <= 10
+    assert not deadline.is_expired()
+
+
+def test_expired_deadline_has_no_remaining_time() -> None:
+    deadline = Deadline(0)
+    assert deadline.is_expired()
+    assert deadline.remaining == 0
+
+
+def test_child_deadline_is_capped_by_parent() -> None:
+    parent = Deadline(1)
+    child = Deadline(10, parent)
+    assert child.end_time == parent.end_time
+    assert child.remaining <= 1
+
+
+def test_child_deadline_shorter_than_parent_is_kept() -> None:
+    parent = Deadline(10)
+    child = Deadline(1, parent)
+    assert child.end_time < parent.end_time
+    assert child.end_time <= monotonic() + 1
+
+
+def test_nested_actions_share_outer_deadline(page_object: FakePageObject) -> None:
+    started = perf_counter()
+    with pytest.raises(AssertionError):
+        with page_object._step('Внешний шаг', timeout=0.3):
+            page_object.find_element(ABSENT)
+    assert perf_counter() - started < 1
+
+
+def test_waits_are_clipped_to_outer_deadline(page_object: FakePageObject) -> None:
+    started = perf_counter()
+    with pytest.raises(TimeoutException):
+        with page_object._step('Внешний шаг', timeout=0.3):
+            page_object.check_element_visibility(ABSENT)
+    assert perf_counter() - started < 1
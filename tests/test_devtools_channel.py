@@ -0,0 +1,90 @@
+from typing import List
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeDevToolsConnection
+from custom_selenium_qa import DevToolsChannel
+from custom_selenium_qa import DevToolsConnection
+from custom_selenium_qa import get_devtools_channel
+
+from .conftest import EmitEvent
+from .conftest import FakePageObject
+
+# Команда расширения Chromium вебдрайвера, через которую DevTools протокол работает без канала
+HTTP_COMMAND = 'devtools:send_command_and_get_result'
+
+
+def test_commands_go_through_open_channel(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        devtools_channel: DevToolsChannel
+) -> None:
+    executor = fake_driver[1]
+    executor.devtools_responses['Runtime.getHeapUsage'] = {'usedSize': 1000}
+    assert page_object.devtools_channel is devtools_channel
+    response = page_object.send_by_devtools_protocol('Runtime.getHeapUsage')
+    assert response == {'value': {'usedSize': 1000}}
+    assert executor.commands == ['devtools:Runtime.getHeapUsage']
+
+
+def test_batch_keeps_command_order(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        devtools_channel: DevToolsChannel
+) -> None:
+    page_object.clear_cash_and_logs()
+    page_object.turn_off_internet()
+    page_object.turn_on_internet()
+    assert [cmd for cmd, _ in fake_driver[1].devtools_commands] == [
+        'Log.clear', 'Network.clearBrowserCache',
+        'Network.enable', 'Network.emulateNetworkConditions',
+        'Network.emulateNetworkConditions',
+    ]
+
+
+def test_closed_channel_falls_back_to_http(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        devtools_connection: FakeDevToolsConnection
+) -> None:
+    page_object.open_devtools_channel(devtools_connection)
+    page_object.close_devtools_channel()
+    assert get_devtools_channel(fake_driver[0]) is None
+    page_object.send_batch_by_devtools_protocol((('Log.clear', {}), ('Network.clearBrowserCache', {})))
+    assert fake_driver[1].commands == [HTTP_COMMAND, HTTP_COMMAND]
+
+
+def test_reopened_channel_replaces_previous(
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        devtools_channel: DevToolsChannel
+) -> None:
+    with DevToolsChannel.open(fake_driver[0], FakeDevToolsConnection(fake_driver[1])) as channel:
+        assert not devtools_channel.is_connected
+        assert get_devtools_channel(fake_driver[0]) is channel
+    assert get_devtools_channel(fake_driver[0]) is None
+
+
+def test_events_reach_subscribers_until_removed(devtools_channel: DevToolsChannel, emit_event: EmitEvent) -> None:
+    received: List[str] = []
+
+    def on_request(params: dict) -> None:
+        received.append(params['requestId'])
+
+    devtools_channel.add_event_listener('Network.requestWillBeSent', on_request)
+    emit_event('Network.requestWillBeSent', {'requestId': '1'})
+    emit_event('Network.loadingFinished', {'requestId': '1'})
+    devtools_channel.remove_event_listener('Network.requestWillBeSent', on_request)
+    emit_event('Network.requestWillBeSent', {'requestId': '2'})
+    assert received == ['1']
+
+
+def test_incomplete_connection_cannot_be_created() -> None:
+    class SendOnlyConnection(DevToolsConnection):
+        def send(self, message: str) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        SendOnlyConnection()  # type: ignore
@@ -0,0 +1,73 @@
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import ElementCache
+from custom_selenium_qa import Locator
+
+from .conftest import FakePageObject
+
+BUTTON = Locator('css selector', '#save', 'Кнопка сохранения')
+FRAME = Locator('css selector', 'iframe', 'Фрейм')
+
+
+@pytest.fixture
+def cached_page_object(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        fake_page: FakePage
+) -> FakePageObject:
+    fake_page.elements[BUTTON.selector] = [FakeElement(text='Сохранить')]
+    fake_page.elements[FRAME.selector] = [FakeElement()]
+    return FakePageObject(fake_driver[0], 'test_element_cache', has_element_cache=True)  # type: ignore
+
+
+def element_cache(page_object: FakePageObject) -> ElementCache:
+    assert page_object.element_cache is not None
+    return page_object.element_cache
+
+
+def test_cache_is_disabled_by_default(page_object: FakePageObject) -> None:
+    assert page_object.element_cache is None
+
+
+def test_repeated_lookups_reuse_one_element(
+        cached_page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    executor.commands.clear()
+    cached_page_object.check_element_visibility(BUTTON)
+    cached_page_object.check_element_clickability(BUTTON)
+    cached_page_object.click_element_by_webdriver(BUTTON)
+    assert executor.commands.count(Command.FIND_ELEMENT) == 1
+    assert element_cache(cached_page_object).misses == 1
+    assert element_cache(cached_page_object).hits >= 2
+
+
+def test_stale_element_is_found_again(cached_page_object: FakePageObject, fake_page: FakePage) -> None:
+    cached_page_object.find_element(BUTTON)
+    fake_page.elements[BUTTON.selector][0].stale_reads = 1
+    cached_page_object.check_element_visibility(BUTTON)
+    assert element_cache(cached_page_object).misses == 2
+
+
+def test_refresh_and_frame_switch_clear_cache(
+        cached_page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    cached_page_object.find_element(BUTTON)
+    cached_page_object.emulator_refresh()
+    cached_page_object.find_element(BUTTON)
+    cached_page_object.switch_to_iframe(FRAME)
+    cached_page_object.find_element(BUTTON)
+    cached_page_object.switch_to_default_page()
+    cached_page_object.find_element(BUTTON)
+    assert executor.commands.count(Command.FIND_ELEMENT) == 5
+    assert element_cache(cached_page_object).hits == 0
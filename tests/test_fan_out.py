@@ -0,0 +1,110 @@
+from pathlib import Path
+from time import perf_counter
+from typing import Dict
+
+import pytest
+
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from benchmarks.fake_webdriver import create_fake_driver
+from custom_selenium_qa import FanOutError
+from custom_selenium_qa import FanOutExecutor
+from custom_selenium_qa import Locator
+from custom_selenium_qa import StepReporter
+from custom_selenium_qa import get_step_reporter
+
+from .conftest import FakePageObject
+from .conftest import FakeStepManager
+from .conftest import reported
+
+BUTTON = Locator('css selector', '#save', 'Кнопка сохранения')
+SESSIONS = ('admin', 'guest', 'manager', 'viewer')
+
+# Задержка каждой команды поддельного вебдрайвера
+LATENCY = 0.02
+
+
+def create_page_objects(latency: float = 0.0) -> Dict[str, FakePageObject]:
+    page_objects = {}
+    for name in SESSIONS:
+        driver, _ = create_fake_driver(FakePage({BUTTON.selector: [FakeElement(name)]}), latency)
+        page_objects[name] = FakePageObject(driver, 'test_fan_out')  # type: ignore
+    return page_objects
+
+
+def flow(page_object: FakePageObject) -> str:
+    page_object.click_element_by_webdriver(BUTTON)
+    return page_object.get_text_from_element(BUTTON)
+
+
+def test_results_keep_session_order() -> None:
+    results = FanOutExecutor(has_steps_report=False).run(create_page_objects(), flow)
+    assert [(result.name, result.value, result.is_succeeded) for result in results] == [
+        (name, name, True) for name in SESSIONS
+    ]
+
+
+def test_failures_are_collected_from_all_sessions(tmp_path: Path) -> None:
+    def fail_for_guests(page_object: FakePageObject) -> str:
+        text = flow(page_object)
+        if text in ('guest', 'viewer'):
+            page_object.screenshot_and_raise_error(f'Нет доступа: {text}')
+        return text
+
+    executor = FanOutExecutor(screenshots_directory=str(tmp_path), has_steps_report=False)
+    with pytest.raises(FanOutError) as error:
+        executor.run(create_page_objects(), fail_for_guests)
+    assert [result.name for result in error.value.failures] == ['guest', 'viewer']
+    results = executor.run(create_page_objects(), fail_for_guests, is_raising=False)
+    assert [result.is_succeeded for result in results] == [True, False, True, False]
+
+
+def test_sessions_write_screenshots_to_own_directories(tmp_path: Path) -> None:
+    page_objects = create_page_objects()
+    directories = {name: page_object.screenshots_directory for name, page_object in page_objects.items()}
+    policies = {name: page_object.screenshot_policy for name, page_object in page_objects.items()}
+    FanOutExecutor(screenshots_directory=str(tmp_path), has_steps_report=False).run(
+        page_objects,
+        lambda page_object: page_object.make_screenshot()
+    )
+    for page_object in page_objects.values():
+        page_object.flush_screenshots()
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob('*.png')) == [
+        f'{name}/test_fan_out.png' for name in SESSIONS
+    ]
+    assert {name: page_object.screenshots_directory for name, page_object in page_objects.items()} == directories
+    assert {name: page_object.screenshot_policy for name, page_object in page_objects.items()} == policies
+    assert next(iter(policies.values())).count == 0
+
+
+def test_steps_are_reported_per_session(step_manager: FakeStepManager) -> None:
+    page_objects = create_page_objects()
+    FanOutExecutor().run(page_objects, flow)
+    assert [(title, outcome) for depth, title, outcome in reported(step_manager) if depth == 0] == [
+        (f'Сессия {name}', 'Passed') for name in SESSIONS
+    ]
+    assert not any(page_object.step_reporter.is_deferred for page_object in page_objects.values())
+
+
+def test_own_and_shared_step_reporters_are_restored(step_manager: FakeStepManager) -> None:
+    page_objects = create_page_objects()
+    own_reporter = StepReporter()
+    page_objects['admin'].step_reporter = own_reporter
+
+    def interrupt(page_object: FakePageObject) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        FanOutExecutor().run(page_objects, interrupt)
+    assert page_objects['admin'].step_reporter is own_reporter
+    assert page_objects['guest'].step_reporter is get_step_reporter()
+
+
+def test_sessions_run_in_parallel() -> None:
+    page_objects = create_page_objects(LATENCY)
+    started = perf_counter()
+    flow(page_objects[SESSIONS[0]])
+    single = perf_counter() - started
+    started = perf_counter()
+    FanOutExecutor(has_steps_report=False).run(page_objects, flow)
+    assert perf_counter() - started < single * 2.5
@@ -0,0 +1,106 @@
+from gc import collect
+from json import loads
+from pathlib import Path
+from typing import List
+from typing import Optional
+from typing import Tuple
+from weakref import ref
+
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from benchmarks.fake_webdriver import create_fake_driver
+from custom_selenium_qa import ActionListener
+from custom_selenium_qa import Locator
+from custom_selenium_qa import MetricsCollector
+
+from .conftest import FakePageObject
+
+BUTTON = Locator('css selector', '#save', 'Кнопка сохранения')
+
+
+class RecordingListener(ActionListener):
+    """Слушатель, запоминающий полученные события."""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, ...]] = []
+
+    def on_action_start(self, title: str, description: Optional[str], started: float) -> None:
+        self.events.append(('start', title))
+
+    def on_action_end(
+            self,
+            title: str,
+            description: Optional[str],
+            started: float,
+            duration: float,
+            error: Optional[BaseException]
+    ) -> None:
+        self.events.append(('end', title))
+
+    def on_command(self, command: str, started: float, duration: float, error: Optional[BaseException]) -> None:
+        self.events.append(('command', command))
+
+
+def test_listener_receives_steps_and_commands(page_object: FakePageObject, fake_page: FakePage) -> None:
+    fake_page.elements[BUTTON.selector] = [FakeElement()]
+    listener = RecordingListener()
+    page_object.add_listener(listener)
+    page_object.find_element(BUTTON)
+    assert listener.events == [
+        ('start', 'Поиск элемента по локатору'),
+        ('command', Command.FIND_ELEMENT),
+        ('end', 'Поиск элемента по локатору'),
+    ]
+    page_object.remove_listener(listener)
+    page_object.find_element(BUTTON)
+    assert len(listener.events) == 3
+
+
+def test_session_without_listeners_is_not_hooked(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    assert page_object.listeners == ()
+    assert 'execute' not in vars(fake_driver[0])
+
+
+def test_hook_is_removed_with_last_listener(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    first, second = RecordingListener(), RecordingListener()
+    page_object.add_listener(first)
+    page_object.add_listener(second)
+    page_object.remove_listener(first)
+    assert 'execute' in vars(fake_driver[0])
+    page_object.remove_listener(second)
+    assert 'execute' not in vars(fake_driver[0])
+    assert not hasattr(fake_driver[0], '_command_hook')
+
+
+def test_hooked_session_is_not_kept_alive(fake_page: FakePage) -> None:
+    driver, _ = create_fake_driver(fake_page)
+    page_object = FakePageObject(driver, 'test_hooked_session')  # type: ignore
+    page_object.add_listener(RecordingListener())
+    session = ref(driver)
+    del driver, page_object
+    collect()
+    assert session() is None
+
+
+def test_metrics_are_written_on_finish_test(page_object: FakePageObject, fake_page: FakePage, tmp_path: Path) -> None:
+    fake_page.elements[BUTTON.selector] = [FakeElement(appear_after=0.2)]
+    collector = MetricsCollector(directory=str(tmp_path / 'metrics'))
+    page_object.add_listener(collector)
+    page_object.check_element_visibility(BUTTON)
+    page_object.finish_test()
+    summary = loads((tmp_path / 'metrics' / 'test_page_object.json').read_text(encoding='UTF-8'))
+    assert summary['test'] == 'test_page_object'
+    assert summary['locators'][0]['description'] == BUTTON.description
+    assert summary['waits']['count'] == 1
+    assert summary['waits']['polls'] > 1
+    assert summary['commands_count'] >= summary['waits']['polls']
@@ -0,0 +1,115 @@
+from threading import Timer
+from time import perf_counter
+from typing import Iterator
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeDevToolsConnection
+from custom_selenium_qa import DevToolsChannel
+from custom_selenium_qa import NetworkActivityTracker
+from custom_selenium_qa.scripts import WAIT_FOR_PAGE_IDLE_SCRIPT
+
+from .conftest import EmitEvent
+from .conftest import FakePageObject
+
+
+@pytest.fixture
+def tracker(devtools_channel: DevToolsChannel) -> Iterator[NetworkActivityTracker]:
+    tracker = NetworkActivityTracker(devtools_channel, ignored_resource_types=('WebSocket',), ignored_urls=('/poll',))
+    tracker.attach()
+    yield tracker
+    tracker.detach()
+
+
+def request_started(request_id: str, url: str, resource_type: str = 'XHR') -> dict:
+    return {'requestId': request_id, 'type': resource_type, 'request': {'url': url}}
+
+
+def test_requests_are_tracked_until_finished(tracker: NetworkActivityTracker, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/api/users'))
+    emit_event('Network.requestWillBeSent', request_started('2', 'https://app.test/api/roles'))
+    assert tracker.in_flight == ['https://app.test/api/users', 'https://app.test/api/roles']
+    emit_event('Network.loadingFinished', {'requestId': '1'})
+    emit_event('Network.loadingFailed', {'requestId': '2', 'errorText': 'net::ERR_ABORTED'})
+    assert tracker.in_flight == []
+
+
+def test_redirect_is_tracked_as_one_request(tracker: NetworkActivityTracker, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'http://app.test/login'))
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/login'))
+    assert tracker.in_flight == ['https://app.test/login']
+    emit_event('Network.loadingFinished', {'requestId': '1'})
+    assert tracker.in_flight == []
+
+
+def test_ignored_requests_are_not_tracked(tracker: NetworkActivityTracker, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'wss://app.test/events', 'WebSocket'))
+    emit_event('Network.requestWillBeSent', request_started('2', 'https://app.test/poll?since=1'))
+    emit_event('Network.requestWillBeSent', request_started('3', 'data:image/png;base64,AAAA', 'Image'))
+    emit_event('Network.requestWillBeSent', request_started('4', 'blob:https://app.test/1', 'Other'))
+    assert tracker.in_flight == []
+
+
+def test_wait_fails_while_requests_are_in_flight(tracker: NetworkActivityTracker, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/api/slow'))
+    assert not tracker.wait_for_idle(idle_time=0.01, timeout=0.1)
+    assert tracker.wait_for_idle(idle_time=0.01, timeout=0.1, max_in_flight=1)
+
+
+def test_wait_wakes_up_on_finished_request(
+        tracker: NetworkActivityTracker,
+        devtools_connection: FakeDevToolsConnection,
+        emit_event: EmitEvent
+) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/api/users'))
+    timer = Timer(0.1, devtools_connection.emit, ('Network.loadingFinished', {'requestId': '1'}))
+    timer.start()
+    started = perf_counter()
+    try:
+        assert tracker.wait_for_idle(idle_time=0.05, timeout=5)
+    finally:
+        timer.cancel()
+    assert 0.15 <= perf_counter() - started < 2
+
+
+def test_detached_tracker_forgets_requests(tracker: NetworkActivityTracker, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/api/users'))
+    tracker.detach()
+    assert tracker.in_flight == []
+    emit_event('Network.requestWillBeSent', request_started('2', 'https://app.test/api/roles'))
+    assert tracker.in_flight == []
+
+
+def test_wait_without_channel_runs_one_script(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    page_object.wait_for_network_idle()
+    assert fake_driver[1].commands.count(Command.W3C_EXECUTE_SCRIPT_ASYNC) == 1
+
+
+def test_wait_continues_after_interrupted_script(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    # Первый вызов прерван переходом на другую страницу: браузер вернул None
+    results = iter([None, {'idle': True, 'readyState': 'complete', 'pending': 0, 'jqueryActive': 0}])
+    executor._scripts[WAIT_FOR_PAGE_IDLE_SCRIPT] = lambda *args: next(results)
+    page_object.wait_for_network_idle()
+    assert executor.commands.count(Command.W3C_EXECUTE_SCRIPT_ASYNC) == 2
+
+
+def test_wait_with_tracked_channel_runs_no_script(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        devtools_channel: DevToolsChannel
+) -> None:
+    page_object.wait_for_network_idle(idle_time=0.01)
+    fake_driver[1].commands.clear()
+    page_object.wait_for_network_idle(idle_time=0.01)
+    assert fake_driver[1].commands == []
@@ -0,0 +1,110 @@
+from json import loads
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from custom_selenium_qa import DevToolsChannel
+from custom_selenium_qa import NetworkRecorder
+
+from .conftest import EmitEvent
+
+# Тайминги ответа DevTools протокола: миллисекунды от requestTime
+TIMING = {
+    'requestTime': 100.01, 'dnsStart': 0, 'dnsEnd': 5, 'connectStart': 5, 'connectEnd': 20,
+    'sslStart': 10, 'sslEnd': 20, 'sendStart': 20, 'sendEnd': 21, 'receiveHeadersEnd': 81,
+}
+
+
+@pytest.fixture
+def recorder(devtools_channel: DevToolsChannel, tmp_path: Path) -> Iterator[NetworkRecorder]:
+    recorder = NetworkRecorder(devtools_channel, str(tmp_path), step_budget=1.0, buffer_size=3)
+    recorder.attach()
+    yield recorder
+    recorder.detach()
+
+
+def request_started(request_id: str, url: str, timestamp: float, **params: object) -> dict:
+    return {
+        'requestId': request_id, 'type': 'XHR', 'timestamp': timestamp, 'wallTime': 1700000000.0,
+        'request': {'url': url, 'method': 'POST'}, **params,
+    }
+
+
+def test_finished_request_becomes_har_entry(recorder: NetworkRecorder, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/api', 100.0))
+    emit_event('Network.responseReceived', {'requestId': '1', 'response': {
+        'status': 200, 'statusText': 'OK', 'mimeType': 'application/json', 'timing': TIMING,
+    }})
+    emit_event('Network.loadingFinished', {'requestId': '1', 'timestamp': 100.1, 'encodedDataLength': 512})
+    [entry] = recorder.entries
+    assert entry['request'] == {'method': 'POST', 'url': 'https://app.test/api'}
+    assert entry['response']['status'] == 200
+    assert entry['response']['_transferSize'] == 512
+    assert entry['time'] == pytest.approx(100)
+    assert entry['timings'] == pytest.approx({
+        'blocked': 10, 'dns': 5, 'connect': 15, 'ssl': 10, 'send': 1, 'wait': 60, 'receive': 9,
+    })
+
+
+def test_redirect_completes_previous_request(recorder: NetworkRecorder, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'http://app.test/', 100.0))
+    emit_event('Network.requestWillBeSent', request_started(
+        '1', 'https://app.test/', 100.05, redirectResponse={'status': 301, 'statusText': 'Moved Permanently'}
+    ))
+    emit_event('Network.loadingFailed', {'requestId': '1', 'timestamp': 100.2, 'errorText': 'net::ERR_ABORTED'})
+    assert [(entry['request']['url'], entry['response']['status']) for entry in recorder.entries] == [
+        ('http://app.test/', 301), ('https://app.test/', 0)
+    ]
+    assert recorder.entries[1]['_error'] == 'net::ERR_ABORTED'
+
+
+def test_buffer_keeps_last_requests(recorder: NetworkRecorder, emit_event: EmitEvent) -> None:
+    for index in range(5):
+        emit_event('Network.requestWillBeSent', request_started(str(index), f'https://app.test/{index}', 100.0))
+        emit_event('Network.loadingFinished', {'requestId': str(index), 'timestamp': 100.1})
+    urls = [entry['request']['url'] for entry in recorder.entries]
+    assert urls == [f'https://app.test/{index}' for index in (2, 3, 4)]
+
+
+def test_unfinished_request_is_pending_in_har(recorder: NetworkRecorder, emit_event: EmitEvent) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/slow', 100.0))
+    [entry] = recorder.to_har('test_pending')['log']['entries']
+    assert entry['time'] == -1
+    assert entry['request']['url'] == 'https://app.test/slow'
+
+
+def test_har_is_not_written_for_passed_fast_steps(recorder: NetworkRecorder, tmp_path: Path) -> None:
+    recorder.on_action_end('Нажать кнопку', None, 0.0, 0.5, None)
+    assert not recorder.is_kept
+    recorder.on_test_finished('test_fast')
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_har_is_written_for_failed_step(
+        recorder: NetworkRecorder,
+        emit_event: EmitEvent,
+        tmp_path: Path
+) -> None:
+    emit_event('Network.requestWillBeSent', request_started('1', 'https://app.test/api', 100.0))
+    emit_event('Network.loadingFinished', {'requestId': '1', 'timestamp': 100.1})
+    error = AssertionError('Кнопка не найдена')
+    recorder.on_action_end('Найти кнопку', None, 0.0, 0.2, error)
+    recorder.on_action_end('Нажать кнопку', 'Внешний шаг', 0.0, 0.3, error)
+    recorder.on_test_finished('test_failed')
+    har = loads((tmp_path / 'test_failed.har').read_text(encoding='UTF-8'))['log']
+    assert har['comment'] == 'test_failed'
+    assert len(har['entries']) == 1
+    assert [step['title'] for step in har['_steps']] == ['Найти кнопку']
+    assert recorder.entries == []
+    assert not recorder.is_kept
+
+
+def test_har_is_written_for_slow_step_and_keep(recorder: NetworkRecorder, tmp_path: Path) -> None:
+    recorder.on_action_end('Загрузить отчёт', None, 0.0, 1.5, None)
+    recorder.on_test_finished('test_slow')
+    recorder.keep('Тест упал вне шагов')
+    recorder.on_test_finished('test_kept')
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['test_kept.har', 'test_slow.har']
+    slow = loads((tmp_path / 'test_slow.har').read_text(encoding='UTF-8'))['log']
+    assert slow['_steps'][0]['time'] == 1500
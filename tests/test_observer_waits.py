@@ -0,0 +1,68 @@
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import Locator
+
+from .conftest import FakePageObject
+
+STATUS = Locator('css selector', '#status', 'Статус')
+FIELD = Locator('css selector', '#field', 'Поле ввода')
+SPINNER = Locator('css selector', '.spinner', 'Индикатор загрузки')
+
+
+@pytest.fixture(autouse=True)
+def elements(fake_page: FakePage) -> None:
+    fake_page.elements[STATUS.selector] = [
+        FakeElement(text='Загрузка', attributes={'data-state': 'loading'}).update_after(
+            0.3,
+            text='Готово',
+            **{'data-state': 'ready'}
+        )
+    ]
+    fake_page.elements[FIELD.selector] = [
+        FakeElement(attributes={'value': ''}).update_after(0.3, value='Сохранено')
+    ]
+    fake_page.elements[SPINNER.selector] = [FakeElement(disappear_after=0.3)]
+
+
+def test_event_driven_waits_take_one_script_call(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    executor.commands.clear()
+    page_object.wait_for_change_text(STATUS, 'Готово', is_event_driven=True)
+    page_object.wait_for_change_value(FIELD, 'Сохр', is_strong_coincidence=False, is_event_driven=True)
+    page_object.sleep_until_update_attribute(STATUS, 'data-state', 'ready', is_event_driven=True)
+    page_object.check_element_not_presence_in_dom(SPINNER, is_event_driven=True)
+    assert executor.commands.count(Command.W3C_EXECUTE_SCRIPT_ASYNC) == 4
+
+
+def test_event_driven_wait_raises_with_current_value(page_object: FakePageObject) -> None:
+    with page_object._step('Ожидание с коротким тайм-аутом', timeout=0.5):
+        with pytest.raises(AssertionError, match='Текущее значение: Готово'):
+            page_object.wait_for_change_text(STATUS, 'Ошибка', is_event_driven=True)
+
+
+def test_polling_and_event_driven_waits_agree(page_object: FakePageObject) -> None:
+    page_object.wait_for_change_text(STATUS, 'Готово')
+    page_object.wait_for_change_text(STATUS, 'Готово', is_event_driven=True)
+    page_object.wait_for_change_value(FIELD, 'Сохранено')
+    page_object.wait_for_change_value(FIELD, 'Сохранено', is_event_driven=True)
+
+
+def test_raised_script_timeout_is_restored(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    executor.script_timeout = 5000
+    page_object.wait_for_change_text(STATUS, 'Готово', is_event_driven=True)
+    assert executor.commands.count(Command.SET_TIMEOUTS) == 2
+    assert executor.script_timeout == 5000
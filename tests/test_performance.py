@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_webdriver import FAKE_PAGE_PERFORMANCE
+from custom_selenium_qa import PerformanceReport
+from custom_selenium_qa import find_budget_violations
+
+from .conftest import FakePageObject
+
+
+@pytest.fixture
+def report(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> PerformanceReport:
+    report = PerformanceReport(str(tmp_path / 'performance'), run_id='run')
+    monkeypatch.setattr(FakePageObject, 'PERFORMANCE_REPORT', report)
+    return report
+
+
+def test_missing_metrics_are_not_checked() -> None:
+    metrics = {'load': 900.0, 'first_contentful_paint': 350.0}
+    budget = {'load': 1000, 'first_contentful_paint': 300, 'largest_contentful_paint': 2500}
+    assert find_budget_violations(metrics, budget) == ['first_contentful_paint: 350 > 300']
+
+
+def test_report_summary_groups_samples_by_label(report: PerformanceReport) -> None:
+    for load in (300.0, 100.0, 200.0):
+        report.add('test_login', 'login', 'https://app.test/login?next=1', {'load': load})
+    report.add('test_home', None, 'https://app.test/', {'load': 50.0}, ['load: 50 > 10'])
+    summary = report.summary()
+    assert summary['login'] == {
+        'samples': 3, 'violations': 0, 'metrics': {'load': {'min': 100.0, 'median': 200.0, 'p90': 300.0, 'max': 300.0}}
+    }
+    assert summary['https://app.test/']['violations'] == 1
+
+
+def test_collected_metrics_are_written_to_report(page_object: FakePageObject, report: PerformanceReport) -> None:
+    assert page_object.collect_page_performance('home') == FAKE_PAGE_PERFORMANCE
+    with open(report.path, encoding='utf-8') as file:
+        record = json.loads(file.readline())
+    assert (record['test'], record['label'], record['violations']) == ('test_page_object', 'home', [])
+
+
+def test_budget_violation_fails_and_is_reported(page_object: FakePageObject, report: PerformanceReport) -> None:
+    with pytest.raises(AssertionError, match='load: 900 > 500'):
+        page_object.check_performance_budget({'load': 500, 'dom_content_loaded': 1000}, 'home')
+    assert report.summary()['home']['violations'] == 1
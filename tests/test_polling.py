@@ -0,0 +1,36 @@
+from itertools import islice
+
+import pytest
+
+from custom_selenium_qa import BackoffPolling
+from custom_selenium_qa import FixedPolling
+from custom_selenium_qa import PollingStrategy
+
+
+def test_fixed_polling_repeats_interval() -> None:
+    assert list(islice(FixedPolling(0.2).delays(), 3)) == [0.2, 0.2, 0.2]
+
+
+def test_backoff_polling_grows_up_to_maximum() -> None:
+    delays = list(islice(BackoffPolling(initial=0.1, factor=2, maximum=0.5, jitter=0).delays(), 5))
+    assert delays == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+def test_backoff_polling_initial_delay_is_capped_by_maximum() -> None:
+    assert next(BackoffPolling(initial=1, factor=2, maximum=0.3, jitter=0).delays()) == 0.3
+
+
+def test_backoff_polling_jitter_only_shortens_delays() -> None:
+    delays = list(islice(BackoffPolling(initial=0.1, factor=1, maximum=0.1, jitter=0.5).delays(), 100))
+    assert all(0.05 <= delay <= 0.1 for delay in delays)
+
+
+@pytest.mark.parametrize('factor, jitter', [(0.5, 0), (2, -0.1), (2, 1.5)])
+def test_backoff_polling_rejects_invalid_parameters(factor: float, jitter: float) -> None:
+    with pytest.raises(ValueError):
+        BackoffPolling(initial=0.1, factor=factor, maximum=1, jitter=jitter)
+
+
+def test_base_strategy_has_no_delays() -> None:
+    with pytest.raises(NotImplementedError):
+        next(PollingStrategy().delays())
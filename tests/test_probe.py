@@ -0,0 +1,88 @@
+from time import monotonic
+from typing import List
+from typing import Tuple
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import Locator
+
+from .conftest import FakePageObject
+
+BANNER = Locator('css selector', '.banner', 'Баннер')
+HIDDEN = Locator('css selector', '.hidden', 'Скрытый блок')
+ABSENT = Locator('css selector', '.absent', 'Отсутствующий элемент')
+
+
+@pytest.fixture(autouse=True)
+def elements(fake_page: FakePage) -> None:
+    fake_page.elements[BANNER.selector] = [FakeElement(appear_after=0.2).update_after(0.4, is_displayed=False)]
+    fake_page.elements[HIDDEN.selector] = [FakeElement(is_displayed=False)]
+
+
+def test_zero_timeout_probe_is_one_script_without_screenshot(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    executor.commands.clear()
+    started = monotonic()
+    assert page_object.probe_element(ABSENT) is False
+    assert monotonic() - started < 0.1
+    assert executor.commands == [Command.W3C_EXECUTE_SCRIPT]
+
+
+def test_probe_returns_on_first_observation(page_object: FakePageObject) -> None:
+    assert page_object.probe_element(HIDDEN) is True
+    assert page_object.probe_element(HIDDEN, is_visible=True) is False
+    assert page_object.probe_element(BANNER, timeout=1.0, is_visible=True) is True
+
+
+def test_probe_raises_on_unhandled_error(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def query_many(*args: object, **kwargs: object) -> List[dict]:
+        raise JavascriptException('Ошибка скрипта')
+
+    monkeypatch.setattr(page_object, 'query_many', query_many)
+    with pytest.raises(AssertionError, match='Необрабатываемое исключение'):
+        page_object.probe_element(ABSENT, timeout=1.0)
+    assert fake_driver[1].commands.count(Command.SCREENSHOT) == 1
+
+
+def test_find_element_return_bool_respects_timeout(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    started = monotonic()
+    assert page_object.find_element_return_bool(ABSENT, timeout=0.3) is False
+    assert monotonic() - started < 1.0
+    assert Command.SCREENSHOT not in fake_driver[1].commands
+
+
+def test_find_element_return_bool_timeout_is_not_cut_by_default_deadline(
+        page_object: FakePageObject,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    remaining: List[float] = []
+
+    def probe_element(locator: Locator, timeout: float = 0.0, is_visible: bool = False) -> bool:
+        remaining.append(page_object.deadline.remaining)  # type: ignore
+        return False
+
+    monkeypatch.setattr(page_object, 'probe_element', probe_element)
+    assert page_object.find_element_return_bool(ABSENT, timeout=30) is False
+    assert remaining[0] > 20
+
+
+def test_invisibility_passes_once_element_is_hidden(page_object: FakePageObject) -> None:
+    page_object.check_element_invisibility(ABSENT, timeout=0.0)
+    page_object.check_element_invisibility(BANNER, timeout=2.0)
+    page_object.check_element_not_presence_in_dom(ABSENT, timeout=0.0)
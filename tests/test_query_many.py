@@ -0,0 +1,67 @@
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import Locator
+
+from .conftest import FakePageObject
+
+HEADER = Locator('css selector', '#header', 'Заголовок')
+ROWS = Locator('css selector', '.row', 'Строки таблицы')
+COLUMNS = Locator('css selector', '.column', 'Столбцы таблицы')
+HIDDEN = Locator('css selector', '#hidden', 'Скрытый элемент')
+ABSENT = Locator('css selector', '#absent', 'Отсутствующий элемент')
+
+
+@pytest.fixture(autouse=True)
+def elements(fake_page: FakePage) -> None:
+    fake_page.elements.update({
+        HEADER.selector: [FakeElement('Отчёт')],
+        ROWS.selector: [FakeElement('Первая'), FakeElement('Вторая')],
+        COLUMNS.selector: [FakeElement('Имя'), FakeElement('Роль')],
+        HIDDEN.selector: [FakeElement('Подсказка', is_displayed=False)],
+    })
+
+
+def test_all_locators_are_queried_in_one_round_trip(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    executor.commands.clear()
+    results = page_object.query_many([HEADER, ROWS, HIDDEN, ABSENT], wait_for=None)
+    assert results == [
+        {'text': 'Отчёт', 'count': 1, 'visible': True, 'present': True},
+        {'text': 'Первая', 'count': 2, 'visible': True, 'present': True},
+        {'text': '', 'count': 1, 'visible': False, 'present': True},
+        {'text': None, 'count': 0, 'visible': False, 'present': False},
+    ]
+    assert executor.commands == [Command.W3C_EXECUTE_SCRIPT]
+
+
+def test_only_requested_fields_are_returned(page_object: FakePageObject) -> None:
+    assert page_object.query_many([HEADER, HIDDEN], fields=('count',), wait_for='present') == [
+        {'count': 1}, {'count': 1}
+    ]
+
+
+def test_query_waits_for_condition_of_all_locators(page_object: FakePageObject, fake_page: FakePage) -> None:
+    fake_page.elements[ABSENT.selector] = [FakeElement('Появился', appear_after=0.3)]
+    assert page_object.query_many([HEADER, ABSENT], fields=('text',)) == [{'text': 'Отчёт'}, {'text': 'Появился'}]
+
+
+def test_helpers_over_several_locators_use_one_query(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor]
+) -> None:
+    executor = fake_driver[1]
+    executor.commands.clear()
+    texts = page_object.get_text_from_elements_with_different_locators((HEADER, ROWS))  # type: ignore
+    assert texts == ('Отчёт', 'Первая')
+    page_object.compare_counts_of_different_locators((ROWS, COLUMNS))
+    assert executor.commands == [Command.W3C_EXECUTE_SCRIPT] * 2
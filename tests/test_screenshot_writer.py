@@ -0,0 +1,34 @@
+from os import getcwd
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_webdriver import FAKE_PNG
+from custom_selenium_qa import SCREENSHOTS_DIRECTORY
+from custom_selenium_qa import SCREENSHOTS_EXTENSION
+from custom_selenium_qa import ScreenshotWriter
+
+from .conftest import FakePageObject
+
+
+def test_screenshot_is_written_without_changing_directory(page_object: FakePageObject, tmp_path: Path) -> None:
+    working_directory = getcwd()
+    page_object.make_screenshot()
+    assert getcwd() == working_directory
+    page_object.flush_screenshots()
+    path = tmp_path / SCREENSHOTS_DIRECTORY / f'test_page_object.{SCREENSHOTS_EXTENSION}'
+    assert path.read_bytes() == FAKE_PNG
+
+
+def test_writer_creates_directories_and_flushes(tmp_path: Path) -> None:
+    writer = ScreenshotWriter(max_in_flight_bytes=1)
+    paths = [tmp_path / 'nested' / f'{index}.png' for index in range(3)]
+    for path in paths:
+        writer.submit(str(path), FAKE_PNG)
+    writer.flush()
+    assert all(path.read_bytes() == FAKE_PNG for path in paths)
+
+
+def test_writer_rejects_invalid_scale() -> None:
+    with pytest.raises(ValueError):
+        ScreenshotWriter(scale=0)
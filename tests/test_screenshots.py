@@ -0,0 +1,108 @@
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import SCREENSHOTS_DIRECTORY
+from custom_selenium_qa import ScreenshotPolicy
+from custom_selenium_qa import get_screenshot_policy
+
+from .conftest import FakePageObject
+
+
+def test_policy_limits_screenshots_per_test() -> None:
+    policy = ScreenshotPolicy(max_per_test=2)
+    for _ in range(2):
+        assert policy.has_capacity()
+        policy.register(None)
+    assert not policy.has_capacity()
+    assert policy.count == 2
+    assert policy.skipped == 1
+
+
+def test_policy_takes_error_screenshot_over_limit_and_unchanged_page() -> None:
+    policy = ScreenshotPolicy(max_per_test=1, is_deduplicated=True)
+    policy.register('page-1')
+    assert policy.has_capacity(is_error=True)
+    assert policy.is_changed('page-1', is_error=True)
+    assert policy.skipped == 0
+
+
+def test_policy_skips_unchanged_page() -> None:
+    policy = ScreenshotPolicy(is_deduplicated=True)
+    policy.register('page-1')
+    assert not policy.is_changed('page-1')
+    assert policy.is_changed('page-2')
+    assert policy.is_changed(None)
+    assert policy.skipped == 1
+
+
+def test_policy_without_deduplication_takes_unchanged_page() -> None:
+    policy = ScreenshotPolicy(is_deduplicated=False)
+    policy.register('page-1')
+    assert policy.is_changed('page-1')
+    assert policy.skipped == 0
+
+
+def test_screenshot_files_are_numbered() -> None:
+    policy = ScreenshotPolicy()
+    names = [ScreenshotPolicy.file_name('test_login', policy.register(None), 'png') for _ in range(3)]
+    assert names == ['test_login.png', 'test_login_2.png', 'test_login_3.png']
+
+
+def test_unchanged_page_is_captured_once(page_object: FakePageObject, fake_page: FakePage, tmp_path: Path) -> None:
+    page_object.screenshot_policy.is_deduplicated = True
+    page_object.make_screenshot()
+    page_object.make_screenshot()
+    fake_page.elements['#status'] = [FakeElement(text='Изменено')]
+    page_object.make_screenshot()
+    page_object.flush_screenshots()
+    assert sorted(path.name for path in (tmp_path / SCREENSHOTS_DIRECTORY).iterdir()) == [
+        'test_page_object.png',
+        'test_page_object_2.png',
+    ]
+    assert page_object.screenshot_policy.skipped == 1
+
+
+def test_error_screenshot_is_taken_over_limit(page_object: FakePageObject, tmp_path: Path) -> None:
+    page_object.screenshot_policy.max_per_test = 1
+    page_object.make_screenshot()
+    page_object.make_screenshot()
+    with pytest.raises(AssertionError, match='Ошибка'):
+        page_object.screenshot_and_raise_error('Ошибка')
+    page_object.flush_screenshots()
+    assert sorted(path.name for path in (tmp_path / SCREENSHOTS_DIRECTORY).iterdir()) == [
+        'test_page_object.png',
+        'test_page_object_2.png',
+    ]
+    assert page_object.screenshot_policy.skipped == 1
+
+
+def test_policy_is_shared_by_test_method_name() -> None:
+    policy = get_screenshot_policy('test_shared_policy')
+    assert get_screenshot_policy('test_shared_policy') is policy
+    assert get_screenshot_policy('test_other_policy') is not policy
+
+
+def test_page_objects_of_one_test_share_policy(
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        tmp_path: Path
+) -> None:
+    driver = fake_driver[0]
+    first = FakePageObject(driver, 'test_page_objects', screenshots_directory=str(tmp_path))  # type: ignore
+    second = FakePageObject(driver, 'test_page_objects', screenshots_directory=str(tmp_path))  # type: ignore
+    other = FakePageObject(driver, 'test_other_page_objects', screenshots_directory=str(tmp_path))  # type: ignore
+    assert first.screenshot_policy is second.screenshot_policy
+    assert first.screenshot_policy is not other.screenshot_policy
+
+
+def test_finish_test_resets_policy(page_object: FakePageObject, tmp_path: Path) -> None:
+    policy = page_object.screenshot_policy
+    page_object.make_screenshot()
+    page_object.finish_test()
+    assert (policy.count, policy.skipped) == (0, 0)
+    assert get_screenshot_policy('test_page_object') is not policy
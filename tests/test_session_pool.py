@@ -0,0 +1,129 @@
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import create_fake_driver
+from benchmarks.scenarios import standard_page
+from custom_selenium_qa import SessionPool
+from custom_selenium_qa import reset_browser_state
+from custom_selenium_qa import session_pool
+
+# Ответы поддельного браузера на сбор источников для очистки хранилищ
+COOKIES = {'cookies': [
+    {'domain': '.example.com', 'secure': True},
+    {'domain': 'sso.example.com', 'secure': False},
+]}
+FRAME_TREE = {'frameTree': {
+    'frame': {'securityOrigin': 'https://example.com'},
+    'childFrames': [
+        {'frame': {'securityOrigin': 'https://widget.example.org'}},
+        {'frame': {'securityOrigin': '://'}},
+    ],
+}}
+
+
+class FakeSessionFactory:
+    """
+    Фабрика сессий поддельного браузера, запоминающая исполнители команд созданных сессий.
+    Ответы DevTools протокола (devtools_responses) общие для всех сессий фабрики.
+    """
+
+    def __init__(self) -> None:
+        self.executors: List[FakeCommandExecutor] = []
+        self.devtools_responses: Dict[str, Any] = {}
+
+    def __call__(self) -> Remote:
+        driver, executor = create_fake_driver(standard_page())
+        executor.devtools_responses = self.devtools_responses
+        self.executors.append(executor)
+        return driver
+
+
+@pytest.fixture
+def factory() -> FakeSessionFactory:
+    return FakeSessionFactory()
+
+
+@pytest.fixture
+def pool(factory: FakeSessionFactory) -> Iterator[SessionPool]:
+    with SessionPool(factory, size=1, max_uses=2, max_heap_growth=None) as pool:
+        yield pool
+
+
+def test_released_session_is_reset_and_reused(pool: SessionPool, factory: FakeSessionFactory) -> None:
+    with pool.lease() as emulator:
+        pass
+    assert pool.acquire() is emulator
+    commands = [cmd for cmd, _ in factory.executors[0].devtools_commands]
+    assert 'Network.clearBrowserCookies' in commands
+    assert 'Network.clearBrowserCache' in commands
+    assert pool.stats['recycled'] == 0
+    assert pool.stats['leases'] == 2
+
+
+def test_session_is_recycled_after_max_uses(pool: SessionPool) -> None:
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)
+    second = pool.acquire()
+    assert second is not first
+    assert pool.stats['recycled'] == 1
+
+
+def test_broken_session_is_recycled_without_reset(pool: SessionPool, factory: FakeSessionFactory) -> None:
+    first = pool.acquire()
+    pool.release(first, is_broken=True)
+    assert pool.acquire() is not first
+    assert factory.executors[0].devtools_commands == []
+    assert pool.stats['recycled'] == 1
+
+
+def test_session_is_recycled_on_reset_error(pool: SessionPool, monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_reset(*args: Any) -> None:
+        raise KeyError('frameTree')
+
+    monkeypatch.setattr(session_pool, 'reset_browser_state', fail_reset)
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is not first
+    assert pool.stats['recycled'] == 1
+
+
+def test_session_is_recycled_on_heap_growth(factory: FakeSessionFactory) -> None:
+    factory.devtools_responses['Runtime.getHeapUsage'] = {'usedSize': 1000}
+    with SessionPool(factory, size=1, max_heap_growth=1000) as pool:
+        first = pool.acquire()
+        factory.devtools_responses['Runtime.getHeapUsage'] = {'usedSize': 3000}
+        pool.release(first)
+        assert pool.acquire() is not first
+        assert pool.stats['recycled'] == 1
+
+
+def test_foreign_session_is_rejected(pool: SessionPool, fake_driver: Tuple[Remote, FakeCommandExecutor]) -> None:
+    with pytest.raises(ValueError):
+        pool.release(fake_driver[0])
+
+
+def test_reset_clears_storages_of_all_collected_origins(fake_driver: Tuple[Remote, FakeCommandExecutor]) -> None:
+    driver, executor = fake_driver
+    executor.devtools_responses.update({'Network.getAllCookies': COOKIES, 'Page.getFrameTree': FRAME_TREE})
+    reset_browser_state(driver, 'about:blank', origins=['https://extra.example.net', ''])
+    cleared = [
+        params['origin'] for cmd, params in executor.devtools_commands if cmd == 'Storage.clearDataForOrigin'
+    ]
+    assert cleared == [
+        'https://extra.example.net',
+        'https://example.com',
+        'https://sso.example.com',
+        'http://sso.example.com',
+        'https://widget.example.org',
+    ]
+    commands = [cmd for cmd, _ in executor.devtools_commands]
+    assert commands.index('Network.getAllCookies') < commands.index('Network.clearBrowserCookies')
@@ -0,0 +1,76 @@
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver import Remote
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from custom_selenium_qa import ReplayMismatchError
+from custom_selenium_qa import SessionRecorder
+from custom_selenium_qa import create_replay_driver
+
+from .conftest import FakePageObject
+
+
+@pytest.fixture(params=['session.jsonl', 'session.jsonl.gz'])
+def recording(request: pytest.FixtureRequest, fake_driver: Tuple[Remote, FakeCommandExecutor], tmp_path: Path) -> str:
+    """
+    Запись сессии поддельного браузера: заголовок, число строк таблицы, команда DevTools протокола и заголовок.
+    """
+    driver, executor = fake_driver
+    path = str(tmp_path / request.param)
+    executor.page.title = 'Первый заголовок'
+    executor.page.elements['.row'] = [FakeElement() for _ in range(50)]
+    with SessionRecorder(driver, path) as recorder:
+        assert driver.title == 'Первый заголовок'
+        assert len(driver.find_elements('css selector', '.row')) == 50
+        FakePageObject(driver, 'test_recording').send_by_devtools_protocol('Network.clearBrowserCache')  # type: ignore
+        executor.page.title = 'Второй заголовок'
+        assert driver.title == 'Второй заголовок'
+    assert recorder.commands_count == 4
+    return path
+
+
+def test_replay_serves_repeated_commands_in_recorded_order(recording: str) -> None:
+    driver, executor = create_replay_driver(recording)
+    assert driver.title == 'Первый заголовок'
+    assert driver.title == 'Второй заголовок'
+    assert driver.title == 'Второй заголовок'
+    assert len(driver.find_elements('css selector', '.row')) == 50
+    FakePageObject(driver, 'test_replay').send_by_devtools_protocol('Network.clearBrowserCache')  # type: ignore
+    assert executor.misses == []
+
+
+def test_replay_reports_unrecorded_command(recording: str) -> None:
+    driver, executor = create_replay_driver(recording)
+    with pytest.raises(ReplayMismatchError):
+        driver.find_elements('css selector', '#absent')
+    assert len(executor.misses) == 1
+
+
+def test_strict_replay_requires_recorded_order(recording: str) -> None:
+    driver, executor = create_replay_driver(recording, is_strict=True)
+    assert driver.title == 'Первый заголовок'
+    with pytest.raises(ReplayMismatchError):
+        driver.title
+    assert len(executor.misses) == 1
+
+
+def test_replay_returns_recorded_error(fake_driver: Tuple[Remote, FakeCommandExecutor], tmp_path: Path) -> None:
+    driver = fake_driver[0]
+    path = str(tmp_path / 'session.jsonl')
+    with SessionRecorder(driver, path):
+        with pytest.raises(NoSuchElementException):
+            driver.find_element('css selector', '#absent')
+    replay_driver, _ = create_replay_driver(path)
+    with pytest.raises(NoSuchElementException):
+        replay_driver.find_element('css selector', '#absent')
+
+
+def test_replay_rejects_foreign_file(tmp_path: Path) -> None:
+    path = tmp_path / 'session.jsonl'
+    path.write_text('{"command": "getTitle"}\n', encoding='UTF-8')
+    with pytest.raises(ValueError):
+        create_replay_driver(str(path))
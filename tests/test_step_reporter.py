@@ -0,0 +1,153 @@
+from threading import Thread
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import Locator
+from custom_selenium_qa import StepReporter
+from custom_selenium_qa import get_step_reporter
+from custom_selenium_qa import step_reporter
+
+from .conftest import FakePageObject
+from .conftest import FakeStepManager
+from .conftest import reported
+
+BUTTON = Locator('css selector', '#save', 'Кнопка сохранения')
+
+
+def run_steps(reporter: StepReporter, verbosity: str) -> None:
+    reporter.open('Внешний шаг', None, verbosity)
+    reporter.open('Вложенный шаг', None, verbosity)
+    reporter.close(is_failed=True)
+    reporter.close(is_failed=False)
+
+
+def test_all_verbosity_reports_nested_steps(step_manager: FakeStepManager) -> None:
+    reporter = StepReporter()
+    run_steps(reporter, 'all')
+    reporter.flush()
+    assert reported(step_manager) == [(0, 'Внешний шаг', 'Passed'), (1, 'Вложенный шаг', 'Failed')]
+
+
+def test_top_verbosity_reports_outer_steps_only(step_manager: FakeStepManager) -> None:
+    reporter = StepReporter()
+    run_steps(reporter, 'top')
+    reporter.flush()
+    assert reported(step_manager) == [(0, 'Внешний шаг', 'Passed')]
+
+
+def test_none_verbosity_reports_nothing(step_manager: FakeStepManager) -> None:
+    reporter = StepReporter()
+    run_steps(reporter, 'none')
+    reporter.flush()
+    assert step_manager.steps == []
+
+
+def test_step_under_skipped_step_is_attached_to_recorded_parent(step_manager: FakeStepManager) -> None:
+    reporter = StepReporter()
+    reporter.open('Внешний шаг', None, 'all')
+    reporter.open('Пропущенный шаг', None, 'none')
+    reporter.open('Вложенный шаг', None, 'all')
+    for _ in range(3):
+        reporter.close(is_failed=False)
+    reporter.flush()
+    assert reported(step_manager) == [(0, 'Внешний шаг', 'Passed'), (1, 'Вложенный шаг', 'Passed')]
+
+
+def test_flush_keeps_buffer_while_steps_are_open(step_manager: FakeStepManager) -> None:
+    reporter = StepReporter()
+    reporter.open('Внешний шаг', None, 'all')
+    reporter.flush()
+    assert step_manager.steps == []
+    reporter.close(is_failed=False)
+    reporter.flush()
+    assert reported(step_manager) == [(0, 'Внешний шаг', 'Passed')]
+
+
+def test_description_function_is_called_on_report(step_manager: FakeStepManager) -> None:
+    calls: List[str] = []
+
+    def describe() -> str:
+        calls.append('describe')
+        return 'Описание'
+
+    reporter = StepReporter()
+    reporter.open('Шаг', describe, 'all')
+    reporter.close(is_failed=False)
+    assert calls == []
+    reporter.flush()
+    assert calls == ['describe']
+    assert step_manager.steps[0][1].get_description() == 'Описание'
+
+
+def test_deferred_reporter_reports_grouped_steps(step_manager: FakeStepManager) -> None:
+    reporter = StepReporter(is_deferred=True)
+    for title, is_failed in (('Первый шаг', False), ('Второй шаг', True)):
+        reporter.open(title, None, 'all')
+        reporter.close(is_failed)
+    reporter.flush()
+    assert step_manager.steps == []
+    reporter.report('Сессия')
+    assert reported(step_manager) == [
+        (0, 'Сессия', 'Failed'), (1, 'Первый шаг', 'Passed'), (1, 'Второй шаг', 'Failed')
+    ]
+    reporter.report('Сессия')
+    assert len(step_manager.steps) == 3
+
+
+def test_soft_check_failure_is_reported_as_in_testit(
+        step_manager: FakeStepManager,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Адаптер TestIT возвращает Failed один раз - для первого шага после непрошедшей мягкой проверки
+    outcomes = iter(['Failed'])
+    hook = SimpleNamespace(get_pytest_check_outcome=lambda: [next(outcomes, 'Passed')])
+    monkeypatch.setattr(step_reporter.TmsPluginManager, 'get_plugin_manager', lambda: SimpleNamespace(hook=hook))
+    reporter = StepReporter()
+    for title in ('Первый шаг', 'Второй шаг'):
+        reporter.open(title, None, 'all')
+        reporter.close(is_failed=False)
+    reporter.flush()
+    assert reported(step_manager) == [(0, 'Первый шаг', 'Failed'), (0, 'Второй шаг', 'Passed')]
+
+
+def test_step_reporter_is_created_per_thread() -> None:
+    reporters: List[StepReporter] = []
+    thread = Thread(target=lambda: reporters.append(get_step_reporter()))
+    thread.start()
+    thread.join()
+    assert get_step_reporter() is get_step_reporter()
+    assert reporters[0] is not get_step_reporter()
+
+
+def test_action_steps_are_flushed_when_outer_step_closes(
+        page_object: FakePageObject,
+        fake_page: FakePage,
+        step_manager: FakeStepManager
+) -> None:
+    fake_page.elements[BUTTON.selector] = [FakeElement()]
+    page_object.click_element_by_webdriver(BUTTON)
+    assert reported(step_manager)[0] == (0, 'Нажатие на элемент при помощи Webdriver', 'Passed')
+    assert step_manager.steps[0][1].get_description() == BUTTON.description
+    assert all(depth > 0 for depth, _, _ in reported(step_manager)[1:])
+
+
+def test_test_flush_policy_reports_on_finish_test(
+        page_object: FakePageObject,
+        fake_page: FakePage,
+        step_manager: FakeStepManager,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(page_object, 'STEPS_FLUSH_POLICY', 'test')
+    monkeypatch.setattr(page_object, 'STEPS_VERBOSITY', 'top')
+    fake_page.elements[BUTTON.selector] = [FakeElement()]
+    page_object.click_element_by_webdriver(BUTTON)
+    page_object.find_element(BUTTON)
+    assert step_manager.steps == []
+    page_object.finish_test()
+    assert [title for _, title, _ in reported(step_manager)] == [
+        'Нажатие на элемент при помощи Webdriver', 'Поиск элемента по локатору'
+    ]
@@ -0,0 +1,68 @@
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+from selenium.webdriver.remote.command import Command
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import Locator
+
+from .conftest import FakePageObject
+
+ROWS = Locator('css selector', '.row', 'Строки таблицы')
+
+
+def fill_rows(page: FakePage, number: int) -> None:
+    page.elements[ROWS.selector] = [FakeElement(f'Строка {index}') for index in range(number)]
+
+
+@pytest.mark.parametrize('is_batched', [False, True])
+def test_texts_are_read_from_all_elements(
+        page_object: FakePageObject,
+        fake_page: FakePage,
+        is_batched: bool
+) -> None:
+    fill_rows(fake_page, 3)
+    fake_page.elements[ROWS.selector][1].text = '  Строка с пробелами \n'
+    texts = page_object.get_texts_from_elements_with_identical_locators(ROWS, is_batched=is_batched)
+    assert texts == ('Строка 0', 'Строка с пробелами', 'Строка 2')
+
+
+def test_batched_texts_cost_one_round_trip_for_any_number_of_elements(
+        page_object: FakePageObject,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        fake_page: FakePage
+) -> None:
+    executor = fake_driver[1]
+    commands_numbers = []
+    for number in (2, 200):
+        fill_rows(fake_page, number)
+        executor.commands.clear()
+        assert len(page_object.get_texts_from_elements_with_identical_locators(ROWS, is_batched=True)) == number
+        assert Command.GET_ELEMENT_TEXT not in executor.commands
+        commands_numbers.append(len(executor.commands))
+    assert commands_numbers[0] == commands_numbers[1]
+
+
+@pytest.mark.parametrize('is_batched', [False, True])
+def test_wait_for_texts_until_they_match_target_set(
+        page_object: FakePageObject,
+        fake_page: FakePage,
+        is_batched: bool
+) -> None:
+    fake_page.elements[ROWS.selector] = [
+        FakeElement('Загрузка').update_after(0.3, text='Готово'),
+        FakeElement('Готово'),
+    ]
+    page_object.wait_for_elements_text_correspond_to_given_set(ROWS, ('Готово', 'Отменено'), is_batched=is_batched)
+    assert page_object.get_texts_from_elements_with_identical_locators(ROWS) == ('Готово', 'Готово')
+
+
+def test_non_batched_wait_treats_no_texts_as_subset(
+        page_object: FakePageObject,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(page_object, 'get_texts_from_elements_with_identical_locators', lambda locator: ())
+    page_object.wait_for_elements_text_correspond_to_given_set(ROWS, ('Готово',), is_batched=False)
@@ -0,0 +1,56 @@
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+import pytest
+from selenium.webdriver import Remote
+
+from benchmarks.fake_webdriver import FakeCommandExecutor
+from custom_selenium_qa import NO_THROTTLING
+from custom_selenium_qa import SLOW_4G
+from custom_selenium_qa import ThrottlingProfile
+from custom_selenium_qa import apply_throttling_profile
+from custom_selenium_qa import get_throttling_profile
+
+from .conftest import FakePageObject
+
+
+@pytest.fixture
+def driver(fake_driver: Tuple[Remote, FakeCommandExecutor]) -> Iterator[Remote]:
+    """
+    Вебдрайвер поддельного браузера; сессии поддельного браузера имеют общий идентификатор,
+    поэтому ограничения снимаются после теста.
+    """
+    yield fake_driver[0]
+    apply_throttling_profile(fake_driver[0], NO_THROTTLING)
+
+
+def sent_commands(executor: FakeCommandExecutor) -> List[str]:
+    return [cmd for cmd, _ in executor.devtools_commands]
+
+
+def test_unknown_profile_name_is_rejected(driver: Remote) -> None:
+    with pytest.raises(ValueError, match='slow-4g'):
+        apply_throttling_profile(driver, '5g')
+
+
+def test_cpu_rate_is_sent_only_when_changed(driver: Remote, fake_driver: Tuple[Remote, FakeCommandExecutor]) -> None:
+    assert apply_throttling_profile(driver, 'slow-4g') is NO_THROTTLING
+    assert apply_throttling_profile(driver, ThrottlingProfile('Задержка', latency=100, cpu_rate=4.0)) is SLOW_4G
+    assert sent_commands(fake_driver[1]) == [
+        'Network.enable', 'Network.emulateNetworkConditions', 'Emulation.setCPUThrottlingRate',
+        'Network.enable', 'Network.emulateNetworkConditions',
+    ]
+
+
+def test_context_manager_restores_previous_profile(
+        driver: Remote,
+        fake_driver: Tuple[Remote, FakeCommandExecutor],
+        page_object: FakePageObject
+) -> None:
+    with page_object.throttling('slow-4g') as profile:
+        assert profile is SLOW_4G
+        assert get_throttling_profile(driver) is SLOW_4G
+    assert get_throttling_profile(driver) is NO_THROTTLING
+    assert sent_commands(fake_driver[1])[-2:] == ['Network.emulateNetworkConditions', 'Emulation.setCPUThrottlingRate']
+    assert fake_driver[1].devtools_commands[-1][1] == {'rate': 1.0}
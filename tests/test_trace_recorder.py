@@ -0,0 +1,36 @@
+from json import loads
+from pathlib import Path
+
+from benchmarks.fake_webdriver import FakeElement
+from benchmarks.fake_webdriver import FakePage
+from custom_selenium_qa import Locator
+from custom_selenium_qa import TraceRecorder
+
+from .conftest import FakePageObject
+
+BUTTON = Locator('css selector', '#save', 'Кнопка сохранения')
+
+
+def test_commands_are_nested_in_step_span(page_object: FakePageObject, fake_page: FakePage) -> None:
+    fake_page.elements[BUTTON.selector] = [FakeElement()]
+    recorder = TraceRecorder()
+    page_object.add_listener(recorder)
+    page_object.find_element(BUTTON)
+    command, action = recorder.events
+    assert (command['cat'], action['cat']) == ('webdriver', 'action')
+    assert action['args'] == {'description': BUTTON.description}
+    assert action['ts'] <= command['ts']
+    assert command['ts'] + command['dur'] <= action['ts'] + action['dur']
+
+
+def test_trace_is_written_on_finish_test(page_object: FakePageObject, fake_page: FakePage, tmp_path: Path) -> None:
+    fake_page.elements[BUTTON.selector] = [FakeElement(appear_after=0.2)]
+    recorder = TraceRecorder(directory=str(tmp_path / 'traces'))
+    page_object.add_listener(recorder)
+    page_object.check_element_visibility(BUTTON)
+    page_object.finish_test()
+    trace = loads((tmp_path / 'traces' / 'test_page_object.trace.json').read_text(encoding='UTF-8'))
+    categories = {event.get('cat') for event in trace['traceEvents']}
+    assert {'action', 'webdriver', 'wait'} <= categories
+    assert trace['traceEvents'][0]['args'] == {'name': 'test_page_object'}
+    assert recorder.events == []